@@ -20,12 +20,14 @@ or retrieved from the Secret Manager Provider if the vector_store_credentials_se
 
 import logging
 from enum import Enum, unique
-from typing import Optional
+from typing import Dict, List, Optional
 
-from path import Path
-from pydantic import Field
+from pydantic import Field, Json
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from gen_ai_orchestrator.models.em.em_provider import EMProvider
+from gen_ai_orchestrator.models.llm.llm_provider import LLMProvider
+from gen_ai_orchestrator.models.llm.llm_types import LLMSetting
 from gen_ai_orchestrator.models.vector_stores.vectore_store_provider import (
     VectorStoreProvider,
 )
@@ -52,17 +54,111 @@ class _Settings(BaseSettings):
     )
 
     application_environment: _Environment = _Environment.DEV
-    application_logging_config_ini: str = (
-        Path(__file__).dirname() + '/../logging/config.ini'
-    )
+    """Logging configuration file (if not set: logging/config_prod.ini on PROD, logging/config.ini otherwise)"""
+    application_logging_config_ini: Optional[str] = None
+    """Sampling rate of the debug logs, by logger (e.g. {"httpx": 0.01}: 1 debug log out of 100 is kept)"""
+    application_logging_sampling: Dict[str, float] = {}
+    """Maximum number of log records waiting to be written by the queue handler (the next ones are dropped)"""
+    application_logging_queue_max_size: int = 10000
     """Request timeout: set the maximum time (in seconds) for the request to be completed."""
     llm_provider_timeout: int = 30
     llm_provider_max_retries: int = 0
-    """ Enable or not the rate limit for the LLM call"""
+    """ Enable or not the rate limit for the LLM call (by provider, endpoint and API key)"""
     llm_rate_limits: bool = True
+    """Maximum number of LLM requests per minute, for a provider endpoint and API key"""
+    llm_rate_limit_requests_per_minute: int = 600
+    """Maximum number of (estimated) LLM tokens per minute, for a provider endpoint and API key (not limited if not set)"""
+    llm_rate_limit_tokens_per_minute: Optional[int] = None
+    """SQLite database file of the rate limits shared by the workers of a host (in memory, by worker, if not set)"""
+    llm_rate_limit_sqlite_path: Optional[str] = None
+    """LLM hedging: a late answering LLM request (no first token within the hedge delay) is also sent to an alternate LLM"""
+    llm_hedging_enabled: bool = False
+    """Percentile of the observed times to first token of a LLM, used as its hedge delay"""
+    llm_hedging_percentile: float = 95
+    """Hedge delay (in seconds) until enough times to first token are observed"""
+    llm_hedging_default_delay: float = 2.0
+    """Minimum hedge delay (in seconds)"""
+    llm_hedging_min_delay: float = 0.2
+    """Number of the last times to first token kept by LLM, and the minimum one to compute the hedge delay"""
+    llm_hedging_window_size: int = 500
+    llm_hedging_min_samples: int = 20
+    """Fall back to the alternate LLM when the answering LLM request fails (before its first token)"""
+    llm_fallback_enabled: bool = False
+    """Alternate LLM setting (JSON), used if the request does not give one (e.g. another Azure OpenAI deployment)"""
+    llm_alternate_setting: Optional[Json[LLMSetting]] = None
     em_provider_timeout: int = 4
+    em_provider_max_retries: int = 2
+    """Embedding Model batches: maximum number of texts by request, and of concurrent requests"""
+    em_batch_size: int = 32
+    em_max_concurrency: int = 4
+    """Query embeddings cache: reuse the embeddings of the same queries (in memory, and optionally on disk)"""
+    em_query_cache_enabled: bool = True
+    """Maximum number of query embeddings kept in memory, as float32 (about 6KB each for 1536 dimensions: 60MB by worker)"""
+    em_query_cache_max_size: int = 10000
+    """Time to live (in seconds) of a query embedding in the cache"""
+    em_query_cache_ttl: int = 86400
+    """SQLite database file of the on-disk query embeddings cache (disabled if not set)"""
+    em_query_cache_sqlite_path: Optional[str] = None
+    """Maximum number of query embeddings kept on disk (the oldest are evicted)"""
+    em_query_cache_sqlite_max_size: int = 100000
+    """Query embeddings coalescing: the concurrent queries are embedded in batches, as documents (each one waits up to em_coalescing_max_wait)"""
+    em_coalescing_enabled: bool = False
+    """Maximum number of query embeddings of a batch"""
+    em_coalescing_max_batch_size: int = 32
+    """Maximum time (in seconds) a query embedding waits for other ones"""
+    em_coalescing_max_wait: float = 0.005
     compressor_provider_timeout: int = 7
 
+    """Maximum number of documents scored by a single compressor request (larger lists are scored in concurrent shards)"""
+    compressor_shard_size: int = 16
+
+    """Shared async HTTP client: connection pool limits"""
+    http_pool_max_connections: int = 100
+    http_pool_max_keepalive_connections: int = 20
+    """Time (in seconds) an idle connection is kept alive"""
+    http_pool_keepalive_expiry: float = 30
+
+    """RAG chain cache: reuse the RAG chain built for a RAG configuration"""
+    rag_chain_cache_enabled: bool = True
+    """Maximum number of RAG chains kept in the cache (the least recently used are evicted)"""
+    rag_chain_cache_max_size: int = 64
+    """Time to live (in seconds) of a RAG chain in the cache (at most secret_cache_ttl, its clients holding the secrets)"""
+    rag_chain_cache_ttl: int = 3600
+
+    """Single-flight: the identical concurrent requests share a single execution (by route)"""
+    rag_single_flight_enabled: bool = True
+    qa_single_flight_enabled: bool = True
+
+    """Semantic answer cache: reuse the RAG answer of a similar (condensed) question, on the same index and prompt"""
+    rag_semantic_cache_enabled: bool = False
+    """Minimum cosine similarity between the condensed questions embeddings, to reuse an answer"""
+    rag_semantic_cache_threshold: float = 0.95
+    """Maximum number of answers kept in the cache (the least recently used are evicted)"""
+    rag_semantic_cache_max_size: int = 1000
+    """Time to live (in seconds) of an answer in the cache"""
+    rag_semantic_cache_ttl: int = 86400
+
+    """Multi-query retrieval: also retrieve the documents with the raw user question, besides the condensed one"""
+    rag_retrieval_raw_question_enabled: bool = False
+    """Reciprocal Rank Fusion constant (k), used to fuse the documents retrieved by several query variants"""
+    rag_retrieval_rrf_k: int = 60
+
+    """RAG batch: number of items run concurrently, if not set by the request, and its maximum"""
+    rag_batch_default_concurrency: int = 4
+    rag_batch_max_concurrency: int = 16
+
+    """Context packing: maximum number of tokens of the documents in the question answering prompt (no limit if not set)"""
+    rag_context_max_tokens: Optional[int] = None
+    """Maximum number of tokens of the chat history in the question answering prompt, the oldest messages are dropped (no limit if not set)"""
+    rag_context_history_max_tokens: Optional[int] = None
+
+    """Client registry: reuse the provider clients (LLM, EM, Vector Store) between requests"""
+    client_registry_enabled: bool = True
+    """Maximum number of clients kept in the registry (the least recently used are evicted)"""
+    client_registry_max_size: int = 128
+    """Time to live (in seconds) of a client in the registry"""
+    client_registry_ttl: int = 3600
+
     vector_store_provider: Optional[
         VectorStoreProvider
     ] = VectorStoreProvider.OPEN_SEARCH
@@ -78,12 +174,83 @@ class _Settings(BaseSettings):
     """Maximum number of documents to be retrieved from the Vector Store"""
     vector_store_test_max_docs_retrieved: int = 4
     vector_store_test_query: str = 'Any definition'
+    """OpenSearch async connection pool, shared by all the indexes of a cluster: maximum number of connections"""
+    opensearch_pool_maxsize: int = 50
+    """Time (in seconds) an idle OpenSearch connection is kept alive"""
+    opensearch_pool_keepalive_timeout: float = 30
+    """Enable the HTTP compression of the OpenSearch requests"""
+    opensearch_http_compress: bool = True
+    """PGVector connection pool, shared by all the collections of a database"""
+    pgvector_pool_size: int = 5
+    """Number of connections that can be opened beyond the pool size, under load"""
+    pgvector_pool_max_overflow: int = 10
+    """Test the connections liveness before using them"""
+    pgvector_pool_pre_ping: bool = True
+    """Recycle the connections after this number of seconds (-1 to disable)"""
+    pgvector_pool_recycle: int = 1800
+
+    """Warm-up at startup: the application is reported ready (readiness check) once it is done"""
+    warmup_enabled: bool = True
+    """Maximum time (in seconds) of the warm-up, the application is reported ready afterwards anyway"""
+    warmup_timeout: float = 120
+    """LLM and EM providers whose modules (SDK and LangChain integration) are loaded at startup"""
+    warmup_llm_providers: List[LLMProvider] = []
+    warmup_em_providers: List[EMProvider] = []
+    """Tokenizer (tiktoken) encodings loaded at startup"""
+    warmup_tiktoken_encodings: List[str] = ['cl100k_base']
+    """Indexes of the default Vector Store to warm up (connection pool opened, OpenSearch kNN graphs loaded in memory)"""
+    warmup_indexes: List[str] = []
+
+    """Circuit breakers: the requests to a failing (or too slow) provider endpoint fail fast, until it recovers"""
+    circuit_breaker_enabled: bool = True
+    """Number of the last calls of an endpoint whose outcome is kept, and the minimum one to open its circuit"""
+    circuit_breaker_window_size: int = 20
+    circuit_breaker_min_calls: int = 10
+    """Rate of failed calls (errors, timeouts, 429 and 5xx responses) from which the circuit is opened"""
+    circuit_breaker_error_rate_threshold: float = 0.5
+    """A call is slow from this ratio of the endpoint request timeout (no slow call if not set)"""
+    circuit_breaker_slow_call_timeout_ratio: Optional[float] = 0.8
+    """Rate of slow calls from which the circuit is opened"""
+    circuit_breaker_slow_call_rate_threshold: float = 0.8
+    """Time (in seconds) the circuit stays open, before trial calls are allowed (half-open circuit)"""
+    circuit_breaker_open_duration: float = 30
+    """Number of successful trial calls that close a half-open circuit"""
+    circuit_breaker_half_open_max_calls: int = 1
+
+    """Admission control: beyond their concurrency limit, the requests are queued, and beyond the queue size, rejected (503)"""
+    admission_control_enabled: bool = True
+    """Maximum number of requests processed concurrently, all route classes together (no limit if not set)"""
+    admission_control_max_in_flight: Optional[int] = 64
+    """Maximum number of requests processed concurrently, by route class: rag, qa, completion, provider_status (not limited if not set)"""
+    admission_control_route_max_in_flight: Dict[str, int] = {
+        'rag': 64,
+        'qa': 32,
+        'completion': 8,
+        'provider_status': 4,
+    }
+    """Maximum number of requests waiting in queue, by route class (not queued if not set)"""
+    admission_control_route_queue_size: Dict[str, int] = {
+        'rag': 128,
+        'qa': 64,
+        'completion': 16,
+        'provider_status': 4,
+    }
+    """Maximum time (in seconds) a request waits in queue, before being rejected"""
+    admission_control_queue_timeout: float = 10
+    """Delay (in seconds) of the Retry-After header of the rejected requests"""
+    admission_control_retry_after: int = 5
 
     """Observability Setting"""
     observability_provider_max_retries: int = 0
     """Request timeout (in seconds)."""
     observability_provider_timeout: int = 3
 
+    """Secret cache: secrets fetched from a Secret Manager are kept for secret_cache_ttl seconds"""
+    secret_cache_enabled: bool = True
+    secret_cache_ttl: int = 900
+    """Time (in seconds) before expiration from which a secret is refreshed in the background"""
+    secret_cache_refresh_ahead: int = 120
+
     """GCP"""
     # GCP project ID used for GCP Secrets
     gcp_project_id: Optional[str] = Field(alias='tock_gcp_project_id', default=None)
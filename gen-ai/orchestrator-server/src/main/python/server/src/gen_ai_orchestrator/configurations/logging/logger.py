@@ -12,16 +12,190 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 #
-"""Managing logging configuration"""
+"""
+Managing logging configuration.
+Besides the synchronous console handler, the logging configuration files can use:
+    - QueueStreamHandler: the records are queued, and written by a background thread (QueueListener),
+      so that no I/O happens on the event loop
+    - JsonFormatter: a JSON object by record (structured logs)
+The debug logs of chatty loggers can be sampled (application_logging_sampling setting).
+"""
 
+import json
 import logging
 import logging.config
+import queue
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+from path import Path
 
 from gen_ai_orchestrator.configurations.environment.settings import (
     application_settings,
+    is_prod_environment,
+)
+from gen_ai_orchestrator.utils.metrics.metrics import counter
+
+dropped_records_counter = counter(
+    'gen_ai_orchestrator_log_records_dropped_total',
+    'Number of log records dropped because the logging queue was full.',
 )
 
+# The attributes of a LogRecord, the other ones are given as "extra"
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {'message', 'asctime'}
+
+
+class JsonFormatter(logging.Formatter):
+    """A formatter writing each record as a JSON object (one per line)."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'timestamp': datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec='milliseconds'
+            ),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'process': record.process,
+            'function': record.funcName,
+            'line': record.lineno,
+        }
+        entry.update(
+            (key, value)
+            for key, value in vars(record).items()
+            if key not in _RECORD_ATTRIBUTES and not key.startswith('_')
+        )
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class QueueStreamHandler(QueueHandler):
+    """
+    A stream handler that does not block the logging threads (nor the event loop):
+    the records are put in a bounded queue, and written to the stream by a background thread.
+    When the queue is full, the records are dropped (and counted) instead of waiting.
+    """
+
+    def __init__(self, stream=None, max_size: Optional[int] = None):
+        """
+        Args:
+            stream: The output stream (sys.stderr if not set)
+            max_size: The maximum number of records in the queue (application_logging_queue_max_size if not set)
+        """
+        super().__init__(
+            queue.Queue(max_size or application_settings.application_logging_queue_max_size)
+        )
+        self.stream_handler = logging.StreamHandler(stream)
+        self.listener = QueueListener(self.queue, self.stream_handler)
+        self.listener.start()
+        self._listening = True
+
+    def setFormatter(self, fmt: Optional[logging.Formatter]) -> None:
+        # The records are formatted by the background thread
+        self.stream_handler.setFormatter(fmt)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Prepare a record for the queue: its message and exception are rendered now
+        (the arguments may change afterwards), its formatting is left to the background thread.
+        """
+        record = logging.makeLogRecord(vars(record))
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            dropped_records_counter.inc()
+
+    def flush(self) -> None:
+        self.stream_handler.flush()
+
+    def close(self) -> None:
+        """Write the queued records, then stop the background thread."""
+        if self._listening:
+            self._listening = False
+            self.listener.stop()
+        self.stream_handler.close()
+        super().close()
+
+
+class SamplingFilter(logging.Filter):
+    """
+    A filter keeping a sample of the debug records of some loggers (and of their children):
+    with a rate of 0.01, 1 record out of 100 is kept. The other records are all kept.
+    """
+
+    def __init__(self, rates: Dict[str, float], level: int = logging.INFO):
+        """
+        Args:
+            rates: The sampling rate (between 0 and 1), by logger name
+            level: The records below this level are sampled
+        """
+        super().__init__()
+        self.rates = rates
+        self.level = level
+        self._counts: Dict[str, int] = {}
+
+    def _rate(self, logger_name: str) -> Optional[float]:
+        """The sampling rate of a logger: the one of its closest configured ancestor."""
+        name = logger_name
+        while name:
+            if name in self.rates:
+                return self.rates[name]
+            name = name.rpartition('.')[0]
+        return None
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= self.level:
+            return True
+        rate = self._rate(record.name)
+        if rate is None or rate >= 1:
+            return True
+        if rate <= 0:
+            return False
+        # Keep the first record, then 1 out of every 1/rate records
+        count = self._counts.get(record.name, 0)
+        self._counts[record.name] = count + 1
+        return count % round(1 / rate) == 0
+
+
+def get_logging_config_ini() -> str:
+    """The logging configuration file: the configured one, or the one of the environment profile."""
+    if application_settings.application_logging_config_ini:
+        return application_settings.application_logging_config_ini
+    return Path(__file__).dirname() / ('config_prod.ini' if is_prod_environment else 'config.ini')
+
 
 def setup_logging():
     """Setting up a logging configuration based on an ini file"""
-    logging.config.fileConfig(application_settings.application_logging_config_ini)
+    logging.config.fileConfig(get_logging_config_ini())
+
+    if application_settings.application_logging_sampling:
+        sampling_filter = SamplingFilter(application_settings.application_logging_sampling)
+        for handler in _configured_handlers():
+            handler.addFilter(sampling_filter)
+
+
+def _configured_handlers() -> list:
+    """The handlers of the root logger, and of the other configured loggers."""
+    loggers = [logging.getLogger()] + [
+        logger
+        for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger)
+    ]
+    handlers = []
+    for logger in loggers:
+        for handler in logger.handlers:
+            if handler not in handlers:
+                handlers.append(handler)
+    return handlers
@@ -89,3 +89,12 @@ class AIProviderAPIContextLengthExceededException(GenAIOrchestratorException):
         super().__init__(
             ErrorCode.AI_PROVIDER_API_CONTEXT_LENGTH_EXCEEDED_BAD_REQUEST, info
         )
+
+
+class AIProviderCircuitOpenException(GenAIOrchestratorException):
+    """
+    The circuit breaker of the AI Provider endpoint is open: the request is rejected without being sent.
+    """
+
+    def __init__(self, info: ErrorInfo):
+        super().__init__(ErrorCode.AI_PROVIDER_CIRCUIT_OPEN, info)
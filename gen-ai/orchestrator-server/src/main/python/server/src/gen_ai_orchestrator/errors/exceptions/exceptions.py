@@ -91,3 +91,9 @@ class GenAIPromptTemplateException(GenAIOrchestratorException):
     def __init__(self, info: ErrorInfo):
         super().__init__(ErrorCode.GEN_AI_PROMPT_TEMPLATE_ERROR, info)
 
+
+class GenAIServerOverloadedException(GenAIOrchestratorException):
+    """The request is rejected by the admission control (too many requests being processed)"""
+
+    def __init__(self, info: ErrorInfo):
+        super().__init__(ErrorCode.GEN_AI_SERVER_OVERLOADED, info)
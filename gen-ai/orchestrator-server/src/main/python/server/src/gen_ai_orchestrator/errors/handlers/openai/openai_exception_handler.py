@@ -14,16 +14,10 @@
 #
 """Module of the OpenAI handlers"""
 
+import inspect
 import logging
-
-from openai import (
-    APIConnectionError,
-    APIError,
-    AuthenticationError,
-    BadRequestError,
-    NotFoundError,
-    OpenAIError,
-)
+import sys
+from typing import TYPE_CHECKING
 
 from gen_ai_orchestrator.errors.exceptions.ai_provider.ai_provider_exceptions import (
     AIProviderAPIBadRequestException,
@@ -37,8 +31,14 @@ from gen_ai_orchestrator.errors.exceptions.exceptions import (
     GenAIAuthenticationException,
     GenAIConnectionErrorException,
 )
+from gen_ai_orchestrator.errors.handlers.stream.stream_exception_handler import (
+    stream_exception_handler,
+)
 from gen_ai_orchestrator.models.errors.errors_models import ErrorInfo
 
+if TYPE_CHECKING:
+    from openai import BadRequestError, NotFoundError, OpenAIError
+
 logger = logging.getLogger(__name__)
 
 
@@ -53,39 +53,64 @@ def openai_exception_handler(provider: str):
     def decorator(func):
         """A decorator of handler function"""
 
+        if inspect.isasyncgenfunction(func):
+            return stream_exception_handler(func, decorator)
+
         async def wrapper(*args, **kwargs):
             """Exception handling logic"""
 
             try:
                 return await func(*args, **kwargs)
-            except APIConnectionError as exc:
-                logger.error(exc)
-                raise GenAIConnectionErrorException(
-                    create_error_info_openai(exc, provider)
-                )
-            except AuthenticationError as exc:
-                logger.error(exc)
-                raise GenAIAuthenticationException(
-                    create_error_info_openai(exc, provider)
-                )
-            except NotFoundError as exc:
-                logger.error(exc)
-                _manage_not_found_error(exc, provider)
-            except BadRequestError as exc:
-                logger.error(exc)
-                _manage_bad_request_error(exc, provider)
-            except APIError as exc:
-                logger.error(exc)
-                raise AIProviderAPIErrorException(
-                    create_error_info_openai(exc, provider)
-                )
+            except Exception as exc:
+                # The OpenAI SDK is only loaded by the deployments using it:
+                # if it is not loaded, the error cannot be an OpenAI error.
+                openai = sys.modules.get('openai')
+                if openai is None or not isinstance(exc, openai.OpenAIError):
+                    raise
+                _manage_openai_error(exc, provider)
 
         return wrapper
 
     return decorator
 
 
-def create_error_info_openai(exc: OpenAIError, provider: str) -> ErrorInfo:
+def _manage_openai_error(exc: 'OpenAIError', provider: str):
+    """
+    Manage an OpenAI error
+
+    Args:
+        exc: the OpenAI error
+        provider: the AI provider type
+    Returns:
+        Raise a specific Gen AI Orchestrator exception according to the OpenAI error type
+    """
+    from openai import (
+        APIConnectionError,
+        APIError,
+        AuthenticationError,
+        BadRequestError,
+        NotFoundError,
+    )
+
+    if isinstance(exc, APIConnectionError):
+        logger.error(exc)
+        raise GenAIConnectionErrorException(create_error_info_openai(exc, provider))
+    elif isinstance(exc, AuthenticationError):
+        logger.error(exc)
+        raise GenAIAuthenticationException(create_error_info_openai(exc, provider))
+    elif isinstance(exc, NotFoundError):
+        logger.error(exc)
+        _manage_not_found_error(exc, provider)
+    elif isinstance(exc, BadRequestError):
+        logger.error(exc)
+        _manage_bad_request_error(exc, provider)
+    elif isinstance(exc, APIError):
+        logger.error(exc)
+        raise AIProviderAPIErrorException(create_error_info_openai(exc, provider))
+    raise exc
+
+
+def create_error_info_openai(exc: 'OpenAIError', provider: str) -> ErrorInfo:
     """
     Create ErrorInfo for a OpenAI error
 
@@ -95,6 +120,7 @@ def create_error_info_openai(exc: OpenAIError, provider: str) -> ErrorInfo:
     Returns:
         The ErrorInfo with the OpenAI error parameters
     """
+    from openai import APIError
 
     if isinstance(exc, APIError):
         return ErrorInfo(
@@ -109,7 +135,7 @@ def create_error_info_openai(exc: OpenAIError, provider: str) -> ErrorInfo:
         )
 
 
-def _manage_not_found_error(exc: NotFoundError, provider: str):
+def _manage_not_found_error(exc: 'NotFoundError', provider: str):
     """
     Manage a not found error
 
@@ -132,7 +158,7 @@ def _manage_not_found_error(exc: NotFoundError, provider: str):
         )
 
 
-def _manage_bad_request_error(exc: BadRequestError, provider: str):
+def _manage_bad_request_error(exc: 'BadRequestError', provider: str):
     """
     Manage a bad request error
 
@@ -14,17 +14,10 @@
 #
 """Module of the OpenSearch handlers"""
 
+import inspect
 import logging
-from typing import Union
-
-from opensearchpy import (
-    AuthenticationException as OpenSearchAuthenticationException,
-)
-from opensearchpy import ConnectionError as OpenSearchConnectionError
-from opensearchpy import ImproperlyConfigured as OpenSearchImproperlyConfigured
-from opensearchpy import NotFoundError as OpenSearchNotFoundError
-from opensearchpy import OpenSearchDslException, OpenSearchException
-from opensearchpy import TransportError as OpenSearchTransportError
+import sys
+from typing import TYPE_CHECKING, Union
 
 from gen_ai_orchestrator.errors.exceptions.exceptions import (
     GenAIAuthenticationException,
@@ -36,48 +29,84 @@ from gen_ai_orchestrator.errors.exceptions.vector_store.opensearch_exceptions im
     GenAIOpenSearchSettingException,
     GenAIOpenSearchTransportException,
 )
+from gen_ai_orchestrator.errors.handlers.stream.stream_exception_handler import (
+    stream_exception_handler,
+)
 from gen_ai_orchestrator.models.errors.errors_models import ErrorInfo
 
+if TYPE_CHECKING:
+    from opensearchpy import ImproperlyConfigured as OpenSearchImproperlyConfigured
+    from opensearchpy import OpenSearchDslException, OpenSearchException
+
 logger = logging.getLogger(__name__)
 
 
 def opensearch_exception_handler(func):
     """A decorator function for managing OpenSearch exceptions"""
 
+    if inspect.isasyncgenfunction(func):
+        return stream_exception_handler(func, opensearch_exception_handler)
+
     async def wrapper(*args, **kwargs):
         """Exception handling logic"""
 
         try:
             return await func(*args, **kwargs)
-        except OpenSearchImproperlyConfigured as exc:
-            logger.error(exc)
-            raise GenAIOpenSearchSettingException(create_error_info_opensearch(exc))
-        except OpenSearchConnectionError as exc:
-            logger.error(exc)
-            raise GenAIConnectionErrorException(create_error_info_opensearch(exc))
-        except OpenSearchAuthenticationException as exc:
-            logger.error(exc)
-            raise GenAIAuthenticationException(create_error_info_opensearch(exc))
-        except OpenSearchNotFoundError as exc:
-            logger.error(exc)
-            if 'index_not_found_exception' == exc.error:
-                raise GenAIOpenSearchIndexNotFoundException(
-                    create_error_info_opensearch(exc)
-                )
-            else:
-                raise GenAIOpenSearchResourceNotFoundException(
-                    create_error_info_opensearch(exc)
-                )
-        except OpenSearchTransportError as exc:
-            logger.error(exc)
-            raise GenAIOpenSearchTransportException(create_error_info_opensearch(exc))
+        except Exception as exc:
+            # opensearch-py is only loaded by the deployments using it:
+            # if it is not loaded, the error cannot be an OpenSearch error.
+            if 'opensearchpy' not in sys.modules:
+                raise
+            _manage_opensearch_error(exc)
 
     return wrapper
 
 
+def _manage_opensearch_error(exc: Exception):
+    """
+    Manage an OpenSearch error
+
+    Args:
+        exc: the error
+    Returns:
+        Raise a specific Gen AI Orchestrator exception according to the OpenSearch error type
+    """
+    from opensearchpy import (
+        AuthenticationException as OpenSearchAuthenticationException,
+    )
+    from opensearchpy import ConnectionError as OpenSearchConnectionError
+    from opensearchpy import ImproperlyConfigured as OpenSearchImproperlyConfigured
+    from opensearchpy import NotFoundError as OpenSearchNotFoundError
+    from opensearchpy import TransportError as OpenSearchTransportError
+
+    if isinstance(exc, OpenSearchImproperlyConfigured):
+        logger.error(exc)
+        raise GenAIOpenSearchSettingException(create_error_info_opensearch(exc))
+    elif isinstance(exc, OpenSearchConnectionError):
+        logger.error(exc)
+        raise GenAIConnectionErrorException(create_error_info_opensearch(exc))
+    elif isinstance(exc, OpenSearchAuthenticationException):
+        logger.error(exc)
+        raise GenAIAuthenticationException(create_error_info_opensearch(exc))
+    elif isinstance(exc, OpenSearchNotFoundError):
+        logger.error(exc)
+        if 'index_not_found_exception' == exc.error:
+            raise GenAIOpenSearchIndexNotFoundException(
+                create_error_info_opensearch(exc)
+            )
+        else:
+            raise GenAIOpenSearchResourceNotFoundException(
+                create_error_info_opensearch(exc)
+            )
+    elif isinstance(exc, OpenSearchTransportError):
+        logger.error(exc)
+        raise GenAIOpenSearchTransportException(create_error_info_opensearch(exc))
+    raise exc
+
+
 def create_error_info_opensearch(
     exc: Union[
-        OpenSearchImproperlyConfigured, OpenSearchException, OpenSearchDslException
+        'OpenSearchImproperlyConfigured', 'OpenSearchException', 'OpenSearchDslException'
     ],
     provider: str = 'OpenSearch',
 ) -> ErrorInfo:
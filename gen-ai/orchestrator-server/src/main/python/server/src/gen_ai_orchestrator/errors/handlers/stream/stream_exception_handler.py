@@ -0,0 +1,49 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""Module of the stream handlers"""
+
+from typing import AsyncIterator, Callable
+
+
+def stream_exception_handler(func, exception_handler: Callable) -> Callable:
+    """
+    Apply an exception handler decorator to an async generator function.
+    The handler is applied to the production of each item, so that the errors raised
+    while streaming are managed like those of a coroutine function.
+
+    Args:
+        func: The async generator function
+        exception_handler: The exception handler decorator (of coroutine functions)
+    Returns:
+        The decorated async generator function
+    """
+
+    next_item = exception_handler(anext)
+
+    async def wrapper(*args, **kwargs) -> AsyncIterator:
+        """Exception handling logic"""
+
+        stream = func(*args, **kwargs)
+        try:
+            while True:
+                try:
+                    item = await next_item(stream)
+                except StopAsyncIteration:
+                    return
+                yield item
+        finally:
+            await stream.aclose()
+
+    return wrapper
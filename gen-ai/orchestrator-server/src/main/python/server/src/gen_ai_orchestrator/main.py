@@ -14,7 +14,9 @@
 #
 """Main module to create and launch FastAPI application"""
 
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
@@ -26,6 +28,13 @@ from gen_ai_orchestrator.errors.handlers.fastapi.fastapi_handler import (
     business_exception_handler,
     generic_exception_handler,
 )
+from gen_ai_orchestrator.middlewares.admission_control_middleware import (
+    AdmissionControlMiddleware,
+)
+from gen_ai_orchestrator.middlewares.metrics_middleware import MetricsMiddleware
+from gen_ai_orchestrator.middlewares.server_timing_middleware import (
+    ServerTimingMiddleware,
+)
 from gen_ai_orchestrator.routers.app_monitors_router import (
     application_check_router,
 )
@@ -45,20 +54,51 @@ from gen_ai_orchestrator.routers.rag_router import rag_router
 from gen_ai_orchestrator.routers.vector_store_providers_router import (
     vector_store_providers_router,
 )
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.pgvector_engine_registry import (
+    dispose_pgvector_engines,
+)
+from gen_ai_orchestrator.services.warmup.warmup_service import warm_up
+from gen_ai_orchestrator.utils.http.async_http_client import (
+    close_async_http_clients,
+    close_http_clients,
+)
 
 # configure logging
 setup_logging()
 logger = logging.getLogger(__name__)
 logger.info('Logging configuration completed')
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """
+    Application lifespan: warm up on startup (in the background, the liveness check answers
+    meanwhile and the readiness check once done), release the shared resources on shutdown.
+    """
+    logger.info('Generative AI Orchestrator - Warm-up')
+    warmup_task = asyncio.create_task(warm_up())
+    yield
+    logger.info('Generative AI Orchestrator - Shutdown')
+    warmup_task.cancel()
+    await dispose_pgvector_engines()
+    await close_async_http_clients()
+    close_http_clients()
+
+
 logger.info('Generative AI Orchestrator - Starting...')
-app = FastAPI(title='Generative AI Orchestrator')
+app = FastAPI(title='Generative AI Orchestrator', lifespan=lifespan)
 
 # Add functional exception handler
 logger.info('Generative AI Orchestrator - Add exception handlers')
 app.add_exception_handler(GenAIOrchestratorException, business_exception_handler)
 app.add_exception_handler(Exception, generic_exception_handler)
 
+logger.info('Generative AI Orchestrator - Add admission control and metrics middlewares')
+# The admission control is the innermost middleware: the rejected requests are measured too
+app.add_middleware(AdmissionControlMiddleware)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(ServerTimingMiddleware)
+
 logger.info('Generative AI Orchestrator - Add routers')
 app.include_router(application_check_router)
 app.include_router(llm_providers_router)
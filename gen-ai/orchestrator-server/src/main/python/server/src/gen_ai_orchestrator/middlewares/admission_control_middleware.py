@@ -0,0 +1,372 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Module of the admission control middleware: the requests of a route class (production RAG and QA, playground
+completion, provider setting checks) are processed up to a concurrency limit, queued beyond it, and rejected
+(503 with a Retry-After header) beyond the queue size. The queued requests are admitted by route class priority.
+The limits apply by worker process. A RAG batch is not admitted as a whole: each of its items is (see admission).
+"""
+
+import asyncio
+import bisect
+import itertools
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import Enum, unique
+from typing import AsyncIterator, Dict, List, Optional
+
+from fastapi import status
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
+from gen_ai_orchestrator.errors.exceptions.exceptions import (
+    GenAIServerOverloadedException,
+)
+from gen_ai_orchestrator.errors.handlers.fastapi.fastapi_handler import (
+    create_error_response,
+)
+from gen_ai_orchestrator.middlewares.metrics_middleware import get_route_path
+from gen_ai_orchestrator.models.errors.errors_models import ErrorInfo
+from gen_ai_orchestrator.utils.metrics.metrics import counter, gauge, histogram
+
+logger = logging.getLogger(__name__)
+
+
+@unique
+class RouteClass(str, Enum):
+    """Enumeration to list the route classes under admission control"""
+
+    RAG = 'rag'
+    QA = 'qa'
+    COMPLETION = 'completion'
+    PROVIDER_STATUS = 'provider_status'
+
+
+# The admission priority of the route classes (the lowest first): production, playground, then provider checks
+ROUTE_CLASS_PRIORITIES = {
+    RouteClass.RAG: 0,
+    RouteClass.QA: 0,
+    RouteClass.COMPLETION: 1,
+    RouteClass.PROVIDER_STATUS: 2,
+}
+
+# The RAG batch route: its items are admitted one by one (a batch runs several RAG chains at once)
+RAG_BATCH_ROUTE = '/rag/batch'
+
+# The reasons of the rejected requests
+QUEUE_FULL = 'queue_full'
+QUEUE_TIMEOUT = 'queue_timeout'
+
+admitted_requests_gauge = gauge(
+    'gen_ai_orchestrator_admission_in_flight',
+    'Number of admitted requests being processed, by route class.',
+    label_names=('route_class',),
+)
+queue_depth_gauge = gauge(
+    'gen_ai_orchestrator_admission_queue_depth',
+    'Number of requests waiting for admission, by route class.',
+    label_names=('route_class',),
+)
+queue_wait_histogram = histogram(
+    'gen_ai_orchestrator_admission_queue_wait_seconds',
+    'Time (in seconds) the queued requests waited for admission (or rejection).',
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+    label_names=('route_class',),
+)
+rejected_requests_counter = counter(
+    'gen_ai_orchestrator_admission_rejected_requests_total',
+    'Number of requests rejected by the admission control, by route class and reason.',
+    label_names=('route_class', 'reason'),
+)
+
+
+def get_route_class(route: str) -> Optional[RouteClass]:
+    """
+    Get the class of a route.
+
+    Args:
+        route: The route path (/rag, /llm-providers/{provider_id}/setting/status...)
+    Returns:
+        The route class, or None if the route is not under admission control (monitors, providers lists...).
+    """
+    if route == RAG_BATCH_ROUTE:
+        return None
+    if route == '/rag' or route.startswith('/rag/'):
+        return RouteClass.RAG
+    if route == '/qa' or route.startswith('/qa/'):
+        return RouteClass.QA
+    if route == '/completion' or route.startswith('/completion/'):
+        return RouteClass.COMPLETION
+    if route.endswith('/setting/status'):
+        return RouteClass.PROVIDER_STATUS
+    return None
+
+
+@dataclass(order=True)
+class _Waiter:
+    """A queued request, ordered by priority then arrival"""
+
+    priority: int
+    sequence: int
+    route_class: RouteClass = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+class AdmissionController:
+    """
+    The admission controller of the requests, by route class.
+    It is not thread-safe: it is used by the event loop of the application.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: Optional[int] = None,
+        route_max_in_flight: Optional[Dict[str, int]] = None,
+        route_queue_size: Optional[Dict[str, int]] = None,
+        queue_timeout: float = 10,
+    ):
+        """
+        Args:
+            max_in_flight: The maximum number of requests processed concurrently, all route classes together
+            route_max_in_flight: The maximum number of requests processed concurrently, by route class
+                (not limited for a route class not given)
+            route_queue_size: The maximum number of queued requests, by route class
+                (no queue for a route class not given)
+            queue_timeout: The maximum time (in seconds) a request waits in queue
+        """
+        self.max_in_flight = max_in_flight
+        self.route_max_in_flight = route_max_in_flight or {}
+        self.route_queue_size = route_queue_size or {}
+        self.queue_timeout = queue_timeout
+        self._in_flight: Dict[RouteClass, int] = {
+            route_class: 0 for route_class in RouteClass
+        }
+        self._total_in_flight = 0
+        self._queued: Dict[RouteClass, int] = {
+            route_class: 0 for route_class in RouteClass
+        }
+        self._waiters: List[_Waiter] = []
+        self._sequence = itertools.count()
+
+    def in_flight(self, route_class: RouteClass) -> int:
+        """The number of admitted requests of a route class, being processed."""
+        return self._in_flight[route_class]
+
+    def queue_depth(self, route_class: RouteClass) -> int:
+        """The number of queued requests of a route class."""
+        return self._queued[route_class]
+
+    async def acquire(self, route_class: RouteClass) -> None:
+        """
+        Admit a request: at once if the concurrency limits allow it, once a queued request is admitted otherwise.
+        The admitted request must be released.
+
+        Args:
+            route_class: The request route class
+        Raises:
+            GenAIServerOverloadedException: The route class queue is full, or the request was not admitted in time.
+        """
+        if self._can_run(route_class):
+            self._admit(route_class)
+            return
+
+        queue_size = self.route_queue_size.get(route_class.value, 0)
+        if self._queued[route_class] >= queue_size:
+            raise self._rejection(
+                route_class,
+                QUEUE_FULL,
+                f'The {route_class.value} requests queue is full ({queue_size} requests).',
+            )
+
+        waiter = _Waiter(
+            priority=ROUTE_CLASS_PRIORITIES[route_class],
+            sequence=next(self._sequence),
+            route_class=route_class,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        bisect.insort(self._waiters, waiter)
+        self._queued[route_class] += 1
+        queue_depth_gauge.inc(route_class=route_class.value)
+
+        start_time = time.perf_counter()
+        try:
+            await asyncio.wait_for(waiter.future, self.queue_timeout)
+        except BaseException as exc:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Admitted while being cancelled
+                self.release(route_class)
+            else:
+                self._dequeue(waiter)
+            if isinstance(exc, asyncio.TimeoutError):
+                raise self._rejection(
+                    route_class,
+                    QUEUE_TIMEOUT,
+                    f'The request was not admitted within {self.queue_timeout}s.',
+                ) from None
+            raise
+        finally:
+            queue_wait_histogram.observe(
+                time.perf_counter() - start_time, route_class=route_class.value
+            )
+
+    @asynccontextmanager
+    async def admitted(self, route_class: RouteClass) -> AsyncIterator[None]:
+        """
+        Admit a request for the time of the context, then release it.
+
+        Args:
+            route_class: The request route class
+        Raises:
+            GenAIServerOverloadedException: The request is rejected.
+        """
+        await self.acquire(route_class)
+        try:
+            yield
+        finally:
+            self.release(route_class)
+
+    def release(self, route_class: RouteClass) -> None:
+        """
+        Release an admitted request, and admit the queued requests that can now be processed.
+
+        Args:
+            route_class: The request route class
+        """
+        self._in_flight[route_class] -= 1
+        self._total_in_flight -= 1
+        admitted_requests_gauge.dec(route_class=route_class.value)
+
+        for waiter in list(self._waiters):
+            if (
+                self.max_in_flight is not None
+                and self._total_in_flight >= self.max_in_flight
+            ):
+                break
+            if waiter.future.done():
+                self._dequeue(waiter)
+            elif self._can_run(waiter.route_class):
+                self._dequeue(waiter)
+                self._admit(waiter.route_class)
+                waiter.future.set_result(None)
+
+    def _can_run(self, route_class: RouteClass) -> bool:
+        route_max_in_flight = self.route_max_in_flight.get(route_class.value)
+        return (
+            self.max_in_flight is None or self._total_in_flight < self.max_in_flight
+        ) and (
+            route_max_in_flight is None
+            or self._in_flight[route_class] < route_max_in_flight
+        )
+
+    def _admit(self, route_class: RouteClass) -> None:
+        self._in_flight[route_class] += 1
+        self._total_in_flight += 1
+        admitted_requests_gauge.inc(route_class=route_class.value)
+
+    def _dequeue(self, waiter: _Waiter) -> None:
+        if waiter in self._waiters:
+            self._waiters.remove(waiter)
+            self._queued[waiter.route_class] -= 1
+            queue_depth_gauge.dec(route_class=waiter.route_class.value)
+
+    @staticmethod
+    def _rejection(
+        route_class: RouteClass, reason: str, cause: str
+    ) -> GenAIServerOverloadedException:
+        rejected_requests_counter.inc(route_class=route_class.value, reason=reason)
+        logger.warning('Request rejected by the admission control: %s', cause)
+        return GenAIServerOverloadedException(ErrorInfo(error=reason, cause=cause))
+
+
+# The admission controller of the application
+admission_controller = AdmissionController(
+    max_in_flight=application_settings.admission_control_max_in_flight,
+    route_max_in_flight=application_settings.admission_control_route_max_in_flight,
+    route_queue_size=application_settings.admission_control_route_queue_size,
+    queue_timeout=application_settings.admission_control_queue_timeout,
+)
+
+
+@asynccontextmanager
+async def admission(route_class: RouteClass) -> AsyncIterator[None]:
+    """
+    Admit a unit of work that is not an HTTP request (a RAG batch item) with the application admission
+    controller, if the admission control is enabled.
+
+    Args:
+        route_class: The route class of the work
+    Raises:
+        GenAIServerOverloadedException: The work is rejected.
+    """
+    if not application_settings.admission_control_enabled:
+        yield
+        return
+    async with admission_controller.admitted(route_class):
+        yield
+
+
+class AdmissionControlMiddleware:
+    """An ASGI middleware applying the admission control to the HTTP requests of the route classes."""
+
+    def __init__(
+        self, app: ASGIApp, controller: Optional[AdmissionController] = None
+    ):
+        """
+        Args:
+            app: The ASGI application
+            controller: The admission controller (the one of the application by default)
+        """
+        self.app = app
+        self.controller = controller or admission_controller
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope['type'] != 'http'
+            or not application_settings.admission_control_enabled
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        route_class = get_route_class(get_route_path(scope))
+        if route_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await self.controller.acquire(route_class)
+        except GenAIServerOverloadedException as exc:
+            exc.info.request = f'[{scope["method"]}] {scope["path"]}'
+            response = JSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content=jsonable_encoder(create_error_response(exc)),
+                headers={
+                    'Retry-After': str(
+                        application_settings.admission_control_retry_after
+                    )
+                },
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(route_class)
@@ -0,0 +1,90 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Module of the HTTP metrics middleware: the in-flight requests and the requests durations, by route.
+"""
+
+import time
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from gen_ai_orchestrator.utils.metrics.metrics import gauge, histogram
+
+in_flight_requests_gauge = gauge(
+    'gen_ai_orchestrator_http_requests_in_flight',
+    'Number of HTTP requests being processed.',
+    label_names=('route',),
+)
+request_duration_histogram = histogram(
+    'gen_ai_orchestrator_http_request_duration_seconds',
+    'Duration (in seconds) of the HTTP requests, until their response is sent.',
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+    label_names=('route', 'method', 'status'),
+)
+
+# The route label of the requests that do not match any route (not to expose their path)
+UNMATCHED_ROUTE = 'unmatched'
+
+
+def get_route_path(scope: Scope) -> str:
+    """
+    Get the path template of the route matching a request.
+
+    Args:
+        scope: The request scope
+    Returns:
+        The route path (/rag, /llm-providers/{provider_id}/setting/status...), or 'unmatched'.
+    """
+    app = scope.get('app')
+    for route in getattr(getattr(app, 'router', None), 'routes', []):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, 'path', UNMATCHED_ROUTE)
+    return UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """An ASGI middleware measuring the HTTP requests (the streamed responses until their end)."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        route = get_route_path(scope)
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await send(message)
+
+        start_time = time.perf_counter()
+        in_flight_requests_gauge.inc(route=route)
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_flight_requests_gauge.dec(route=route)
+            request_duration_histogram.observe(
+                time.perf_counter() - start_time,
+                route=route,
+                method=scope['method'],
+                status=str(status_code),
+            )
@@ -0,0 +1,59 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Module of the Server-Timing middleware: the stage timings of a request are sent in its Server-Timing header.
+"""
+
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from gen_ai_orchestrator.services.langchain.callbacks.stage_metrics_callback_handler import (
+    StageTimings,
+    request_stage_timings,
+)
+
+SERVER_TIMING_HEADER = 'Server-Timing'
+
+
+class ServerTimingMiddleware:
+    """
+    An ASGI middleware recording the stage timings of the HTTP requests, sent in their Server-Timing header
+    with their total duration. The streamed responses only hold the stages completed before their first byte.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        stage_timings = StageTimings()
+        request_stage_timings.set(stage_timings)
+        start_time = time.perf_counter()
+
+        async def send_with_server_timing(message: Message) -> None:
+            if message['type'] == 'http.response.start' and stage_timings:
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    SERVER_TIMING_HEADER,
+                    stage_timings.server_timing(time.perf_counter() - start_time),
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_server_timing)
@@ -35,6 +35,7 @@ class ErrorCode(Enum):
     GEN_AI_UNKNOWN_PROVIDER_SETTING = 1003
     GEN_AI_GUARD_CHECK_ERROR = 1004
     GEN_AI_PROMPT_TEMPLATE_ERROR = 1005
+    GEN_AI_SERVER_OVERLOADED = 1006
 
     # AI Provider Errors
     AI_PROVIDER_UNKNOWN = 2000
@@ -45,6 +46,7 @@ class ErrorCode(Enum):
     AI_PROVIDER_API_DEPLOYMENT_NOT_FOUND = 2005
     AI_PROVIDER_API_BAD_REQUEST = 2006
     AI_PROVIDER_API_CONTEXT_LENGTH_EXCEEDED_BAD_REQUEST = 2007
+    AI_PROVIDER_CIRCUIT_OPEN = 2008
 
     # Vector Store Errors
     VECTOR_STORE_UNKNOWN_PROVIDER = 3000
@@ -148,6 +150,10 @@ class ErrorMessages:
             message='Prompt Template Error.',
             detail='Check the template syntax.',
         ),
+        ErrorCode.GEN_AI_SERVER_OVERLOADED: ErrorMessage(
+            message='Server overloaded.',
+            detail='Too many requests are being processed: retry after the Retry-After delay.',
+        ),
         # AI Provider Errors
         ErrorCode.AI_PROVIDER_UNKNOWN: ErrorMessage(message='Unknown AI Provider.'),
         ErrorCode.AI_PROVIDER_BAD_REQUEST: ErrorMessage(
@@ -173,6 +179,11 @@ class ErrorMessages:
             message="The model's context length has been exceeded.",
             detail='Reduce the length of the prompt message.',
         ),
+        ErrorCode.AI_PROVIDER_CIRCUIT_OPEN: ErrorMessage(
+            message='AI Provider unavailable.',
+            detail='The recent requests to the provider endpoint failed or were too slow: '
+            'they are rejected until it recovers (circuit breaker open).',
+        ),
         # Vector Store Errors
         ErrorCode.VECTOR_STORE_UNKNOWN_PROVIDER: ErrorMessage(
             message='Unknown vector store provider.'
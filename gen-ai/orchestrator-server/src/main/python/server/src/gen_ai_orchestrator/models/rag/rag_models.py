@@ -15,7 +15,7 @@
 """Module for RAG Models"""
 
 from enum import Enum, unique
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import AnyUrl, BaseModel, Field, HttpUrl
 
@@ -209,6 +209,47 @@ class QADebugData(BaseModel):
     )
 
 
+class SemanticCacheDebugData(BaseModel):
+    """The semantic answer cache debug data"""
+
+    hit: bool = Field(
+        description='It indicates whether the answer was found in the cache.',
+        examples=[True],
+    )
+    similarity: Optional[float] = Field(
+        description='The similarity of the cached question (on a hit).',
+        examples=[0.97],
+        default=None,
+    )
+    hits: int = Field(description='The number of cache hits.', examples=[12])
+    misses: int = Field(description='The number of cache misses.', examples=[30])
+
+
+class ContextPackingDebugData(BaseModel):
+    """The context packing debug data"""
+
+    packed_documents: int = Field(
+        description='The number of documents packed into the prompt context (truncated or not).',
+        examples=[4],
+    )
+    truncated_documents: int = Field(
+        description='The number of documents truncated (at a sentence boundary) to fit in the token budget.',
+        examples=[1],
+    )
+    dropped_documents: int = Field(
+        description='The number of documents that did not fit in the token budget.',
+        examples=[2],
+    )
+    dropped_history_messages: int = Field(
+        description='The number of (oldest) chat history messages that did not fit in the token budget.',
+        examples=[0],
+    )
+    tokens: int = Field(
+        description='The number of tokens of the packed documents and chat history.',
+        examples=[5830],
+    )
+
+
 class RAGDebugData(QADebugData):
     """A RAG debug data"""
 
@@ -232,3 +273,32 @@ class RAGDebugData(QADebugData):
         ],
     )
     answer: LLMAnswer = Field(description='The RAG answer.')
+    stage_timings: Optional[Dict[str, float]] = Field(
+        description='The total durations (in seconds) of the RAG stages (condensation, query_embedding, '
+        'vector_search, rerank, answer, guardrail), in the order they were first recorded.',
+        examples=[{'condensation': 0.52, 'query_embedding': 0.04, 'vector_search': 0.12, 'answer': 3.1}],
+        default=None,
+    )
+    semantic_cache: Optional[SemanticCacheDebugData] = Field(
+        description='The semantic answer cache debug data (if the cache is enabled).',
+        default=None,
+    )
+    context_packing: Optional[ContextPackingDebugData] = Field(
+        description='The context packing debug data (not set for a cached answer).',
+        default=None,
+    )
+
+
+@unique
+class RAGStreamEventType(str, Enum):
+    """Enumeration to list the event types of a streamed RAG response"""
+
+    # A new part of the answer text
+    ANSWER = 'answer'
+    CONTEXT_USAGE = 'context_usage'
+    FOOTNOTES = 'footnotes'
+    OBSERVABILITY_INFO = 'observability_info'
+    DEBUG = 'debug'
+    # The complete LLM answer, which ends the stream
+    DONE = 'done'
+    ERROR = 'error'
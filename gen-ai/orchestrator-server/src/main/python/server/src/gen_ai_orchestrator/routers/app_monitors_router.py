@@ -16,8 +16,15 @@
 
 import logging
 
-from fastapi import APIRouter, status
-from pydantic import BaseModel
+from fastapi import APIRouter, Response, status
+from pydantic import BaseModel, Field
+
+from gen_ai_orchestrator.services.warmup.warmup_service import is_ready
+from gen_ai_orchestrator.utils.circuit_breaker import get_circuit_breakers
+from gen_ai_orchestrator.utils.metrics.prometheus import (
+    PROMETHEUS_CONTENT_TYPE,
+    generate_latest,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +40,25 @@ class AppCheckResponse(BaseModel):
     status: str = 'Ok'
 
 
+class CircuitBreakerResponse(BaseModel):
+    """The state of the circuit breaker of a provider endpoint"""
+
+    name: str = Field(
+        description='The provider endpoint.',
+        examples=['BloomzRerank:https://rerank.example.com'],
+    )
+    state: str = Field(
+        description='The circuit state: closed, open or half_open.', examples=['open']
+    )
+    calls: int = Field(description='The number of calls in the sliding window.')
+    error_rate: float = Field(description='The rate of failed calls in the window.')
+    slow_call_rate: float = Field(description='The rate of slow calls in the window.')
+    rejected_calls: int = Field(description='The number of rejected calls.')
+    open_remaining_seconds: float = Field(
+        description='The time (in seconds) before an open circuit becomes half-open.'
+    )
+
+
 @application_check_router.get(
     '/health-check',
     summary='Perform a health check',
@@ -73,3 +99,66 @@ def get_health() -> AppCheckResponse:
     """
     logger.debug('Liveness check -> OK')
     return AppCheckResponse(status='OK')
+
+
+@application_check_router.get(
+    '/readiness-check',
+    summary='Perform a readiness check',
+    response_description='Return HTTP status code 200 (OK) once the application is warmed up, 503 otherwise',
+    status_code=status.HTTP_200_OK,
+)
+def get_readiness(response: Response) -> AppCheckResponse:
+    """
+    ## Perform a Readiness Check
+    Endpoint to perform a readiness check on. The application is ready once its startup warm-up
+    is done (secrets resolved, provider modules and tokenizer encodings loaded, indexes warmed up):
+    until then, the endpoint returns HTTP status code 503, and no traffic should be routed to it.
+    Returns:
+        ReadinessCheck: Returns a JSON response with the readiness status
+    """
+    if not is_ready():
+        logger.debug('Readiness check -> Warming up')
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return AppCheckResponse(status='Warming up')
+    logger.debug('Readiness check -> OK')
+    return AppCheckResponse(status='OK')
+
+
+@application_check_router.get(
+    '/metrics',
+    summary='Get the application metrics',
+    response_description='The metrics, in the Prometheus text format',
+    status_code=status.HTTP_200_OK,
+    response_class=Response,
+)
+def get_metrics() -> Response:
+    """
+    ## Get the application metrics
+    Endpoint scraped by Prometheus: durations of the pipeline stages (condensation, query embedding,
+    vector search, rerank, answer, guardrail, response assembly), LLM tokens, in-flight HTTP requests,
+    and cache hits and misses.
+    Returns:
+        The metrics, in the Prometheus text format.
+    """
+    return Response(content=generate_latest(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@application_check_router.get(
+    '/circuit-breakers',
+    summary='Get the circuit breakers state',
+    response_description='The circuit breakers of the provider endpoints',
+    status_code=status.HTTP_200_OK,
+)
+def get_circuit_breakers_state() -> list[CircuitBreakerResponse]:
+    """
+    ## Get the circuit breakers state
+    The circuit breakers of the provider endpoints called so far (LLM, Vector Store, Bloomz rerank,
+    guardrail and embeddings): their state, and the error and slow call rates of their last calls.
+    While a circuit is open, the calls to its endpoint fail fast (or fall back).
+    Returns:
+        The circuit breakers state.
+    """
+    return [
+        CircuitBreakerResponse(**circuit_breaker.snapshot())
+        for circuit_breaker in get_circuit_breakers()
+    ]
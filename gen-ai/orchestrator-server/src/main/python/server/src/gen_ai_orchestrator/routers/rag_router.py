@@ -14,8 +14,11 @@
 #
 """RAG Router Module"""
 import logging
+from typing import AsyncIterable
 
 from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+from fastapi.sse import EventSourceResponse, ServerSentEvent
 
 from gen_ai_orchestrator.configurations.environment.settings import (
     application_settings,
@@ -23,17 +26,30 @@ from gen_ai_orchestrator.configurations.environment.settings import (
 from gen_ai_orchestrator.errors.exceptions.ai_provider.ai_provider_exceptions import (
     AIProviderBadRequestException,
 )
+from gen_ai_orchestrator.errors.exceptions.exceptions import (
+    GenAIOrchestratorException,
+    GenAIUnknownErrorException,
+)
 from gen_ai_orchestrator.errors.handlers.fastapi.fastapi_handler import (
     create_error_info_bad_request,
+    create_error_response,
 )
-from gen_ai_orchestrator.models.rag.rag_models import LLMAnswer
+from gen_ai_orchestrator.models.errors.errors_models import ErrorInfo
+from gen_ai_orchestrator.models.rag.rag_models import LLMAnswer, RAGStreamEventType
 from gen_ai_orchestrator.models.vector_stores.vector_store_types import (
     DocumentSearchParams,
     VectorStoreSetting,
 )
-from gen_ai_orchestrator.routers.requests.requests import RAGRequest
+from gen_ai_orchestrator.routers.requests.requests import (
+    RAGBatchRequest,
+    RAGRequest,
+)
 from gen_ai_orchestrator.routers.responses.responses import RAGResponse
-from gen_ai_orchestrator.services.rag.rag_service import rag
+from gen_ai_orchestrator.services.rag.rag_service import (
+    rag,
+    rag_batch,
+    rag_stream,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +73,84 @@ async def ask_rag(
     return await rag(request, debug)
 
 
+@rag_router.post('/stream', response_class=EventSourceResponse)
+async def ask_rag_stream(
+    http_request: Request, request: RAGRequest, debug: bool = False
+) -> AsyncIterable[ServerSentEvent]:
+    """
+    ## Ask a RAG System, with a streamed answer (Server-Sent Events)
+    Ask question to a RAG System, and stream its answer as soon as it is generated:
+    - `answer` events hold the successive parts of the answer text,
+    - `context_usage`, `footnotes`, `observability_info` (and `debug`) events are then sent,
+    - the `done` event holds the complete answer, and ends the stream.
+
+    An error ends the stream with an `error` event.
+    """
+    try:
+        # Check the consistency of the Vector Store Provider with the request body
+        validate_vector_store_rag_query(
+            http_request, request.vector_store_setting, request.document_search_params
+        )
+
+        # execute RAG
+        async for event, data in rag_stream(request, debug):
+            if data is None:
+                # An event without data would not be dispatched by the clients
+                yield ServerSentEvent(event=event.value, raw_data='null')
+            else:
+                yield ServerSentEvent(event=event.value, data=data)
+    except GenAIOrchestratorException as exc:
+        logger.error(exc)
+        yield ServerSentEvent(
+            event=RAGStreamEventType.ERROR.value, data=create_error_response(exc)
+        )
+    except Exception as exc:
+        logger.exception(exc)
+        yield ServerSentEvent(
+            event=RAGStreamEventType.ERROR.value,
+            data=create_error_response(
+                GenAIUnknownErrorException(
+                    ErrorInfo(error=exc.__class__.__name__, cause=str(exc))
+                )
+            ),
+        )
+
+
+@rag_router.post(
+    '/batch',
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            'description': 'The items responses (RAGBatchItemResponse), one JSON object by line.',
+            'content': {'application/x-ndjson': {}},
+        }
+    },
+)
+async def ask_rag_batch(
+    http_request: Request, request: RAGBatchRequest, debug: bool = False
+) -> StreamingResponse:
+    """
+    ## Ask a RAG System a batch of questions
+    Ask several questions to a RAG System, sharing the same configuration (e.g. regression runs, FAQ generation):
+    - the RAG chain is built once, then the items are run concurrently (`max_concurrency`),
+    - the items responses are streamed as newline-delimited JSON, as soon as they complete (not in the request order),
+    - an item failure is reported in its response (`error`), without aborting the batch.
+    """
+    # Check the consistency of the Vector Store Provider with the request body
+    validate_vector_store_rag_query(
+        http_request,
+        request.configuration.vector_store_setting,
+        request.configuration.document_search_params,
+    )
+
+    # execute RAG, item by item
+    responses = rag_batch(request, debug)
+    return StreamingResponse(
+        (f'{response.model_dump_json()}\n' async for response in responses),
+        media_type='application/x-ndjson',
+    )
+
+
 def validate_vector_store_rag_query(
     http_request: Request,
     vector_store_setting: VectorStoreSetting,
@@ -14,7 +14,7 @@
 #
 """Module for Request Models"""
 
-from typing import Optional
+from typing import Any, Optional
 
 from pyasn1.type.univ import Boolean
 from pydantic import BaseModel, Field
@@ -184,6 +184,11 @@ class RAGRequest(BaseRequest):
     question_answering_llm_setting: LLMSetting = Field(
         description='LLM setting, used to perform a QA Prompt.'
     )
+    question_answering_llm_alternate_setting: Optional[LLMSetting] = Field(
+        description='Alternate LLM setting (e.g. another deployment), used by the hedged and fallback requests '
+        'of the QA Prompt, if enabled. The environment one is used if not set.',
+        default=None,
+    )
     question_answering_prompt: PromptTemplate = Field(
         description='Prompt template, used to create a prompt with inputs for jinja and fstring format'
     )
@@ -270,6 +275,41 @@ Answer in {locale}:""",
     }
 
 
+class RAGBatchItem(BaseModel):
+    """An item of a RAG batch request: a question, asked with the batch configuration"""
+
+    id: str = Field(
+        description='The item ID, given back with its result.', examples=['faq-001']
+    )
+    inputs: dict[str, Any] = Field(
+        description='The question answering prompt inputs of the item. '
+        'They override the inputs of the batch configuration.',
+        examples=[{'question': 'How to get started playing guitar ?'}],
+    )
+    dialog: Optional[DialogDetails] = Field(
+        description='The user dialog details (the batch configuration one if not set).',
+        default=None,
+    )
+
+
+class RAGBatchRequest(BaseModel):
+    """The RAG batch request model"""
+
+    configuration: RAGRequest = Field(
+        description='The RAG configuration, shared by all the items. '
+        'Its question answering prompt inputs and dialog are the default ones of the items.'
+    )
+    items: list[RAGBatchItem] = Field(
+        description='The items (questions) of the batch.', min_length=1
+    )
+    max_concurrency: Optional[int] = Field(
+        description='The number of items run concurrently (limited by the server settings).',
+        default=None,
+        ge=1,
+        examples=[4],
+    )
+
+
 class CompletionRequest(BaseModel):
     """The completion request model"""
 
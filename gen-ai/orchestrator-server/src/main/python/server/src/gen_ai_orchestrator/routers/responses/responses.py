@@ -141,6 +141,18 @@ class RAGResponse(BaseModel):
     )
 
 
+class RAGBatchItemResponse(BaseModel):
+    """The response of a RAG batch item: its RAG response, or its error"""
+
+    id: str = Field(description='The item ID.', examples=['faq-001'])
+    response: Optional[RAGResponse] = Field(
+        description='The RAG response of the item, if it succeeded.', default=None
+    )
+    error: Optional[ErrorResponse] = Field(
+        description='The error of the item, if it failed.', default=None
+    )
+
+
 class QAResponse(BaseModel):
     """The QA response model"""
 
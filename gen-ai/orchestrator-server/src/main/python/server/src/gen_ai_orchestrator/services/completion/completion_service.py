@@ -34,6 +34,11 @@ from gen_ai_orchestrator.routers.responses.responses import (
     PlaygroundResponse,
     SentenceGenerationResponse,
 )
+from gen_ai_orchestrator.services.langchain.callbacks.stage_metrics_callback_handler import (
+    PipelineStage,
+    create_stage_metrics_callback_handler,
+    stage_metadata,
+)
 from gen_ai_orchestrator.services.langchain.factories.langchain_factory import (
     create_observability_callback_handler,
     get_llm_factory,
@@ -70,11 +75,16 @@ async def generate(
     )
     model = get_llm_factory(request.llm_setting).get_language_model()
 
-    chain = prompt | model | parser
+    chain = (
+        prompt
+        | model.with_config(metadata=stage_metadata(PipelineStage.COMPLETION))
+        | parser
+    )
 
-    config = None
+    # Create a RunnableConfig containing the stage metrics callback handler
+    config = {'callbacks': [create_stage_metrics_callback_handler()]}
     observability_handler = None
-    # Create a RunnableConfig containing the observability callback handler
+    # Add the observability callback handler
     if request.observability_setting is not None:
         # Langfuse callback handler
         observability_handler = create_observability_callback_handler(
@@ -84,7 +94,7 @@ async def generate(
             user_id=None,
             tags=None,
         )
-        config = {'callbacks': [observability_handler]}
+        config['callbacks'].append(observability_handler)
 
     parsedLlmAnswer = await chain.ainvoke(request.prompt.inputs, config=config)
 
@@ -127,16 +137,21 @@ async def generate_sentences(
     )
     model = get_llm_factory(request.llm_setting).get_language_model()
 
-    chain = prompt | model | parser
+    chain = (
+        prompt
+        | model.with_config(metadata=stage_metadata(PipelineStage.COMPLETION))
+        | parser
+    )
 
-    config = None
-    # Create a RunnableConfig containing the observability callback handler
+    # Create a RunnableConfig containing the stage metrics callback handler
+    config = {'callbacks': [create_stage_metrics_callback_handler()]}
+    # Add the observability callback handler
     if request.observability_setting is not None:
-        config = {'callbacks': [
+        config['callbacks'].append(
             create_observability_callback_handler(
                 observability_setting=request.observability_setting,
                 trace_name=ObservabilityTrace.SENTENCE_GENERATION.value
-            )]}
+            ))
 
     sentences = await chain.ainvoke(request.prompt.inputs, config=config)
 
@@ -0,0 +1,120 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Circuit breaker callback handler for LangChain.
+It is given to the language models of a provider endpoint (model callbacks): their calls are rejected
+while the endpoint circuit is open, and their outcomes are recorded (the latency of a streamed call
+is its time to first token).
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import LLMResult
+
+from gen_ai_orchestrator.utils.circuit_breaker import (
+    CircuitBreaker,
+    get_circuit_breaker,
+    is_failure,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreakerCallbackHandler(BaseCallbackHandler):
+    """The callback handler of the circuit breaker of a provider endpoint."""
+
+    # The rejection of a call is raised to the caller, before the call is sent
+    raise_error: bool = True
+    run_inline: bool = True
+
+    def __init__(self, circuit_breaker: CircuitBreaker):
+        self.circuit_breaker = circuit_breaker
+        # The start time, then the time to first token, of the runs
+        self._runs: Dict[UUID, float] = {}
+        self._first_tokens: Dict[UUID, float] = {}
+        self._lock = threading.Lock()
+
+    def on_llm_start(
+        self, serialized: Dict[str, Any], prompts: List[str], *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._start(run_id)
+
+    def on_chat_model_start(
+        self,
+        serialized: Dict[str, Any],
+        messages: List[List[BaseMessage]],
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> None:
+        self._start(run_id)
+
+    def on_llm_new_token(self, token: str, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            if run_id in self._runs and run_id not in self._first_tokens:
+                self._first_tokens[run_id] = time.monotonic() - self._runs[run_id]
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        duration = self._end(run_id)
+        if duration is not None:
+            self.circuit_breaker.record(duration, failed=False)
+
+    def on_llm_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        duration = self._end(run_id)
+        if duration is None:
+            return
+        if is_failure(error):
+            self.circuit_breaker.record(duration, failed=True)
+        else:
+            self.circuit_breaker.release()
+
+    def _start(self, run_id: UUID) -> None:
+        self.circuit_breaker.check()
+        with self._lock:
+            self._runs[run_id] = time.monotonic()
+
+    def _end(self, run_id: UUID) -> Optional[float]:
+        with self._lock:
+            start_time = self._runs.pop(run_id, None)
+            first_token = self._first_tokens.pop(run_id, None)
+        if start_time is None:
+            return None
+        return first_token if first_token is not None else time.monotonic() - start_time
+
+
+def get_circuit_breaker_callbacks(
+    name: str, timeout: Optional[float] = None
+) -> Optional[List[BaseCallbackHandler]]:
+    """
+    Get the callbacks of the language models of a provider endpoint.
+
+    Args:
+        name: The provider endpoint
+        timeout: The request timeout (in seconds) of the endpoint
+    Returns:
+        The circuit breaker callback handler, or None if the circuit breakers are disabled.
+    """
+    circuit_breaker = get_circuit_breaker(name, timeout)
+    if circuit_breaker is None:
+        return None
+    return [CircuitBreakerCallbackHandler(circuit_breaker)]
@@ -0,0 +1,389 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Stage metrics callback handler for LangChain.
+The pipeline stages (condensation LLM, vector search, rerank, answer LLM...) are timed from the
+callbacks of their runs, tagged with a stage in their metadata. The stages that are not LangChain runs
+(query embedding, guardrail, response assembly) are timed with stage_timer.
+Besides the metrics, the stage durations of an execution and of an HTTP request are recorded in
+their StageTimings (debug data, Server-Timing header).
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum, unique
+from typing import Any, Dict, Iterator, List, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+
+from gen_ai_orchestrator.utils.metrics.metrics import counter, histogram
+
+logger = logging.getLogger(__name__)
+
+# The metadata keys of the runs of a stage, and of their provider
+STAGE_METADATA_KEY = 'gen_ai_stage'
+STAGE_PROVIDER_METADATA_KEY = 'gen_ai_stage_provider'
+
+SUCCESS = 'success'
+ERROR = 'error'
+
+
+@unique
+class PipelineStage(str, Enum):
+    """Enumeration to list the pipeline stages"""
+
+    CONDENSATION = 'condensation'
+    QUERY_EMBEDDING = 'query_embedding'
+    VECTOR_SEARCH = 'vector_search'
+    RERANK = 'rerank'
+    ANSWER = 'answer'
+    COMPLETION = 'completion'
+    GUARDRAIL = 'guardrail'
+    RESPONSE_ASSEMBLY = 'response_assembly'
+
+
+stage_duration_histogram = histogram(
+    'gen_ai_orchestrator_stage_duration_seconds',
+    'Duration (in seconds) of the pipeline stages, excluding their nested stages.',
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+    label_names=('stage', 'provider', 'model', 'index', 'outcome'),
+)
+llm_tokens_counter = counter(
+    'gen_ai_orchestrator_llm_tokens_total',
+    'Number of LLM tokens, by type (input, output).',
+    label_names=('stage', 'provider', 'model', 'type'),
+)
+
+
+class StageTimings:
+    """The total durations of the pipeline stages of an execution, or of an HTTP request."""
+
+    def __init__(self):
+        self._durations: Dict[PipelineStage, float] = {}
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self._durations)
+
+    def add(self, stage: PipelineStage, duration: float) -> None:
+        """Add a duration (in seconds) to a stage."""
+        with self._lock:
+            self._durations[stage] = self._durations.get(stage, 0.0) + duration
+
+    def add_all(self, other: 'StageTimings') -> None:
+        """Add the durations of other stage timings (those of a shared execution)."""
+        with other._lock:
+            durations = dict(other._durations)
+        for stage, duration in durations.items():
+            self.add(stage, duration)
+
+    def durations(self) -> Dict[str, float]:
+        """The total durations (in seconds) of the stages, in the order they were first recorded."""
+        with self._lock:
+            return {
+                stage.value: round(duration, 4)
+                for stage, duration in self._durations.items()
+            }
+
+    def server_timing(self, total: Optional[float] = None) -> str:
+        """
+        The Server-Timing header value of the stages.
+
+        Args:
+            total: The total duration (in seconds), if any
+        Returns:
+            The stages metrics, with their durations in milliseconds.
+        """
+        durations = self.durations()
+        if total is not None:
+            durations['total'] = total
+        return ', '.join(
+            f'{name};dur={duration * 1000:.1f}' for name, duration in durations.items()
+        )
+
+
+# The stage timings of the current execution (RAG, QA, completion), and of the current HTTP request
+current_stage_timings: ContextVar[Optional[StageTimings]] = ContextVar(
+    'current_stage_timings', default=None
+)
+request_stage_timings: ContextVar[Optional[StageTimings]] = ContextVar(
+    'request_stage_timings', default=None
+)
+
+
+def stage_metadata(stage: PipelineStage, provider: Optional[str] = None) -> dict:
+    """
+    The metadata of the runs of a stage.
+
+    Args:
+        stage: The pipeline stage
+        provider: The stage provider, if the run does not report it
+    Returns:
+        The run metadata.
+    """
+    metadata = {STAGE_METADATA_KEY: stage.value}
+    if provider is not None:
+        metadata[STAGE_PROVIDER_METADATA_KEY] = provider
+    return metadata
+
+
+def observe_stage(
+    stage: PipelineStage,
+    duration: float,
+    outcome: str = SUCCESS,
+    provider: str = '',
+    model: str = '',
+    index: str = '',
+    stage_timings: Optional[StageTimings] = None,
+) -> None:
+    """
+    Observe the duration (in seconds) of a stage.
+    It is also recorded in the stage timings of the execution (the current one by default) and of the request.
+    """
+    stage_duration_histogram.observe(
+        duration,
+        stage=stage.value,
+        provider=provider,
+        model=model,
+        index=index,
+        outcome=outcome,
+    )
+    execution_timings = stage_timings or current_stage_timings.get()
+    request_timings = request_stage_timings.get()
+    if execution_timings is not None:
+        execution_timings.add(stage, duration)
+    if request_timings is not None and request_timings is not execution_timings:
+        request_timings.add(stage, duration)
+
+
+@contextmanager
+def stage_timer(
+    stage: PipelineStage, provider: str = '', model: str = '', index: str = ''
+) -> Iterator[None]:
+    """Time a stage, whose outcome is an error if it raises an exception."""
+    start_time = time.perf_counter()
+    outcome = ERROR
+    try:
+        yield
+        outcome = SUCCESS
+    finally:
+        observe_stage(
+            stage, time.perf_counter() - start_time, outcome, provider, model, index
+        )
+
+
+class _StageRun:
+    """A run of a stage"""
+
+    __slots__ = ('stage', 'provider', 'model', 'start_time', 'nested_duration')
+
+    def __init__(self, stage: PipelineStage, provider: str, model: str):
+        self.stage = stage
+        self.provider = provider
+        self.model = model
+        self.start_time = time.perf_counter()
+        self.nested_duration = 0.0
+
+
+class StageMetricsCallbackHandler(BaseCallbackHandler):
+    """
+    Callback handler timing the runs tagged with a pipeline stage (see stage_metadata).
+    The nested runs inherit the metadata of their parent: a run only starts a stage
+    if its nearest stage ancestor is of another stage, whose duration then excludes it.
+    """
+
+    # The runs are timed when their callbacks are triggered, not in a worker thread
+    run_inline = True
+
+    def __init__(self, index: str = ''):
+        """
+        Args:
+            index: The document index (metrics label)
+        """
+        self.index = index
+        self.stage_timings = StageTimings()
+        self._parents: Dict[UUID, Optional[UUID]] = {}
+        self._stage_runs: Dict[UUID, _StageRun] = {}
+
+    def on_chain_start(
+        self,
+        serialized: Dict[str, Any],
+        inputs: Dict[str, Any],
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        self._start(run_id, parent_run_id, metadata)
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end(run_id, SUCCESS)
+
+    def on_chain_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._end(run_id, ERROR)
+
+    def on_llm_start(
+        self,
+        serialized: Dict[str, Any],
+        prompts: List[str],
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        self._start(run_id, parent_run_id, metadata)
+
+    def on_chat_model_start(
+        self,
+        serialized: Dict[str, Any],
+        messages: List[List[BaseMessage]],
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        self._start(run_id, parent_run_id, metadata)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        stage_run = self._end(run_id, SUCCESS)
+        if stage_run is not None:
+            self._count_tokens(stage_run, response)
+
+    def on_llm_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._end(run_id, ERROR)
+
+    def on_retriever_start(
+        self,
+        serialized: Dict[str, Any],
+        query: str,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        self._start(run_id, parent_run_id, metadata)
+
+    def on_retriever_end(self, documents: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end(run_id, SUCCESS)
+
+    def on_retriever_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._end(run_id, ERROR)
+
+    def _start(
+        self,
+        run_id: UUID,
+        parent_run_id: Optional[UUID],
+        metadata: Optional[Dict[str, Any]],
+    ) -> None:
+        self._parents[run_id] = parent_run_id
+        stage = (metadata or {}).get(STAGE_METADATA_KEY)
+        if stage is None:
+            return
+        stage_ancestor = self._stage_ancestor(run_id)
+        if stage_ancestor is not None and stage_ancestor.stage.value == stage:
+            return
+        self._stage_runs[run_id] = _StageRun(
+            PipelineStage(stage),
+            provider=metadata.get(STAGE_PROVIDER_METADATA_KEY)
+            or metadata.get('ls_provider')
+            or metadata.get('ls_vector_store_provider')
+            or '',
+            model=metadata.get('ls_model_name') or '',
+        )
+
+    def _end(self, run_id: UUID, outcome: str) -> Optional[_StageRun]:
+        stage_run = self._stage_runs.pop(run_id, None)
+        if stage_run is not None:
+            duration = time.perf_counter() - stage_run.start_time
+            stage_ancestor = self._stage_ancestor(run_id)
+            if stage_ancestor is not None:
+                stage_ancestor.nested_duration += duration
+            observe_stage(
+                stage_run.stage,
+                duration - stage_run.nested_duration,
+                outcome,
+                stage_run.provider,
+                stage_run.model,
+                self.index,
+                self.stage_timings,
+            )
+        self._parents.pop(run_id, None)
+        return stage_run
+
+    def _stage_ancestor(self, run_id: UUID) -> Optional[_StageRun]:
+        parent_run_id = self._parents.get(run_id)
+        while parent_run_id is not None:
+            if parent_run_id in self._stage_runs:
+                return self._stage_runs[parent_run_id]
+            parent_run_id = self._parents.get(parent_run_id)
+        return None
+
+    @staticmethod
+    def _count_tokens(stage_run: _StageRun, response: LLMResult) -> None:
+        input_tokens = output_tokens = 0
+        for generations in response.generations:
+            for generation in generations:
+                if isinstance(generation, ChatGeneration):
+                    usage = getattr(generation.message, 'usage_metadata', None) or {}
+                    input_tokens += usage.get('input_tokens', 0)
+                    output_tokens += usage.get('output_tokens', 0)
+        if not input_tokens and not output_tokens:
+            usage = (response.llm_output or {}).get('token_usage') or {}
+            input_tokens = usage.get('prompt_tokens', 0)
+            output_tokens = usage.get('completion_tokens', 0)
+
+        labels = dict(
+            stage=stage_run.stage.value,
+            provider=stage_run.provider,
+            model=stage_run.model,
+        )
+        if input_tokens:
+            llm_tokens_counter.inc(input_tokens, type='input', **labels)
+        if output_tokens:
+            llm_tokens_counter.inc(output_tokens, type='output', **labels)
+
+
+def create_stage_metrics_callback_handler(
+    index: str = '',
+) -> StageMetricsCallbackHandler:
+    """
+    Create the stage metrics callback handler of an execution.
+    Its stage timings become the current ones: the stages timed out of the LangChain runs
+    (stage_timer) are recorded in them too.
+
+    Args:
+        index: The document index (metrics label)
+    Returns:
+        The callback handler.
+    """
+    handler = StageMetricsCallbackHandler(index=index)
+    current_stage_timings.set(handler.stage_timings)
+    return handler
@@ -16,15 +16,17 @@
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from langfuse.langchain import CallbackHandler
 from pydantic import BaseModel
 
 from gen_ai_orchestrator.models.observability.observability_setting import (
     BaseObservabilitySetting,
 )
 
+if TYPE_CHECKING:
+    from langfuse.langchain import CallbackHandler
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,7 +36,7 @@ class LangChainCallbackHandlerFactory(ABC, BaseModel):
     setting: BaseObservabilitySetting
 
     @abstractmethod
-    def get_callback_handler(self, **kwargs: Any) -> CallbackHandler:
+    def get_callback_handler(self, **kwargs: Any) -> 'CallbackHandler':
         """
         Fabric a callback handler.
         :return: LangchainCallbackHandler.
@@ -0,0 +1,111 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Module for the provider client registry.
+LLM, Embedding Model and Vector Store clients hold HTTP connection pools (and TLS sessions).
+Instead of building them for each request, the factories keep them in a process-wide registry,
+keyed by a fingerprint of the provider setting and its resolved secret.
+The clients removed from the registry (evicted, expired...) are closed, if they can be.
+"""
+
+import asyncio
+import inspect
+import logging
+from typing import Any, Callable, Set, TypeVar
+
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
+from gen_ai_orchestrator.utils.cache.ttl_lru_cache import TTLLRUCache
+from gen_ai_orchestrator.utils.fingerprint import fingerprint
+from gen_ai_orchestrator.utils.metrics.cache_metrics import register_cache_metrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# The pending closings of the async clients
+_closings: Set[asyncio.Task] = set()
+
+
+def _close_client(client: Any) -> None:
+    """
+    Close a client removed from the registry, if it has a close (or aclose) method.
+    An async close runs in a task of the running event loop (if any).
+    """
+    close = getattr(client, 'aclose', None) or getattr(client, 'close', None)
+    if not callable(close):
+        return
+    logger.debug('Client registry - Close client %s', type(client).__name__)
+    try:
+        closing = close()
+        if not inspect.isawaitable(closing):
+            return
+        try:
+            task = asyncio.get_running_loop().create_task(closing)
+        except RuntimeError:
+            asyncio.run(closing)
+            return
+        _closings.add(task)
+        task.add_done_callback(_closings.discard)
+    except Exception as exc:
+        logger.warning('Client registry - Failed to close client %s: %s', type(client).__name__, exc)
+
+
+client_registry: TTLLRUCache[str, Any] = TTLLRUCache(
+    max_size=application_settings.client_registry_max_size,
+    ttl=application_settings.client_registry_ttl,
+    on_evict=_close_client,
+)
+register_cache_metrics('client_registry', client_registry)
+
+
+def get_or_create_client(builder: Callable[[], T], *key_parts: Any) -> T:
+    """
+    Get a client from the registry, or build it and register it.
+
+    Args:
+        builder: The function that builds the client
+        key_parts: The values identifying the client (factory type, setting, resolved secret...)
+    Returns:
+        The registered client, or a new one if the registry is disabled.
+    """
+    if not application_settings.client_registry_enabled:
+        return builder()
+
+    def build_and_log() -> T:
+        client = builder()
+        logger.debug('Client registry - New client %s', type(client).__name__)
+        return client
+
+    return client_registry.get_or_create(fingerprint(*key_parts), build_and_log)
+
+
+def invalidate_client(*key_parts: Any) -> bool:
+    """
+    Remove a client from the registry.
+
+    Args:
+        key_parts: The values identifying the client, as given to get_or_create_client
+    Returns:
+        True if the client was registered.
+    """
+    return client_registry.invalidate(fingerprint(*key_parts))
+
+
+def clear_client_registry() -> None:
+    """Remove all clients from the registry."""
+    logger.info('Client registry - Clear all clients')
+    client_registry.clear()
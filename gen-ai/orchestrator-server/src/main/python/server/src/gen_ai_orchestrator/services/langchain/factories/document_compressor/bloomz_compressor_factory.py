@@ -40,6 +40,7 @@ class BloomzCompressorFactory(DocumentCompressorFactory):
             label=self.setting.label,
             timeout=application_settings.compressor_provider_timeout,
             fill_to_max_documents=self.setting.fill_to_max_documents,
+            shard_size=application_settings.compressor_shard_size,
             is_fault_tolerant=self.is_fault_tolerant
         )
 
@@ -27,6 +27,9 @@ from gen_ai_orchestrator.errors.handlers.openai.openai_exception_handler import
 from gen_ai_orchestrator.models.em.azureopenai.azure_openai_em_setting import (
     AzureOpenAIEMSetting,
 )
+from gen_ai_orchestrator.services.langchain.factories.client_registry import (
+    get_or_create_client,
+)
 from gen_ai_orchestrator.services.langchain.factories.em.em_factory import (
     LangChainEMFactory,
 )
@@ -40,15 +43,22 @@ class AzureOpenAIEMFactory(LangChainEMFactory):
 
     setting: AzureOpenAIEMSetting
 
-    def get_embedding_model(self) -> Embeddings:
-        return AzureOpenAIEmbeddings(
-            openai_api_key=fetch_secret_key_value(self.setting.api_key),
-            openai_api_version=self.setting.api_version,
-            azure_endpoint=str(self.setting.api_base),
-            azure_deployment=self.setting.deployment_name,
-            # the model is not Nullable, it has a default value
-            model=self.setting.model or OpenAIEmbeddings.__fields__['model'].default,
-            timeout=application_settings.em_provider_timeout,
+    def create_embedding_model(self) -> Embeddings:
+        api_key = fetch_secret_key_value(self.setting.api_key)
+        return get_or_create_client(
+            lambda: AzureOpenAIEmbeddings(
+                openai_api_key=api_key,
+                openai_api_version=self.setting.api_version,
+                azure_endpoint=str(self.setting.api_base),
+                azure_deployment=self.setting.deployment_name,
+                # the model is not Nullable, it has a default value
+                model=self.setting.model or OpenAIEmbeddings.__fields__['model'].default,
+                timeout=application_settings.em_provider_timeout,
+                max_retries=application_settings.em_provider_max_retries,
+            ),
+            type(self).__name__,
+            self.setting,
+            api_key,
         )
 
     @openai_exception_handler(provider='AzureOpenAIService')
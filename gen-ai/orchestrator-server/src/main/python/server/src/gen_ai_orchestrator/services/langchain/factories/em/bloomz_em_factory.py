@@ -16,9 +16,15 @@
 
 from langchain.embeddings.base import Embeddings
 
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
 from gen_ai_orchestrator.models.em.bloomz.bloomz_em_setting import (
     BloomzEMSetting,
 )
+from gen_ai_orchestrator.services.langchain.factories.client_registry import (
+    get_or_create_client,
+)
 from gen_ai_orchestrator.services.langchain.factories.em.em_factory import (
     LangChainEMFactory,
 )
@@ -32,7 +38,16 @@ class BloomzEMFactory(LangChainEMFactory):
 
     setting: BloomzEMSetting
 
-    def get_embedding_model(self) -> Embeddings:
-        return BloomzEmbeddings(
-            pooling=self.setting.pooling, api_base=self.setting.api_base
+    def create_embedding_model(self) -> Embeddings:
+        return get_or_create_client(
+            lambda: BloomzEmbeddings(
+                pooling=self.setting.pooling,
+                api_base=self.setting.api_base,
+                batch_size=application_settings.em_batch_size,
+                max_concurrency=application_settings.em_max_concurrency,
+                timeout=application_settings.em_provider_timeout,
+                max_retries=application_settings.em_provider_max_retries,
+            ),
+            type(self).__name__,
+            self.setting,
         )
@@ -21,7 +21,24 @@ from typing import List
 from langchain.embeddings.base import Embeddings
 from pydantic import BaseModel
 
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
 from gen_ai_orchestrator.models.em.em_setting import BaseEMSetting
+from gen_ai_orchestrator.services.langchain.factories.client_registry import (
+    get_or_create_client,
+)
+from gen_ai_orchestrator.services.langchain.impls.em.cached_query_embeddings import (
+    CachedQueryEmbeddings,
+    query_embedding_cache,
+)
+from gen_ai_orchestrator.services.langchain.impls.em.coalescing_embeddings import (
+    CoalescingEmbeddings,
+)
+from gen_ai_orchestrator.services.langchain.impls.em.timed_query_embeddings import (
+    TimedQueryEmbeddings,
+)
+from gen_ai_orchestrator.utils.fingerprint import fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -32,13 +49,58 @@ class LangChainEMFactory(ABC, BaseModel):
     setting: BaseEMSetting
 
     @abstractmethod
-    def get_embedding_model(self) -> Embeddings:
+    def create_embedding_model(self) -> Embeddings:
         """
-        Embedding model to call
+        Create the provider Embedding model
         :return: [Embeddings] the interface for embedding models.
         """
         pass
 
+    def get_embedding_model(self) -> Embeddings:
+        """
+        Embedding model to call, whose concurrent query embeddings are coalesced in batches,
+        and whose query embeddings are cached (if enabled) and timed
+        :return: [Embeddings] the interface for embedding models.
+        """
+        embedding_model = self.create_embedding_model()
+
+        # The wrappers are registered with the model they wrap (which the registry keeps alive)
+        if application_settings.em_coalescing_enabled:
+            provider_model = embedding_model
+            embedding_model = get_or_create_client(
+                lambda: CoalescingEmbeddings(
+                    embeddings=provider_model,
+                    provider=self.setting.provider.value,
+                    max_batch_size=application_settings.em_coalescing_max_batch_size,
+                    max_wait=application_settings.em_coalescing_max_wait,
+                ),
+                CoalescingEmbeddings.__name__,
+                id(provider_model),
+            )
+        if application_settings.em_query_cache_enabled:
+            coalescing_model = embedding_model
+            embedding_model = get_or_create_client(
+                lambda: CachedQueryEmbeddings(
+                    embeddings=coalescing_model,
+                    model_key=fingerprint(
+                        self.setting.model_dump(mode='json', exclude={'api_key'})
+                    ),
+                    cache=query_embedding_cache,
+                ),
+                CachedQueryEmbeddings.__name__,
+                id(coalescing_model),
+            )
+        cached_model = embedding_model
+        return get_or_create_client(
+            lambda: TimedQueryEmbeddings(
+                embeddings=cached_model,
+                provider=self.setting.provider.value,
+                model=getattr(self.setting, 'model', None) or '',
+            ),
+            TimedQueryEmbeddings.__name__,
+            id(cached_model),
+        )
+
     async def check_embedding_model_setting(self) -> bool:
         """
         check the Embedding model setting validity
@@ -52,5 +114,5 @@ class LangChainEMFactory(ABC, BaseModel):
         return True
 
     async def embed_query(self, text: str) -> List[float]:
-        """Embed text."""
-        return await self.get_embedding_model().aembed_query(text)
+        """Embed text. The provider is always called (without cache), to check the setting."""
+        return await self.create_embedding_model().aembed_query(text)
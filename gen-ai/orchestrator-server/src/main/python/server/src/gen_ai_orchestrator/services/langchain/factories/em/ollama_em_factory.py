@@ -24,6 +24,9 @@ from gen_ai_orchestrator.errors.handlers.ollama.ollama_exception_handler import
 from gen_ai_orchestrator.models.em.ollama.ollama_em_setting import (
     OllamaEMSetting,
 )
+from gen_ai_orchestrator.services.langchain.factories.client_registry import (
+    get_or_create_client,
+)
 from gen_ai_orchestrator.services.langchain.factories.em.em_factory import (
     LangChainEMFactory,
 )
@@ -34,10 +37,14 @@ class OllamaEMFactory(LangChainEMFactory):
 
     setting: OllamaEMSetting
 
-    def get_embedding_model(self) -> Embeddings:
-        return OllamaEmbeddings(
-            base_url=self.setting.base_url,
-            model=self.setting.model,
+    def create_embedding_model(self) -> Embeddings:
+        return get_or_create_client(
+            lambda: OllamaEmbeddings(
+                base_url=self.setting.base_url,
+                model=self.setting.model,
+            ),
+            type(self).__name__,
+            self.setting,
         )
 
     @ollama_exception_handler(provider='Ollama')
@@ -27,6 +27,9 @@ from gen_ai_orchestrator.errors.handlers.openai.openai_exception_handler import
 from gen_ai_orchestrator.models.em.openai.openai_em_setting import (
     OpenAIEMSetting,
 )
+from gen_ai_orchestrator.services.langchain.factories.client_registry import (
+    get_or_create_client,
+)
 from gen_ai_orchestrator.services.langchain.factories.em.em_factory import (
     LangChainEMFactory,
 )
@@ -40,12 +43,19 @@ class OpenAIEMFactory(LangChainEMFactory):
 
     setting: OpenAIEMSetting
 
-    def get_embedding_model(self) -> Embeddings:
-        return OpenAIEmbeddings(
-            openai_api_key=fetch_secret_key_value(self.setting.api_key),
-            base_url=self.setting.base_url,
-            model=self.setting.model,
-            timeout=application_settings.em_provider_timeout,
+    def create_embedding_model(self) -> Embeddings:
+        api_key = fetch_secret_key_value(self.setting.api_key)
+        return get_or_create_client(
+            lambda: OpenAIEmbeddings(
+                openai_api_key=api_key,
+                base_url=self.setting.base_url,
+                model=self.setting.model,
+                timeout=application_settings.em_provider_timeout,
+                max_retries=application_settings.em_provider_max_retries,
+            ),
+            type(self).__name__,
+            self.setting,
+            api_key,
         )
 
     @openai_exception_handler(provider='OpenAI')
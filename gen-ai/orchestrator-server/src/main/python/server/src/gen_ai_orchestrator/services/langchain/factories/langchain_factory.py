@@ -23,10 +23,9 @@ It manages the creation of :
 """
 
 import logging
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from langchain_core.embeddings import Embeddings
-from langfuse.langchain import CallbackHandler
 
 from gen_ai_orchestrator.configurations.environment.settings import (
     application_settings,
@@ -43,46 +42,24 @@ from gen_ai_orchestrator.errors.exceptions.observability.observability_exception
 from gen_ai_orchestrator.errors.exceptions.vector_store.vector_store_exceptions import (
     GenAIUnknownVectorStoreProviderSettingException,
 )
-from gen_ai_orchestrator.models.document_compressor.bloomz.bloomz_compressor_setting import (
-    BloomzCompressorSetting,
+from gen_ai_orchestrator.models.document_compressor.document_compressor_provider import (
+    DocumentCompressorProvider,
 )
 from gen_ai_orchestrator.models.document_compressor.document_compressor_setting import (
     BaseDocumentCompressorSetting,
 )
-from gen_ai_orchestrator.models.em.azureopenai.azure_openai_em_setting import (
-    AzureOpenAIEMSetting,
-)
-from gen_ai_orchestrator.models.em.bloomz.bloomz_em_setting import (
-    BloomzEMSetting,
-)
+from gen_ai_orchestrator.models.em.em_provider import EMProvider
 from gen_ai_orchestrator.models.em.em_setting import BaseEMSetting
-from gen_ai_orchestrator.models.em.ollama.ollama_em_setting import (
-    OllamaEMSetting,
-)
-from gen_ai_orchestrator.models.em.openai.openai_em_setting import (
-    OpenAIEMSetting,
-)
-from gen_ai_orchestrator.models.guardrail.bloomz.bloomz_guardrail_setting import (
-    BloomzGuardrailSetting,
+from gen_ai_orchestrator.models.guardrail.guardrail_provider import (
+    GuardrailProvider,
 )
 from gen_ai_orchestrator.models.guardrail.guardrail_setting import (
     BaseGuardrailSetting,
 )
-from gen_ai_orchestrator.models.llm.azureopenai.azure_openai_llm_setting import (
-    AzureOpenAILLMSetting,
-)
-from gen_ai_orchestrator.models.llm.fake_llm.fake_llm_setting import (
-    FakeLLMSetting,
-)
+from gen_ai_orchestrator.models.llm.llm_provider import LLMProvider
 from gen_ai_orchestrator.models.llm.llm_setting import BaseLLMSetting
-from gen_ai_orchestrator.models.llm.ollama.ollama_llm_setting import (
-    OllamaLLMSetting,
-)
-from gen_ai_orchestrator.models.llm.openai.openai_llm_setting import (
-    OpenAILLMSetting,
-)
-from gen_ai_orchestrator.models.observability.langfuse.langfuse_setting import (
-    LangfuseObservabilitySetting,
+from gen_ai_orchestrator.models.observability.observability_provider import (
+    ObservabilityProvider,
 )
 from gen_ai_orchestrator.models.observability.observability_setting import (
     BaseObservabilitySetting,
@@ -105,98 +82,111 @@ from gen_ai_orchestrator.models.vector_stores.vector_store_types import (
 from gen_ai_orchestrator.models.vector_stores.vectore_store_provider import (
     VectorStoreProvider,
 )
-from gen_ai_orchestrator.services.langchain.factories.callback_handlers.callback_handlers_factory import (
-    LangChainCallbackHandlerFactory,
-)
-from gen_ai_orchestrator.services.langchain.factories.callback_handlers.langfuse_callback_handler_factory import (
-    LangfuseCallbackHandlerFactory,
-)
-from gen_ai_orchestrator.services.langchain.factories.document_compressor.bloomz_compressor_factory import (
-    BloomzCompressorFactory,
-)
-from gen_ai_orchestrator.services.langchain.factories.document_compressor.document_compressor_factory import (
-    DocumentCompressorFactory,
-)
-from gen_ai_orchestrator.services.langchain.factories.em.azure_openai_em_factory import (
-    AzureOpenAIEMFactory,
-)
-from gen_ai_orchestrator.services.langchain.factories.em.bloomz_em_factory import (
-    BloomzEMFactory,
-)
-from gen_ai_orchestrator.services.langchain.factories.em.em_factory import (
-    LangChainEMFactory,
-)
-from gen_ai_orchestrator.services.langchain.factories.em.ollama_em_factory import (
-    OllamaEMFactory,
-)
-from gen_ai_orchestrator.services.langchain.factories.em.openai_em_factory import (
-    OpenAIEMFactory,
-)
-from gen_ai_orchestrator.services.langchain.factories.guardrail.bloomz_guardrail_factory import (
-    BloomzGuardrailFactory,
-)
-from gen_ai_orchestrator.services.langchain.factories.guardrail.guardrail_factory import (
-    GuardrailFactory,
-)
-from gen_ai_orchestrator.services.langchain.factories.llm.azure_openai_llm_factory import (
-    AzureOpenAILLMFactory,
-)
-from gen_ai_orchestrator.services.langchain.factories.llm.fake_llm_factory import (
-    FakeLLMFactory,
-)
-from gen_ai_orchestrator.services.langchain.factories.llm.llm_factory import (
-    LangChainLLMFactory,
-)
-from gen_ai_orchestrator.services.langchain.factories.llm.ollama_llm_factory import (
-    OllamaLLMFactory,
-)
-from gen_ai_orchestrator.services.langchain.factories.llm.openai_llm_factory import (
-    OpenAILLMFactory,
-)
-from gen_ai_orchestrator.services.langchain.factories.vector_stores.open_search_factory import (
-    OpenSearchFactory,
-)
-from gen_ai_orchestrator.services.langchain.factories.vector_stores.pgvector_factory import (
-    PGVectorFactory,
-)
-from gen_ai_orchestrator.services.langchain.factories.vector_stores.vector_store_factory import (
-    LangChainVectorStoreFactory,
-)
+from gen_ai_orchestrator.utils.lazy_registry import LazyRegistry
 from gen_ai_orchestrator.utils.secret_manager.secret_manager_service import (
     fetch_default_vector_store_credentials,
 )
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from langfuse.langchain import CallbackHandler
+
+    from gen_ai_orchestrator.services.langchain.factories.callback_handlers.callback_handlers_factory import (
+        LangChainCallbackHandlerFactory,
+    )
+    from gen_ai_orchestrator.services.langchain.factories.document_compressor.document_compressor_factory import (
+        DocumentCompressorFactory,
+    )
+    from gen_ai_orchestrator.services.langchain.factories.em.em_factory import (
+        LangChainEMFactory,
+    )
+    from gen_ai_orchestrator.services.langchain.factories.guardrail.guardrail_factory import (
+        GuardrailFactory,
+    )
+    from gen_ai_orchestrator.services.langchain.factories.llm.llm_factory import (
+        LangChainLLMFactory,
+    )
+    from gen_ai_orchestrator.services.langchain.factories.vector_stores.vector_store_factory import (
+        LangChainVectorStoreFactory,
+    )
 
+logger = logging.getLogger(__name__)
 
-def get_llm_factory(setting: BaseLLMSetting) -> LangChainLLMFactory:
+_FACTORIES = 'gen_ai_orchestrator.services.langchain.factories'
+
+# The factories by provider, imported on first use (a deployment only loads the SDKs of its providers)
+llm_factories = LazyRegistry(
+    'LLM Factory',
+    {
+        LLMProvider.OPEN_AI: f'{_FACTORIES}.llm.openai_llm_factory:OpenAILLMFactory',
+        LLMProvider.AZURE_OPEN_AI_SERVICE: f'{_FACTORIES}.llm.azure_openai_llm_factory:AzureOpenAILLMFactory',
+        LLMProvider.FAKE_LLM: f'{_FACTORIES}.llm.fake_llm_factory:FakeLLMFactory',
+        LLMProvider.OLLAMA: f'{_FACTORIES}.llm.ollama_llm_factory:OllamaLLMFactory',
+    },
+)
+em_factories = LazyRegistry(
+    'EM Factory',
+    {
+        EMProvider.OPEN_AI: f'{_FACTORIES}.em.openai_em_factory:OpenAIEMFactory',
+        EMProvider.AZURE_OPEN_AI_SERVICE: f'{_FACTORIES}.em.azure_openai_em_factory:AzureOpenAIEMFactory',
+        EMProvider.OLLAMA: f'{_FACTORIES}.em.ollama_em_factory:OllamaEMFactory',
+        EMProvider.BLOOMZ: f'{_FACTORIES}.em.bloomz_em_factory:BloomzEMFactory',
+    },
+)
+vector_store_factories = LazyRegistry(
+    'Vector Store Factory',
+    {
+        VectorStoreProvider.OPEN_SEARCH: f'{_FACTORIES}.vector_stores.open_search_factory:OpenSearchFactory',
+        VectorStoreProvider.PGVECTOR: f'{_FACTORIES}.vector_stores.pgvector_factory:PGVectorFactory',
+    },
+)
+callback_handler_factories = LazyRegistry(
+    'Observability Factory',
+    {
+        ObservabilityProvider.LANGFUSE: f'{_FACTORIES}.callback_handlers.langfuse_callback_handler_factory:LangfuseCallbackHandlerFactory',
+    },
+)
+guardrail_factories = LazyRegistry(
+    'Guardrail Factory',
+    {
+        GuardrailProvider.BLOOMZ: f'{_FACTORIES}.guardrail.bloomz_guardrail_factory:BloomzGuardrailFactory',
+    },
+)
+compressor_factories = LazyRegistry(
+    'Document Compressor Factory',
+    {
+        DocumentCompressorProvider.BLOOMZ: f'{_FACTORIES}.document_compressor.bloomz_compressor_factory:BloomzCompressorFactory',
+    },
+)
+
+
+def _get_provider(setting: Any) -> Any:
+    """The provider of a setting (None if the given object is not a provider setting)."""
+    return getattr(setting, 'provider', None)
+
+
+def get_llm_factory(
+    setting: BaseLLMSetting, alternate_setting: Optional[BaseLLMSetting] = None
+) -> 'LangChainLLMFactory':
     """
     Creates an LangChain LLM Factory according to the given setting
     Args:
         setting: The LLM setting
+        alternate_setting: The alternate LLM setting, used by the hedged language model (optional)
 
     Returns:
         The LangChain LLM Factory, or raise an exception otherwise
     """
 
     logger.info('Get LLM Factory for the given setting')
-    if isinstance(setting, OpenAILLMSetting):
-        logger.debug('LLM Factory - OpenAILLMFactory')
-        return OpenAILLMFactory(setting=setting)
-    elif isinstance(setting, AzureOpenAILLMSetting):
-        logger.debug('LLM Factory - AzureOpenAILLMFactory')
-        return AzureOpenAILLMFactory(setting=setting)
-    elif isinstance(setting, FakeLLMSetting):
-        logger.debug('LLM Factory - FakeLLMFactory')
-        return FakeLLMFactory(setting=setting)
-    elif isinstance(setting, OllamaLLMSetting):
-        logger.debug('LLM Factory - OllamaLLMFactory')
-        return OllamaLLMFactory(setting=setting)
-    else:
+    provider = _get_provider(setting)
+    if provider not in llm_factories:
         raise GenAIUnknownProviderSettingException()
+    factory_class = llm_factories[provider]
+    logger.debug('LLM Factory - %s', factory_class.__name__)
+    return factory_class(setting=setting, alternate_setting=alternate_setting)
 
 
-def get_em_factory(setting: BaseEMSetting) -> LangChainEMFactory:
+def get_em_factory(setting: BaseEMSetting) -> 'LangChainEMFactory':
     """
     Creates an LangChain EM Factory according to the given setting
     Args:
@@ -207,27 +197,19 @@ def get_em_factory(setting: BaseEMSetting) -> LangChainEMFactory:
     """
 
     logger.info('Get Embedding Model Factory for the given setting')
-    if isinstance(setting, OpenAIEMSetting):
-        logger.debug('EM Factory - OpenAIEMFactory')
-        return OpenAIEMFactory(setting=setting)
-    elif isinstance(setting, AzureOpenAIEMSetting):
-        logger.debug('EM Factory - AzureOpenAIEMFactory')
-        return AzureOpenAIEMFactory(setting=setting)
-    elif isinstance(setting, OllamaEMSetting):
-        logger.debug('LLM Factory - OllamaEMFactory')
-        return OllamaEMFactory(setting=setting)
-    elif isinstance(setting, BloomzEMSetting):
-        logger.debug('EM Factory - BloomzEMFactory')
-        return BloomzEMFactory(setting=setting)
-    else:
+    provider = _get_provider(setting)
+    if provider not in em_factories:
         raise GenAIUnknownProviderSettingException()
+    factory_class = em_factories[provider]
+    logger.debug('EM Factory - %s', factory_class.__name__)
+    return factory_class(setting=setting)
 
 
 def get_vector_store_factory(
     setting: Optional[VectorStoreSetting],
     index_name: str,
     embedding_function: Embeddings,
-) -> LangChainVectorStoreFactory:
+) -> 'LangChainVectorStoreFactory':
     """
     Creates an LangChain Vector Store Factory according to the vector store provider
     Args:
@@ -241,38 +223,21 @@ def get_vector_store_factory(
     logger.info('Get Vector Store Factory for the given setting')
     vector_store_credentials = fetch_default_vector_store_credentials()
 
-    # Helper function to create OpenSearchFactory
-    def create_opensearch_factory(
-        vs_setting: Optional[OpenSearchVectorStoreSetting],
-    ) -> OpenSearchFactory:
-        return OpenSearchFactory(
-            setting=vs_setting
-            or OpenSearchVectorStoreSetting(
-                host=application_settings.vector_store_host,
-                port=application_settings.vector_store_port,
-                username=vector_store_credentials.username,
-                password=RawSecretKey(secret=vector_store_credentials.password),
-            ),
-            index_name=index_name,
-            embedding_function=embedding_function,
-        )
-
-    # Helper function to create PGVectorFactory
-    def create_pgvector_factory(
-        vs_setting: Optional[PGVectorStoreSetting],
-    ) -> PGVectorFactory:
-        vector_store_credentials = fetch_default_vector_store_credentials()
-        return PGVectorFactory(
-            setting=vs_setting
-            or PGVectorStoreSetting(
+    # Helper function to create the default setting of a provider, from environment variables
+    def create_default_setting(provider: VectorStoreProvider) -> VectorStoreSetting:
+        if provider == VectorStoreProvider.PGVECTOR:
+            return PGVectorStoreSetting(
                 host=application_settings.vector_store_host,
                 port=application_settings.vector_store_port,
                 username=vector_store_credentials.username,
                 password=RawSecretKey(secret=vector_store_credentials.password),
                 database=application_settings.vector_store_database,
-            ),
-            index_name=index_name,
-            embedding_function=embedding_function,
+            )
+        return OpenSearchVectorStoreSetting(
+            host=application_settings.vector_store_host,
+            port=application_settings.vector_store_port,
+            username=vector_store_credentials.username,
+            password=RawSecretKey(secret=vector_store_credentials.password),
         )
 
     # If no setting is provided, use defaults from environment variables
@@ -287,40 +252,33 @@ def get_vector_store_factory(
             logger.error('No default Vector Store defined!')
             raise GenAIUnknownVectorStoreProviderSettingException()
 
-        # Dictionary dispatch for factory creation based on provider type
-        factory_dispatch = {
-            VectorStoreProvider.OPEN_SEARCH: create_opensearch_factory,
-            VectorStoreProvider.PGVECTOR: create_pgvector_factory,
-        }
-
-        # Create factory based on the provider type
         provider = application_settings.vector_store_provider
-        if provider in factory_dispatch:
-            logger.debug(f"Creating Vector Store Factory from environment - {provider}")
-            return factory_dispatch[provider](None)
+        if provider not in vector_store_factories:
+            logger.error('Unknown Vector Store provider in environment!')
+            raise GenAIUnknownVectorStoreProviderSettingException()
 
-        logger.error('Unknown Vector Store provider in environment!')
-        raise GenAIUnknownVectorStoreProviderSettingException()
+        logger.debug(f"Creating Vector Store Factory from environment - {provider}")
+        setting = create_default_setting(provider)
+    else:
+        provider = _get_provider(setting)
+        if provider not in vector_store_factories:
+            logger.error('Unknown Vector Store provider setting in RAG request!')
+            raise GenAIUnknownVectorStoreProviderSettingException()
 
-    # Use the provided setting to determine the factory type
-    if isinstance(setting, OpenSearchVectorStoreSetting):
-        logger.debug(
-            'Creating Vector Store Factory based on RAG request - OpenSearchFactory'
-        )
-        return create_opensearch_factory(setting)
-    elif isinstance(setting, PGVectorStoreSetting):
         logger.debug(
-            'Creating Vector Store Factory based on RAG request - PGVectorFactory'
+            f'Creating Vector Store Factory based on RAG request - {provider}'
         )
-        return create_pgvector_factory(setting)
 
-    logger.error('Unknown Vector Store provider setting in RAG request!')
-    raise GenAIUnknownVectorStoreProviderSettingException()
+    return vector_store_factories[provider](
+        setting=setting,
+        index_name=index_name,
+        embedding_function=embedding_function,
+    )
 
 
 def get_callback_handler_factory(
     setting: BaseObservabilitySetting,
-) -> LangChainCallbackHandlerFactory:
+) -> 'LangChainCallbackHandlerFactory':
     """
     Creates a Langchain Callback Handler Factory according to the given setting
     Args:
@@ -331,16 +289,17 @@ def get_callback_handler_factory(
     """
 
     logger.info('Get Observability Factory for the given setting')
-    if isinstance(setting, LangfuseObservabilitySetting):
-        logger.debug('Observability Factory - LangfuseCallbackHandlerFactory')
-        return LangfuseCallbackHandlerFactory(setting=setting)
-    else:
+    provider = _get_provider(setting)
+    if provider not in callback_handler_factories:
         raise GenAIUnknownObservabilityProviderSettingException()
+    factory_class = callback_handler_factories[provider]
+    logger.debug('Observability Factory - %s', factory_class.__name__)
+    return factory_class(setting=setting)
 
 
 def create_observability_callback_handler(
     observability_setting: Optional[ObservabilitySetting], **kwargs: Any
-) -> Optional[CallbackHandler]:
+) -> Optional['CallbackHandler']:
     """
     Create the Observability Callback Handler
 
@@ -358,7 +317,7 @@ def create_observability_callback_handler(
     return None
 
 
-def get_guardrail_factory(setting: BaseGuardrailSetting) -> GuardrailFactory:
+def get_guardrail_factory(setting: BaseGuardrailSetting) -> 'GuardrailFactory':
     """
     Retrieves the appropriate GuardrailFactory instance based on the provided setting.
         Args:
@@ -367,16 +326,17 @@ def get_guardrail_factory(setting: BaseGuardrailSetting) -> GuardrailFactory:
         The Guardrail Factory, or raise an exception otherwise
     """
     logger.info('Get Guardrail Factory for the given setting')
-    if isinstance(setting, BloomzGuardrailSetting):
-        logger.debug('Guardrail Factory - BloomzGuardrailFactory')
-        return BloomzGuardrailFactory(setting=setting)
-    else:
+    provider = _get_provider(setting)
+    if provider not in guardrail_factories:
         raise GenAIUnknownProviderSettingException()
+    factory_class = guardrail_factories[provider]
+    logger.debug('Guardrail Factory - %s', factory_class.__name__)
+    return factory_class(setting=setting)
 
 
 def get_compressor_factory(
     setting: BaseDocumentCompressorSetting, is_fault_tolerant: bool = True
-) -> DocumentCompressorFactory:
+) -> 'DocumentCompressorFactory':
     """
     Creates a  Compressor Factory according to the compressor provider
     Args:
@@ -386,12 +346,9 @@ def get_compressor_factory(
         The  Compressor Factory, or raise an exception otherwise
     """
     logger.info('Get Document Compressor Factory for the given setting')
-    if isinstance(setting, BloomzCompressorSetting):
-        logger.debug(
-            'Document Compressor Factory - BloomzCompressorFactory'
-        )
-        return BloomzCompressorFactory(
-            setting=setting, is_fault_tolerant = is_fault_tolerant
-        )
-    else:
+    provider = _get_provider(setting)
+    if provider not in compressor_factories:
         raise GenAIUnknownDocumentCompressorProviderSettingException()
+    factory_class = compressor_factories[provider]
+    logger.debug('Document Compressor Factory - %s', factory_class.__name__)
+    return factory_class(setting=setting, is_fault_tolerant=is_fault_tolerant)
@@ -29,9 +29,16 @@ from gen_ai_orchestrator.errors.handlers.openai.openai_exception_handler import
 from gen_ai_orchestrator.models.llm.azureopenai.azure_openai_llm_setting import (
     AzureOpenAILLMSetting,
 )
+from gen_ai_orchestrator.services.langchain.callbacks.circuit_breaker_callback_handler import (
+    get_circuit_breaker_callbacks,
+)
+from gen_ai_orchestrator.services.langchain.factories.client_registry import (
+    get_or_create_client,
+)
 from gen_ai_orchestrator.services.langchain.factories.llm.llm_factory import (
     LangChainLLMFactory,
-    rate_limiter,
+    get_rate_limited_http_clients,
+    get_rate_limiter,
 )
 from gen_ai_orchestrator.services.security.security_service import (
     fetch_secret_key_value,
@@ -44,17 +51,33 @@ class AzureOpenAILLMFactory(LangChainLLMFactory):
     setting: AzureOpenAILLMSetting
 
     def get_language_model(self) -> BaseLanguageModel:
-        return AzureChatOpenAI(
-            api_key=fetch_secret_key_value(self.setting.api_key),
-            api_version=self.setting.api_version,
-            azure_endpoint=str(self.setting.api_base),
-            azure_deployment=self.setting.deployment_name,
-            model=self.setting.model,
-            temperature=self.setting.temperature,
-            timeout=application_settings.llm_provider_timeout,
-            max_retries=application_settings.llm_provider_max_retries,
-            rate_limiter=rate_limiter if application_settings.llm_rate_limits else None,
-            reasoning_effort=self.setting.reasoning_effort,
+        api_key = fetch_secret_key_value(self.setting.api_key)
+        rate_limiter = get_rate_limiter(
+            'AzureOpenAIService',
+            f'{self.setting.api_base}/{self.setting.deployment_name}',
+            api_key,
+        )
+        return get_or_create_client(
+            lambda: AzureChatOpenAI(
+                api_key=api_key,
+                api_version=self.setting.api_version,
+                azure_endpoint=str(self.setting.api_base),
+                azure_deployment=self.setting.deployment_name,
+                model=self.setting.model,
+                temperature=self.setting.temperature,
+                timeout=application_settings.llm_provider_timeout,
+                max_retries=application_settings.llm_provider_max_retries,
+                rate_limiter=rate_limiter,
+                **get_rate_limited_http_clients(rate_limiter),
+                reasoning_effort=self.setting.reasoning_effort,
+                callbacks=get_circuit_breaker_callbacks(
+                    f'AzureOpenAIService:{self.setting.api_base}/{self.setting.deployment_name}',
+                    application_settings.llm_provider_timeout,
+                ),
+            ),
+            type(self).__name__,
+            self.setting,
+            api_key,
         )
 
     @openai_exception_handler(provider='AzureOpenAIService')
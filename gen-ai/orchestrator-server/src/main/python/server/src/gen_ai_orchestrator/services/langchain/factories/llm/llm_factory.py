@@ -16,16 +16,35 @@
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from langchain_core.callbacks import BaseCallbackHandler
-from langchain_core.language_models import BaseLanguageModel
-from langchain_core.rate_limiters import InMemoryRateLimiter
-from langchain_core.runnables import RunnableConfig
+from langchain_core.language_models import BaseLanguageModel, LanguageModelInput
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import Runnable, RunnableConfig
 from langchain_core.runnables.utils import Input, Output
 from pydantic import BaseModel
 
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
 from gen_ai_orchestrator.models.llm.llm_setting import BaseLLMSetting
+from gen_ai_orchestrator.services.langchain.factories.client_registry import (
+    get_or_create_client,
+)
+from gen_ai_orchestrator.services.langchain.impls.llm.hedged_language_model import (
+    HedgedLanguageModel,
+)
+from gen_ai_orchestrator.utils.fingerprint import fingerprint
+from gen_ai_orchestrator.utils.rate_limit.adaptive_rate_limiter import (
+    AdaptiveRateLimiter,
+    RateLimitedHttpHooks,
+)
+from gen_ai_orchestrator.utils.rate_limit.rate_limit_backend import (
+    InMemoryRateLimitBackend,
+    RateLimitBackend,
+    SQLiteRateLimitBackend,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +53,7 @@ class LangChainLLMFactory(ABC, BaseModel):
     """A base class for LangChain Large Language Model Factory"""
 
     setting: BaseLLMSetting
+    alternate_setting: Optional[BaseLLMSetting] = None
 
     @abstractmethod
     def get_language_model(self) -> BaseLanguageModel:
@@ -43,6 +63,56 @@ class LangChainLLMFactory(ABC, BaseModel):
         """
         pass
 
+    def get_hedged_language_model(self) -> Runnable[LanguageModelInput, BaseMessage]:
+        """
+        Fabric the language model to call, hedged by an alternate language model if LLM hedging is enabled
+        (or falling back to it if LLM fallback is enabled).
+        The alternate setting is the factory one, or the environment one.
+        :return: The language model, wrapped by a HedgedLanguageModel if there is an alternate one.
+        """
+        language_model = self.get_language_model()
+        alternate_setting = (
+            self.alternate_setting or application_settings.llm_alternate_setting
+        )
+        if alternate_setting is None or not (
+            application_settings.llm_hedging_enabled
+            or application_settings.llm_fallback_enabled
+        ):
+            return language_model
+
+        # Imported here: the factories module lazily loads this one
+        from gen_ai_orchestrator.services.langchain.factories.langchain_factory import (
+            get_llm_factory,
+        )
+
+        alternate_language_model = get_llm_factory(
+            alternate_setting
+        ).get_language_model()
+        # The wrapper (and its latency statistics) is registered by settings
+        hedged_language_model = get_or_create_client(
+            lambda: HedgedLanguageModel(
+                primary=language_model,
+                alternate=alternate_language_model,
+                provider=self.setting.provider.value,
+                model=getattr(self.setting, 'deployment_name', None)
+                or getattr(self.setting, 'model', None)
+                or '',
+                hedging=application_settings.llm_hedging_enabled,
+                percentile=application_settings.llm_hedging_percentile,
+                default_delay=application_settings.llm_hedging_default_delay,
+                min_delay=application_settings.llm_hedging_min_delay,
+                min_samples=application_settings.llm_hedging_min_samples,
+                window_size=application_settings.llm_hedging_window_size,
+            ),
+            HedgedLanguageModel.__name__,
+            self.setting,
+            alternate_setting,
+        )
+        # The wrapped models are rebuilt when their secrets change (the latency statistics are kept)
+        hedged_language_model.primary = language_model
+        hedged_language_model.alternate = alternate_language_model
+        return hedged_language_model
+
     async def check_llm_setting(
         self,
         observability_callback_handler: Optional[BaseCallbackHandler] = None,
@@ -88,11 +158,62 @@ class LangChainLLMFactory(ABC, BaseModel):
         return await self.get_language_model().ainvoke(_input, config)
 
 
-rate_limiter = InMemoryRateLimiter(
-    # We can only make a request once every 10 seconds!!
-    requests_per_second=0.1,
-    # Wake up every 100 ms to check whether allowed to make a request,
-    check_every_n_seconds=0.1,
-    # Controls the maximum burst size.
-    max_bucket_size=10,
-)
+def create_rate_limit_backend() -> RateLimitBackend:
+    """Create the rate limit backend: shared by the workers if a SQLite path is set, else in memory."""
+    if application_settings.llm_rate_limit_sqlite_path:
+        return SQLiteRateLimitBackend(application_settings.llm_rate_limit_sqlite_path)
+    return InMemoryRateLimitBackend()
+
+
+rate_limit_backend = create_rate_limit_backend()
+
+
+def get_rate_limiter(
+    provider: str, endpoint: Optional[str], api_key: Optional[str]
+) -> Optional[AdaptiveRateLimiter]:
+    """
+    Get the rate limiter of a provider credential.
+    The rate limiters of the same provider, endpoint (or deployment) and API key share their buckets.
+
+    Args:
+        provider: The LLM provider
+        endpoint: The provider endpoint, or deployment
+        api_key: The resolved API key
+    Returns:
+        The rate limiter, or None if the rate limits are disabled.
+    """
+    if not application_settings.llm_rate_limits:
+        return None
+    return AdaptiveRateLimiter(
+        # The API key is hashed, never stored
+        key=fingerprint(provider, endpoint, api_key),
+        requests_per_minute=application_settings.llm_rate_limit_requests_per_minute,
+        tokens_per_minute=application_settings.llm_rate_limit_tokens_per_minute,
+        backend=rate_limit_backend,
+    )
+
+
+def get_rate_limited_http_clients(
+    rate_limiter: Optional[AdaptiveRateLimiter],
+) -> Dict[str, Any]:
+    """
+    Get the HTTP clients of an OpenAI model, that acquire the tokens of the requests
+    and adapt the rate limiter to the responses (429, x-ratelimit-* headers).
+
+    Args:
+        rate_limiter: The rate limiter
+    Returns:
+        The http_client and http_async_client model arguments (none if there is no rate limiter).
+    """
+    if rate_limiter is None:
+        return {}
+    # Imported here: only the OpenAI based factories (that already load the SDK) use these clients
+    import openai
+
+    hooks = RateLimitedHttpHooks(rate_limiter)
+    return {
+        'http_client': openai.DefaultHttpxClient(event_hooks=hooks.event_hooks()),
+        'http_async_client': openai.DefaultAsyncHttpxClient(
+            event_hooks=hooks.async_event_hooks()
+        ),
+    }
@@ -26,6 +26,12 @@ from gen_ai_orchestrator.errors.handlers.ollama.ollama_exception_handler import
 from gen_ai_orchestrator.models.llm.ollama.ollama_llm_setting import (
     OllamaLLMSetting,
 )
+from gen_ai_orchestrator.services.langchain.callbacks.circuit_breaker_callback_handler import (
+    get_circuit_breaker_callbacks,
+)
+from gen_ai_orchestrator.services.langchain.factories.client_registry import (
+    get_or_create_client,
+)
 from gen_ai_orchestrator.services.langchain.factories.llm.llm_factory import (
     LangChainLLMFactory,
 )
@@ -37,10 +43,17 @@ class OllamaLLMFactory(LangChainLLMFactory):
     setting: OllamaLLMSetting
 
     def get_language_model(self) -> BaseLanguageModel:
-        return ChatOllama(
-            base_url=self.setting.base_url,
-            model=self.setting.model,
-            temperature=self.setting.temperature,
+        return get_or_create_client(
+            lambda: ChatOllama(
+                base_url=self.setting.base_url,
+                model=self.setting.model,
+                temperature=self.setting.temperature,
+                callbacks=get_circuit_breaker_callbacks(
+                    f'Ollama:{self.setting.base_url}'
+                ),
+            ),
+            type(self).__name__,
+            self.setting,
         )
 
     @ollama_exception_handler(provider='Ollama')
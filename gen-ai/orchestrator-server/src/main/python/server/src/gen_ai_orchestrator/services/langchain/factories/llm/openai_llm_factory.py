@@ -29,9 +29,16 @@ from gen_ai_orchestrator.errors.handlers.openai.openai_exception_handler import
 from gen_ai_orchestrator.models.llm.openai.openai_llm_setting import (
     OpenAILLMSetting,
 )
+from gen_ai_orchestrator.services.langchain.callbacks.circuit_breaker_callback_handler import (
+    get_circuit_breaker_callbacks,
+)
+from gen_ai_orchestrator.services.langchain.factories.client_registry import (
+    get_or_create_client,
+)
 from gen_ai_orchestrator.services.langchain.factories.llm.llm_factory import (
     LangChainLLMFactory,
-    rate_limiter,
+    get_rate_limited_http_clients,
+    get_rate_limiter,
 )
 from gen_ai_orchestrator.services.security.security_service import (
     fetch_secret_key_value,
@@ -44,15 +51,27 @@ class OpenAILLMFactory(LangChainLLMFactory):
     setting: OpenAILLMSetting
 
     def get_language_model(self) -> BaseLanguageModel:
-        return ChatOpenAI(
-            api_key=fetch_secret_key_value(self.setting.api_key),
-            base_url=self.setting.base_url,
-            model=self.setting.model,
-            temperature=self.setting.temperature,
-            timeout=application_settings.llm_provider_timeout,
-            max_retries=application_settings.llm_provider_max_retries,
-            rate_limiter=rate_limiter if application_settings.llm_rate_limits else None,
-            reasoning_effort=self.setting.reasoning_effort,
+        api_key = fetch_secret_key_value(self.setting.api_key)
+        rate_limiter = get_rate_limiter('OpenAI', self.setting.base_url, api_key)
+        return get_or_create_client(
+            lambda: ChatOpenAI(
+                api_key=api_key,
+                base_url=self.setting.base_url,
+                model=self.setting.model,
+                temperature=self.setting.temperature,
+                timeout=application_settings.llm_provider_timeout,
+                max_retries=application_settings.llm_provider_max_retries,
+                rate_limiter=rate_limiter,
+                **get_rate_limited_http_clients(rate_limiter),
+                reasoning_effort=self.setting.reasoning_effort,
+                callbacks=get_circuit_breaker_callbacks(
+                    f'OpenAI:{self.setting.base_url}',
+                    application_settings.llm_provider_timeout,
+                ),
+            ),
+            type(self).__name__,
+            self.setting,
+            api_key,
         )
 
     @openai_exception_handler(provider='OpenAI')
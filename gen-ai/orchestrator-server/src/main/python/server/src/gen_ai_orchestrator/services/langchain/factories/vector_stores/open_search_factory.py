@@ -20,6 +20,7 @@ from langchain_community.vectorstores.opensearch_vector_search import (
     OpenSearchVectorSearch,
 )
 from langchain_core.vectorstores import VectorStoreRetriever
+from opensearchpy import AsyncOpenSearch
 
 from gen_ai_orchestrator.configurations.environment.settings import (
     application_settings,
@@ -31,9 +32,16 @@ from gen_ai_orchestrator.errors.handlers.opensearch.opensearch_exception_handler
 from gen_ai_orchestrator.models.vector_stores.open_search.open_search_setting import (
     OpenSearchVectorStoreSetting,
 )
+from gen_ai_orchestrator.services.langchain.factories.client_registry import (
+    get_or_create_client,
+)
 from gen_ai_orchestrator.services.langchain.factories.vector_stores.vector_store_factory import (
     LangChainVectorStoreFactory,
 )
+from gen_ai_orchestrator.services.langchain.impls.vector_stores.async_opensearch_vector_search import (
+    AsyncOpenSearchVectorSearch,
+    KeepAliveAIOHttpConnection,
+)
 from gen_ai_orchestrator.services.security.security_service import (
     fetch_secret_key_value,
 )
@@ -52,35 +60,90 @@ class OpenSearchFactory(LangChainVectorStoreFactory):
 
     def get_vector_store(self, async_mode: Optional[bool] = True) -> OpenSearchVectorSearch:
         password = fetch_secret_key_value(self.setting.password)
-        logger.info(
+        logger.debug(
             'OpenSearch user credentials: %s:%s',
             self.setting.username,
             obfuscate(password),
         )
-        return OpenSearchVectorSearch(
-            opensearch_url=f'https://{self.setting.host}:{self.setting.port}',
-            http_auth=(
-                self.setting.username,
-                fetch_secret_key_value(self.setting.password),
+        if async_mode:
+            # The kNN query runs natively on the event loop, with the AsyncOpenSearch client of the cluster
+            return get_or_create_client(
+                lambda: AsyncOpenSearchVectorSearch(
+                    **self._client_kwargs(password),
+                    index_name=self.index_name,
+                    embedding_function=self.embedding_function,
+                    async_client=self._get_async_client(password),
+                ),
+                type(self).__name__,
+                self.setting,
+                password,
+                self.index_name,
+                # The registered vector store keeps a reference to its embedding function,
+                # so its id cannot be reused by another object while the entry exists.
+                id(self.embedding_function),
+                async_mode,
+            )
+
+        return get_or_create_client(
+            lambda: OpenSearchVectorSearch(
+                **self._client_kwargs(password),
+                index_name=self.index_name,
+                embedding_function=self.embedding_function,
             ),
-            use_ssl=is_prod_environment,
-            verify_certs=is_prod_environment,
+            type(self).__name__,
+            self.setting,
+            password,
+            self.index_name,
+            id(self.embedding_function),
+            async_mode,
+        )
+
+    def _client_kwargs(self, password: str) -> dict:
+        """The OpenSearch client arguments, common to the sync and async clients."""
+        return {
+            'opensearch_url': f'https://{self.setting.host}:{self.setting.port}',
+            'http_auth': (self.setting.username, password),
+            'use_ssl': is_prod_environment,
+            'verify_certs': is_prod_environment,
             # Expected hostname on the server certificate.
             # By default, is the same as host. If set to False, it will not verify hostname on certificate
-            ssl_assert_hostname=self.setting.host if is_prod_environment else False,
-            ssl_show_warn=is_prod_environment,
-            index_name=self.index_name,
-            embedding_function=self.embedding_function,
-            timeout=application_settings.vector_store_timeout,
-        )
+            'ssl_assert_hostname': self.setting.host if is_prod_environment else False,
+            'ssl_show_warn': is_prod_environment,
+            'timeout': application_settings.vector_store_timeout,
+            'http_compress': application_settings.opensearch_http_compress,
+        }
+
+    def _get_async_client(self, password: str) -> AsyncOpenSearch:
+        """Get the AsyncOpenSearch client of the cluster, shared by all its indexes (and its connection pool)."""
+
+        def build() -> AsyncOpenSearch:
+            kwargs = self._client_kwargs(password)
+            return AsyncOpenSearch(
+                kwargs.pop('opensearch_url'),
+                **kwargs,
+                connection_class=KeepAliveAIOHttpConnection,
+                maxsize=application_settings.opensearch_pool_maxsize,
+                keepalive_timeout=application_settings.opensearch_pool_keepalive_timeout,
+            )
+
+        return get_or_create_client(build, AsyncOpenSearch.__name__, self.setting, password)
 
     def get_vector_store_retriever(self, search_kwargs: dict, async_mode: Optional[bool] = True) -> VectorStoreRetriever:
-        return self.get_vector_store(async_mode).as_retriever(
-            search_kwargs=search_kwargs
-        )
+        return self.as_retriever(self.get_vector_store(async_mode), search_kwargs)
 
     @opensearch_exception_handler
     async def check_vector_store_connection(self) -> bool:
         """To check the connection information, we ask for basic information about the cluster."""
-        self.get_vector_store().client.info()
+        await self.get_vector_store().async_client.info()
         return True
+
+    @opensearch_exception_handler
+    async def warm_up(self) -> None:
+        """
+        Open the connections to the cluster, and load the kNN graphs of the index in memory
+        (k-NN plugin warm-up API), instead of faulting them in on the first searches.
+        """
+        await self.check_vector_store_connection()
+        await self.get_vector_store().async_client.transport.perform_request(
+            'POST', f'/_plugins/_knn/warmup/{self.index_name}'
+        )
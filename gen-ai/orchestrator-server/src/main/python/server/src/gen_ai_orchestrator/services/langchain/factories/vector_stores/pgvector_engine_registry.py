@@ -0,0 +1,139 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Module for the PGVector engine registry.
+A SQLAlchemy engine holds a pool of PostgreSQL connections: it is shared between all
+the PGVector stores (whatever their collection) that target the same database (DSN).
+When the DSN of a database changes (password rotation), its previous engine is disposed.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import TYPE_CHECKING, Dict, Set, Tuple, Union
+
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
+from gen_ai_orchestrator.utils.fingerprint import fingerprint
+
+if TYPE_CHECKING:
+    from sqlalchemy import Engine
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+# The engines by database (host, port, database, user and mode), with the fingerprint of their DSN
+_engines: Dict[Tuple[str, bool], Tuple[str, Union['Engine', 'AsyncEngine']]] = {}
+_lock = threading.Lock()
+# The pending disposals of the replaced async engines (a reference is kept until they are done)
+_disposals: Set[asyncio.Task] = set()
+
+
+def _pool_args() -> dict:
+    """The connection pool arguments of the engines."""
+    return {
+        'pool_size': application_settings.pgvector_pool_size,
+        'max_overflow': application_settings.pgvector_pool_max_overflow,
+        'pool_pre_ping': application_settings.pgvector_pool_pre_ping,
+        'pool_recycle': application_settings.pgvector_pool_recycle,
+    }
+
+
+def get_pgvector_engine(dsn: str, async_mode: bool = True) -> Union['Engine', 'AsyncEngine']:
+    """
+    Get the engine of the given DSN, or create it (with its connection pool).
+    The previous engine of the same database, created with another DSN (e.g. an old password), is disposed.
+
+    Args:
+        dsn: The database connection string
+        async_mode: True for an asynchronous engine
+    Returns:
+        The shared engine.
+    """
+    # SQLAlchemy is only loaded by the deployments using PGVector
+    from sqlalchemy import create_engine, make_url
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    # The DSN holds the password: the database is identified without it, and only its fingerprint is kept.
+    url = make_url(dsn)
+    database = fingerprint(
+        url.drivername, url.username, url.host, url.port, url.database, dict(url.query)
+    )
+    dsn_fingerprint = fingerprint(dsn)
+    replaced_engine = None
+    with _lock:
+        entry = _engines.get((database, async_mode))
+        if entry is not None and entry[0] == dsn_fingerprint:
+            return entry[1]
+        if entry is not None:
+            replaced_engine = entry[1]
+
+        logger.info(
+            'PGVector engine registry - New %s engine (pool size: %s, max overflow: %s)',
+            'async' if async_mode else 'sync',
+            application_settings.pgvector_pool_size,
+            application_settings.pgvector_pool_max_overflow,
+        )
+        engine = (
+            create_async_engine(dsn, **_pool_args())
+            if async_mode
+            else create_engine(dsn, **_pool_args())
+        )
+        _engines[(database, async_mode)] = (dsn_fingerprint, engine)
+
+    if replaced_engine is not None:
+        logger.info('PGVector engine registry - The DSN has changed, the previous engine is disposed')
+        _dispose_in_background(replaced_engine)
+    return engine
+
+
+def _dispose_in_background(engine: Union['Engine', 'AsyncEngine']) -> None:
+    """
+    Dispose an engine: its idle connections are closed, the checked out ones are closed when returned.
+    An async engine is disposed in a task of the running event loop (if any).
+    """
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+    if not isinstance(engine, AsyncEngine):
+        engine.dispose()
+        return
+    try:
+        task = asyncio.get_running_loop().create_task(engine.dispose())
+    except RuntimeError:
+        asyncio.run(engine.dispose())
+        return
+    _disposals.add(task)
+    task.add_done_callback(_disposals.discard)
+
+
+async def dispose_pgvector_engines() -> None:
+    """Close the connection pools of all engines, and remove them from the registry."""
+    with _lock:
+        engines = [engine for _, engine in _engines.values()]
+        _engines.clear()
+    if _disposals:
+        await asyncio.gather(*_disposals, return_exceptions=True)
+    if not engines:
+        return
+
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+    for engine in engines:
+        if isinstance(engine, AsyncEngine):
+            await engine.dispose()
+        else:
+            engine.dispose()
+    logger.info('PGVector engine registry - %s engine(s) disposed', len(engines))
@@ -18,6 +18,7 @@ from typing import Optional
 
 from langchain_core.vectorstores import VectorStoreRetriever
 from langchain_postgres import PGVector
+from sqlalchemy import text
 
 from gen_ai_orchestrator.configurations.environment.settings import (
     application_settings,
@@ -25,6 +26,12 @@ from gen_ai_orchestrator.configurations.environment.settings import (
 from gen_ai_orchestrator.models.vector_stores.pgvector.pgvector_setting import (
     PGVectorStoreSetting,
 )
+from gen_ai_orchestrator.services.langchain.factories.client_registry import (
+    get_or_create_client,
+)
+from gen_ai_orchestrator.services.langchain.factories.vector_stores.pgvector_engine_registry import (
+    get_pgvector_engine,
+)
 from gen_ai_orchestrator.services.langchain.factories.vector_stores.vector_store_factory import (
     LangChainVectorStoreFactory,
 )
@@ -46,24 +53,37 @@ class PGVectorFactory(LangChainVectorStoreFactory):
 
     def get_vector_store(self, async_mode: Optional[bool] = True) -> PGVector:
         password = fetch_secret_key_value(self.setting.password)
-        logger.info(
+        logger.debug(
             'PostgreSQL user credentials: %s:%s',
             self.setting.username,
             obfuscate(password),
         )
 
-        return PGVector(
-            embeddings=self.embedding_function,
-            collection_name=self.index_name,
-            connection=f'postgresql+psycopg://{self.setting.username}:{password}@{self.setting.host}:{self.setting.port}/{self.setting.database}',
-            use_jsonb=True,
-            async_mode=async_mode
+        return get_or_create_client(
+            lambda: PGVector(
+                embeddings=self.embedding_function,
+                collection_name=self.index_name,
+                # The engine (and its connection pool) is shared by all the collections of the database
+                connection=get_pgvector_engine(self._dsn(password), async_mode=async_mode),
+                use_jsonb=True,
+                async_mode=async_mode
+            ),
+            type(self).__name__,
+            self.setting,
+            password,
+            self.index_name,
+            # The registered vector store keeps a reference to its embedding function,
+            # so its id cannot be reused by another object while the entry exists.
+            id(self.embedding_function),
+            async_mode,
         )
 
+    def _dsn(self, password: str) -> str:
+        """The database connection string."""
+        return f'postgresql+psycopg://{self.setting.username}:{password}@{self.setting.host}:{self.setting.port}/{self.setting.database}'
+
     def get_vector_store_retriever(self, search_kwargs: dict, async_mode: Optional[bool] = True) -> VectorStoreRetriever:
-        return self.get_vector_store(async_mode).as_retriever(
-            search_kwargs=search_kwargs
-        )
+        return self.as_retriever(self.get_vector_store(async_mode), search_kwargs)
 
     async def check_vector_store_connection(self) -> bool:
         """
@@ -74,3 +94,9 @@ class PGVectorFactory(LangChainVectorStoreFactory):
         await self.get_vector_store().asimilarity_search(
             query=application_settings.vector_store_test_query, k=application_settings.vector_store_test_max_docs_retrieved)
         return True
+
+    async def warm_up(self) -> None:
+        """Open a connection of the pool of the database (shared by all its collections)."""
+        password = fetch_secret_key_value(self.setting.password)
+        async with get_pgvector_engine(self._dsn(password)).connect() as connection:
+            await connection.execute(text('SELECT 1'))
@@ -36,6 +36,10 @@ from gen_ai_orchestrator.models.errors.errors_models import ErrorInfo
 from gen_ai_orchestrator.models.vector_stores.vector_store_setting import (
     BaseVectorStoreSetting,
 )
+from gen_ai_orchestrator.services.langchain.impls.vector_stores.circuit_breaker_retriever import (
+    CircuitBreakerRetriever,
+)
+from gen_ai_orchestrator.utils.circuit_breaker import get_circuit_breaker
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +73,27 @@ class LangChainVectorStoreFactory(ABC, BaseModel):
         """
         pass
 
+    def as_retriever(self, vector_store: VectorStore, search_kwargs: dict) -> VectorStoreRetriever:
+        """
+        Get the retriever of a vector store, guarded by the circuit breaker of the Vector Store endpoint (if enabled)
+        Args:
+            vector_store: the vector store
+            search_kwargs: the search filter
+        :return: A VectorStoreRetriever.
+        """
+        circuit_breaker = get_circuit_breaker(
+            f"{self.setting.provider.value}:{getattr(self.setting, 'host', '')}:{getattr(self.setting, 'port', '')}",
+            application_settings.vector_store_timeout,
+        )
+        if circuit_breaker is None:
+            return vector_store.as_retriever(search_kwargs=search_kwargs)
+        return CircuitBreakerRetriever(
+            vectorstore=vector_store,
+            tags=vector_store._get_retriever_tags(),
+            search_kwargs=search_kwargs,
+            circuit_breaker=circuit_breaker,
+        )
+
     @opensearch_exception_handler
     async def check_vector_store_setting(self) -> bool:
         """
@@ -100,3 +125,10 @@ class LangChainVectorStoreFactory(ABC, BaseModel):
     async def check_vector_store_connection(self) -> bool:
         """Check vector store connection and authentication"""
         pass
+
+    async def warm_up(self) -> None:
+        """
+        Warm up the vector store of the index (at startup): create its client
+        and open the connections, so that the first requests do not pay for it.
+        """
+        await self.check_vector_store_connection()
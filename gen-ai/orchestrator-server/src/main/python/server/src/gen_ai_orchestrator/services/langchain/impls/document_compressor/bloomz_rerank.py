@@ -12,10 +12,13 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 #
+import asyncio
 import logging
-from typing import Sequence
+from itertools import chain
+from typing import List, Optional, Sequence
 from urllib.parse import urljoin
 
+import httpx
 import requests
 from langchain_core.callbacks import Callbacks
 from langchain_core.documents import BaseDocumentCompressor, Document
@@ -25,6 +28,15 @@ from gen_ai_orchestrator.errors.exceptions.document_compressor.document_compress
     GenAIDocumentCompressorUnknownLabelException,
 )
 from gen_ai_orchestrator.models.errors.errors_models import ErrorInfo
+from gen_ai_orchestrator.utils.circuit_breaker import (
+    CircuitBreaker,
+    circuit_breaker_call,
+    get_circuit_breaker,
+    is_failure_status,
+)
+from gen_ai_orchestrator.utils.http.async_http_client import (
+    get_async_http_client,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -42,11 +54,22 @@ class BloomzRerank(BaseDocumentCompressor):
     """Label to use for reranking."""
     fill_to_max_documents: bool = False
     """If True, complete with the best remaining documents up to max_documents."""
+    shard_size: int = 16
+    """Maximum number of documents scored by a request. Larger lists are scored in concurrent requests (async only)."""
 
     timeout: int = 5
     is_fault_tolerant: bool = True
     """If True, the treatment is fault-tolerant."""
 
+    @property
+    def _url(self) -> str:
+        return urljoin(self.endpoint, '/score')
+
+    @property
+    def _circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """The circuit breaker of the endpoint: while it is open, the compression falls back at once."""
+        return get_circuit_breaker(f'BloomzRerank:{self.endpoint}', self.timeout)
+
     def compress_documents(
         self,
         documents: Sequence[Document],
@@ -67,53 +90,145 @@ class BloomzRerank(BaseDocumentCompressor):
         if len(documents) == 0:  # to avoid empty api call
             return []
 
-        url = urljoin(self.endpoint, '/score')
         try:
-            response = requests.post(
-                url=url,
-                json={
-                    'contexts': [
-                        {'query': query, 'context': document.page_content}
-                        for document in documents
-                    ]
-                },
-                timeout=self.timeout,
-            )
+            with circuit_breaker_call(self._circuit_breaker) as call:
+                response = requests.post(
+                    url=self._url,
+                    json=self._score_request(documents, query),
+                    timeout=self.timeout,
+                )
+                call.failed = is_failure_status(response.status_code)
 
             if response.status_code != 200:
-                logger.error(
-                    f'[Compressor] Bad response {response.status_code} '
-                    f'{response.reason} - {response.text}'
+                return self._fallback_on_bad_response(
+                    documents, response.status_code, response.reason, response.text
                 )
 
-                if not self.is_fault_tolerant:
-                    raise GenAIDocumentCompressorErrorException(
-                        ErrorInfo(
-                            error=str(response.status_code),
-                            cause=f"Response: {response.text}, Reason: {response.reason}",
-                            request=f"[POST] {url}",
-                        )
-                    )
-
-                logger.warning('[Compressor] Fallback to original documents')
-                return documents
-
             results = response.json().get('response', [])
 
         except Exception as exc:
-            logger.error(f'[Compressor] Exception during rerank call: {exc}')
-
-            if not self.is_fault_tolerant:
-                raise GenAIDocumentCompressorErrorException(
-                    ErrorInfo(
-                        error=exc.__class__.__name__,
-                        cause=str(exc),
-                        request=f"[POST] {url}",
+            return self._fallback_on_exception(documents, exc)
+
+        return self._rerank(documents, results)
+
+    async def acompress_documents(
+        self,
+        documents: Sequence[Document],
+        query: str,
+        callbacks: Callbacks | None = None
+    ) -> Sequence[Document]:
+        """
+        Compress documents asynchronously, on the shared HTTP client.
+        The documents are scored in concurrent shards of shard_size documents.
+
+        Args:
+            documents: A sequence of documents to compress.
+            query: The query to use for compressing the documents.
+            callbacks: Callbacks to run during the compression process.
+
+        Returns:
+            A sequence of compressed documents.
+        """
+        if len(documents) == 0:  # to avoid empty api call
+            return []
+
+        shards = [
+            documents[i : i + self.shard_size]
+            for i in range(0, len(documents), self.shard_size)
+        ]
+        try:
+            with circuit_breaker_call(self._circuit_breaker) as call:
+                responses = await self._ascore_shards(shards, query)
+                call.failed = any(
+                    is_failure_status(response.status_code) for response in responses
+                )
+
+            for response in responses:
+                if response.status_code != 200:
+                    return self._fallback_on_bad_response(
+                        documents, response.status_code, response.reason_phrase, response.text
                     )
+
+            # The shards results are merged in the documents order
+            results = list(
+                chain.from_iterable(
+                    response.json().get('response', []) for response in responses
+                )
+            )
+
+        except Exception as exc:
+            return self._fallback_on_exception(documents, exc)
+
+        return self._rerank(documents, results)
+
+    async def _ascore_shards(
+        self, shards: List[Sequence[Document]], query: str
+    ) -> List[httpx.Response]:
+        """Score the shards concurrently. A failed shard cancels the other ones."""
+        tasks = [asyncio.ensure_future(self._ascore(shard, query)) for shard in shards]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    async def _ascore(self, documents: Sequence[Document], query: str) -> httpx.Response:
+        """Score a shard of documents."""
+        return await get_async_http_client().post(
+            url=self._url,
+            json=self._score_request(documents, query),
+            timeout=self.timeout,
+        )
+
+    @staticmethod
+    def _score_request(documents: Sequence[Document], query: str) -> dict:
+        return {
+            'contexts': [
+                {'query': query, 'context': document.page_content}
+                for document in documents
+            ]
+        }
+
+    def _fallback_on_bad_response(
+        self, documents: Sequence[Document], status_code: int, reason: str, text: str
+    ) -> Sequence[Document]:
+        logger.error(
+            f'[Compressor] Bad response {status_code} '
+            f'{reason} - {text}'
+        )
+
+        if not self.is_fault_tolerant:
+            raise GenAIDocumentCompressorErrorException(
+                ErrorInfo(
+                    error=str(status_code),
+                    cause=f"Response: {text}, Reason: {reason}",
+                    request=f"[POST] {self._url}",
+                )
+            )
+
+        logger.warning('[Compressor] Fallback to original documents')
+        return documents
+
+    def _fallback_on_exception(
+        self, documents: Sequence[Document], exc: Exception
+    ) -> Sequence[Document]:
+        logger.error(f'[Compressor] Exception during rerank call: {exc}')
+
+        if not self.is_fault_tolerant:
+            raise GenAIDocumentCompressorErrorException(
+                ErrorInfo(
+                    error=exc.__class__.__name__,
+                    cause=str(exc),
+                    request=f"[POST] {self._url}",
                 )
+            )
+
+        logger.warning('[Compressor] Fallback to original documents')
+        return documents
 
-            logger.warning('[Compressor] Fallback to original documents')
-            return documents
+    def _rerank(self, documents: Sequence[Document], results: list) -> List[Document]:
+        """Score the documents with the results, then keep the best ones."""
 
         scored_docs = []
 
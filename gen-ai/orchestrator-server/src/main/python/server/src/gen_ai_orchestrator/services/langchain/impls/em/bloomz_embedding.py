@@ -13,16 +13,32 @@
 #   limitations under the License.
 #
 
+import asyncio
 import logging
-from typing import List, Union
+import time
+from typing import List, Optional, Union
 from urllib.parse import urljoin
 
-import requests
+import httpx
 from langchain.embeddings.base import Embeddings
 from pydantic import BaseModel
 
+from gen_ai_orchestrator.utils.circuit_breaker import (
+    CircuitBreaker,
+    circuit_breaker_call,
+    get_circuit_breaker,
+    is_failure_status,
+)
+from gen_ai_orchestrator.utils.http.async_http_client import (
+    get_async_http_client,
+    get_http_client,
+)
+
 logger = logging.getLogger(__name__)
 
+# The status codes of the responses that can be retried
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
 
 class InferenceRequest(BaseModel):
     text: Union[str, list]
@@ -34,26 +50,113 @@ class BloomzEmbeddings(BaseModel, Embeddings):
 
     pooling: str
     api_base: str
+    batch_size: int = 32
+    """Maximum number of texts embedded by a request. Larger inputs are split in batches."""
+    max_concurrency: int = 4
+    """Maximum number of batches embedded concurrently (async only)."""
+    timeout: float = 4
+    """Request timeout (in seconds)."""
+    max_retries: int = 2
+    """Number of retries of a failed request (connection error, timeout, 429 or 5xx response)."""
+    retry_backoff: float = 0.5
+    """Delay (in seconds) before the first retry, doubled for each next retry."""
 
     @property
     def _api_url(self) -> str:
         return urljoin(self.api_base, '/embed')
 
+    @property
+    def _circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """The circuit breaker of the endpoint (each attempt of a batch counts as a call, the retry delays excluded)."""
+        return get_circuit_breaker(f'BloomzEmbeddings:{self.api_base}', self.timeout)
+
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
         """Get the embeddings for a list of texts."""
-        response = requests.post(
-            self._api_url,
-            json=InferenceRequest(text=texts, pooling=self.pooling).model_dump(
-                mode='json'
-            ),
-            verify=False,
-        )
-        if response.status_code != 200:
-            logger.exception(
-                f"Embedding request didn't return expected status code {response.content}"
-            )
-        return response.json()['embedding']
+        embeddings = []
+        for batch in self._batches(texts):
+            embeddings.extend(self._embed_batch(batch))
+        return embeddings
 
     def embed_query(self, text: str) -> List[float]:
         """Compute query embeddings using a HuggingFace transformer model."""
         return self.embed_documents([text])[0]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Get the embeddings for a list of texts. The batches are embedded concurrently."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def embed_batch(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await self._aembed_batch(batch)
+
+        results = await asyncio.gather(
+            *(embed_batch(batch) for batch in self._batches(texts))
+        )
+        return [embedding for result in results for embedding in result]
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """Compute query embeddings using a HuggingFace transformer model."""
+        return (await self.aembed_documents([text]))[0]
+
+    def _batches(self, texts: List[str]) -> List[List[str]]:
+        return [
+            texts[i : i + self.batch_size] for i in range(0, len(texts), self.batch_size)
+        ]
+
+    def _request_body(self, texts: List[str]) -> dict:
+        return InferenceRequest(text=texts, pooling=self.pooling).model_dump(mode='json')
+
+    def _retry_delay(self, attempt: int) -> float:
+        return self.retry_backoff * (2**attempt)
+
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        for attempt in range(self.max_retries + 1):
+            is_last_attempt = attempt == self.max_retries
+            try:
+                with circuit_breaker_call(self._circuit_breaker) as call:
+                    response = get_http_client(verify=False).post(
+                        self._api_url,
+                        json=self._request_body(texts),
+                        timeout=self.timeout,
+                    )
+                    call.failed = is_failure_status(response.status_code)
+            except httpx.TransportError as exc:
+                if is_last_attempt:
+                    raise
+                logger.warning('Embedding request failed (%s), retrying...', exc)
+            else:
+                if response.status_code == 200:
+                    return response.json()['embedding']
+                if is_last_attempt or response.status_code not in RETRYABLE_STATUS_CODES:
+                    logger.error(
+                        f"Embedding request didn't return expected status code {response.content}"
+                    )
+                    response.raise_for_status()
+                logger.warning('Embedding request returned %s, retrying...', response.status_code)
+            time.sleep(self._retry_delay(attempt))
+
+    async def _aembed_batch(self, texts: List[str]) -> List[List[float]]:
+        for attempt in range(self.max_retries + 1):
+            is_last_attempt = attempt == self.max_retries
+            try:
+                with circuit_breaker_call(self._circuit_breaker) as call:
+                    response = await get_async_http_client(verify=False).post(
+                        self._api_url,
+                        json=self._request_body(texts),
+                        timeout=self.timeout,
+                    )
+                    call.failed = is_failure_status(response.status_code)
+            except httpx.TransportError as exc:
+                if is_last_attempt:
+                    raise
+                logger.warning('Embedding request failed (%s), retrying...', exc)
+            else:
+                if response.status_code == 200:
+                    return response.json()['embedding']
+                if is_last_attempt or response.status_code not in RETRYABLE_STATUS_CODES:
+                    logger.error(
+                        f"Embedding request didn't return expected status code {response.content}"
+                    )
+                    response.raise_for_status()
+                logger.warning('Embedding request returned %s, retrying...', response.status_code)
+            await asyncio.sleep(self._retry_delay(attempt))
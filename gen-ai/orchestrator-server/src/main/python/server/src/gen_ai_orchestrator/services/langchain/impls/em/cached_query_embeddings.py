@@ -0,0 +1,172 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Module for the query embeddings cache.
+The same questions are often asked again (or re-embedded by the health probes):
+their embeddings are cached, to save a round trip to the Embedding Model provider.
+"""
+
+import asyncio
+import logging
+import unicodedata
+from array import array
+from typing import List, Optional
+
+from langchain.embeddings.base import Embeddings
+from pydantic import BaseModel, ConfigDict
+
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
+from gen_ai_orchestrator.utils.cache.sqlite_embedding_cache import (
+    SQLiteEmbeddingCache,
+)
+from gen_ai_orchestrator.utils.cache.ttl_lru_cache import TTLLRUCache
+from gen_ai_orchestrator.utils.fingerprint import fingerprint
+from gen_ai_orchestrator.utils.metrics.cache_metrics import register_cache_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class QueryEmbeddingCache:
+    """
+    A query embeddings cache: an in-memory LRU cache, backed by an optional on-disk cache.
+    The embeddings are kept in memory as float32 arrays (6KB for 1536 dimensions, instead of about 49KB
+    as a list of floats): a cached embedding is the float32 rounding of the one given by the provider.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: Optional[float] = None,
+        disk_cache: Optional[SQLiteEmbeddingCache] = None,
+    ):
+        """
+        Args:
+            max_size: The maximum number of embeddings kept in memory.
+            ttl: The time to live (in seconds) of an embedding. No expiration if None.
+            disk_cache: The optional on-disk cache, looked up on a memory miss.
+        """
+        self.memory_cache: TTLLRUCache[str, array] = TTLLRUCache(
+            max_size=max_size, ttl=ttl
+        )
+        self.disk_cache = disk_cache
+
+    def get(self, key: str) -> Optional[List[float]]:
+        """Get a cached embedding, from memory first."""
+        compact_embedding = self.memory_cache.get(key)
+        if compact_embedding is not None:
+            return compact_embedding.tolist()
+        if self.disk_cache is None:
+            return None
+        embedding = self.disk_cache.get(key)
+        if embedding is not None:
+            self.memory_cache.put(key, array('f', embedding))
+        return embedding
+
+    async def aget(self, key: str) -> Optional[List[float]]:
+        """Get a cached embedding, from memory first. The disk is read in a worker thread."""
+        compact_embedding = self.memory_cache.get(key)
+        if compact_embedding is not None:
+            return compact_embedding.tolist()
+        if self.disk_cache is None:
+            return None
+        embedding = await asyncio.to_thread(self.disk_cache.get, key)
+        if embedding is not None:
+            self.memory_cache.put(key, array('f', embedding))
+        return embedding
+
+    def put(self, key: str, embedding: List[float]) -> None:
+        """Cache an embedding."""
+        self.memory_cache.put(key, array('f', embedding))
+        if self.disk_cache is not None:
+            self.disk_cache.put(key, embedding)
+
+    async def aput(self, key: str, embedding: List[float]) -> None:
+        """Cache an embedding. The disk is written in a worker thread."""
+        self.memory_cache.put(key, array('f', embedding))
+        if self.disk_cache is not None:
+            await asyncio.to_thread(self.disk_cache.put, key, embedding)
+
+    def clear(self) -> None:
+        """Remove all the cached embeddings."""
+        self.memory_cache.clear()
+        if self.disk_cache is not None:
+            self.disk_cache.clear()
+
+
+def create_query_embedding_cache() -> QueryEmbeddingCache:
+    """Create the query embeddings cache, from the application settings."""
+    disk_cache = None
+    if application_settings.em_query_cache_sqlite_path:
+        disk_cache = SQLiteEmbeddingCache(
+            path=application_settings.em_query_cache_sqlite_path,
+            max_size=application_settings.em_query_cache_sqlite_max_size,
+            ttl=application_settings.em_query_cache_ttl,
+        )
+    return QueryEmbeddingCache(
+        max_size=application_settings.em_query_cache_max_size,
+        ttl=application_settings.em_query_cache_ttl,
+        disk_cache=disk_cache,
+    )
+
+
+query_embedding_cache = create_query_embedding_cache()
+register_cache_metrics('em_query', query_embedding_cache.memory_cache)
+
+
+def normalize_query(text: str) -> str:
+    """Normalize a query: unicode composition, and collapsed whitespaces."""
+    return ' '.join(unicodedata.normalize('NFC', text).split())
+
+
+class CachedQueryEmbeddings(BaseModel, Embeddings):
+    """
+    An Embeddings wrapper, caching the query embeddings.
+    The documents embeddings are not cached: they are computed once, when indexing.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    embeddings: Embeddings
+    """The wrapped embedding model."""
+    model_key: str
+    """The key of the embedding model (provider, model, dimensions...), which its embeddings depend on."""
+    cache: QueryEmbeddingCache
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embeddings.embed_documents(texts)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self.embeddings.aembed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        key = self._cache_key(text)
+        embedding = self.cache.get(key)
+        if embedding is None:
+            embedding = self.embeddings.embed_query(text)
+            self.cache.put(key, embedding)
+        return embedding
+
+    async def aembed_query(self, text: str) -> List[float]:
+        key = self._cache_key(text)
+        embedding = await self.cache.aget(key)
+        if embedding is None:
+            embedding = await self.embeddings.aembed_query(text)
+            await self.cache.aput(key, embedding)
+        return embedding
+
+    def _cache_key(self, text: str) -> str:
+        return fingerprint(self.model_key, normalize_query(text))
@@ -0,0 +1,141 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Module for the query embeddings coalescer.
+Under load, the concurrent query embeddings of an Embedding Model are coalesced in batches:
+a single provider request embeds them all, saving rate limit budget and connections.
+"""
+
+import asyncio
+import logging
+import time
+from typing import List, Optional
+from weakref import WeakKeyDictionary
+
+from langchain.embeddings.base import Embeddings
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+
+from gen_ai_orchestrator.utils.metrics.metrics import histogram
+
+logger = logging.getLogger(__name__)
+
+batch_size_histogram = histogram(
+    'gen_ai_orchestrator_em_coalesced_batch_size',
+    'Number of query embeddings coalesced in a provider request.',
+    buckets=(1, 2, 4, 8, 16, 32, 64),
+    label_names=('provider',),
+)
+wait_time_histogram = histogram(
+    'gen_ai_orchestrator_em_coalesced_wait_seconds',
+    'Time (in seconds) a query embedding waited for its batch to be sent.',
+    buckets=(0.001, 0.002, 0.005, 0.01, 0.025, 0.05, 0.1),
+    label_names=('provider',),
+)
+
+
+class _PendingQuery:
+    """A query waiting for its batch to be embedded"""
+
+    __slots__ = ('text', 'future', 'queued_at')
+
+    def __init__(self, text: str, future: asyncio.Future):
+        self.text = text
+        self.future = future
+        self.queued_at = time.monotonic()
+
+
+class CoalescingEmbeddings(BaseModel, Embeddings):
+    """
+    An Embeddings wrapper, coalescing the concurrent async query embeddings.
+    The queries are collected during max_wait seconds (or until max_batch_size queries),
+    then embedded with a single aembed_documents call, whose results are delivered to each caller.
+    The sync and documents embeddings are delegated as is.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    embeddings: Embeddings
+    """The wrapped embedding model."""
+    provider: str
+    """The Embedding Model provider (metrics label)."""
+    max_batch_size: int = 32
+    """Maximum number of queries of a batch."""
+    max_wait: float = 0.005
+    """Maximum time (in seconds) a query waits for other ones."""
+
+    # The batch being collected, by event loop (the futures are bound to their loop)
+    _pending: WeakKeyDictionary = PrivateAttr(default_factory=WeakKeyDictionary)
+    _tasks: set = PrivateAttr(default_factory=set)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embeddings.embed_documents(texts)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self.embeddings.aembed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embeddings.embed_query(text)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        loop = asyncio.get_running_loop()
+        pending: Optional[List[_PendingQuery]] = self._pending.get(loop)
+        if pending is None:
+            pending = self._pending[loop] = []
+            loop.call_later(self.max_wait, self._flush, loop, pending)
+
+        query = _PendingQuery(text, loop.create_future())
+        pending.append(query)
+        if len(pending) >= self.max_batch_size:
+            self._flush(loop, pending)
+        return await query.future
+
+    def _flush(self, loop: asyncio.AbstractEventLoop, pending: List[_PendingQuery]):
+        """Send a batch (once: when it is full, or when its time is up)."""
+        if self._pending.get(loop) is not pending:
+            return
+        del self._pending[loop]
+
+        task = loop.create_task(self._embed_batch(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _embed_batch(self, pending: List[_PendingQuery]):
+        """Embed a batch of queries, and deliver their embeddings (or the error) to the callers."""
+        sent_at = time.monotonic()
+        for query in pending:
+            wait_time_histogram.observe(sent_at - query.queued_at, provider=self.provider)
+        texts = list(dict.fromkeys(query.text for query in pending))
+        batch_size_histogram.observe(len(texts), provider=self.provider)
+        logger.debug('Embedding a batch of %s queries', len(texts))
+
+        try:
+            embeddings = dict(zip(texts, await self.embeddings.aembed_documents(texts)))
+        except BaseException as exc:
+            # The callers must not wait forever, even if the batch is cancelled (e.g. on shutdown)
+            for query in pending:
+                if query.future.done():
+                    continue
+                if isinstance(exc, asyncio.CancelledError):
+                    query.future.cancel()
+                else:
+                    query.future.set_exception(exc)
+            if isinstance(exc, Exception):
+                return
+            raise
+
+        for query in pending:
+            # The caller may have been cancelled
+            if not query.future.done():
+                query.future.set_result(embeddings[query.text])
@@ -0,0 +1,58 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Module for the query embeddings timer.
+The query embeddings are not LangChain runs: they are timed by this wrapper (query embedding stage metrics).
+"""
+
+from typing import List
+
+from langchain.embeddings.base import Embeddings
+from pydantic import BaseModel, ConfigDict
+
+from gen_ai_orchestrator.services.langchain.callbacks.stage_metrics_callback_handler import (
+    PipelineStage,
+    stage_timer,
+)
+
+
+class TimedQueryEmbeddings(BaseModel, Embeddings):
+    """
+    An Embeddings wrapper, timing the query embeddings (cache lookups included).
+    The documents embeddings are delegated as is.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    embeddings: Embeddings
+    """The wrapped embedding model."""
+    provider: str
+    """The Embedding Model provider (metrics label)."""
+    model: str = ''
+    """The Embedding Model (metrics label)."""
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embeddings.embed_documents(texts)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self.embeddings.aembed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        with stage_timer(PipelineStage.QUERY_EMBEDDING, self.provider, self.model):
+            return self.embeddings.embed_query(text)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        with stage_timer(PipelineStage.QUERY_EMBEDDING, self.provider, self.model):
+            return await self.embeddings.aembed_query(text)
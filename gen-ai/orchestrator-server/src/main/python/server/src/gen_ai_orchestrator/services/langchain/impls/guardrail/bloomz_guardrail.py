@@ -12,16 +12,40 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 #
-from typing import List, Optional
+import asyncio
+import re
+from typing import AsyncIterator, List, Optional, Union
 from urllib.parse import urljoin
 
 import requests
+from langchain_core.messages import BaseMessage
 from langchain_core.output_parsers.transform import (
     BaseCumulativeTransformOutputParser,
 )
-from pydantic import BaseModel
+from langchain_core.outputs import Generation
+from pydantic import BaseModel, PrivateAttr
 from requests.exceptions import HTTPError
 
+from gen_ai_orchestrator.models.guardrail.guardrail_provider import (
+    GuardrailProvider,
+)
+from gen_ai_orchestrator.services.langchain.callbacks.stage_metrics_callback_handler import (
+    PipelineStage,
+    stage_timer,
+)
+from gen_ai_orchestrator.utils.circuit_breaker import (
+    CircuitBreaker,
+    circuit_breaker_call,
+    get_circuit_breaker,
+    is_failure_status,
+)
+from gen_ai_orchestrator.utils.http.async_http_client import (
+    get_async_http_client,
+)
+
+# The end of a sentence, followed by a whitespace
+SENTENCE_BOUNDARY = re.compile(r'[.!?;:\n]\s')
+
 
 class GuardrailOutput(BaseModel):
     content: str
@@ -37,6 +61,14 @@ class BloomzGuardrailOutputParser(BaseCumulativeTransformOutputParser[dict]):
     endpoint: str
     """The model API endpoint to use."""
     diff: bool = True
+    segment_min_length: int = 100
+    """In streaming mode, minimum length of the text segments checked while the answer is generated.
+    The segments end on a sentence boundary."""
+    timeout: float = 10
+    """Request timeout (in seconds) of the async checks."""
+
+    _checked_length: int = PrivateAttr(default=0)
+    _checks: List[asyncio.Task] = PrivateAttr(default_factory=list)
 
     @classmethod
     def is_lc_serializable(cls) -> bool:
@@ -59,25 +91,126 @@ class BloomzGuardrailOutputParser(BaseCumulativeTransformOutputParser[dict]):
             output['content'] = next['content'][len(prev['content']) :]
         return output
 
+    @property
+    def _circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """The circuit breaker of the endpoint: while it is open, the checks fail at once."""
+        return get_circuit_breaker(f'BloomzGuardrail:{self.endpoint}', self.timeout)
+
     def parse(self, text: str) -> dict:
-        response = requests.post(
-            urljoin(self.endpoint, '/guardrail'), json={'text': [text]}
-        )
+        with stage_timer(
+            PipelineStage.GUARDRAIL, GuardrailProvider.BLOOMZ.value
+        ), circuit_breaker_call(self._circuit_breaker) as call:
+            response = requests.post(
+                urljoin(self.endpoint, '/guardrail'), json={'text': [text]}
+            )
+            call.failed = is_failure_status(response.status_code)
         if response.status_code != 200:
             raise HTTPError(
                 f"Error {response.status_code}. Bloomz guardrail didn't respond as expected."
             )
 
-        results = response.json()['response'][0]
+        return self._output(text, self._detected_toxicities(response.json()))
+
+    async def aparse_result(
+        self, result: List[Generation], *, partial: bool = False
+    ) -> dict:
+        """
+        Check the text asynchronously.
+        While streaming (partial), each new segment of the text is checked in the background,
+        and the output reports the toxicities detected so far.
+        Otherwise, the remaining text is checked and all the checks are awaited.
+        """
+        text = result[0].text
+        if partial:
+            boundary = self._last_sentence_boundary(text)
+            if boundary - self._checked_length >= self.segment_min_length:
+                self._check_segment(text, boundary)
+            return self._output(text, self._completed_checks_toxicities())
+
+        try:
+            if len(text) > self._checked_length:
+                self._check_segment(text, len(text))
+            await asyncio.gather(*self._checks)
+            return self._output(text, self._completed_checks_toxicities())
+        finally:
+            self._reset()
 
-        detected_toxicities = list(
-            filter(lambda mode: mode['score'] > self.max_score, results)
+    async def _atransform(
+        self, input: AsyncIterator[Union[str, BaseMessage]]
+    ) -> AsyncIterator[dict]:
+        """
+        Check the text while it is generated: toxicities are reported as soon as a segment check completes.
+        Once the input is exhausted, the final output (with all the checks completed) is yielded.
+        """
+        text = ''
+
+        async def accumulate() -> AsyncIterator[Union[str, BaseMessage]]:
+            nonlocal text
+            async for chunk in input:
+                text += chunk.content if isinstance(chunk, BaseMessage) else chunk
+                yield chunk
+
+        self._reset()
+        try:
+            async for output in super()._atransform(accumulate()):
+                yield output
+            output = await self.aparse_result([Generation(text=text)])
+            yield {**output, 'content': ''} if self.diff else output
+        finally:
+            self._reset()
+
+    def _last_sentence_boundary(self, text: str) -> int:
+        boundaries = list(SENTENCE_BOUNDARY.finditer(text, self._checked_length))
+        return boundaries[-1].end() if boundaries else self._checked_length
+
+    def _check_segment(self, text: str, end: int) -> None:
+        """Check the text segment from the last checked position to end, in the background."""
+        self._checks.append(
+            asyncio.create_task(self._acheck(text[self._checked_length : end]))
         )
+        self._checked_length = end
 
+    async def _acheck(self, text: str) -> List[dict]:
+        with stage_timer(
+            PipelineStage.GUARDRAIL, GuardrailProvider.BLOOMZ.value
+        ), circuit_breaker_call(self._circuit_breaker) as call:
+            response = await get_async_http_client().post(
+                urljoin(self.endpoint, '/guardrail'),
+                json={'text': [text]},
+                timeout=self.timeout,
+            )
+            call.failed = is_failure_status(response.status_code)
+        if response.status_code != 200:
+            raise HTTPError(
+                f"Error {response.status_code}. Bloomz guardrail didn't respond as expected."
+            )
+        return self._detected_toxicities(response.json())
+
+    def _completed_checks_toxicities(self) -> List[dict]:
+        """The toxicities detected by the completed checks (a failed check raises its error)."""
+        return [
+            toxicity
+            for check in self._checks
+            if check.done()
+            for toxicity in check.result()
+        ]
+
+    def _detected_toxicities(self, guardrail_response: dict) -> List[dict]:
+        results = guardrail_response['response'][0]
+        return list(filter(lambda mode: mode['score'] > self.max_score, results))
+
+    @staticmethod
+    def _output(text: str, detected_toxicities: List[dict]) -> dict:
         return GuardrailOutput(
             content=text,
             output_toxicity=bool(detected_toxicities),
             output_toxicity_reason=list(
-                map(lambda mode: mode['label'], detected_toxicities)
+                dict.fromkeys(map(lambda mode: mode['label'], detected_toxicities))
             ),
         ).model_dump()
+
+    def _reset(self) -> None:
+        for check in self._checks:
+            check.cancel()
+        self._checks = []
+        self._checked_length = 0
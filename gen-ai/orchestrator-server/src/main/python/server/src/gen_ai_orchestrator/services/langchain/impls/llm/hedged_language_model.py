@@ -0,0 +1,260 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Module for the hedged language model.
+The tail latency of a LLM deployment is cut by hedging its requests: if the primary LLM has not
+produced its first token within a delay (a percentile of its observed times to first token),
+the same request is sent to an alternate LLM (another deployment or provider). The first one
+to produce a token wins, the other one is cancelled.
+A primary request that fails before its first token falls back to the alternate LLM.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Optional, Tuple
+
+from langchain_core.language_models import BaseLanguageModel, LanguageModelInput
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import RunnableConfig, RunnableSerializable
+from pydantic import ConfigDict, PrivateAttr
+
+from gen_ai_orchestrator.utils.metrics.metrics import counter, gauge
+
+logger = logging.getLogger(__name__)
+
+# The outcomes of the hedged requests
+PRIMARY = 'primary'
+HEDGED_PRIMARY = 'hedged_primary'
+HEDGED_ALTERNATE = 'hedged_alternate'
+FALLBACK = 'fallback'
+
+hedged_requests_counter = counter(
+    'gen_ai_orchestrator_llm_hedged_requests_total',
+    'Number of LLM requests of a hedging policy, by outcome: primary (answered within the hedge delay), '
+    'hedged_primary / hedged_alternate (a hedge request was sent, and the LLM that won), '
+    'fallback (the primary LLM failed).',
+    label_names=('provider', 'model', 'outcome'),
+)
+hedge_delay_gauge = gauge(
+    'gen_ai_orchestrator_llm_hedge_delay_seconds',
+    'Current hedge delay (in seconds) of a primary LLM.',
+    label_names=('provider', 'model'),
+)
+
+_Attempt = Tuple[AsyncIterator[BaseMessage], 'asyncio.Task[BaseMessage]']
+
+
+def _succeeded(first_chunk: 'asyncio.Task[BaseMessage]') -> bool:
+    """True if the first chunk of an attempt is received (or if its stream ended without any)."""
+    return first_chunk.done() and (
+        first_chunk.exception() is None
+        or isinstance(first_chunk.exception(), StopAsyncIteration)
+    )
+
+
+def _cancelling() -> bool:
+    """True if the current task is being cancelled (only known from Python 3.11)."""
+    cancelling = getattr(asyncio.current_task(), 'cancelling', None)
+    return cancelling is not None and cancelling() > 0
+
+
+class LatencyTracker:
+    """The last latencies of a LLM, to compute their percentiles"""
+
+    def __init__(self, window_size: int):
+        self._latencies: Deque[float] = deque(maxlen=window_size)
+
+    def __len__(self) -> int:
+        return len(self._latencies)
+
+    def observe(self, latency: float) -> None:
+        """Add a latency (in seconds)."""
+        self._latencies.append(latency)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """The percentile (nearest rank) of the latencies, None if there is none."""
+        if not self._latencies:
+            return None
+        latencies = sorted(self._latencies)
+        rank = math.ceil(percentile / 100 * len(latencies))
+        return latencies[min(max(rank, 1), len(latencies)) - 1]
+
+
+class HedgedLanguageModel(RunnableSerializable[LanguageModelInput, BaseMessage]):
+    """
+    A language model wrapper, hedging the requests of a primary LLM with an alternate one.
+    Both LLMs are given the caller config: each attempt is traced as its own LLM run
+    (a cancelled attempt ends with an error).
+    The output of an invocation is the sum of the streamed message chunks.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    primary: BaseLanguageModel
+    """The primary LLM."""
+    alternate: BaseLanguageModel
+    """The alternate LLM (another deployment or provider)."""
+    provider: str
+    """The primary LLM provider (metrics label)."""
+    model: str = ''
+    """The primary LLM model or deployment (metrics label)."""
+    hedging: bool = True
+    """Send a hedge request when the primary LLM is late (otherwise, only fall back on failure)."""
+    percentile: float = 95
+    """Percentile of the primary LLM times to first token used as hedge delay."""
+    default_delay: float = 2.0
+    """Hedge delay (in seconds) until min_samples times to first token are observed."""
+    min_delay: float = 0.0
+    """Minimum hedge delay (in seconds)."""
+    min_samples: int = 20
+    """Minimum number of observed times to first token to compute the hedge delay."""
+    window_size: int = 500
+    """Number of the last times to first token of the primary LLM that are kept."""
+
+    _latencies: LatencyTracker = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        self._latencies = LatencyTracker(self.window_size)
+
+    @property
+    def hedge_delay(self) -> float:
+        """The current hedge delay (in seconds)."""
+        delay = self.default_delay
+        if len(self._latencies) >= self.min_samples:
+            delay = self._latencies.percentile(self.percentile)
+        return max(delay, self.min_delay)
+
+    def invoke(
+        self,
+        input: LanguageModelInput,
+        config: Optional[RunnableConfig] = None,
+        **kwargs: Any,
+    ) -> BaseMessage:
+        # The synchronous calls are not hedged: they only fall back on failure
+        try:
+            return self.primary.invoke(input, config, **kwargs)
+        except Exception as exc:
+            logger.warning('LLM hedging - Primary LLM failure, fall back to the alternate one: %s', exc)
+            self._count(FALLBACK)
+            return self.alternate.invoke(input, config, **kwargs)
+
+    async def ainvoke(
+        self,
+        input: LanguageModelInput,
+        config: Optional[RunnableConfig] = None,
+        **kwargs: Any,
+    ) -> BaseMessage:
+        output = None
+        async for chunk in self.astream(input, config, **kwargs):
+            output = chunk if output is None else output + chunk
+        return output
+
+    async def astream(
+        self,
+        input: LanguageModelInput,
+        config: Optional[RunnableConfig] = None,
+        **kwargs: Optional[Any],
+    ) -> AsyncIterator[BaseMessage]:
+        start_time = time.monotonic()
+        primary = self._start(self.primary, input, config, kwargs)
+        attempts = [primary]
+        try:
+            delay = self.hedge_delay if self.hedging else None
+            hedge_delay_gauge.set(delay or 0, provider=self.provider, model=self.model)
+            await asyncio.wait([primary[1]], timeout=delay)
+
+            if _succeeded(primary[1]):
+                self._latencies.observe(time.monotonic() - start_time)
+                winner, outcome = primary, PRIMARY
+            elif primary[1].done():
+                logger.warning(
+                    'LLM hedging - Primary LLM failure, fall back to the alternate one: %s',
+                    primary[1].exception(),
+                )
+                attempts.append(self._start(self.alternate, input, config, kwargs))
+                winner, outcome = attempts[1], FALLBACK
+            else:
+                logger.info('LLM hedging - Primary LLM late (%.3fs), send a hedge request', delay)
+                attempts.append(self._start(self.alternate, input, config, kwargs))
+                winner = await self._first_success(attempts)
+                outcome = HEDGED_PRIMARY if winner is primary else HEDGED_ALTERNATE
+                # The time to first token of a late primary LLM is at least the elapsed time
+                self._latencies.observe(time.monotonic() - start_time)
+
+            self._count(outcome)
+            stream, first_chunk = winner
+            try:
+                yield await first_chunk
+            except StopAsyncIteration:
+                return
+            async for chunk in stream:
+                yield chunk
+        finally:
+            for attempt in attempts:
+                await self._close(attempt)
+
+    @staticmethod
+    def _start(
+        llm: BaseLanguageModel,
+        input: LanguageModelInput,
+        config: Optional[RunnableConfig],
+        kwargs: dict,
+    ) -> _Attempt:
+        """Start the streaming of a LLM: the first chunk is awaited by a task."""
+        stream = llm.astream(input, config, **kwargs)
+        return stream, asyncio.ensure_future(stream.__anext__())
+
+    @staticmethod
+    async def _first_success(attempts: list[_Attempt]) -> _Attempt:
+        """
+        Wait for the first attempt that produces its first chunk (or ends without any).
+        If all of them fail, the first one is returned (its error is raised when its chunk is awaited).
+        """
+        pending = {attempt[1] for attempt in attempts}
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for attempt in attempts:
+                if attempt[1] in done and _succeeded(attempt[1]):
+                    return attempt
+            if pending:
+                logger.warning('LLM hedging - A LLM request failed, wait for the other one')
+        return attempts[0]
+
+    @staticmethod
+    async def _close(attempt: _Attempt) -> None:
+        """Cancel the first chunk task of an attempt (if pending), then close its stream."""
+        stream, first_chunk = attempt
+        if not first_chunk.done():
+            first_chunk.cancel()
+        try:
+            await first_chunk
+        except asyncio.CancelledError:
+            # Only the cancellation of the attempt is expected, not the one of the current task
+            if not first_chunk.cancelled() or _cancelling():
+                raise
+        except Exception:
+            # The error of a lost (or failed) attempt is not raised
+            pass
+        await stream.aclose()
+
+    def _count(self, outcome: str) -> None:
+        hedged_requests_counter.inc(
+            provider=self.provider, model=self.model, outcome=outcome
+        )
@@ -0,0 +1,195 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Module for the OpenSearch Vector Store with a native async search.
+LangChain's OpenSearchVectorSearch has no async similarity search: its default
+implementation runs the synchronous client in a thread executor.
+"""
+
+import asyncio
+from typing import Any, List, Optional, Tuple
+
+import aiohttp
+from langchain_community.vectorstores.opensearch_vector_search import (
+    SCRIPT_SCORING_SEARCH,
+    OpenSearchVectorSearch,
+    _approximate_search_query_with_boolean_filter,
+    _approximate_search_query_with_efficient_filter,
+    _default_approximate_search_query,
+    _default_script_query,
+)
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from opensearchpy import AIOHttpConnection, AsyncOpenSearch
+from opensearchpy._async.http_aiohttp import OpenSearchClientResponse
+
+APPROXIMATE_SEARCH = 'approximate_search'
+
+
+class KeepAliveAIOHttpConnection(AIOHttpConnection):
+    """An aiohttp connection whose idle connections are kept alive for a configurable time."""
+
+    def __init__(self, *args: Any, keepalive_timeout: float = 15, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._keepalive_timeout = keepalive_timeout
+
+    async def _create_aiohttp_session(self) -> Any:
+        """Same session as AIOHttpConnection, with the keep-alive timeout on its connector."""
+        if self.loop is None:
+            self.loop = asyncio.get_running_loop()
+        self.session = aiohttp.ClientSession(
+            headers=self.headers,
+            skip_auto_headers=('accept', 'accept-encoding'),
+            auto_decompress=True,
+            loop=self.loop,
+            cookie_jar=aiohttp.DummyCookieJar(),
+            response_class=OpenSearchClientResponse,
+            connector=aiohttp.TCPConnector(
+                limit=self._limit,
+                keepalive_timeout=self._keepalive_timeout,
+                use_dns_cache=True,
+                enable_cleanup_closed=True,
+                ssl=self._ssl_context,
+            ),
+            trust_env=self._trust_env,
+        )
+
+
+class AsyncOpenSearchVectorSearch(OpenSearchVectorSearch):
+    """
+    OpenSearchVectorSearch whose async similarity search runs the kNN query
+    on the event loop, with an AsyncOpenSearch client (that can be shared between stores).
+    Only the approximate and script scoring searches are native, the others fall back
+    to the default executor implementation.
+    """
+
+    def __init__(
+        self,
+        opensearch_url: str,
+        index_name: str,
+        embedding_function: Embeddings,
+        async_client: Optional[AsyncOpenSearch] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(opensearch_url, index_name, embedding_function, **kwargs)
+        if async_client is not None:
+            self.async_client = async_client
+
+    async def asimilarity_search(
+        self,
+        query: str,
+        k: int = 4,
+        score_threshold: Optional[float] = 0.0,
+        **kwargs: Any,
+    ) -> List[Document]:
+        docs_with_scores = await self.asimilarity_search_with_score(
+            query, k, score_threshold, **kwargs
+        )
+        return [doc for doc, _ in docs_with_scores]
+
+    async def asimilarity_search_with_score(
+        self,
+        query: str,
+        k: int = 4,
+        score_threshold: Optional[float] = 0.0,
+        **kwargs: Any,
+    ) -> List[Tuple[Document, float]]:
+        search_type = kwargs.get('search_type', APPROXIMATE_SEARCH)
+        if search_type not in (APPROXIMATE_SEARCH, SCRIPT_SCORING_SEARCH):
+            return await super().asimilarity_search_with_score(
+                query, k, score_threshold=score_threshold, **kwargs
+            )
+
+        embedding = await self.embedding_function.aembed_query(query)
+        response = await self.async_client.search(
+            index=kwargs.get('index_name', self.index_name),
+            body=self._build_search_query(embedding, k, score_threshold, **kwargs),
+        )
+
+        text_field = kwargs.get('text_field', 'text')
+        metadata_field = kwargs.get('metadata_field', 'metadata')
+        return [
+            (
+                Document(
+                    page_content=hit['_source'][text_field],
+                    metadata=(
+                        hit['_source']
+                        if metadata_field == '*' or metadata_field not in hit['_source']
+                        else hit['_source'][metadata_field]
+                    ),
+                    id=hit['_id'],
+                ),
+                hit['_score'],
+            )
+            for hit in response['hits']['hits']
+        ]
+
+    def _build_search_query(
+        self,
+        embedding: List[float],
+        k: int,
+        score_threshold: Optional[float],
+        **kwargs: Any,
+    ) -> dict:
+        """Build the search query, the same way as the synchronous OpenSearchVectorSearch."""
+        vector_field = kwargs.get('vector_field', 'vector_field')
+
+        if kwargs.get('search_type', APPROXIMATE_SEARCH) == SCRIPT_SCORING_SEARCH:
+            return _default_script_query(
+                embedding,
+                k,
+                kwargs.get('space_type', 'l2'),
+                kwargs.get('pre_filter', {'match_all': {}}),
+                vector_field,
+                score_threshold=score_threshold,
+            )
+
+        boolean_filter = kwargs.get('boolean_filter', {})
+        # `lucene_filter` is the deprecated name of `efficient_filter`
+        efficient_filter = kwargs.get('efficient_filter', {}) or kwargs.get(
+            'lucene_filter', {}
+        )
+        if boolean_filter and efficient_filter:
+            raise ValueError(
+                'Both `boolean_filter` and `efficient_filter` are provided which is invalid'
+            )
+
+        search_filter = kwargs.get('filter', {})
+        if not boolean_filter and not efficient_filter and search_filter:
+            if self.engine in ['faiss', 'lucene']:
+                efficient_filter = search_filter
+            else:
+                boolean_filter = search_filter
+
+        if boolean_filter:
+            return _approximate_search_query_with_boolean_filter(
+                embedding,
+                boolean_filter,
+                k=k,
+                vector_field=vector_field,
+                subquery_clause=kwargs.get('subquery_clause', 'must'),
+                score_threshold=score_threshold,
+            )
+        if efficient_filter:
+            return _approximate_search_query_with_efficient_filter(
+                embedding,
+                efficient_filter,
+                k=k,
+                vector_field=vector_field,
+                score_threshold=score_threshold,
+            )
+        return _default_approximate_search_query(
+            embedding, k=k, vector_field=vector_field, score_threshold=score_threshold
+        )
@@ -0,0 +1,56 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""Module for the circuit breaker retriever"""
+
+from typing import Any, List
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForRetrieverRun,
+    CallbackManagerForRetrieverRun,
+)
+from langchain_core.documents import Document
+from langchain_core.vectorstores import VectorStoreRetriever
+
+from gen_ai_orchestrator.utils.circuit_breaker import CircuitBreaker
+
+
+class CircuitBreakerRetriever(VectorStoreRetriever):
+    """
+    A Vector Store retriever guarded by the circuit breaker of the Vector Store endpoint:
+    the searches fail fast while the circuit is open.
+    """
+
+    circuit_breaker: CircuitBreaker
+    """The circuit breaker of the Vector Store endpoint."""
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun, **kwargs: Any
+    ) -> List[Document]:
+        with self.circuit_breaker.call():
+            return super()._get_relevant_documents(
+                query, run_manager=run_manager, **kwargs
+            )
+
+    async def _aget_relevant_documents(
+        self,
+        query: str,
+        *,
+        run_manager: AsyncCallbackManagerForRetrieverRun,
+        **kwargs: Any,
+    ) -> List[Document]:
+        with self.circuit_breaker.call():
+            return await super()._aget_relevant_documents(
+                query, run_manager=run_manager, **kwargs
+            )
@@ -35,6 +35,11 @@ from gen_ai_orchestrator.models.vector_stores.vectore_store_provider import (
 )
 from gen_ai_orchestrator.routers.requests.requests import QARequest
 from gen_ai_orchestrator.routers.responses.responses import QAResponse
+from gen_ai_orchestrator.services.langchain.callbacks.stage_metrics_callback_handler import (
+    PipelineStage,
+    create_stage_metrics_callback_handler,
+    stage_metadata,
+)
 from gen_ai_orchestrator.services.langchain.factories.langchain_factory import (
     get_em_factory,
     get_vector_store_factory,
@@ -61,7 +66,13 @@ async def execute_qa_chain(request: QARequest) -> QAResponse:
 
     conversational_qa_chain = create_qa_chain(request)
 
-    response = await conversational_qa_chain.ainvoke(request.user_query)
+    # The stage metrics callback handler
+    stage_metrics_handler = create_stage_metrics_callback_handler(
+        index=request.document_index_name
+    )
+    response = await conversational_qa_chain.ainvoke(
+        request.user_query, config={'callbacks': [stage_metrics_handler]}
+    )
 
     qa_duration = '{:.2f}'.format(time.time() - start_time)
     logger.info('QA chain - End of execution. (Duration : %s seconds)', qa_duration)
@@ -109,7 +120,8 @@ def create_qa_chain(request: QARequest) -> Runnable:
     ).get_vector_store()
 
     retriever = vector_store.as_retriever(
-        search_kwargs=request.document_search_params.to_dict()
+        search_kwargs=request.document_search_params.to_dict(),
+        metadata=stage_metadata(PipelineStage.VECTOR_SEARCH),
     )
 
     logger.debug('QA chain - Create a QA chain')
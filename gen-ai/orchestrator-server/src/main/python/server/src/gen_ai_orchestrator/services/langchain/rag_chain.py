@@ -17,19 +17,24 @@ Module for the RAG Chain
 It uses LangChain to perform a Conversational Retrieval Chain
 """
 
+import asyncio
 import json
 import logging
+import re
 import time
 from functools import partial
 from operator import itemgetter
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from langchain_classic.retrievers import ContextualCompressionRetriever
 from langchain_community.chat_message_histories import ChatMessageHistory
 from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.documents import Document
-from langchain_core.messages import AIMessage, HumanMessage
-from langchain_core.output_parsers import JsonOutputParser, StrOutputParser
+from langchain_core.output_parsers import (
+    BaseOutputParser,
+    JsonOutputParser,
+    StrOutputParser,
+)
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.prompts import PromptTemplate as LangChainPromptTemplate
 from langchain_core.retrievers import BaseRetriever
@@ -44,6 +49,9 @@ from langchain_core.runnables.config import RunnableConfig
 from langchain_core.vectorstores import VectorStoreRetriever
 from typing_extensions import Any
 
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
 from gen_ai_orchestrator.errors.exceptions.exceptions import (
     GenAIGuardCheckException,
 )
@@ -64,17 +72,28 @@ from gen_ai_orchestrator.models.prompt.prompt_formatter import PromptFormatter
 from gen_ai_orchestrator.models.prompt.prompt_template import PromptTemplate
 from gen_ai_orchestrator.models.rag.rag_models import (
     ChatMessageType,
+    ContextPackingDebugData,
     Footnote,
     LLMAnswer,
     RAGDebugData,
     RAGDocument,
     RAGDocumentMetadata,
+    RAGStreamEventType,
+    SemanticCacheDebugData,
 )
 from gen_ai_orchestrator.routers.requests.requests import RAGRequest
 from gen_ai_orchestrator.routers.responses.responses import RAGResponse
 from gen_ai_orchestrator.services.langchain.callbacks.rag_callback_handler import (
     RAGCallbackHandler,
 )
+from gen_ai_orchestrator.services.langchain.callbacks.stage_metrics_callback_handler import (
+    PipelineStage,
+    StageMetricsCallbackHandler,
+    StageTimings,
+    create_stage_metrics_callback_handler,
+    stage_metadata,
+    stage_timer,
+)
 from gen_ai_orchestrator.services.langchain.factories.langchain_factory import (
     create_observability_callback_handler,
     get_compressor_factory,
@@ -86,27 +105,77 @@ from gen_ai_orchestrator.services.langchain.factories.langchain_factory import (
 from gen_ai_orchestrator.services.observability.observabilty_service import (
     get_observability_info,
 )
+from gen_ai_orchestrator.services.utils.context_packer import (
+    PackedContext,
+    get_token_counter,
+    pack_context,
+)
 from gen_ai_orchestrator.services.utils.prompt_utility import (
     validate_prompt_template,
 )
+from gen_ai_orchestrator.services.utils.rank_fusion import (
+    document_key,
+    reciprocal_rank_fusion,
+)
+from gen_ai_orchestrator.utils.cache.semantic_cache import SemanticCache
+from gen_ai_orchestrator.utils.cache.ttl_lru_cache import TTLLRUCache
+from gen_ai_orchestrator.utils.fingerprint import fingerprint
+from gen_ai_orchestrator.utils.metrics.cache_metrics import register_cache_metrics
 
 logger = logging.getLogger(__name__)
 
+# The RAG chains, keyed by the fingerprint of their configuration.
+# Their clients hold the secrets resolved when they were built (the configuration only holds their references):
+# a chain is not kept longer than a secret, so that a rotated secret is used once fetched again.
+rag_chain_cache: TTLLRUCache[str, RunnableSerializable] = TTLLRUCache(
+    max_size=application_settings.rag_chain_cache_max_size,
+    ttl=min(
+        application_settings.rag_chain_cache_ttl,
+        application_settings.secret_cache_ttl,
+    ),
+)
+
+# The RAG answers, looked up by the similarity of their condensed question
+rag_answer_cache: SemanticCache[RAGResponse] = SemanticCache(
+    max_size=application_settings.rag_semantic_cache_max_size,
+    threshold=application_settings.rag_semantic_cache_threshold,
+    ttl=application_settings.rag_semantic_cache_ttl,
+)
+
+register_cache_metrics('rag_chain', rag_chain_cache)
+register_cache_metrics('rag_semantic_answer', rag_answer_cache)
+
+# An index name holding its indexing session id (see the indexing tools)
+INDEX_SESSION_PATTERN = re.compile(r'^(?P<index>.+)-session-(?P<session>.+)$')
+
 
 async def retrieve_documents_with_variants(
     retriever: BaseRetriever, variants: List[str]
 ) -> List[Document]:
-    """Retrieve documents asynchronously for each variant and deduplicate by id."""
-    docs = []
-    for variant in variants:
-        docs.extend(await retriever.ainvoke(variant))
-
-    unique_docs = {
-        (d.metadata.get('id'), d.metadata.get('chunk')): d
-        for d in docs
-    }
+    """
+    Retrieve documents concurrently for each query variant.
+    The results of several variants are fused with the Reciprocal Rank Fusion algorithm,
+    whose score is exposed in the 'retriever_score' metadata of the documents.
+    A single variant result is only deduplicated by id, keeping its ranking and scores.
 
-    return list(unique_docs.values())
+    Args:
+        retriever: The documents retriever
+        variants: The query variants (duplicates and empty ones are ignored)
+    Returns:
+        The unique retrieved documents, sorted by relevance.
+    """
+    variants = list(dict.fromkeys(variant for variant in variants if variant))
+    results = await asyncio.gather(
+        *(retriever.ainvoke(variant) for variant in variants)
+    )
+
+    if len(results) == 1:
+        unique_docs = {document_key(doc): doc for doc in results[0]}
+        return list(unique_docs.values())
+
+    return reciprocal_rank_fusion(
+        results, k=application_settings.rag_retrieval_rrf_k
+    )
 
 
 @opensearch_exception_handler
@@ -115,6 +184,7 @@ async def execute_rag_chain(
     request: RAGRequest,
     debug: bool,
     custom_observability_handler: Optional[BaseCallbackHandler] = None,
+    rag_chain: Optional[RunnableSerializable[Any, dict[str, Any]]] = None,
 ) -> RAGResponse:
     """
     RAG chain execution, using the LLM and Embedding settings specified in the request
@@ -123,6 +193,7 @@ async def execute_rag_chain(
         request: The RAG request
         debug: True if RAG data debug should be returned with the response.
         custom_observability_handler: Custom observability handler (Used in the tooling run_experiment.py script)
+        rag_chain: The RAG chain of the request configuration, if already built (e.g. shared by the items of a batch)
     Returns:
         The RAG response (Answer and document sources)
     """
@@ -130,33 +201,224 @@ async def execute_rag_chain(
     logger.info('RAG chain - Start of execution...')
     start_time = time.time()
 
-    conversational_retrieval_chain = create_rag_chain(request=request)
+    inputs = get_rag_chain_inputs(request)
+    (
+        config,
+        records_callback_handler,
+        observability_handler,
+        stage_metrics_handler,
+    ) = get_rag_chain_config(request, debug, custom_observability_handler)
+
+    # The experiments (custom observability handler) always run the RAG chain
+    answer_cache_key = None
+    if (
+        application_settings.rag_semantic_cache_enabled
+        and custom_observability_handler is None
+    ):
+        answer_cache_key, cached_answer = await alookup_rag_answer_cache(
+            request, inputs, config
+        )
+        if cached_answer is not None:
+            return create_cached_rag_response(
+                request,
+                cached_answer,
+                observability_handler,
+                records_callback_handler if debug else None,
+                '{:.2f}'.format(time.time() - start_time),
+                stage_metrics_handler.stage_timings,
+            )
+
+    conversational_retrieval_chain = rag_chain or create_rag_chain(request=request)
 
-    message_history = ChatMessageHistory()
-    session_id = None
-    user_id = None
-    tags = []
+    if request.guardrail_setting:
+        # The guardrail checks the answer while it is generated
+        guardrail = get_guardrail_factory(
+            setting=request.guardrail_setting
+        ).get_parser()
+        response = await ainvoke_with_guardrail(
+            conversational_retrieval_chain, inputs, config, guardrail
+        )
+    else:
+        response = await conversational_retrieval_chain.ainvoke(
+            input=inputs,
+            config=config,
+        )
+
+    # Calculation of RAG processing time
+    rag_duration = '{:.2f}'.format(time.time() - start_time)
+    logger.info('RAG chain - End of execution. (Duration : %s seconds)', rag_duration)
+
+    rag_response = create_rag_response(
+        request,
+        response,
+        observability_handler,
+        records_callback_handler if debug else None,
+        rag_duration,
+        get_semantic_cache_debug_data() if answer_cache_key is not None else None,
+        stage_metrics_handler.stage_timings,
+    )
+    if answer_cache_key is not None:
+        store_rag_answer(answer_cache_key, rag_response)
+    return rag_response
+
+
+@opensearch_exception_handler
+@openai_exception_handler(provider='OpenAI or AzureOpenAIService')
+async def astream_rag_chain(
+    request: RAGRequest,
+    debug: bool,
+) -> AsyncIterator[tuple[RAGStreamEventType, Any]]:
+    """
+    RAG chain execution in streaming mode.
+    The answer text is streamed as soon as the LLM generates it: the partial JSON output of the LLM
+    is parsed incrementally, and each new part of its answer field is sent in an ANSWER event.
+    The context usage, footnotes, observability info (and debug data) are then sent as final events,
+    before the DONE event holding the complete LLM answer.
+
+    Args:
+        request: The RAG request
+        debug: True if RAG data debug should be returned with the response.
+    Returns:
+        The RAG response events (type and data)
+    """
+
+    logger.info('RAG chain - Start of streamed execution...')
+    start_time = time.time()
+
+    inputs = get_rag_chain_inputs(request)
+    (
+        config,
+        records_callback_handler,
+        observability_handler,
+        stage_metrics_handler,
+    ) = get_rag_chain_config(request, debug)
+
+    answer_cache_key = None
+    cached_answer = None
+    if application_settings.rag_semantic_cache_enabled:
+        answer_cache_key, cached_answer = await alookup_rag_answer_cache(
+            request, inputs, config
+        )
 
+    if cached_answer is not None:
+        rag_response = create_cached_rag_response(
+            request,
+            cached_answer,
+            observability_handler,
+            records_callback_handler if debug else None,
+            '{:.2f}'.format(time.time() - start_time),
+            stage_metrics_handler.stage_timings,
+        )
+        yield RAGStreamEventType.ANSWER, rag_response.answer.answer
+    else:
+        conversational_retrieval_chain = create_rag_chain(request=request)
+
+        guardrail = None
+        if request.guardrail_setting:
+            # The guardrail checks the answer while it is streamed: a toxicity ends the stream on error
+            guardrail = get_guardrail_factory(
+                setting=request.guardrail_setting
+            ).get_parser()
+
+        response = None
+        first_token_time = None
+        async for response, answer_text in astream_rag_chain_output(
+            conversational_retrieval_chain, inputs, config, guardrail
+        ):
+            if answer_text:
+                if first_token_time is None:
+                    first_token_time = time.time()
+                    logger.info(
+                        'RAG chain - First answer token. (Duration : %.2f seconds)',
+                        first_token_time - start_time,
+                    )
+                yield RAGStreamEventType.ANSWER, answer_text
+
+        rag_duration = '{:.2f}'.format(time.time() - start_time)
+        logger.info(
+            'RAG chain - End of streamed execution. (Duration : %s seconds)',
+            rag_duration,
+        )
+
+        rag_response = create_rag_response(
+            request,
+            response,
+            observability_handler,
+            records_callback_handler if debug else None,
+            rag_duration,
+            get_semantic_cache_debug_data() if answer_cache_key is not None else None,
+            stage_metrics_handler.stage_timings,
+        )
+        if answer_cache_key is not None:
+            store_rag_answer(answer_cache_key, rag_response)
+
+    yield RAGStreamEventType.CONTEXT_USAGE, rag_response.answer.context_usage
+    yield RAGStreamEventType.FOOTNOTES, rag_response.footnotes
+    yield RAGStreamEventType.OBSERVABILITY_INFO, rag_response.observability_info
+    if debug:
+        yield RAGStreamEventType.DEBUG, rag_response.debug
+    yield RAGStreamEventType.DONE, rag_response.answer
+
+
+def get_rag_chain_inputs(request: RAGRequest) -> dict[str, Any]:
+    """
+    Get the RAG chain inputs: the question answering prompt inputs and the chat history.
+
+    Args:
+        request: The RAG request
+    Returns:
+        The RAG chain inputs.
+    """
+
+    message_history = ChatMessageHistory()
     if request.dialog:
         for msg in request.dialog.history:
             if ChatMessageType.HUMAN == msg.type:
                 message_history.add_user_message(msg.text)
             else:
                 message_history.add_ai_message(msg.text)
-        session_id = request.dialog.dialog_id
-        user_id = request.dialog.user_id
-        tags = request.dialog.tags or []
 
     logger.debug(
         'RAG chain - Use chat history: %s',
         'Yes' if len(message_history.messages) > 0 else 'No',
     )
 
-    inputs = {
+    return {
         **request.question_answering_prompt.inputs,
         'chat_history': message_history.messages,
     }
 
+
+def get_rag_chain_config(
+    request: RAGRequest,
+    debug: bool,
+    custom_observability_handler: Optional[BaseCallbackHandler] = None,
+) -> tuple[
+    RunnableConfig,
+    RAGCallbackHandler,
+    Optional[BaseCallbackHandler],
+    StageMetricsCallbackHandler,
+]:
+    """
+    Get the RAG chain config, with its callback handlers and observability metadata.
+
+    Args:
+        request: The RAG request
+        debug: True if RAG data debug should be recorded.
+        custom_observability_handler: Custom observability handler
+    Returns:
+        The RAG chain config, the debug records callback handler, the observability handler
+        and the stage metrics callback handler.
+    """
+
+    session_id = None
+    user_id = None
+    tags = []
+    if request.dialog:
+        session_id = request.dialog.dialog_id
+        user_id = request.dialog.user_id
+        tags = request.dialog.tags or []
+
     logger.debug(
         'RAG chain - Use RAGCallbackHandler for debugging : %s',
         debug,
@@ -176,6 +438,11 @@ async def execute_rag_chain(
             observability_setting=request.observability_setting,
         )
         callback_handlers.append(observability_handler)
+    # Stage metrics callback handler
+    stage_metrics_handler = create_stage_metrics_callback_handler(
+        index=request.document_index_name
+    )
+    callback_handlers.append(stage_metrics_handler)
 
     metadata = {}
     if user_id is not None:
@@ -185,59 +452,359 @@ async def execute_rag_chain(
     if tags:
         metadata['langfuse_tags'] = tags
 
-    response = await conversational_retrieval_chain.ainvoke(
-        input=inputs,
-        config=RunnableConfig(
-            callbacks=callback_handlers,
-            metadata=metadata,
-        ),
+    config = RunnableConfig(
+        callbacks=callback_handlers,
+        metadata=metadata,
     )
-    llm_answer = LLMAnswer(**response['answer'])
+    return config, records_callback_handler, observability_handler, stage_metrics_handler
 
-    # Guardrail
-    if request.guardrail_setting:
-        guardrail = get_guardrail_factory(
-            setting=request.guardrail_setting
-        ).get_parser()
-        guardrail_output = guardrail.parse(llm_answer.answer)
-        check_guardrail_output(guardrail_output)
 
-    # Calculation of RAG processing time
-    rag_duration = '{:.2f}'.format(time.time() - start_time)
-    logger.info('RAG chain - End of execution. (Duration : %s seconds)', rag_duration)
+def create_rag_response(
+    request: RAGRequest,
+    response: dict[str, Any],
+    observability_handler: Optional[BaseCallbackHandler],
+    records_callback_handler: Optional[RAGCallbackHandler],
+    rag_duration: str,
+    semantic_cache_debug_data: Optional[SemanticCacheDebugData] = None,
+    stage_timings: Optional[StageTimings] = None,
+) -> RAGResponse:
+    """
+    Create the RAG response from the RAG chain output.
 
-    # Group contexts by chunk id
-    contexts_by_chunk = {
-        ctx.chunk: ctx
-        for ctx in (llm_answer.context_usage or [])
-        if ctx.used_in_response
-    }
+    Args:
+        request: The RAG request
+        response: The RAG chain output
+        observability_handler: The observability handler
+        records_callback_handler: The debug records callback handler (None if not in debug mode)
+        rag_duration: The RAG processing time
+        semantic_cache_debug_data: The semantic answer cache debug data (if the cache is enabled)
+        stage_timings: The stage timings of the RAG execution
+    Returns:
+        The RAG response (Answer and document sources)
+    """
+
+    with stage_timer(
+        PipelineStage.RESPONSE_ASSEMBLY, index=request.document_index_name
+    ):
+        llm_answer = LLMAnswer(**response['answer'])
+
+        # Group contexts by chunk id
+        contexts_by_chunk = {
+            ctx.chunk: ctx
+            for ctx in (llm_answer.context_usage or [])
+            if ctx.used_in_response
+        }
 
-    # Returning RAG response
-    return RAGResponse(
-        answer=llm_answer,
-        footnotes={
-            Footnote(
-                identifier=doc.metadata['id'],
-                title=doc.metadata['title'],
-                url=doc.metadata['source'],
-                content=get_source_content(doc),
-                score=doc.metadata.get('retriever_score', None),
-                metadata=doc.metadata.copy(),
+        # Returning RAG response
+        return RAGResponse(
+            answer=llm_answer,
+            footnotes={
+                Footnote(
+                    identifier=doc.metadata['id'],
+                    title=doc.metadata['title'],
+                    url=doc.metadata['source'],
+                    content=get_source_content(doc),
+                    score=doc.metadata.get('retriever_score', None),
+                    metadata=doc.metadata.copy(),
+                )
+                for doc in response['documents']
+                if doc.metadata['id'] in contexts_by_chunk
+            },
+            observability_info=get_observability_info(
+                observability_handler,
+                ObservabilityTrace.RAG.value,
+            ),
+            debug=get_rag_debug_data(
+                request,
+                records_callback_handler,
+                rag_duration,
+                semantic_cache_debug_data,
+                stage_timings,
+                response.get('packed_context'),
             )
-            for doc in response['documents']
-            if doc.metadata['id'] in contexts_by_chunk
+            if records_callback_handler is not None
+            else None,
+        )
+
+
+async def alookup_rag_answer_cache(
+    request: RAGRequest, inputs: dict, config: RunnableConfig
+) -> tuple[tuple, Optional[tuple[RAGResponse, float]]]:
+    """
+    Look up the semantic answer cache, with the embedding of the condensed question.
+    The condensed question is added to the RAG chain inputs, so that the chain does not condense it again.
+
+    Args:
+        request: The RAG request
+        inputs: The RAG chain inputs
+        config: The RAG chain config
+    Returns:
+        The cache key (to store the answer on a miss), and the cached RAG response with its similarity on a hit.
+    """
+
+    inputs['condensed_question'] = await acondense_question(request, inputs, config)
+    embedding = await get_em_factory(
+        setting=request.embedding_question_em_setting
+    ).get_embedding_model().aembed_query(inputs['condensed_question'])
+
+    index_name, index_session_id = get_index_session(request)
+    answer_cache_key = (
+        index_name,
+        index_session_id,
+        get_rag_answer_cache_scope(request),
+        embedding,
+    )
+    cached_answer = rag_answer_cache.get(*answer_cache_key)
+    logger.debug(
+        'RAG chain - Semantic cache %s (hits: %s, misses: %s)',
+        'hit' if cached_answer is not None else 'miss',
+        rag_answer_cache.hits,
+        rag_answer_cache.misses,
+    )
+    return answer_cache_key, cached_answer
+
+
+def store_rag_answer(answer_cache_key: tuple, rag_response: RAGResponse) -> None:
+    """Store a RAG response in the semantic answer cache (without its request specific data)."""
+    rag_answer_cache.put(
+        *answer_cache_key,
+        rag_response.model_copy(update={'observability_info': None, 'debug': None}),
+    )
+
+
+def create_cached_rag_response(
+    request: RAGRequest,
+    cached_answer: tuple[RAGResponse, float],
+    observability_handler: Optional[BaseCallbackHandler],
+    records_callback_handler: Optional[RAGCallbackHandler],
+    rag_duration: str,
+    stage_timings: Optional[StageTimings] = None,
+) -> RAGResponse:
+    """
+    Create the RAG response from a semantic answer cache hit.
+
+    Args:
+        request: The RAG request
+        cached_answer: The cached RAG response, and its similarity
+        observability_handler: The observability handler
+        records_callback_handler: The debug records callback handler (None if not in debug mode)
+        rag_duration: The RAG processing time
+        stage_timings: The stage timings of the RAG execution
+    Returns:
+        The cached RAG response, with the observability and debug data of the request.
+    """
+    rag_response, similarity = cached_answer
+    logger.info(
+        'RAG chain - Answer found in the semantic cache. (Similarity : %.3f, Duration : %s seconds)',
+        similarity,
+        rag_duration,
+    )
+
+    debug = None
+    if records_callback_handler is not None:
+        debug = get_rag_debug_data(
+            request,
+            records_callback_handler,
+            rag_duration,
+            get_semantic_cache_debug_data(similarity),
+            stage_timings,
+        ).model_copy(update={'answer': rag_response.answer})
+
+    return rag_response.model_copy(
+        update={
+            'observability_info': get_observability_info(
+                observability_handler,
+                ObservabilityTrace.RAG.value,
+            ),
+            'debug': debug,
+        }
+    )
+
+
+def get_semantic_cache_debug_data(
+    similarity: Optional[float] = None,
+) -> SemanticCacheDebugData:
+    """Get the semantic answer cache debug data. The similarity is given on a hit."""
+    return SemanticCacheDebugData(
+        hit=similarity is not None,
+        similarity=similarity,
+        hits=rag_answer_cache.hits,
+        misses=rag_answer_cache.misses,
+    )
+
+
+def get_rag_answer_cache_scope(request: RAGRequest) -> str:
+    """
+    Get the scope of the RAG answers in the semantic cache: the RAG configuration
+    (including the index and the search filters) and the prompt inputs, but the question.
+    """
+    return fingerprint(
+        get_rag_chain_fingerprint(request),
+        {
+            name: value
+            for name, value in request.question_answering_prompt.inputs.items()
+            if name != 'question'
         },
-        observability_info=get_observability_info(
-            observability_handler,
-            ObservabilityTrace.RAG.value,
-        ),
-        debug=get_rag_debug_data(request, records_callback_handler, rag_duration)
-        if debug
-        else None,
     )
 
 
+def get_index_session(request: RAGRequest) -> tuple[str, Optional[str]]:
+    """
+    Get the index session of a RAG request.
+    The indexing session id is part of the index name (ns-<namespace>-bot-<bot>-session-<id>),
+    or is given in the document search filter.
+
+    Args:
+        request: The RAG request
+    Returns:
+        The index name (without its session), and the indexing session id.
+    """
+    match = INDEX_SESSION_PATTERN.match(request.document_index_name)
+    if match is not None:
+        return match['index'], match['session']
+
+    filters = request.document_search_params.to_dict().get('filter') or []
+    if isinstance(filters, dict):
+        filters = [filters]
+    for search_filter in filters:
+        for key, value in search_filter.get('term', search_filter).items():
+            if key.removesuffix('.keyword').split('.')[-1] == 'index_session_id':
+                return request.document_index_name, str(value)
+    return request.document_index_name, None
+
+
+async def acondense_question(
+    request: RAGRequest, inputs: dict, config: RunnableConfig
+) -> str:
+    """
+    Condense the question with the chat history (the question itself if there is no history).
+
+    Args:
+        request: The RAG request
+        inputs: The RAG chain inputs
+        config: The RAG chain config
+    Returns:
+        The condensed question.
+    """
+    if not inputs.get('chat_history'):
+        return inputs['question']
+
+    llm_setting = (
+        request.question_condensing_llm_setting
+        or request.question_answering_llm_setting
+    )
+    chat_chain = build_question_condensation_chain(
+        get_llm_factory(setting=llm_setting).get_language_model(),
+        request.question_condensing_prompt,
+    )
+    return await chat_chain.ainvoke(inputs, config)
+
+
+async def ainvoke_with_guardrail(
+    chain: RunnableSerializable[Any, dict[str, Any]],
+    inputs: dict,
+    config: RunnableConfig,
+    guardrail: BaseOutputParser,
+) -> dict[str, Any]:
+    """
+    Invoke the RAG chain in streaming mode, while the guardrail checks the answer text as it is generated.
+    A toxicity detected by the guardrail aborts the generation (GenAIGuardCheckException).
+    As soon as the answer field is complete, its last segment is checked while the LLM generates
+    the rest of its JSON output, so a clean answer is released without waiting for a final check.
+
+    Args:
+        chain: The RAG chain
+        inputs: The RAG chain inputs
+        config: The RAG chain config
+        guardrail: The guardrail output parser
+    Returns:
+        The RAG chain output.
+    """
+    response = None
+    async for response, _ in astream_rag_chain_output(chain, inputs, config, guardrail):
+        pass
+    return response
+
+
+async def astream_rag_chain_output(
+    chain: RunnableSerializable[Any, dict[str, Any]],
+    inputs: dict,
+    config: RunnableConfig,
+    guardrail: Optional[BaseOutputParser] = None,
+) -> AsyncIterator[tuple[dict[str, Any], str]]:
+    """
+    Stream the RAG chain output.
+    The JSON output parser of the chain parses the partial LLM output incrementally:
+    the output fields are accumulated, and the new text of the answer field is extracted from them.
+    If a guardrail is given, it checks the answer text as it is generated (see ainvoke_with_guardrail).
+
+    Args:
+        chain: The RAG chain
+        inputs: The RAG chain inputs
+        config: The RAG chain config
+        guardrail: The guardrail output parser (optional)
+    Returns:
+        The accumulated RAG chain output, and the new answer text.
+    """
+    answer_chunks: Optional[asyncio.Queue[Optional[str]]] = None
+    guardrail_task = None
+    if guardrail is not None:
+        answer_chunks = asyncio.Queue()
+
+        async def answer_stream():
+            while (chunk := await answer_chunks.get()) is not None:
+                yield chunk
+
+        async def check_answer():
+            async for guardrail_output in guardrail.atransform(answer_stream()):
+                check_guardrail_output(guardrail_output)
+
+        guardrail_task = asyncio.create_task(check_answer())
+
+    def send_to_guardrail(answer_chunk: Optional[str]):
+        if answer_chunks is not None:
+            answer_chunks.put_nowait(answer_chunk)
+
+    stream = chain.astream(input=inputs, config=config)
+    response = {}
+    answer_text = ''
+    answer_completed = False
+    try:
+        async for chunk in stream:
+            # Each field is output once, except the answer whose parser outputs the whole parsed JSON each time
+            # (the chunks are not added: the list fields, like the documents, would be concatenated)
+            response = {**response, **chunk}
+            if guardrail_task is not None and guardrail_task.done():
+                # Raises the guardrail exception, if any
+                guardrail_task.result()
+            if answer_completed:
+                yield response, ''
+                continue
+
+            answer = response.get('answer') or {}
+            text = answer.get('answer') or ''
+            new_text = ''
+            if len(text) > len(answer_text) and text.startswith(answer_text):
+                new_text = text[len(answer_text) :]
+                send_to_guardrail(new_text)
+                answer_text = text
+            # The answer is complete when the LLM writes the next field
+            if 'answer' in answer and list(answer)[-1] != 'answer':
+                answer_completed = True
+                send_to_guardrail(None)
+            yield response, new_text
+
+        if guardrail_task is not None:
+            if not answer_completed:
+                send_to_guardrail(None)
+            await guardrail_task
+    finally:
+        # Stop the generation (and the guardrail checks) on error
+        await stream.aclose()
+        if guardrail_task is not None:
+            guardrail_task.cancel()
+
+
 def get_source_content(doc: Document) -> str:
     """
     Find and delete the title followed by two line breaks
@@ -259,6 +826,59 @@ def create_rag_chain(
 ) -> RunnableSerializable[Any, dict[str, Any]]:
     """
     Create the RAG chain from RAGRequest, using the LLM and Embedding settings specified in the request.
+    The chain only depends on the RAG configuration (the per-request data is given as chain inputs),
+    so it is built once per configuration and then reused from the cache.
+
+    Args:
+        request: The RAG request
+        vector_db_async_mode: enable/disable the async_mode for vector DB client (if supported). Default to True.
+    Returns:
+        The RAG chain.
+    """
+    if not application_settings.rag_chain_cache_enabled:
+        return build_rag_chain(request, vector_db_async_mode)
+
+    chain = rag_chain_cache.get_or_create(
+        get_rag_chain_fingerprint(request, vector_db_async_mode),
+        partial(build_rag_chain, request, vector_db_async_mode),
+    )
+    logger.debug(
+        'RAG chain - Cache hits: %s, misses: %s',
+        rag_chain_cache.hits,
+        rag_chain_cache.misses,
+    )
+    return chain
+
+
+def get_rag_chain_fingerprint(
+    request: RAGRequest, vector_db_async_mode: Optional[bool] = True
+) -> str:
+    """
+    Compute the fingerprint of the RAG chain configuration.
+    The question answering prompt inputs are per-request values: only their names are part of it.
+    """
+    return fingerprint(
+        request.question_condensing_llm_setting,
+        request.question_condensing_prompt,
+        request.question_answering_llm_setting,
+        request.question_answering_llm_alternate_setting,
+        request.question_answering_prompt.formatter,
+        request.question_answering_prompt.template,
+        sorted(request.question_answering_prompt.inputs.keys()),
+        request.embedding_question_em_setting,
+        request.vector_store_setting,
+        request.document_index_name,
+        request.document_search_params,
+        request.compressor_setting,
+        vector_db_async_mode,
+    )
+
+
+def build_rag_chain(
+    request: RAGRequest, vector_db_async_mode: Optional[bool] = True
+) -> RunnableSerializable[Any, dict[str, Any]]:
+    """
+    Build the RAG chain from RAGRequest, using the LLM and Embedding settings specified in the request.
 
     Args:
         request: The RAG request
@@ -283,7 +903,8 @@ def create_rag_chain(
             setting=request.question_condensing_llm_setting
         )
     question_answering_llm_factory = get_llm_factory(
-        setting=request.question_answering_llm_setting
+        setting=request.question_answering_llm_setting,
+        alternate_setting=request.question_answering_llm_alternate_setting,
     )
     em_factory = get_em_factory(setting=request.embedding_question_em_setting)
     vector_store_factory = get_vector_store_factory(
@@ -296,6 +917,11 @@ def create_rag_chain(
         search_kwargs=request.document_search_params.to_dict(),
         async_mode=vector_db_async_mode,
     )
+    if isinstance(retriever, BaseRetriever):
+        retriever.metadata = {
+            **(retriever.metadata or {}),
+            **stage_metadata(PipelineStage.VECTOR_SEARCH),
+        }
     if request.compressor_setting:
         retriever = add_document_compressor(retriever, request.compressor_setting)
 
@@ -305,7 +931,7 @@ def create_rag_chain(
     question_condensing_llm = None
     if question_condensing_llm_factory is not None:
         question_condensing_llm = question_condensing_llm_factory.get_language_model()
-    question_answering_llm = question_answering_llm_factory.get_language_model()
+    question_answering_llm = question_answering_llm_factory.get_hedged_language_model()
 
     # Fallback in case of missing condensing LLM setting using the answering LLM setting.
     if question_condensing_llm is not None:
@@ -328,16 +954,16 @@ def create_rag_chain(
             'condensed_question': contextualize_question_fn,
             'question': itemgetter('question'),
             'chat_history': itemgetter('chat_history'),
+            # The question answering prompt inputs
+            'prompt_inputs': RunnablePassthrough(),
         }
     )
 
     async def retrieve_with_variants(inputs):
-        variants = [
-            # inputs["question"], Deactivated. It's an example to prove the multi retriever process
-            inputs['condensed_question']
-        ]
+        variants = [inputs['condensed_question']]
+        if application_settings.rag_retrieval_raw_question_enabled:
+            variants.append(inputs['question'])
 
-        # TODO [DERCBOT-1649] Apply the RRF Algo on unique_docs.
         return await retrieve_documents_with_variants(retriever, variants)
 
     # Build the RAG inputs
@@ -346,27 +972,37 @@ def create_rag_chain(
             'question': itemgetter('condensed_question'),
             'chat_history': itemgetter('chat_history'),
             'documents': RunnableLambda(retrieve_with_variants),
+            'prompt_inputs': itemgetter('prompt_inputs'),
         }
     )
 
+    # Pack the documents and the chat history into the prompt, within the token budget of the answering LLM
+    count_tokens = get_token_counter(request.question_answering_llm_setting)
+
+    def pack(x) -> PackedContext:
+        return pack_context(
+            x['documents'],
+            x['chat_history'],
+            count_tokens,
+            max_tokens=application_settings.rag_context_max_tokens,
+            history_max_tokens=application_settings.rag_context_history_max_tokens,
+        )
+
     return rag_inputs | RunnablePassthrough.assign(
+        packed_context=RunnableLambda(pack, name='context_packing')
+    ) | RunnablePassthrough.assign(
         answer=(
-            {
-                'context': lambda x: json.dumps(
-                    [
-                        {
-                            'chunk_id': doc.metadata['id'],
-                            'chunk_text': doc.page_content,
-                        }
-                        for doc in x['documents']
-                    ],
-                    ensure_ascii=False,
-                    indent=2,
-                ),
-                'chat_history': format_chat_history,
-            }
+            RunnableLambda(
+                lambda x: {
+                    **x['prompt_inputs'],
+                    'context': x['packed_context'].documents,
+                    'chat_history': x['packed_context'].chat_history,
+                }
+            )
             | rag_prompt
-            | question_answering_llm
+            | question_answering_llm.with_config(
+                metadata=stage_metadata(PipelineStage.ANSWER)
+            )
             | JsonOutputParser(pydantic_object=LLMAnswer, name='rag_chain_output')
         )
     )
@@ -375,24 +1011,14 @@ def create_rag_chain(
 def build_rag_prompt(request: RAGRequest) -> LangChainPromptTemplate:
     """
     Build the RAG prompt template.
+    Its inputs are not bound to the template: they are given with the chain inputs.
     """
     return LangChainPromptTemplate.from_template(
         template=request.question_answering_prompt.template,
         template_format=request.question_answering_prompt.formatter.value,
-        partial_variables=request.question_answering_prompt.inputs,
     )
 
 
-def format_chat_history(x):
-    messages = []
-    for msg in x['chat_history']:
-        if isinstance(msg, HumanMessage):
-            messages.append({'user': msg.content})
-        elif isinstance(msg, AIMessage):
-            messages.append({'assistant': msg.content})
-    return json.dumps(messages, ensure_ascii=False, indent=2)
-
-
 def build_question_condensation_chain(
     llm, prompt: Optional[PromptTemplate]
 ) -> ChatPromptTemplate:
@@ -430,7 +1056,7 @@ Return only the reformulated question.
                 ('human', '{question}'),
             ]
         ).partial(**prompt.inputs)
-        | llm
+        | llm.with_config(metadata=stage_metadata(PipelineStage.CONDENSATION))
         | StrOutputParser(name='chat_chain_output')
     )
 
@@ -439,6 +1065,9 @@ def contextualize_question(inputs: dict, chat_chain) -> str:
     """
     Contextualize the question based on the chat history.
     """
+    if inputs.get('condensed_question'):
+        # Already condensed (see the semantic answer cache)
+        return inputs['condensed_question']
     if inputs.get('chat_history') and len(inputs['chat_history']) > 0:
         return chat_chain
     return inputs['question']
@@ -502,7 +1131,12 @@ def get_llm_answer(rag_chain_output) -> LLMAnswer:
 
 
 def get_rag_debug_data(
-    request: RAGRequest, records_callback_handler: RAGCallbackHandler, rag_duration
+    request: RAGRequest,
+    records_callback_handler: RAGCallbackHandler,
+    rag_duration,
+    semantic_cache_debug_data: Optional[SemanticCacheDebugData] = None,
+    stage_timings: Optional[StageTimings] = None,
+    packed_context: Optional[PackedContext] = None,
 ) -> RAGDebugData:
     """RAG debug data assembly"""
 
@@ -521,6 +1155,17 @@ def get_rag_debug_data(
         document_search_params=request.document_search_params,
         answer=get_llm_answer(records_callback_handler.records['rag_chain_output']),
         duration=rag_duration,
+        stage_timings=stage_timings.durations() if stage_timings is not None else None,
+        semantic_cache=semantic_cache_debug_data,
+        context_packing=ContextPackingDebugData(
+            packed_documents=packed_context.packed_documents,
+            truncated_documents=packed_context.truncated_documents,
+            dropped_documents=packed_context.dropped_documents,
+            dropped_history_messages=packed_context.dropped_history_messages,
+            tokens=packed_context.tokens,
+        )
+        if packed_context is not None
+        else None,
     )
 
 
@@ -553,4 +1198,7 @@ def add_document_compressor(
     return ContextualCompressionRetriever(
         base_retriever=retriever,
         base_compressor=compressor,
+        metadata=stage_metadata(
+            PipelineStage.RERANK, compressor_settings.provider.value
+        ),
     )
@@ -17,9 +17,6 @@
 import logging
 from typing import Optional
 
-from langfuse import get_client
-from langfuse.langchain import CallbackHandler as LangfuseCallbackHandler
-
 from gen_ai_orchestrator.models.observability.observability_type import (
     ObservabilitySetting,
 )
@@ -50,6 +47,12 @@ def check_observability_setting(setting: ObservabilitySetting) -> bool:
 
 def get_observability_info(observability_handler, trace_name: Optional[str] = None) -> Optional[ObservabilityInfo]:
     """Get the observability Information"""
+    if observability_handler is None:
+        return None
+
+    # Imported here: Langfuse is only loaded by the deployments using it (a handler was created)
+    from langfuse.langchain import CallbackHandler as LangfuseCallbackHandler
+
     if not isinstance(observability_handler, LangfuseCallbackHandler):
         return None
 
@@ -14,11 +14,27 @@
 #
 """Module for the QA Service"""
 
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
 from gen_ai_orchestrator.routers.requests.requests import QARequest
 from gen_ai_orchestrator.routers.responses.responses import QAResponse
 from gen_ai_orchestrator.services.langchain.qa_chain import execute_qa_chain
+from gen_ai_orchestrator.utils.fingerprint import fingerprint
+from gen_ai_orchestrator.utils.single_flight import SingleFlight
+
+# The in-flight QA executions, shared by the identical concurrent requests
+qa_single_flight: SingleFlight[QAResponse] = SingleFlight('QA')
 
 
 async def qa(request: QARequest) -> QAResponse:
-    """Launch execution of the RAG chain"""
-    return await execute_qa_chain(request)
+    """
+    Launch execution of the RAG chain.
+    The identical concurrent requests share a single execution, if enabled.
+    """
+    if not application_settings.qa_single_flight_enabled:
+        return await execute_qa_chain(request)
+
+    return await qa_single_flight.run(
+        fingerprint(request), lambda: execute_qa_chain(request)
+    )
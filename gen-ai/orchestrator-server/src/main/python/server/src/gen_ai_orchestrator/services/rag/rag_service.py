@@ -14,11 +14,205 @@
 #
 """Module for the RAG Service"""
 
-from gen_ai_orchestrator.routers.requests.requests import RAGRequest
-from gen_ai_orchestrator.routers.responses.responses import RAGResponse
-from gen_ai_orchestrator.services.langchain.rag_chain import execute_rag_chain
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Tuple
+
+from langchain_core.runnables import RunnableSerializable
+
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
+from gen_ai_orchestrator.errors.exceptions.exceptions import (
+    GenAIOrchestratorException,
+    GenAIUnknownErrorException,
+)
+from gen_ai_orchestrator.errors.handlers.fastapi.fastapi_handler import (
+    create_error_response,
+)
+from gen_ai_orchestrator.middlewares.admission_control_middleware import (
+    RouteClass,
+    admission,
+)
+from gen_ai_orchestrator.models.errors.errors_models import ErrorInfo
+from gen_ai_orchestrator.models.rag.rag_models import RAGStreamEventType
+from gen_ai_orchestrator.routers.requests.requests import (
+    RAGBatchItem,
+    RAGBatchRequest,
+    RAGRequest,
+)
+from gen_ai_orchestrator.routers.responses.responses import (
+    RAGBatchItemResponse,
+    RAGResponse,
+)
+from gen_ai_orchestrator.services.langchain.callbacks.stage_metrics_callback_handler import (
+    StageTimings,
+    request_stage_timings,
+)
+from gen_ai_orchestrator.services.langchain.rag_chain import (
+    astream_rag_chain,
+    create_rag_chain,
+    execute_rag_chain,
+)
+from gen_ai_orchestrator.utils.fingerprint import fingerprint
+from gen_ai_orchestrator.utils.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# The in-flight RAG executions, shared by the identical concurrent requests
+rag_single_flight: SingleFlight[RAGResponse] = SingleFlight('RAG')
 
 
 async def rag(request: RAGRequest, debug: bool) -> RAGResponse:
-    """Launch execution of the RAG chain"""
-    return await execute_rag_chain(request, debug)
+    """
+    Launch execution of the RAG chain.
+    The identical concurrent requests (e.g. bot retries) share a single execution, if enabled.
+    Each of them gets the stage timings of the shared execution (Server-Timing header).
+    """
+    if not application_settings.rag_single_flight_enabled:
+        return await execute_rag_chain(request, debug)
+
+    response, stage_timings = await rag_single_flight.run(
+        get_rag_request_fingerprint(request, debug),
+        lambda: execute_rag_chain_with_stage_timings(request, debug),
+    )
+    request_timings = request_stage_timings.get()
+    if request_timings is not None:
+        request_timings.add_all(stage_timings)
+    return response
+
+
+async def execute_rag_chain_with_stage_timings(
+    request: RAGRequest, debug: bool
+) -> Tuple[RAGResponse, StageTimings]:
+    """
+    Execute the RAG chain, and record its stage timings apart from those of the request
+    (the execution runs in its own task, whose context is a copy of the one of the request).
+    """
+    stage_timings = StageTimings()
+    request_stage_timings.set(stage_timings)
+    return await execute_rag_chain(request, debug), stage_timings
+
+
+def get_rag_request_fingerprint(request: RAGRequest, debug: bool) -> str:
+    """
+    Compute the canonical fingerprint of a RAG request: its settings, prompt inputs and dialog history.
+    Without observability, the dialog identifiers are not part of it, so that the replicas of a bot
+    share the same execution. With observability, they are: the execution is traced for its dialog and user.
+    """
+    exclude = (
+        None
+        if request.observability_setting
+        else {'dialog': {'dialog_id', 'user_id', 'tags'}}
+    )
+    return fingerprint(request.model_dump(mode='json', exclude=exclude), debug)
+
+
+def rag_stream(
+    request: RAGRequest, debug: bool
+) -> AsyncIterator[tuple[RAGStreamEventType, Any]]:
+    """Launch execution of the RAG chain in streaming mode"""
+    return astream_rag_chain(request, debug)
+
+
+def rag_batch(
+    request: RAGBatchRequest, debug: bool
+) -> AsyncIterator[RAGBatchItemResponse]:
+    """
+    Launch execution of the RAG chain for each item of a batch.
+    The chain is built once (so that a configuration error fails the whole request),
+    then the items are run concurrently and their responses are yielded as soon as they complete.
+    """
+    rag_chain = create_rag_chain(request=request.configuration)
+    max_concurrency = min(
+        request.max_concurrency or application_settings.rag_batch_default_concurrency,
+        application_settings.rag_batch_max_concurrency,
+    )
+    return arun_rag_batch(request, debug, rag_chain, max_concurrency)
+
+
+async def arun_rag_batch(
+    request: RAGBatchRequest,
+    debug: bool,
+    rag_chain: RunnableSerializable,
+    max_concurrency: int,
+) -> AsyncIterator[RAGBatchItemResponse]:
+    """
+    Run the items of a RAG batch, at most max_concurrency at a time.
+    The pending items are cancelled if the iteration is stopped (e.g. the client disconnected).
+    """
+    items = iter(request.items)
+    responses: asyncio.Queue[RAGBatchItemResponse] = asyncio.Queue()
+
+    async def worker():
+        # The workers share the items iterator: each one takes the next item when it is free
+        for item in items:
+            responses.put_nowait(
+                await arun_rag_batch_item(request.configuration, item, debug, rag_chain)
+            )
+
+    workers = [
+        asyncio.create_task(worker())
+        for _ in range(min(max_concurrency, len(request.items)))
+    ]
+    try:
+        for _ in request.items:
+            yield await responses.get()
+    finally:
+        for task in workers:
+            task.cancel()
+
+
+async def arun_rag_batch_item(
+    configuration: RAGRequest,
+    item: RAGBatchItem,
+    debug: bool,
+    rag_chain: RunnableSerializable,
+) -> RAGBatchItemResponse:
+    """
+    Run a RAG batch item. It is admitted as a RAG request (admission control).
+    Its error is returned with its response, so that it does not abort the batch.
+    """
+    try:
+        async with admission(RouteClass.RAG):
+            response = await execute_rag_chain(
+                get_rag_batch_item_request(configuration, item),
+                debug,
+                rag_chain=rag_chain,
+            )
+        return RAGBatchItemResponse(id=item.id, response=response)
+    except GenAIOrchestratorException as exc:
+        logger.error('RAG batch - Item %s failed: %s', item.id, exc)
+        return RAGBatchItemResponse(id=item.id, error=create_error_response(exc))
+    except Exception as exc:
+        logger.exception('RAG batch - Item %s failed', item.id)
+        return RAGBatchItemResponse(
+            id=item.id,
+            error=create_error_response(
+                GenAIUnknownErrorException(
+                    ErrorInfo(error=exc.__class__.__name__, cause=str(exc))
+                )
+            ),
+        )
+
+
+def get_rag_batch_item_request(
+    configuration: RAGRequest, item: RAGBatchItem
+) -> RAGRequest:
+    """
+    Get the RAG request of a batch item: the batch configuration, with the item inputs and dialog.
+    The configuration is copied without being validated again.
+    """
+    return configuration.model_copy(
+        update={
+            'dialog': item.dialog or configuration.dialog,
+            'question_answering_prompt': configuration.question_answering_prompt.model_copy(
+                update={
+                    'inputs': {
+                        **configuration.question_answering_prompt.inputs,
+                        **item.inputs,
+                    }
+                }
+            ),
+        }
+    )
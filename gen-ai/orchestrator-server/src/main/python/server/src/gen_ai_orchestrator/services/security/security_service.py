@@ -26,11 +26,12 @@ from gen_ai_orchestrator.models.security.raw_secret_key.raw_secret_key import (
     RawSecretKey,
 )
 from gen_ai_orchestrator.models.security.security_types import SecretKey
-from gen_ai_orchestrator.utils.aws.aws_secrets_manager_client import (
-    AWSSecretsManagerClient,
+from gen_ai_orchestrator.utils.secret_manager.secret_manager_provider import (
+    SecretManagerProvider,
 )
-from gen_ai_orchestrator.utils.gcp.gcp_secret_manager_client import (
-    GCPSecretManagerClient,
+from gen_ai_orchestrator.utils.secret_manager.secret_manager_service import (
+    fetch_cached_secret,
+    get_secret_manager_client,
 )
 
 logger = logging.getLogger(__name__)
@@ -39,6 +40,7 @@ logger = logging.getLogger(__name__)
 def fetch_secret_key_value(secret_key: SecretKey) -> Optional[str]:
     """
     Fetch the value of the given secret key.
+    The secrets of a Secret Manager are cached (see secret_cache_ttl).
 
     Args:
         secret_key: The secret key
@@ -48,13 +50,21 @@ def fetch_secret_key_value(secret_key: SecretKey) -> Optional[str]:
         secret_value = secret_key.secret
     elif isinstance(secret_key, AwsSecretKey):
         # Get secret from AWS Secrets Manager
-        aws_secret = AWSSecretsManagerClient().get_ai_provider_secret(secret_key.secret_name)
-        if aws_secret is not None:
-            secret_value = aws_secret.secret
+        secret_value = _fetch_ai_provider_secret(SecretManagerProvider.AWS, secret_key.secret_name)
     elif isinstance(secret_key, GcpSecretKey):
         # Get secret from GCP Secret Manager
-        gcp_secret = GCPSecretManagerClient().get_ai_provider_secret(secret_key.secret_name)
-        if gcp_secret is not None:
-            secret_value = gcp_secret.secret
+        secret_value = _fetch_ai_provider_secret(SecretManagerProvider.GCP, secret_key.secret_name)
 
     return secret_value
+
+
+def _fetch_ai_provider_secret(
+    secret_manager_provider: SecretManagerProvider, secret_name: str
+) -> Optional[str]:
+    """Fetch the AI provider secret value from the given Secret Manager."""
+
+    def fetch() -> Optional[str]:
+        secret = get_secret_manager_client(secret_manager_provider).get_ai_provider_secret(secret_name)
+        return secret.secret if secret is not None else None
+
+    return fetch_cached_secret((secret_manager_provider, secret_name), fetch)
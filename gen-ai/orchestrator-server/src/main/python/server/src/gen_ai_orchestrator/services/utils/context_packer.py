@@ -0,0 +1,220 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Module of the context packer of the question answering prompt.
+The retrieved documents (and the chat history) are packed into the prompt within a token budget:
+the documents are taken in their ranking order, the last one that does not fit is truncated at
+a sentence boundary, the next ones are dropped. They are serialized in compact JSON.
+"""
+
+import json
+import re
+from typing import Callable, List, Optional
+
+from langchain_core.documents import Document
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+
+from gen_ai_orchestrator.models.llm.azureopenai.azure_openai_llm_setting import (
+    AzureOpenAILLMSetting,
+)
+from gen_ai_orchestrator.models.llm.llm_setting import BaseLLMSetting
+from gen_ai_orchestrator.models.llm.openai.openai_llm_setting import (
+    OpenAILLMSetting,
+)
+from gen_ai_orchestrator.utils.token_counter import (
+    TokenCounter,
+    estimate_tokens,
+    get_tiktoken_counter,
+)
+
+# The end of a sentence: a punctuation mark followed by a whitespace (or the end of the text)
+_SENTENCE_END = re.compile(r'[.!?…](?=\s|$)')
+
+
+class PackedContext:
+    """The documents and chat history packed into the question answering prompt"""
+
+    def __init__(
+        self,
+        documents: str,
+        chat_history: str,
+        packed_documents: int,
+        truncated_documents: int,
+        dropped_documents: int,
+        dropped_history_messages: int,
+        tokens: int,
+    ):
+        """
+        Args:
+            documents: The documents context (compact JSON)
+            chat_history: The chat history (compact JSON)
+            packed_documents: The number of documents in the context (truncated or not)
+            truncated_documents: The number of documents truncated to fit in the context
+            dropped_documents: The number of documents that did not fit in the context
+            dropped_history_messages: The number of (oldest) history messages that did not fit
+            tokens: The number of tokens of the documents and chat history
+        """
+        self.documents = documents
+        self.chat_history = chat_history
+        self.packed_documents = packed_documents
+        self.truncated_documents = truncated_documents
+        self.dropped_documents = dropped_documents
+        self.dropped_history_messages = dropped_history_messages
+        self.tokens = tokens
+
+
+def get_token_counter(setting: BaseLLMSetting) -> TokenCounter:
+    """
+    Get the token counter of an LLM: the tiktoken encoding of the OpenAI models,
+    an estimation for the other providers.
+    """
+    if isinstance(setting, OpenAILLMSetting):
+        return get_tiktoken_counter(setting.model)
+    if isinstance(setting, AzureOpenAILLMSetting):
+        return get_tiktoken_counter(setting.model or setting.deployment_name)
+    return estimate_tokens
+
+
+def to_compact_json(value) -> str:
+    """Serialize a value in compact JSON (no indentation, no spaces): it spends fewer prompt tokens."""
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def truncate_to_sentences(text: str, fits: Callable[[str], bool]) -> Optional[str]:
+    """
+    Truncate a text at its last sentence boundary that fits.
+
+    Args:
+        text: The text
+        fits: A function telling whether a truncated text fits
+    Returns:
+        The longest text prefix, ending at a sentence boundary, that fits (None if no sentence fits).
+    """
+    boundaries = [match.end() for match in _SENTENCE_END.finditer(text)]
+    # Binary search of the last boundary that fits (the fit is monotonic with the length)
+    low, high = 0, len(boundaries)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if fits(text[: boundaries[middle - 1]]):
+            low = middle
+        else:
+            high = middle - 1
+    return text[: boundaries[low - 1]] if low > 0 else None
+
+
+def pack_documents(
+    documents: List[Document],
+    count_tokens: TokenCounter,
+    max_tokens: Optional[int],
+) -> tuple[list[dict], int, int, int]:
+    """
+    Pack the documents into the context, within the token budget.
+
+    Args:
+        documents: The documents, in ranking order
+        count_tokens: The token counter of the LLM
+        max_tokens: The token budget of the documents (no limit if None)
+    Returns:
+        The packed document entries, their number of tokens, and the numbers of truncated and dropped documents.
+    """
+    entries = []
+    tokens = 0
+    truncated = 0
+    for doc in documents:
+        entry = {'chunk_id': doc.metadata['id'], 'chunk_text': doc.page_content}
+        entry_tokens = count_tokens(to_compact_json(entry))
+        if max_tokens is not None and tokens + entry_tokens > max_tokens:
+            remaining = max_tokens - tokens
+            chunk_text = truncate_to_sentences(
+                doc.page_content,
+                lambda text: count_tokens(to_compact_json({**entry, 'chunk_text': text})) <= remaining,
+            )
+            if chunk_text is not None:
+                entry = {**entry, 'chunk_text': chunk_text}
+                entries.append(entry)
+                tokens += count_tokens(to_compact_json(entry))
+                truncated += 1
+            # The budget is exhausted: the next documents are dropped, even smaller ones (ranking order)
+            break
+        entries.append(entry)
+        tokens += entry_tokens
+    return entries, tokens, truncated, len(documents) - len(entries)
+
+
+def pack_chat_history(
+    chat_history: List[BaseMessage],
+    count_tokens: TokenCounter,
+    max_tokens: Optional[int],
+) -> tuple[list[dict], int, int]:
+    """
+    Pack the chat history, within the token budget: the most recent messages are kept.
+
+    Args:
+        chat_history: The chat history messages
+        count_tokens: The token counter of the LLM
+        max_tokens: The token budget of the chat history (no limit if None)
+    Returns:
+        The packed messages, their number of tokens, and the number of dropped messages.
+    """
+    messages = [
+        {'user': msg.content} if isinstance(msg, HumanMessage) else {'assistant': msg.content}
+        for msg in chat_history
+        if isinstance(msg, (HumanMessage, AIMessage))
+    ]
+    packed = []
+    tokens = 0
+    for message in reversed(messages):
+        message_tokens = count_tokens(to_compact_json(message))
+        if max_tokens is not None and tokens + message_tokens > max_tokens:
+            break
+        packed.insert(0, message)
+        tokens += message_tokens
+    return packed, tokens, len(messages) - len(packed)
+
+
+def pack_context(
+    documents: List[Document],
+    chat_history: List[BaseMessage],
+    count_tokens: TokenCounter,
+    max_tokens: Optional[int],
+    history_max_tokens: Optional[int],
+) -> PackedContext:
+    """
+    Pack the documents and the chat history into the question answering prompt context.
+
+    Args:
+        documents: The retrieved documents, in ranking order
+        chat_history: The chat history messages
+        count_tokens: The token counter of the LLM
+        max_tokens: The token budget of the documents (no limit if None)
+        history_max_tokens: The token budget of the chat history (no limit if None)
+    Returns:
+        The packed context.
+    """
+    entries, documents_tokens, truncated, dropped = pack_documents(
+        documents, count_tokens, max_tokens
+    )
+    messages, history_tokens, dropped_messages = pack_chat_history(
+        chat_history, count_tokens, history_max_tokens
+    )
+    return PackedContext(
+        documents=to_compact_json(entries),
+        chat_history=to_compact_json(messages),
+        packed_documents=len(entries),
+        truncated_documents=truncated,
+        dropped_documents=dropped,
+        dropped_history_messages=dropped_messages,
+        tokens=documents_tokens + history_tokens,
+    )
@@ -0,0 +1,58 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""Module for the rank fusion of retrieved documents"""
+
+from typing import Hashable, List
+
+from langchain_core.documents import Document
+
+
+def document_key(doc: Document) -> Hashable:
+    """The key identifying a retrieved document: its id and chunk"""
+    return doc.metadata.get('id'), doc.metadata.get('chunk')
+
+
+def reciprocal_rank_fusion(
+    results: List[List[Document]], k: int = 60
+) -> List[Document]:
+    """
+    Fuse several ranked lists of documents with the Reciprocal Rank Fusion (RRF) algorithm.
+    The fused score of a document is the sum, over the lists where it appears, of 1 / (k + rank),
+    the rank starting at 1. It is exposed in the 'retriever_score' metadata of the fused documents.
+
+    Args:
+        results: The ranked lists of documents
+        k: The RRF constant, which damps the weight of the top ranks
+    Returns:
+        The unique documents, sorted by descending fused score.
+    """
+
+    scores = {}
+    documents = {}
+    for docs in results:
+        for rank, doc in enumerate(docs, start=1):
+            key = document_key(doc)
+            scores[key] = scores.get(key, 0) + 1 / (k + rank)
+            documents.setdefault(key, doc)
+
+    # The retrieved documents are copied, not to alter the retriever ones
+    return [
+        Document(
+            id=documents[key].id,
+            page_content=documents[key].page_content,
+            metadata={**documents[key].metadata, 'retriever_score': scores[key]},
+        )
+        for key in sorted(scores, key=scores.get, reverse=True)
+    ]
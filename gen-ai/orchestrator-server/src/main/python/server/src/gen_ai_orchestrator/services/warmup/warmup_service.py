@@ -0,0 +1,135 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Module for the Warm-up Service.
+At startup, the warm-up resolves the default secrets, loads the provider modules and the
+tokenizer encodings, and warms up the configured indexes, so that the first requests of
+a new worker do not pay for it. The application is reported ready once it is done.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+
+from langchain_community.embeddings import FakeEmbeddings
+
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
+from gen_ai_orchestrator.services.langchain.factories.langchain_factory import (
+    em_factories,
+    get_vector_store_factory,
+    llm_factories,
+    vector_store_factories,
+)
+from gen_ai_orchestrator.utils.secret_manager.secret_manager_service import (
+    fetch_default_vector_store_credentials,
+)
+
+logger = logging.getLogger(__name__)
+
+_ready = threading.Event()
+
+
+def is_ready() -> bool:
+    """True once the warm-up is done (or disabled)."""
+    return _ready.is_set()
+
+
+async def warm_up() -> None:
+    """
+    Warm up the application, then report it ready.
+    The warm-up steps are independent: a failing step is logged, and does not prevent the others.
+    The application is reported ready after the warm-up timeout anyway.
+    """
+    _ready.clear()
+    if not application_settings.warmup_enabled:
+        logger.info('Warm-up - Disabled')
+        _ready.set()
+        return
+
+    start = time.perf_counter()
+    try:
+        await asyncio.wait_for(_run_steps(), timeout=application_settings.warmup_timeout)
+        logger.info('Warm-up - Done in %.2fs', time.perf_counter() - start)
+    except asyncio.TimeoutError:
+        logger.warning(
+            'Warm-up - Not done after %ss, the application is reported ready anyway',
+            application_settings.warmup_timeout,
+        )
+    finally:
+        _ready.set()
+
+
+async def _run_steps() -> None:
+    """Run the warm-up steps (the blocking ones in worker threads)."""
+    # The secrets and the modules first: the indexes warm-up uses them
+    await asyncio.gather(
+        _run_step('Default Vector Store credentials', asyncio.to_thread(fetch_default_vector_store_credentials)),
+        _run_step('Provider modules', asyncio.to_thread(load_provider_modules)),
+    )
+    await asyncio.gather(
+        _run_step('Tokenizer encodings', asyncio.to_thread(load_tokenizer_encodings)),
+        *[_run_step(f'Index {index_name}', warm_up_index(index_name)) for index_name in application_settings.warmup_indexes],
+    )
+
+
+async def _run_step(name: str, step) -> None:
+    """Run a warm-up step, logging its duration or its error."""
+    start = time.perf_counter()
+    try:
+        await step
+        logger.info('Warm-up - %s - Done in %.2fs', name, time.perf_counter() - start)
+    except Exception as exc:
+        logger.warning('Warm-up - %s - Failed: %s', name, exc)
+
+
+def load_provider_modules() -> None:
+    """Load the modules of the default Vector Store provider, and of the configured LLM and EM providers."""
+    # The registries import the module of a provider on its first access
+    if application_settings.vector_store_provider is not None:
+        vector_store_factories[application_settings.vector_store_provider]
+    for provider in application_settings.warmup_llm_providers:
+        llm_factories[provider]
+    for provider in application_settings.warmup_em_providers:
+        em_factories[provider]
+
+
+def load_tokenizer_encodings() -> None:
+    """Load the tokenizer encodings (read from the tiktoken cache, or downloaded)."""
+    if not application_settings.warmup_tiktoken_encodings:
+        return
+
+    import tiktoken
+
+    for encoding_name in application_settings.warmup_tiktoken_encodings:
+        tiktoken.get_encoding(encoding_name)
+
+
+async def warm_up_index(index_name: str) -> None:
+    """
+    Warm up an index of the default Vector Store: its client is created, the connections
+    are opened and (for OpenSearch) the kNN graphs are loaded in memory.
+
+    Args:
+        index_name: The index name
+    """
+    await get_vector_store_factory(
+        setting=None,
+        index_name=index_name,
+        # No query is embedded: the embedding function is not used
+        embedding_function=FakeEmbeddings(size=1536),
+    ).warm_up()
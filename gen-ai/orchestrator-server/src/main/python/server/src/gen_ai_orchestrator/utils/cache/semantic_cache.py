@@ -0,0 +1,216 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+A thread-safe in-memory semantic cache: its values are looked up by the similarity
+of their embedding, with a maximum size (LRU eviction) and an optional time to live (TTL eviction).
+"""
+
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+import numpy as np
+
+V = TypeVar('V')
+
+# The key of a bucket of entries: their namespace, session and scope
+_BucketKey = Tuple[Hashable, Hashable, Hashable]
+
+
+class _SemanticCacheEntry(Generic[V]):
+    """A semantic cache entry"""
+
+    __slots__ = ('embedding', 'value', 'created_at')
+
+    def __init__(self, embedding: np.ndarray, value: V):
+        self.embedding = embedding
+        self.value = value
+        self.created_at = time.monotonic()
+
+
+class _SemanticCacheBucket(Generic[V]):
+    """The entries of a namespace, session and scope, with the (lazily stacked) matrix of their embeddings"""
+
+    __slots__ = ('entries', '_entry_ids', '_matrix')
+
+    def __init__(self):
+        # The entries, in creation order
+        self.entries: Dict[int, _SemanticCacheEntry[V]] = {}
+        self._entry_ids: List[int] = []
+        self._matrix: Optional[np.ndarray] = None
+
+    def add(self, entry_id: int, entry: _SemanticCacheEntry[V]) -> None:
+        self.entries[entry_id] = entry
+        self._matrix = None
+
+    def remove(self, entry_id: int) -> None:
+        del self.entries[entry_id]
+        self._matrix = None
+
+    def search(self, embedding: np.ndarray) -> Tuple[int, float]:
+        """The id of the most similar entry (the bucket is not empty), and its similarity."""
+        if self._matrix is None:
+            self._entry_ids = list(self.entries)
+            self._matrix = np.stack([self.entries[entry_id].embedding for entry_id in self._entry_ids])
+        similarities = self._matrix @ embedding
+        best = int(np.argmax(similarities))
+        return self._entry_ids[best], float(similarities[best])
+
+
+class SemanticCache(Generic[V]):
+    """
+    A thread-safe semantic cache.
+    Its entries are grouped by namespace, session and scope: a lookup only matches the entries of the same
+    namespace, session and scope, whose embedding cosine similarity with the searched one reaches the threshold.
+    The entries of a previous session (e.g. the index before a reindex) are no longer matched, and age out
+    (LRU and TTL eviction): several sessions of a namespace can be served at the same time.
+    """
+
+    def __init__(self, max_size: int, threshold: float, ttl: Optional[float] = None):
+        """
+        Args:
+            max_size: The maximum number of entries. The least recently used entry is evicted first.
+            threshold: The minimum cosine similarity of a matching entry.
+            ttl: The time to live (in seconds) of an entry. No expiration if None.
+        """
+        self.max_size = max_size
+        self.threshold = threshold
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        # The hits and misses since the cache creation (not reset by clear, exported as metrics)
+        self.total_hits = 0
+        self.total_misses = 0
+        # The bucket key of the entries, in least recently used order
+        self._entries: OrderedDict[int, _BucketKey] = OrderedDict()
+        self._buckets: Dict[_BucketKey, _SemanticCacheBucket[V]] = {}
+        self._ids = itertools.count()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(
+        self,
+        namespace: Hashable,
+        session: Hashable,
+        scope: Hashable,
+        embedding: List[float],
+    ) -> Optional[Tuple[V, float]]:
+        """
+        Get the value of the most similar entry, if its similarity reaches the threshold.
+
+        Args:
+            namespace: The entry namespace
+            session: The namespace session
+            scope: The entry scope, in the namespace
+            embedding: The searched embedding
+        Returns:
+            The entry value and its similarity, or None otherwise.
+        """
+        searched = _normalize(embedding)
+        key = (namespace, session, scope)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                self._remove_expired(key, bucket)
+            if bucket is None or not bucket.entries:
+                self.misses += 1
+                self.total_misses += 1
+                return None
+
+            best_id, similarity = bucket.search(searched)
+            if similarity < self.threshold:
+                self.misses += 1
+                self.total_misses += 1
+                return None
+
+            self._entries.move_to_end(best_id)
+            self.hits += 1
+            self.total_hits += 1
+            return bucket.entries[best_id].value, similarity
+
+    def put(
+        self,
+        namespace: Hashable,
+        session: Hashable,
+        scope: Hashable,
+        embedding: List[float],
+        value: V,
+    ) -> None:
+        """Add an entry, then evict the least recently used entries if the cache is full."""
+        entry = _SemanticCacheEntry(_normalize(embedding), value)
+        key = (namespace, session, scope)
+        with self._lock:
+            entry_id = next(self._ids)
+            self._buckets.setdefault(key, _SemanticCacheBucket()).add(entry_id, entry)
+            self._entries[entry_id] = key
+            while len(self._entries) > self.max_size:
+                self._remove(*self._entries.popitem(last=False))
+
+    def invalidate(self, namespace: Hashable) -> int:
+        """
+        Remove the entries of the given namespace (all its sessions).
+        Returns:
+            The number of removed entries.
+        """
+        with self._lock:
+            keys = [key for key in self._buckets if key[0] == namespace]
+            removed = 0
+            for key in keys:
+                for entry_id in self._buckets.pop(key).entries:
+                    del self._entries[entry_id]
+                    removed += 1
+            return removed
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics (the totals are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _remove(self, entry_id: int, key: _BucketKey) -> None:
+        bucket = self._buckets[key]
+        bucket.remove(entry_id)
+        if not bucket.entries:
+            del self._buckets[key]
+
+    def _remove_expired(self, key: _BucketKey, bucket: _SemanticCacheBucket[V]) -> None:
+        if self.ttl is None:
+            return
+        # The entries of a bucket are in creation order: the expired ones come first
+        expired = list(
+            itertools.takewhile(
+                lambda item: self._is_expired(item[1].created_at), bucket.entries.items()
+            )
+        )
+        for entry_id, _ in expired:
+            del self._entries[entry_id]
+            self._remove(entry_id, key)
+
+    def _is_expired(self, created_at: float) -> bool:
+        return self.ttl is not None and time.monotonic() - created_at > self.ttl
+
+
+def _normalize(embedding: List[float]) -> np.ndarray:
+    """Normalize an embedding, so that the cosine similarity is a dot product."""
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
@@ -0,0 +1,104 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+A thread-safe on-disk embedding cache, backed by a SQLite database,
+with a maximum size (oldest entries evicted first) and an optional time to live.
+"""
+
+import sqlite3
+import threading
+import time
+from array import array
+from typing import List, Optional
+
+
+class SQLiteEmbeddingCache:
+    """An embedding cache stored in a SQLite database, shared by the application processes."""
+
+    # The number of writes between two evictions of the oldest entries
+    EVICTION_INTERVAL = 100
+
+    def __init__(self, path: str, max_size: int, ttl: Optional[float] = None):
+        """
+        Args:
+            path: The SQLite database file path
+            max_size: The maximum number of entries. The oldest entries are evicted first.
+            ttl: The time to live (in seconds) of an entry. No expiration if None.
+        """
+        self.path = path
+        self.max_size = max_size
+        self.ttl = ttl
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS embeddings '
+                '(key TEXT PRIMARY KEY, embedding BLOB NOT NULL, created_at REAL NOT NULL)'
+            )
+            self._connection.execute(
+                'CREATE INDEX IF NOT EXISTS embeddings_created_at ON embeddings (created_at)'
+            )
+
+    def get(self, key: str) -> Optional[List[float]]:
+        """
+        Get the embedding of the given key, if it exists and has not expired.
+        Returns:
+            The embedding, or None otherwise.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT embedding, created_at FROM embeddings WHERE key = ?', (key,)
+            ).fetchone()
+        if row is None or self._is_expired(row[1]):
+            return None
+        return array('d', row[0]).tolist()
+
+    def put(self, key: str, embedding: List[float]) -> None:
+        """Add or replace an embedding, and periodically evict the expired and oldest entries."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO embeddings (key, embedding, created_at) VALUES (?, ?, ?)',
+                (key, array('d', embedding).tobytes(), time.time()),
+            )
+            self._writes += 1
+            if self._writes % self.EVICTION_INTERVAL == 0:
+                self._evict()
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM embeddings')
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _evict(self) -> None:
+        if self.ttl is not None:
+            self._connection.execute(
+                'DELETE FROM embeddings WHERE created_at < ?', (time.time() - self.ttl,)
+            )
+        self._connection.execute(
+            'DELETE FROM embeddings WHERE key NOT IN '
+            '(SELECT key FROM embeddings ORDER BY created_at DESC LIMIT ?)',
+            (self.max_size,),
+        )
+
+    def _is_expired(self, created_at: float) -> bool:
+        # The wall clock is used, as the entries outlive the process
+        return self.ttl is not None and time.time() - created_at > self.ttl
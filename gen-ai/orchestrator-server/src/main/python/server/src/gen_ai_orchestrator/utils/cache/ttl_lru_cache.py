@@ -0,0 +1,160 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+A thread-safe in-memory cache, with a maximum size (LRU eviction)
+and an optional time to live for its entries (TTL eviction).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class TTLLRUCache(Generic[K, V]):
+    """A thread-safe LRU cache whose entries expire after a time to live."""
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: Optional[float] = None,
+        on_evict: Optional[Callable[[V], None]] = None,
+    ):
+        """
+        Args:
+            max_size: The maximum number of entries. The least recently used entry is evicted first.
+            ttl: The time to live (in seconds) of an entry. No expiration if None.
+            on_evict: Called (outside the lock) with the values removed from the cache:
+                evicted, expired, replaced, invalidated or cleared.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self.hits = 0
+        self.misses = 0
+        # The hits and misses since the cache creation (not reset by clear, exported as metrics)
+        self.total_hits = 0
+        self.total_misses = 0
+        self._entries: OrderedDict[K, Tuple[float, V]] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: K, count: bool = True) -> Optional[V]:
+        """
+        Get the value of the given key, if it exists and has not expired.
+
+        Args:
+            key: The entry key
+            count: True if the lookup should be counted in hits / misses statistics.
+        Returns:
+            The entry value, or None otherwise.
+        """
+        evicted: List[V] = []
+        with self._lock:
+            value = self._get(key, count, evicted)
+        self._evicted(evicted)
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        """Add or replace an entry, then evict the least recently used entries if the cache is full."""
+        evicted: List[V] = []
+        with self._lock:
+            self._put(key, value, evicted)
+        self._evicted(evicted)
+
+    def get_or_create(self, key: K, factory: Callable[[], V]) -> V:
+        """
+        Get the value of the given key, or create it with the factory and cache it.
+        The factory is called outside the lock: if two threads create the same entry
+        concurrently, the first one stored wins and is returned to both (the other one is evicted).
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        created = factory()
+        evicted: List[V] = []
+        with self._lock:
+            value = self._get(key, False, evicted)
+            if value is None:
+                value = created
+                self._put(key, created, evicted)
+            else:
+                evicted.append(created)
+        self._evicted(evicted)
+        return value
+
+    def invalidate(self, key: K) -> bool:
+        """
+        Remove the given entry.
+        Returns:
+            True if the entry was cached.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._evicted([entry[1]])
+        return entry is not None
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics (the totals are kept)."""
+        with self._lock:
+            evicted = [value for _, value in self._entries.values()]
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+        self._evicted(evicted)
+
+    def _get(self, key: K, count: bool, evicted: List[V]) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is not None and self._is_expired(entry[0]):
+            del self._entries[key]
+            evicted.append(entry[1])
+            entry = None
+
+        if entry is None:
+            if count:
+                self.misses += 1
+                self.total_misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        if count:
+            self.hits += 1
+            self.total_hits += 1
+        return entry[1]
+
+    def _put(self, key: K, value: V, evicted: List[V]) -> None:
+        replaced = self._entries.get(key)
+        if replaced is not None and replaced[1] is not value:
+            evicted.append(replaced[1])
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            evicted.append(self._entries.popitem(last=False)[1][1])
+
+    def _evicted(self, values: List[V]) -> None:
+        if self.on_evict is not None:
+            for value in values:
+                self.on_evict(value)
+
+    def _is_expired(self, created_at: float) -> bool:
+        return self.ttl is not None and time.monotonic() - created_at > self.ttl
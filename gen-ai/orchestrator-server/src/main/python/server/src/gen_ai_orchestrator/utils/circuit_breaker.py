@@ -0,0 +1,346 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Circuit breakers of the provider endpoints.
+When an endpoint fails (or is too slow), the requests keep waiting for their full timeout, piling up.
+Its circuit breaker opens once the error (or slow call) rate of its last calls reaches a threshold:
+the calls are then rejected at once (fast-fail) and the callers fall back if they can.
+After a while, the circuit is half-open: trial calls are allowed, and close it if they succeed.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from enum import Enum, unique
+from typing import ContextManager, Deque, Dict, Iterator, List, Optional, Tuple
+
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
+from gen_ai_orchestrator.errors.exceptions.ai_provider.ai_provider_exceptions import (
+    AIProviderCircuitOpenException,
+)
+from gen_ai_orchestrator.models.errors.errors_models import ErrorInfo
+from gen_ai_orchestrator.utils.metrics.metrics import counter, gauge
+
+logger = logging.getLogger(__name__)
+
+state_gauge = gauge(
+    'gen_ai_orchestrator_circuit_breaker_state',
+    'State of the circuit breaker of a provider endpoint (0: closed, 1: open, 2: half-open).',
+    label_names=('name',),
+)
+rejected_calls_counter = counter(
+    'gen_ai_orchestrator_circuit_breaker_rejected_calls_total',
+    'Number of calls rejected by the circuit breaker of a provider endpoint.',
+    label_names=('name',),
+)
+transitions_counter = counter(
+    'gen_ai_orchestrator_circuit_breaker_transitions_total',
+    'Number of state transitions of the circuit breaker of a provider endpoint, by new state.',
+    label_names=('name', 'state'),
+)
+
+
+@unique
+class CircuitState(str, Enum):
+    """Enumeration to list the circuit breaker states"""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+
+_STATE_VALUES = {CircuitState.CLOSED: 0, CircuitState.OPEN: 1, CircuitState.HALF_OPEN: 2}
+# The outcomes of a call kept in the window: (failed, slow)
+_FAILED = 0
+_SLOW = 1
+
+
+def is_failure_status(status_code: int) -> bool:
+    """True if a response status is a failure of the endpoint (5xx, or 429: the endpoint is overloaded)."""
+    return status_code >= 500 or status_code == 429
+
+
+def is_failure(exc: BaseException) -> bool:
+    """
+    True if an error is a failure of the endpoint.
+    The client errors (4xx responses, except 429) and the cancellations are not.
+    """
+    if not isinstance(exc, Exception):
+        return False
+    status_code = getattr(exc, 'status_code', None)
+    if status_code is None:
+        status_code = getattr(getattr(exc, 'response', None), 'status_code', None)
+    if isinstance(status_code, int) and 400 <= status_code < 500:
+        return is_failure_status(status_code)
+    return True
+
+
+class CallOutcome:
+    """The outcome of a guarded call, that did not raise an error (e.g. a failure response status)"""
+
+    __slots__ = ('failed',)
+
+    def __init__(self):
+        self.failed = False
+
+
+class CircuitBreaker:
+    """
+    The circuit breaker of a provider endpoint.
+    The outcomes of its last calls (failed, slow) are kept in a sliding window.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        window_size: int = 20,
+        min_calls: int = 10,
+        error_rate_threshold: float = 0.5,
+        slow_call_duration: Optional[float] = None,
+        slow_call_rate_threshold: float = 0.8,
+        open_duration: float = 30,
+        half_open_max_calls: int = 1,
+    ):
+        """
+        Args:
+            name: The circuit breaker name (the provider endpoint)
+            window_size: The number of last calls whose outcome is kept
+            min_calls: The minimum number of calls in the window to open the circuit
+            error_rate_threshold: The rate of failed calls from which the circuit is opened
+            slow_call_duration: The duration (in seconds) from which a call is slow (no slow call if not set)
+            slow_call_rate_threshold: The rate of slow calls from which the circuit is opened
+            open_duration: The time (in seconds) the circuit stays open, before being half-open
+            half_open_max_calls: The number of trial calls of the half-open circuit (that close it if they succeed)
+        """
+        self.name = name
+        self.min_calls = min_calls
+        self.error_rate_threshold = error_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.open_duration = open_duration
+        self.half_open_max_calls = half_open_max_calls
+        self.rejected_calls = 0
+        self._calls: Deque[Tuple[bool, bool]] = deque(maxlen=window_size)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._trial_calls = 0
+        self._trial_successes = 0
+        self._lock = threading.Lock()
+        state_gauge.set_function(lambda: _STATE_VALUES[self.state], name=name)
+        rejected_calls_counter.set_function(lambda: self.rejected_calls, name=name)
+
+    @property
+    def state(self) -> CircuitState:
+        """The circuit state (an open circuit becomes half-open once its open duration has elapsed)."""
+        with self._lock:
+            return self._current_state()
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a call is allowed. An allowed call must then be recorded (or released).
+        Returns:
+            False if the circuit is open, or if the trial calls of the half-open circuit are all in flight.
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CircuitState.CLOSED:
+                return True
+            if state == CircuitState.HALF_OPEN and self._trial_calls < self.half_open_max_calls:
+                self._trial_calls += 1
+                return True
+            self.rejected_calls += 1
+            return False
+
+    def check(self) -> None:
+        """
+        Check that a call is allowed.
+        Raises:
+            AIProviderCircuitOpenException: if the call is rejected
+        """
+        if not self.allow_request():
+            raise AIProviderCircuitOpenException(
+                ErrorInfo(
+                    provider=self.name,
+                    error='CircuitBreakerOpen',
+                    cause=f'The circuit breaker of {self.name} is open',
+                )
+            )
+
+    def record(self, duration: float, failed: bool) -> None:
+        """
+        Record the outcome of an allowed call.
+        Args:
+            duration: The call duration (in seconds)
+            failed: True if the call failed
+        """
+        slow = self.slow_call_duration is not None and duration >= self.slow_call_duration
+        with self._lock:
+            state = self._current_state()
+            if state == CircuitState.HALF_OPEN:
+                self._trial_calls = max(self._trial_calls - 1, 0)
+                if failed or slow:
+                    self._transition(CircuitState.OPEN)
+                else:
+                    self._trial_successes += 1
+                    if self._trial_successes >= self.half_open_max_calls:
+                        self._transition(CircuitState.CLOSED)
+            elif state == CircuitState.CLOSED:
+                self._calls.append((failed, slow))
+                if self._should_open():
+                    self._transition(CircuitState.OPEN)
+
+    def release(self) -> None:
+        """Release an allowed call whose outcome is not recorded (cancelled, or failed on a client error)."""
+        with self._lock:
+            if self._current_state() == CircuitState.HALF_OPEN:
+                self._trial_calls = max(self._trial_calls - 1, 0)
+
+    @contextmanager
+    def call(self) -> Iterator[CallOutcome]:
+        """
+        Guard a call: it is rejected if the circuit is open, otherwise its outcome is recorded.
+        The call fails if it raises an error (see is_failure), or if it sets its outcome as failed.
+        Raises:
+            AIProviderCircuitOpenException: if the call is rejected
+        """
+        self.check()
+        outcome = CallOutcome()
+        start_time = time.monotonic()
+        try:
+            yield outcome
+        except BaseException as exc:
+            if is_failure(exc):
+                self.record(time.monotonic() - start_time, failed=True)
+            else:
+                self.release()
+            raise
+        self.record(time.monotonic() - start_time, failed=outcome.failed)
+
+    def snapshot(self) -> dict:
+        """The circuit breaker state and statistics (monitoring)."""
+        with self._lock:
+            state = self._current_state()
+            calls = len(self._calls)
+            return {
+                'name': self.name,
+                'state': state.value,
+                'calls': calls,
+                'error_rate': self._rate(_FAILED),
+                'slow_call_rate': self._rate(_SLOW),
+                'rejected_calls': self.rejected_calls,
+                'open_remaining_seconds': round(
+                    max(self._opened_at + self.open_duration - time.monotonic(), 0), 3
+                )
+                if state == CircuitState.OPEN
+                else 0,
+            }
+
+    def _current_state(self) -> CircuitState:
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.open_duration
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    def _should_open(self) -> bool:
+        return len(self._calls) >= self.min_calls and (
+            self._rate(_FAILED) >= self.error_rate_threshold
+            or (
+                self.slow_call_duration is not None
+                and self._rate(_SLOW) >= self.slow_call_rate_threshold
+            )
+        )
+
+    def _rate(self, outcome: int) -> float:
+        if not self._calls:
+            return 0.0
+        return round(sum(call[outcome] for call in self._calls) / len(self._calls), 4)
+
+    def _transition(self, state: CircuitState) -> None:
+        logger.log(
+            logging.WARNING if state == CircuitState.OPEN else logging.INFO,
+            'Circuit breaker %s - %s -> %s',
+            self.name,
+            self._state.value,
+            state.value,
+        )
+        self._state = state
+        self._trial_calls = 0
+        self._trial_successes = 0
+        if state == CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+        elif state == CircuitState.CLOSED:
+            self._calls.clear()
+        transitions_counter.inc(name=self.name, state=state.value)
+
+
+# The circuit breakers, by provider endpoint
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+_circuit_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(
+    name: str, timeout: Optional[float] = None
+) -> Optional[CircuitBreaker]:
+    """
+    Get the circuit breaker of a provider endpoint, created on first use.
+
+    Args:
+        name: The provider endpoint (e.g. 'BloomzRerank:https://host')
+        timeout: The request timeout (in seconds) of the endpoint: a call is slow from a ratio of it
+    Returns:
+        The circuit breaker, or None if the circuit breakers are disabled.
+    """
+    if not application_settings.circuit_breaker_enabled:
+        return None
+
+    with _circuit_breakers_lock:
+        circuit_breaker = _circuit_breakers.get(name)
+        if circuit_breaker is None:
+            ratio = application_settings.circuit_breaker_slow_call_timeout_ratio
+            circuit_breaker = CircuitBreaker(
+                name,
+                window_size=application_settings.circuit_breaker_window_size,
+                min_calls=application_settings.circuit_breaker_min_calls,
+                error_rate_threshold=application_settings.circuit_breaker_error_rate_threshold,
+                slow_call_duration=timeout * ratio
+                if timeout is not None and ratio is not None
+                else None,
+                slow_call_rate_threshold=application_settings.circuit_breaker_slow_call_rate_threshold,
+                open_duration=application_settings.circuit_breaker_open_duration,
+                half_open_max_calls=application_settings.circuit_breaker_half_open_max_calls,
+            )
+            _circuit_breakers[name] = circuit_breaker
+        return circuit_breaker
+
+
+def circuit_breaker_call(
+    circuit_breaker: Optional[CircuitBreaker],
+) -> ContextManager[CallOutcome]:
+    """Guard a call with a circuit breaker (see CircuitBreaker.call), if there is one."""
+    if circuit_breaker is None:
+        return nullcontext(CallOutcome())
+    return circuit_breaker.call()
+
+
+def get_circuit_breakers() -> List[CircuitBreaker]:
+    """The circuit breakers created so far."""
+    with _circuit_breakers_lock:
+        return list(_circuit_breakers.values())
@@ -0,0 +1,54 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""Utility module to compute stable fingerprints of settings and requests"""
+
+import hashlib
+import json
+from typing import Any
+
+from pydantic import BaseModel
+
+
+def _to_serializable(value: Any) -> Any:
+    """Convert pydantic models (and nested structures) to JSON compatible values."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode='json')
+    if isinstance(value, dict):
+        return {str(k): _to_serializable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_to_serializable(v) for v in value]
+        return sorted(items, key=repr) if isinstance(value, (set, frozenset)) else items
+    return value
+
+
+def fingerprint(*parts: Any) -> str:
+    """
+    Compute a stable fingerprint (SHA-256) of the given parts.
+    Two calls with equal parts (same settings, same inputs) give the same fingerprint,
+    whatever the process or the dictionary ordering.
+    Secrets may be part of the fingerprint: they are hashed, never exposed.
+
+    Args:
+        parts: The values to fingerprint (pydantic models, dict, list, str, numbers...)
+    Returns:
+        The hexadecimal digest.
+    """
+    serialized = json.dumps(
+        [_to_serializable(part) for part in parts],
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
@@ -0,0 +1,101 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Module for the shared async HTTP clients.
+An httpx.AsyncClient holds a pool of keep-alive connections: it is shared by all the
+HTTP calls of the application (Bloomz rerank, embeddings...) instead of opening
+a new connection for each call. A client is bound to the event loop that uses it.
+The sync calls share a process-wide httpx.Client, with the same pool configuration.
+"""
+
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Dict
+
+import httpx
+
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
+
+logger = logging.getLogger(__name__)
+
+_clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[bool, httpx.AsyncClient]]' = (
+    weakref.WeakKeyDictionary()
+)
+_sync_clients: Dict[bool, httpx.Client] = {}
+_sync_clients_lock = threading.Lock()
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=application_settings.http_pool_max_connections,
+        max_keepalive_connections=application_settings.http_pool_max_keepalive_connections,
+        keepalive_expiry=application_settings.http_pool_keepalive_expiry,
+    )
+
+
+def get_async_http_client(verify: bool = True) -> httpx.AsyncClient:
+    """
+    Get the shared async HTTP client of the running event loop.
+
+    Args:
+        verify: True to verify the server certificates
+    Returns:
+        The shared client.
+    """
+    clients = _clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(verify)
+    if client is None or client.is_closed:
+        logger.debug('Async HTTP client - New client (verify=%s)', verify)
+        client = httpx.AsyncClient(verify=verify, limits=_limits())
+        clients[verify] = client
+    return client
+
+
+def get_http_client(verify: bool = True) -> httpx.Client:
+    """
+    Get the shared sync HTTP client (thread-safe).
+
+    Args:
+        verify: True to verify the server certificates
+    Returns:
+        The shared client.
+    """
+    with _sync_clients_lock:
+        client = _sync_clients.get(verify)
+        if client is None or client.is_closed:
+            logger.debug('HTTP client - New client (verify=%s)', verify)
+            client = httpx.Client(verify=verify, limits=_limits())
+            _sync_clients[verify] = client
+        return client
+
+
+async def close_async_http_clients() -> None:
+    """Close the shared clients of the running event loop."""
+    clients = _clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
+
+
+def close_http_clients() -> None:
+    """Close the shared sync clients."""
+    with _sync_clients_lock:
+        clients = list(_sync_clients.values())
+        _sync_clients.clear()
+    for client in clients:
+        client.close()
@@ -0,0 +1,77 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""Utility module of the lazy registries, importing the provider implementations on first use"""
+
+import importlib
+import logging
+import threading
+from typing import Any, Dict, Generic, Hashable, Mapping, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class LazyRegistry(Generic[T]):
+    """
+    A registry of provider implementations (factory classes, clients), keyed by provider enum.
+    The implementations are given by their import path ('package.module:Name') and imported on
+    first use: a deployment only loads the SDKs of the providers it actually uses.
+    """
+
+    def __init__(self, name: str, paths: Mapping[Hashable, str]):
+        """
+        Args:
+            name: The registry name (used in the logs)
+            paths: The import path ('package.module:Name') of the implementation, by provider
+        """
+        self.name = name
+        self._paths = dict(paths)
+        self._loaded: Dict[Hashable, T] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, provider: Any) -> bool:
+        return provider in self._paths
+
+    def __getitem__(self, provider: Any) -> T:
+        """
+        Get the implementation of a provider, imported on first use.
+
+        Args:
+            provider: The provider
+        Returns:
+            The implementation.
+        Raises:
+            KeyError: if the provider is not registered.
+        """
+        implementation = self._loaded.get(provider)
+        if implementation is None:
+            with self._lock:
+                implementation = self._loaded.get(provider)
+                if implementation is None:
+                    implementation = self._import(self._paths[provider])
+                    self._loaded[provider] = implementation
+                    logger.debug('%s registry - %s loaded', self.name, provider)
+        return implementation
+
+    def loaded(self) -> list:
+        """The providers whose implementation is already imported."""
+        return list(self._loaded)
+
+    @staticmethod
+    def _import(path: str) -> Any:
+        """Import an implementation from its path ('package.module:Name')."""
+        module_name, _, attribute = path.partition(':')
+        return getattr(importlib.import_module(module_name), attribute)
@@ -0,0 +1,45 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Module of the cache metrics: the hits and misses of the application caches.
+The caches keep their own totals (never reset), which are read when the metrics are collected.
+"""
+
+from typing import Any
+
+from gen_ai_orchestrator.utils.metrics.metrics import counter
+
+cache_hits_counter = counter(
+    'gen_ai_orchestrator_cache_hits_total',
+    'Number of cache hits.',
+    label_names=('cache',),
+)
+cache_misses_counter = counter(
+    'gen_ai_orchestrator_cache_misses_total',
+    'Number of cache misses.',
+    label_names=('cache',),
+)
+
+
+def register_cache_metrics(name: str, cache: Any) -> None:
+    """
+    Expose the hits and misses of a cache.
+
+    Args:
+        name: The cache name (metrics label)
+        cache: The cache, with its total_hits and total_misses
+    """
+    cache_hits_counter.set_function(lambda: cache.total_hits, cache=name)
+    cache_misses_counter.set_function(lambda: cache.total_misses, cache=name)
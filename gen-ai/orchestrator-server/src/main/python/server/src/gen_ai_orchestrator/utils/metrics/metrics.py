@@ -0,0 +1,191 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Module of the application metrics.
+The metrics are kept in memory, in a registry, and are identified by their name and label values.
+"""
+
+import bisect
+import threading
+from typing import Callable, Dict, List, Sequence, Tuple, TypeVar
+
+M = TypeVar('M', bound='Metric')
+
+
+class Metric:
+    """A base class for the metrics"""
+
+    type: str = 'untyped'
+
+    def __init__(self, name: str, description: str, label_names: Sequence[str] = ()):
+        """
+        Args:
+            name: The metric name
+            description: The metric description
+            label_names: The names of the labels of the metric values
+        """
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, '')) for name in self.label_names)
+
+
+class Counter(Metric):
+    """A counter: a value that only increases (a number of requests, of tokens...)."""
+
+    type = 'counter'
+
+    def __init__(self, name: str, description: str, label_names: Sequence[str] = ()):
+        super().__init__(name, description, label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._functions: Dict[Tuple[str, ...], Callable[[], float]] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """Increase the value."""
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def set_function(self, function: Callable[[], float], **labels: str) -> None:
+        """Get the value from a function, when collected (a counter kept by another object)."""
+        with self._lock:
+            self._functions[self._label_values(labels)] = function
+
+    def collect(self) -> Dict[Tuple[str, ...], float]:
+        """Get the values, by label values."""
+        with self._lock:
+            values = dict(self._values)
+            functions = dict(self._functions)
+        values.update({key: function() for key, function in functions.items()})
+        return values
+
+
+class Gauge(Counter):
+    """A gauge: a value that increases and decreases (a number of in-flight requests...)."""
+
+    type = 'gauge'
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        """Decrease the value."""
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the value."""
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(Metric):
+    """A histogram: the counts of the observed values by bucket (upper bound), their sum and count."""
+
+    type = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        buckets: Sequence[float],
+        label_names: Sequence[str] = (),
+    ):
+        """
+        Args:
+            name: The metric name
+            description: The metric description
+            buckets: The buckets upper bounds (in ascending order)
+            label_names: The names of the labels of the metric values
+        """
+        super().__init__(name, description, label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._values: Dict[Tuple[str, ...], List] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Observe a value."""
+        key = self._label_values(labels)
+        with self._lock:
+            values = self._values.setdefault(
+                key, [[0] * (len(self.buckets) + 1), 0.0]
+            )
+            values[0][bisect.bisect_left(self.buckets, value)] += 1
+            values[1] += value
+
+    def collect(self) -> Dict[Tuple[str, ...], Tuple[List[int], float]]:
+        """
+        Get the histogram values, by label values.
+        Returns:
+            The cumulative counts by bucket (the last one being +Inf), and the sum of the values.
+        """
+        with self._lock:
+            return {
+                key: (list(_cumulative(counts)), total)
+                for key, (counts, total) in self._values.items()
+            }
+
+
+def _cumulative(counts: List[int]):
+    total = 0
+    for count in counts:
+        total += count
+        yield total
+
+
+class MetricsRegistry:
+    """A thread-safe registry of the application metrics."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: M) -> M:
+        """
+        Register a metric. If a metric of the same name is already registered, it is returned instead.
+        """
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def metrics(self) -> List[Metric]:
+        """The registered metrics."""
+        with self._lock:
+            return list(self._metrics.values())
+
+
+metrics_registry = MetricsRegistry()
+
+
+def counter(
+    name: str, description: str, label_names: Sequence[str] = ()
+) -> Counter:
+    """Get or create a counter of the metrics registry."""
+    return metrics_registry.register(Counter(name, description, label_names))
+
+
+def gauge(name: str, description: str, label_names: Sequence[str] = ()) -> Gauge:
+    """Get or create a gauge of the metrics registry."""
+    return metrics_registry.register(Gauge(name, description, label_names))
+
+
+def histogram(
+    name: str,
+    description: str,
+    buckets: Sequence[float],
+    label_names: Sequence[str] = (),
+) -> Histogram:
+    """Get or create a histogram of the metrics registry."""
+    return metrics_registry.register(
+        Histogram(name, description, buckets, label_names)
+    )
@@ -0,0 +1,107 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Module of the Prometheus exposition of the application metrics (text format 0.0.4).
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+from gen_ai_orchestrator.utils.metrics.metrics import (
+    Counter,
+    Histogram,
+    Metric,
+    MetricsRegistry,
+    metrics_registry,
+)
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def generate_latest(registry: Optional[MetricsRegistry] = None) -> str:
+    """
+    Expose the metrics of a registry in the Prometheus text format.
+
+    Args:
+        registry: The metrics registry (the application one by default)
+    Returns:
+        The metrics, in the Prometheus text format.
+    """
+    lines: List[str] = []
+    for metric in (registry or metrics_registry).metrics():
+        lines.append(f'# HELP {metric.name} {_escape_help(metric.description)}')
+        lines.append(f'# TYPE {metric.name} {metric.type}')
+        lines.extend(_samples(metric))
+    return '\n'.join(lines) + '\n'
+
+
+def _samples(metric: Metric) -> List[str]:
+    if isinstance(metric, Histogram):
+        return _histogram_samples(metric)
+    if isinstance(metric, Counter):
+        return [
+            _sample(metric.name, metric.label_names, label_values, value)
+            for label_values, value in sorted(metric.collect().items())
+        ]
+    return []
+
+
+def _histogram_samples(metric: Histogram) -> List[str]:
+    samples = []
+    bounds = [_format_value(bound) for bound in metric.buckets] + ['+Inf']
+    for label_values, (counts, total) in sorted(metric.collect().items()):
+        for bound, count in zip(bounds, counts):
+            samples.append(
+                _sample(
+                    f'{metric.name}_bucket',
+                    metric.label_names + ('le',),
+                    label_values + (bound,),
+                    count,
+                )
+            )
+        samples.append(
+            _sample(f'{metric.name}_sum', metric.label_names, label_values, total)
+        )
+        samples.append(
+            _sample(f'{metric.name}_count', metric.label_names, label_values, counts[-1])
+        )
+    return samples
+
+
+def _sample(
+    name: str, label_names: Sequence[str], label_values: Tuple[str, ...], value: float
+) -> str:
+    if not label_names:
+        return f'{name} {_format_value(value)}'
+    labels = ','.join(
+        f'{label_name}="{_escape_label_value(label_value)}"'
+        for label_name, label_value in zip(label_names, label_values)
+    )
+    return f'{name}{{{labels}}} {_format_value(value)}'
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value)) if abs(value) < 1e15 else repr(float(value))
+    return repr(float(value))
+
+
+def _escape_help(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('\n', '\\n')
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
@@ -0,0 +1,339 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Module of the adaptive rate limiter.
+A rate limiter holds token buckets of requests and (estimated) tokens per minute, for a provider credential.
+It adapts to the provider responses: a 429 (Retry-After) or an exhausted x-ratelimit-* budget blocks it
+until the provider reset time, and the x-ratelimit-remaining-* headers lower its buckets.
+"""
+
+import asyncio
+import json
+import logging
+import re
+import time
+from email.utils import parsedate_to_datetime
+from typing import List, Mapping, Optional, Tuple
+
+import httpx
+from langchain_core.rate_limiters import BaseRateLimiter
+
+from gen_ai_orchestrator.utils.rate_limit.rate_limit_backend import (
+    Bucket,
+    InMemoryRateLimitBackend,
+    RateLimitBackend,
+)
+
+logger = logging.getLogger(__name__)
+
+REQUESTS = 'requests'
+TOKENS = 'tokens'
+
+# The durations of the x-ratelimit-reset-* headers: 1s, 6m0s, 20ms, 1h2m3.5s...
+_DURATION_PATTERN = re.compile(r'(?P<value>\d+(?:\.\d+)?)(?P<unit>ms|h|m|s)')
+_DURATION_UNITS = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600}
+
+
+class AdaptiveRateLimiter(BaseRateLimiter):
+    """
+    A token bucket rate limiter, by requests and by tokens per minute, that adapts to the provider responses.
+    The buckets are stored in a backend, possibly shared by several processes.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        requests_per_minute: int,
+        tokens_per_minute: Optional[int] = None,
+        backend: Optional[RateLimitBackend] = None,
+    ):
+        """
+        Args:
+            key: The rate limiter key (in the backend)
+            requests_per_minute: The number of requests allowed per minute (burst included)
+            tokens_per_minute: The number of tokens allowed per minute (not limited if not set)
+            backend: The buckets backend (in memory by default)
+        """
+        self.key = key
+        self.backend = backend or InMemoryRateLimitBackend()
+        self.requests_bucket = Bucket(
+            REQUESTS, requests_per_minute, requests_per_minute / 60
+        )
+        self.tokens_bucket = (
+            Bucket(TOKENS, tokens_per_minute, tokens_per_minute / 60)
+            if tokens_per_minute
+            else None
+        )
+
+    def acquire(self, *, blocking: bool = True) -> bool:
+        """
+        Acquire a request.
+
+        Args:
+            blocking: True to wait until the request is allowed
+        Returns:
+            True if the request is allowed.
+        """
+        return self._acquire(1, 0, blocking)
+
+    async def aacquire(self, *, blocking: bool = True) -> bool:
+        """
+        Acquire a request, without blocking the event loop.
+
+        Args:
+            blocking: True to wait until the request is allowed
+        Returns:
+            True if the request is allowed.
+        """
+        return await self._aacquire(1, 0, blocking)
+
+    def acquire_tokens(self, tokens: int, *, blocking: bool = True) -> bool:
+        """
+        Acquire the (estimated) tokens of a request.
+
+        Args:
+            tokens: The number of tokens
+            blocking: True to wait until the tokens are allowed
+        Returns:
+            True if the tokens are allowed.
+        """
+        if self.tokens_bucket is None or tokens <= 0:
+            return True
+        return self._acquire(0, tokens, blocking)
+
+    async def aacquire_tokens(self, tokens: int, *, blocking: bool = True) -> bool:
+        """
+        Acquire the (estimated) tokens of a request, without blocking the event loop.
+
+        Args:
+            tokens: The number of tokens
+            blocking: True to wait until the tokens are allowed
+        Returns:
+            True if the tokens are allowed.
+        """
+        if self.tokens_bucket is None or tokens <= 0:
+            return True
+        return await self._aacquire(0, tokens, blocking)
+
+    def update_from_response(
+        self, status_code: int, headers: Mapping[str, str]
+    ) -> None:
+        """
+        Adapt the rate limiter to a provider response.
+
+        Args:
+            status_code: The response HTTP status code
+            headers: The response headers
+        """
+        for bucket, level, blocked_until in self._response_limits(status_code, headers):
+            self.backend.limit(self.key, bucket, level=level, blocked_until=blocked_until)
+
+    async def aupdate_from_response(
+        self, status_code: int, headers: Mapping[str, str]
+    ) -> None:
+        """
+        Adapt the rate limiter to a provider response, without blocking the event loop.
+
+        Args:
+            status_code: The response HTTP status code
+            headers: The response headers
+        """
+        for bucket, level, blocked_until in self._response_limits(status_code, headers):
+            await self.backend.alimit(
+                self.key, bucket, level=level, blocked_until=blocked_until
+            )
+
+    def _response_limits(
+        self, status_code: int, headers: Mapping[str, str]
+    ) -> List[Tuple[Bucket, Optional[float], Optional[float]]]:
+        """The buckets limits reported by a provider response: their level and blocked until time."""
+        now = time.time()
+        if status_code == 429:
+            retry_after = parse_retry_after(headers)
+            if retry_after is None:
+                # No hint from the provider: wait for a request to be available again
+                retry_after = 1 / self.requests_bucket.per_second
+            logger.warning(
+                'Rate limiter - Rate limited by the provider, blocked for %.2fs',
+                retry_after,
+            )
+            return [(bucket, None, now + retry_after) for bucket in self._buckets()]
+
+        limits = []
+        for bucket in self._buckets():
+            remaining = _parse_float(headers.get(f'x-ratelimit-remaining-{bucket.name}'))
+            if remaining is None:
+                continue
+            blocked_until = None
+            if remaining <= 0:
+                reset = parse_duration(headers.get(f'x-ratelimit-reset-{bucket.name}'))
+                if reset is not None:
+                    blocked_until = now + reset
+            limits.append((bucket, remaining, blocked_until))
+        return limits
+
+    def _buckets(self) -> List[Bucket]:
+        return [self.requests_bucket] + (
+            [self.tokens_bucket] if self.tokens_bucket else []
+        )
+
+    def _acquire(self, requests: int, tokens: int, blocking: bool) -> bool:
+        while True:
+            wait = self._try_acquire(requests, tokens)
+            if wait == 0:
+                return True
+            if not blocking:
+                return False
+            time.sleep(wait)
+
+    async def _aacquire(self, requests: int, tokens: int, blocking: bool) -> bool:
+        while True:
+            wait = await self.backend.atry_acquire(
+                self.key, self._amounts(requests, tokens)
+            )
+            if wait == 0:
+                return True
+            if not blocking:
+                return False
+            await asyncio.sleep(wait)
+
+    def _try_acquire(self, requests: int, tokens: int) -> float:
+        return self.backend.try_acquire(self.key, self._amounts(requests, tokens))
+
+    def _amounts(self, requests: int, tokens: int) -> List[Tuple[Bucket, float]]:
+        amounts: List[Tuple[Bucket, float]] = []
+        if requests:
+            amounts.append((self.requests_bucket, requests))
+        if tokens and self.tokens_bucket:
+            amounts.append((self.tokens_bucket, tokens))
+        return amounts
+
+
+class RateLimitedHttpHooks:
+    """
+    The httpx event hooks of a rate limiter: each request acquires its estimated tokens,
+    and each response adapts the rate limiter.
+    The requests themselves are acquired by the LangChain model (its rate_limiter), once per model call.
+    """
+
+    def __init__(self, rate_limiter: AdaptiveRateLimiter):
+        self.rate_limiter = rate_limiter
+
+    def event_hooks(self) -> dict:
+        """The event hooks of a sync httpx client."""
+        return {'request': [self.on_request], 'response': [self.on_response]}
+
+    def async_event_hooks(self) -> dict:
+        """The event hooks of an async httpx client."""
+        return {'request': [self.aon_request], 'response': [self.aon_response]}
+
+    def on_request(self, request: httpx.Request) -> None:
+        if self.rate_limiter.tokens_bucket is not None:
+            self.rate_limiter.acquire_tokens(estimate_request_tokens(request.content))
+
+    async def aon_request(self, request: httpx.Request) -> None:
+        if self.rate_limiter.tokens_bucket is not None:
+            await self.rate_limiter.aacquire_tokens(
+                estimate_request_tokens(request.content)
+            )
+
+    def on_response(self, response: httpx.Response) -> None:
+        self.rate_limiter.update_from_response(response.status_code, response.headers)
+
+    async def aon_response(self, response: httpx.Response) -> None:
+        await self.rate_limiter.aupdate_from_response(
+            response.status_code, response.headers
+        )
+
+
+def estimate_request_tokens(content: bytes) -> int:
+    """
+    Estimate the number of tokens consumed by a completion request:
+    its prompt (about 4 characters per token) and its maximum completion.
+
+    Args:
+        content: The request body
+    Returns:
+        The estimated number of tokens.
+    """
+    if not content:
+        return 0
+    tokens = len(content) // 4
+    try:
+        body = json.loads(content)
+    except ValueError:
+        return tokens
+    if isinstance(body, dict):
+        max_tokens = body.get('max_completion_tokens') or body.get('max_tokens')
+        if isinstance(max_tokens, int):
+            tokens += max_tokens
+    return tokens
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Parse the retry-after-ms or retry-after header.
+
+    Args:
+        headers: The response headers
+    Returns:
+        The time to wait (in seconds), or None if not given.
+    """
+    retry_after_ms = _parse_float(headers.get('retry-after-ms'))
+    if retry_after_ms is not None:
+        return max(0.0, retry_after_ms / 1000)
+
+    retry_after = headers.get('retry-after')
+    if retry_after is None:
+        return None
+    seconds = _parse_float(retry_after)
+    if seconds is not None:
+        return max(0.0, seconds)
+    try:
+        return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a duration of the x-ratelimit-reset-* headers (1s, 6m0s, 20ms) or a number of seconds.
+
+    Args:
+        value: The header value
+    Returns:
+        The duration (in seconds), or None if not given or invalid.
+    """
+    if not value:
+        return None
+    seconds = _parse_float(value)
+    if seconds is not None:
+        return seconds
+    matches = list(_DURATION_PATTERN.finditer(value))
+    if not matches or ''.join(match.group(0) for match in matches) != value.strip():
+        return None
+    return sum(
+        float(match.group('value')) * _DURATION_UNITS[match.group('unit')]
+        for match in matches
+    )
+
+
+def _parse_float(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
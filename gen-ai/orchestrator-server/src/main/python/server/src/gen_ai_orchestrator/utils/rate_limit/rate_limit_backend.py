@@ -0,0 +1,329 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Module of the rate limit backends, storing the token buckets of the rate limiters.
+The in-memory backend is local to a process. The SQLite backend is shared by the processes
+(workers) of a host, so that they share the same budget.
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+
+class Bucket:
+    """The definition of a token bucket: its capacity, and its refill rate"""
+
+    __slots__ = ('name', 'capacity', 'per_second')
+
+    def __init__(self, name: str, capacity: float, per_second: float):
+        """
+        Args:
+            name: The bucket name (requests, tokens...)
+            capacity: The maximum number of tokens of the bucket (burst)
+            per_second: The number of tokens added to the bucket per second
+        """
+        self.name = name
+        self.capacity = capacity
+        self.per_second = per_second
+
+
+class BucketState:
+    """The state of a token bucket"""
+
+    __slots__ = ('level', 'updated_at', 'blocked_until')
+
+    def __init__(self, level: float, updated_at: float, blocked_until: float = 0):
+        self.level = level
+        self.updated_at = updated_at
+        self.blocked_until = blocked_until
+
+    def refill(self, bucket: Bucket, now: float) -> None:
+        self.level = min(
+            bucket.capacity,
+            self.level + max(0.0, now - self.updated_at) * bucket.per_second,
+        )
+        self.updated_at = now
+
+    def full_at(self, bucket: Bucket) -> float:
+        """The time when the bucket is full again and not blocked (as a new bucket)."""
+        if self.level >= bucket.capacity:
+            return self.blocked_until
+        if bucket.per_second <= 0:
+            return float('inf')
+        return max(
+            self.updated_at + (bucket.capacity - self.level) / bucket.per_second,
+            self.blocked_until,
+        )
+
+
+def take(
+    states: Dict[str, BucketState],
+    requests: Sequence[Tuple[Bucket, float]],
+    now: float,
+) -> float:
+    """
+    Take the amounts from their buckets, all or none.
+
+    Args:
+        states: The buckets states (updated)
+        requests: The buckets and the amounts to take from them
+        now: The current time
+    Returns:
+        0 if the amounts have been taken, or else the time to wait (in seconds) before trying again.
+    """
+    wait = 0.0
+    for bucket, amount in requests:
+        state = states[bucket.name]
+        state.refill(bucket, now)
+        # An amount larger than the bucket capacity would never be available
+        amount = min(amount, bucket.capacity)
+        if state.blocked_until > now:
+            wait = max(wait, state.blocked_until - now)
+        elif state.level < amount:
+            wait = max(wait, (amount - state.level) / bucket.per_second)
+
+    if wait == 0:
+        for bucket, amount in requests:
+            states[bucket.name].level -= min(amount, bucket.capacity)
+    return wait
+
+
+class RateLimitBackend(ABC):
+    """A base class for the rate limit backends"""
+
+    @abstractmethod
+    def try_acquire(self, key: str, requests: Sequence[Tuple[Bucket, float]]) -> float:
+        """
+        Try to take the amounts from the buckets of a rate limiter, all or none.
+
+        Args:
+            key: The rate limiter key
+            requests: The buckets and the amounts to take from them
+        Returns:
+            0 if the amounts have been taken, or else the time to wait (in seconds) before trying again.
+        """
+
+    @abstractmethod
+    def limit(
+        self,
+        key: str,
+        bucket: Bucket,
+        level: Optional[float] = None,
+        blocked_until: Optional[float] = None,
+    ) -> None:
+        """
+        Limit a bucket, as reported by the provider.
+
+        Args:
+            key: The rate limiter key
+            bucket: The bucket
+            level: The maximum level of the bucket (the provider remaining budget)
+            blocked_until: The time until which the bucket is blocked (the provider reset or retry time)
+        """
+
+    async def atry_acquire(
+        self, key: str, requests: Sequence[Tuple[Bucket, float]]
+    ) -> float:
+        """
+        Try to take the amounts from the buckets of a rate limiter, without blocking the event loop.
+        By default, the backend is fast enough to be called on the event loop.
+        """
+        return self.try_acquire(key, requests)
+
+    async def alimit(
+        self,
+        key: str,
+        bucket: Bucket,
+        level: Optional[float] = None,
+        blocked_until: Optional[float] = None,
+    ) -> None:
+        """
+        Limit a bucket, as reported by the provider, without blocking the event loop.
+        By default, the backend is fast enough to be called on the event loop.
+        """
+        self.limit(key, bucket, level, blocked_until)
+
+
+def _limit(
+    state: BucketState,
+    bucket: Bucket,
+    now: float,
+    level: Optional[float],
+    blocked_until: Optional[float],
+) -> None:
+    state.refill(bucket, now)
+    if level is not None:
+        state.level = min(state.level, level)
+    if blocked_until is not None:
+        state.blocked_until = max(state.blocked_until, blocked_until)
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """
+    A thread-safe rate limit backend, local to the process.
+    The states of the idle keys (whose buckets are all full again) are removed periodically.
+    """
+
+    def __init__(self, prune_interval: float = 60):
+        """
+        Args:
+            prune_interval: The minimum time (in seconds) between two removals of the idle keys
+        """
+        self.prune_interval = prune_interval
+        self._states: Dict[str, Dict[str, BucketState]] = {}
+        # The time when the buckets of a key are all full again
+        self._full_at: Dict[str, float] = {}
+        self._pruned_at = time.time()
+        self._lock = threading.Lock()
+
+    def try_acquire(self, key: str, requests: Sequence[Tuple[Bucket, float]]) -> float:
+        buckets = [bucket for bucket, _ in requests]
+        with self._lock:
+            now = time.time()
+            states = self._get_states(key, buckets)
+            wait = take(states, requests, now)
+            self._updated(key, states, buckets, now)
+            return wait
+
+    def limit(
+        self,
+        key: str,
+        bucket: Bucket,
+        level: Optional[float] = None,
+        blocked_until: Optional[float] = None,
+    ) -> None:
+        with self._lock:
+            now = time.time()
+            states = self._get_states(key, [bucket])
+            _limit(states[bucket.name], bucket, now, level, blocked_until)
+            self._updated(key, states, [bucket], now)
+
+    def _updated(
+        self, key: str, states: Dict[str, BucketState], buckets: Sequence[Bucket], now: float
+    ) -> None:
+        """Update the full time of a key (the buckets only get full later), then prune the idle keys."""
+        self._full_at[key] = max(
+            [self._full_at.get(key, 0.0)] + [states[bucket.name].full_at(bucket) for bucket in buckets]
+        )
+        if now - self._pruned_at < self.prune_interval:
+            return
+        self._pruned_at = now
+        for idle_key in [
+            idle_key for idle_key, full_at in self._full_at.items() if full_at <= now
+        ]:
+            del self._full_at[idle_key]
+            del self._states[idle_key]
+
+    def _get_states(self, key: str, buckets: Sequence[Bucket]) -> Dict[str, BucketState]:
+        states = self._states.setdefault(key, {})
+        for bucket in buckets:
+            if bucket.name not in states:
+                states[bucket.name] = BucketState(bucket.capacity, time.time())
+        return states
+
+
+class SQLiteRateLimitBackend(RateLimitBackend):
+    """
+    A rate limit backend stored in a SQLite database, shared by the processes of a host.
+    Its transactions may wait for the other processes (busy timeout): the async calls run them in a thread.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: The SQLite database file path
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None, timeout=10
+        )
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS rate_limit_buckets '
+            '(key TEXT NOT NULL, bucket TEXT NOT NULL, level REAL NOT NULL, '
+            'updated_at REAL NOT NULL, blocked_until REAL NOT NULL, PRIMARY KEY (key, bucket))'
+        )
+
+    def try_acquire(self, key: str, requests: Sequence[Tuple[Bucket, float]]) -> float:
+        with self._transaction():
+            states = self._get_states(key, [bucket for bucket, _ in requests])
+            wait = take(states, requests, time.time())
+            self._save_states(key, states)
+            return wait
+
+    def limit(
+        self,
+        key: str,
+        bucket: Bucket,
+        level: Optional[float] = None,
+        blocked_until: Optional[float] = None,
+    ) -> None:
+        with self._transaction():
+            states = self._get_states(key, [bucket])
+            _limit(states[bucket.name], bucket, time.time(), level, blocked_until)
+            self._save_states(key, states)
+
+    async def atry_acquire(
+        self, key: str, requests: Sequence[Tuple[Bucket, float]]
+    ) -> float:
+        return await asyncio.to_thread(self.try_acquire, key, requests)
+
+    async def alimit(
+        self,
+        key: str,
+        bucket: Bucket,
+        level: Optional[float] = None,
+        blocked_until: Optional[float] = None,
+    ) -> None:
+        await asyncio.to_thread(self.limit, key, bucket, level, blocked_until)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        with self._lock:
+            # The write lock is taken at once, so that the other processes wait for the update
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                yield
+            except BaseException:
+                self._connection.execute('ROLLBACK')
+                raise
+            self._connection.execute('COMMIT')
+
+    def _get_states(self, key: str, buckets: Sequence[Bucket]) -> Dict[str, BucketState]:
+        rows = self._connection.execute(
+            'SELECT bucket, level, updated_at, blocked_until FROM rate_limit_buckets WHERE key = ?',
+            (key,),
+        ).fetchall()
+        states = {row[0]: BucketState(row[1], row[2], row[3]) for row in rows}
+        for bucket in buckets:
+            if bucket.name not in states:
+                states[bucket.name] = BucketState(bucket.capacity, time.time())
+        return states
+
+    def _save_states(self, key: str, states: Dict[str, BucketState]) -> None:
+        self._connection.executemany(
+            'INSERT OR REPLACE INTO rate_limit_buckets '
+            '(key, bucket, level, updated_at, blocked_until) VALUES (?, ?, ?, ?, ?)',
+            [
+                (key, name, state.level, state.updated_at, state.blocked_until)
+                for name, state in states.items()
+            ],
+        )
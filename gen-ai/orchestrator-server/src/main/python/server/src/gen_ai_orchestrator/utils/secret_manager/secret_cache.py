@@ -0,0 +1,122 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+A cache for the secrets fetched from a Secret Manager.
+- Entries expire after a time to live, so that rotated secrets are picked up.
+- Concurrent fetches of the same secret are coalesced (single-flight).
+- Entries close to expiration are refreshed in the background (refresh-ahead),
+  while the current value is still served.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Hashable, Optional, Set, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+V = TypeVar('V')
+
+
+class SecretCache:
+    """A thread-safe TTL cache with single-flight loading and background refresh-ahead."""
+
+    def __init__(self, ttl: float, refresh_ahead: float = 0):
+        """
+        Args:
+            ttl: The time to live (in seconds) of a secret.
+            refresh_ahead: The time (in seconds) before expiration from which a secret is refreshed in the background.
+        """
+        self.ttl = ttl
+        self.refresh_ahead = refresh_ahead
+        self._entries: Dict[Hashable, Tuple[float, object]] = {}
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._refreshing: Set[Hashable] = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix='secret-refresh'
+        )
+
+    def get(self, key: Hashable, loader: Callable[[], Optional[V]]) -> Optional[V]:
+        """
+        Get the secret of the given key, or load it.
+        A None value is not cached: it will be loaded again on the next call.
+
+        Args:
+            key: The secret key (provider and secret name)
+            loader: The function that fetches the secret from the Secret Manager
+        Returns:
+            The secret value.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = time.monotonic() - entry[0]
+                if age < self.ttl:
+                    if age >= self.ttl - self.refresh_ahead and key not in self._refreshing:
+                        self._refreshing.add(key)
+                        self._executor.submit(self._refresh, key, loader)
+                    return entry[1]
+                del self._entries[key]
+
+            future = self._in_flight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not is_owner:
+            # The secret is being fetched by another thread
+            return future.result()
+
+        try:
+            value = loader()
+        except BaseException as exc:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(exc)
+            raise
+
+        with self._lock:
+            if value is not None:
+                self._entries[key] = (time.monotonic(), value)
+            del self._in_flight[key]
+        future.set_result(value)
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove the secret of the given key."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all secrets."""
+        with self._lock:
+            self._entries.clear()
+
+    def _refresh(self, key: Hashable, loader: Callable[[], Optional[V]]) -> None:
+        """Reload a secret in the background. On failure, the current value is kept until it expires."""
+        try:
+            value = loader()
+            if value is not None:
+                with self._lock:
+                    self._entries[key] = (time.monotonic(), value)
+                logger.debug('Secret cache - Secret refreshed')
+        except Exception as exc:
+            logger.warning('Secret cache - Background refresh failed: %s', exc)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
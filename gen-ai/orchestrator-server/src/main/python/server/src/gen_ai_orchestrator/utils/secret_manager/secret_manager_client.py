@@ -19,9 +19,6 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Optional, Type, TypeVar
 
-import boto3
-from botocore.exceptions import ClientError
-
 from gen_ai_orchestrator.models.security.ai_provider_secret import (
     AIProviderSecret,
 )
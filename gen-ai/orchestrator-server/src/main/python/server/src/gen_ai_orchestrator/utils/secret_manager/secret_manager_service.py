@@ -13,18 +13,17 @@
 #   limitations under the License.
 #
 import logging
-from functools import lru_cache
-from typing import Optional
+import threading
+from typing import Dict, Optional
 
 from gen_ai_orchestrator.configurations.environment.settings import (
     application_settings,
 )
 from gen_ai_orchestrator.models.security.credentials import Credentials
-from gen_ai_orchestrator.utils.aws.aws_secrets_manager_client import (
-    AWSSecretsManagerClient,
-)
-from gen_ai_orchestrator.utils.gcp.gcp_secret_manager_client import (
-    GCPSecretManagerClient,
+from gen_ai_orchestrator.utils.lazy_registry import LazyRegistry
+from gen_ai_orchestrator.utils.secret_manager.secret_cache import SecretCache
+from gen_ai_orchestrator.utils.secret_manager.secret_manager_client import (
+    SecretManagerClient,
 )
 from gen_ai_orchestrator.utils.secret_manager.secret_manager_provider import (
     SecretManagerProvider,
@@ -34,31 +33,93 @@ from gen_ai_orchestrator.utils.strings import obfuscate
 logger = logging.getLogger(__name__)
 
 # Define a mapping of secret manager providers to their corresponding client classes
-secret_manager_provider_map = {
-    SecretManagerProvider.AWS.value: AWSSecretsManagerClient,
-    SecretManagerProvider.GCP.value: GCPSecretManagerClient,
-}
+# (imported on first use, boto3 and the GCP client are only loaded by the deployments using them)
+secret_manager_provider_map = LazyRegistry(
+    'Secret Manager Client',
+    {
+        SecretManagerProvider.AWS: 'gen_ai_orchestrator.utils.aws.aws_secrets_manager_client:AWSSecretsManagerClient',
+        SecretManagerProvider.GCP: 'gen_ai_orchestrator.utils.gcp.gcp_secret_manager_client:GCPSecretManagerClient',
+    },
+)
+
+# The Secret Manager clients (boto3 / GCP clients), shared by all the secret fetches
+_secret_manager_clients: Dict[str, SecretManagerClient] = {}
+_secret_manager_clients_lock = threading.Lock()
+
+# The fetched secrets, refreshed in the background before their expiration
+secret_cache = SecretCache(
+    ttl=application_settings.secret_cache_ttl,
+    refresh_ahead=application_settings.secret_cache_refresh_ahead,
+)
+
+
+def get_secret_manager_client(
+    secret_manager_provider: SecretManagerProvider,
+) -> SecretManagerClient:
+    """
+    Get the client of the given Secret Manager provider, created on first use.
+
+    Args:
+        secret_manager_provider: The Secret Manager provider
+    Returns:
+        The shared Secret Manager client.
+    """
+    with _secret_manager_clients_lock:
+        client = _secret_manager_clients.get(secret_manager_provider)
+        if client is None:
+            client = secret_manager_provider_map[secret_manager_provider]()
+            _secret_manager_clients[secret_manager_provider] = client
+        return client
+
+
+def fetch_cached_secret(key: tuple, loader):
+    """
+    Fetch a secret through the secret cache (if enabled).
+
+    Args:
+        key: The secret key (provider and secret name)
+        loader: The function that fetches the secret from the Secret Manager
+    Returns:
+        The secret.
+    """
+    if not application_settings.secret_cache_enabled:
+        return loader()
+    return secret_cache.get(key, loader)
+
+
+def clear_secret_cache() -> None:
+    """Remove all the cached secrets, and the Secret Manager clients."""
+    secret_cache.clear()
+    with _secret_manager_clients_lock:
+        _secret_manager_clients.clear()
 
 
-@lru_cache(maxsize=1)
 def fetch_default_vector_store_credentials() -> Optional[Credentials]:
-    """Fetch the Vector Store credentials."""
+    """Fetch the Vector Store credentials (cached, rotated credentials are picked up after the cache TTL)."""
+    return fetch_cached_secret(
+        (
+            'default_vector_store_credentials',
+            application_settings.vector_store_secret_manager_provider,
+            application_settings.vector_store_credentials_secret_name,
+        ),
+        _fetch_default_vector_store_credentials,
+    )
+
+
+def _fetch_default_vector_store_credentials() -> Optional[Credentials]:
+    """Fetch the Vector Store credentials from the Secret Manager or the environment."""
     if application_settings.vector_store_credentials_secret_name:
         secret_name = application_settings.vector_store_credentials_secret_name
         secret_manager_provider = (
             application_settings.vector_store_secret_manager_provider
         )
 
-        # Fetch the corresponding client based on the provider
-        secret_manager_client_class = secret_manager_provider_map.get(
-            secret_manager_provider
-        )
-
-        if secret_manager_client_class:
+        if secret_manager_provider in secret_manager_provider_map:
             logger.info(
                 f"Using {secret_manager_provider} to get vector store credentials..."
             )
-            secret_manager_client = secret_manager_client_class()
+            # Fetch the corresponding client based on the provider
+            secret_manager_client = get_secret_manager_client(secret_manager_provider)
             credentials = secret_manager_client.get_credentials(secret_name)
         else:
             credentials = _get_credentials_from_env()
@@ -0,0 +1,101 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""
+Single-flight execution: the identical concurrent calls share a single in-flight execution, and its result.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+from weakref import WeakKeyDictionary
+
+from gen_ai_orchestrator.utils.metrics.metrics import counter
+
+logger = logging.getLogger(__name__)
+
+executions_counter = counter(
+    'gen_ai_orchestrator_single_flight_executions_total',
+    'Number of executions of the single-flight calls.',
+    label_names=('name',),
+)
+shared_counter = counter(
+    'gen_ai_orchestrator_single_flight_shared_total',
+    'Number of single-flight calls that shared an in-flight execution.',
+    label_names=('name',),
+)
+
+T = TypeVar('T')
+
+
+class SingleFlight(Generic[T]):
+    """
+    Share the execution of the identical concurrent calls.
+    A call is identified by a key: while it is in flight, the calls with the same key wait for its result
+    (or its error) instead of executing it again. The execution is not cancelled when one of its callers is.
+    """
+
+    def __init__(self, name: str):
+        """
+        Args:
+            name: The name of the calls (for logging)
+        """
+        self.name = name
+        self.executions = 0
+        self.shared = 0
+        executions_counter.set_function(lambda: self.executions, name=name)
+        shared_counter.set_function(lambda: self.shared, name=name)
+        # The in-flight executions, by event loop (the tasks are bound to their loop)
+        self._in_flight: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, Dict[Hashable, asyncio.Task]
+        ] = WeakKeyDictionary()
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run the call of the given key, or wait for its in-flight execution.
+
+        Args:
+            key: The call key
+            func: The call to execute
+        Returns:
+            The call result.
+        """
+        loop = asyncio.get_running_loop()
+        in_flight = self._in_flight.setdefault(loop, {})
+        task = in_flight.get(key)
+        if task is None:
+            self.executions += 1
+            task = loop.create_task(func())
+            in_flight[key] = task
+            task.add_done_callback(lambda done: self._remove(in_flight, key, done))
+        else:
+            self.shared += 1
+            logger.info('%s - Sharing an in-flight execution', self.name)
+
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        """The number of in-flight executions (of the current event loop)."""
+        try:
+            return len(self._in_flight.get(asyncio.get_running_loop(), {}))
+        except RuntimeError:
+            return 0
+
+    @staticmethod
+    def _remove(in_flight: Dict[Hashable, asyncio.Task], key: Hashable, task: asyncio.Task):
+        if in_flight.get(key) is task:
+            del in_flight[key]
+        if not task.cancelled():
+            # The error is retrieved, even if all the callers have been cancelled
+            task.exception()
@@ -0,0 +1,80 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""Utility module to count the tokens of texts, with the tokenizer of a model"""
+
+import logging
+import threading
+from functools import lru_cache
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+TokenCounter = Callable[[str], int]
+
+# The tiktoken encoding of the models unknown to tiktoken
+DEFAULT_TIKTOKEN_ENCODING = 'cl100k_base'
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens of a text (about 4 characters by token), when no tokenizer is available."""
+    return (len(text) + 3) // 4
+
+
+class TiktokenCounter:
+    """
+    A token counter based on the tiktoken encoding of an OpenAI model.
+    The encoding is loaded on the first count (from the tiktoken cache, or downloaded): if it cannot
+    be loaded, the tokens are estimated instead.
+    """
+
+    def __init__(self, model: Optional[str]):
+        """
+        Args:
+            model: The model name (the default encoding is used for an unknown model)
+        """
+        self.model = model
+        self._count: Optional[TokenCounter] = None
+        self._lock = threading.Lock()
+
+    def __call__(self, text: str) -> int:
+        if self._count is None:
+            with self._lock:
+                if self._count is None:
+                    self._count = self._load()
+        return self._count(text)
+
+    def _load(self) -> TokenCounter:
+        """Load the encoding of the model, and return its token counter."""
+        try:
+            import tiktoken
+
+            try:
+                encoding = tiktoken.encoding_for_model(self.model)
+            except KeyError:
+                encoding = tiktoken.get_encoding(DEFAULT_TIKTOKEN_ENCODING)
+        except Exception as exc:
+            logger.warning(
+                'Token counter - The tiktoken encoding of %s cannot be loaded, the tokens are estimated: %s',
+                self.model,
+                exc,
+            )
+            return estimate_tokens
+        return lambda text: len(encoding.encode_ordinary(text))
+
+
+@lru_cache(maxsize=None)
+def get_tiktoken_counter(model: Optional[str]) -> TiktokenCounter:
+    """Get the (shared) tiktoken token counter of a model."""
+    return TiktokenCounter(model or '')
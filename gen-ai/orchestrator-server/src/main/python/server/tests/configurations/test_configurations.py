@@ -26,14 +26,15 @@ from gen_ai_orchestrator.utils.secret_manager.secret_manager_provider import (
     SecretManagerProvider,
 )
 from gen_ai_orchestrator.utils.secret_manager.secret_manager_service import (
+    clear_secret_cache,
     fetch_default_vector_store_credentials,
 )
 
 
 class TestSecretManagerService(unittest.TestCase):
     def setUp(self):
-        """Clear lru_cache before each test to avoid cached credentials."""
-        fetch_default_vector_store_credentials.cache_clear()
+        """Clear the secret cache before each test to avoid cached credentials."""
+        clear_secret_cache()
 
     def test_environment(self):
         """Test settings are read successfully"""
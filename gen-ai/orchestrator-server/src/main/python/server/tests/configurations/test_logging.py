@@ -0,0 +1,86 @@
+#   Copyright (C) 2024-2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import io
+import json
+import logging
+import sys
+
+from gen_ai_orchestrator.configurations.logging.logger import (
+    JsonFormatter,
+    QueueStreamHandler,
+    SamplingFilter,
+    dropped_records_counter,
+)
+
+
+def _record(name='gen_ai_orchestrator.test', level=logging.INFO, args=('value',), exc_info=None):
+    return logging.LogRecord(name, level, __file__, 10, 'message %s', args, exc_info)
+
+
+def test_json_formatter():
+    record = _record()
+    record.index = 'my-index'
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry['level'] == 'INFO'
+    assert entry['logger'] == 'gen_ai_orchestrator.test'
+    assert entry['message'] == 'message value'
+    assert entry['index'] == 'my-index'
+    assert entry['timestamp'].endswith('+00:00')
+
+
+def test_queue_stream_handler():
+    stream = io.StringIO()
+    handler = QueueStreamHandler(stream)
+    handler.setFormatter(JsonFormatter())
+    args = ['first']
+    try:
+        raise ValueError('error')
+    except ValueError:
+        exc_info = sys.exc_info()
+    handler.handle(_record(args=(args,), exc_info=exc_info))
+    # The message is rendered when the record is queued
+    args.append('second')
+
+    # Closing the handler writes the queued records
+    handler.close()
+
+    entry = json.loads(stream.getvalue())
+    assert entry['message'] == "message ['first']"
+    assert 'ValueError: error' in entry['exception']
+
+
+def test_queue_stream_handler_drops_records_when_full():
+    handler = QueueStreamHandler(io.StringIO(), max_size=1)
+    handler.close()
+    dropped = dropped_records_counter.collect().get((), 0)
+
+    handler.handle(_record())
+    handler.handle(_record())
+
+    assert dropped_records_counter.collect()[()] == dropped + 1
+
+
+def test_sampling_filter():
+    sampling_filter = SamplingFilter({'httpx': 0.25, 'gen_ai_orchestrator.services': 0})
+
+    kept = [sampling_filter.filter(_record('httpx._client', logging.DEBUG)) for _ in range(8)]
+
+    assert kept == [True, False, False, False, True, False, False, False]
+    # The records of the other loggers, and the ones above the sampled level, are kept
+    assert sampling_filter.filter(_record('gen_ai_orchestrator.routers', logging.DEBUG))
+    assert not sampling_filter.filter(_record('gen_ai_orchestrator.services.rag', logging.DEBUG))
+    assert sampling_filter.filter(_record('gen_ai_orchestrator.services.rag', logging.INFO))
@@ -0,0 +1,160 @@
+#   Copyright (C) 2024-2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from gen_ai_orchestrator.errors.exceptions.exceptions import (
+    GenAIServerOverloadedException,
+)
+from gen_ai_orchestrator.middlewares.admission_control_middleware import (
+    QUEUE_FULL,
+    QUEUE_TIMEOUT,
+    AdmissionController,
+    AdmissionControlMiddleware,
+    RouteClass,
+    get_route_class,
+    queue_depth_gauge,
+    rejected_requests_counter,
+)
+from gen_ai_orchestrator.models.errors.errors_models import ErrorCode
+
+
+def test_get_route_class():
+    assert get_route_class('/rag') == RouteClass.RAG
+    assert get_route_class('/rag/stream') == RouteClass.RAG
+    # The batch items are admitted one by one
+    assert get_route_class('/rag/batch') is None
+    assert get_route_class('/qa') == RouteClass.QA
+    assert get_route_class('/completion/') == RouteClass.COMPLETION
+    assert (
+        get_route_class('/llm-providers/{provider_id}/setting/status')
+        == RouteClass.PROVIDER_STATUS
+    )
+    assert get_route_class('/ragged') is None
+    assert get_route_class('/llm-providers/{provider_id}') is None
+    assert get_route_class('/health-check') is None
+
+
+@pytest.mark.asyncio
+async def test_admission_control_queue_full():
+    controller = AdmissionController(
+        route_max_in_flight={'completion': 1}, route_queue_size={'completion': 1}
+    )
+    rejected_requests = rejected_requests_counter.collect().get(
+        ('completion', QUEUE_FULL), 0
+    )
+
+    await controller.acquire(RouteClass.COMPLETION)
+    queued = asyncio.create_task(controller.acquire(RouteClass.COMPLETION))
+    await asyncio.sleep(0)
+    assert controller.queue_depth(RouteClass.COMPLETION) == 1
+    assert queue_depth_gauge.collect()[('completion',)] >= 1
+
+    with pytest.raises(GenAIServerOverloadedException):
+        await controller.acquire(RouteClass.COMPLETION)
+    assert (
+        rejected_requests_counter.collect()[('completion', QUEUE_FULL)]
+        == rejected_requests + 1
+    )
+    # The other route classes are not limited
+    await controller.acquire(RouteClass.RAG)
+
+    controller.release(RouteClass.COMPLETION)
+    await queued
+    assert controller.in_flight(RouteClass.COMPLETION) == 1
+    assert controller.queue_depth(RouteClass.COMPLETION) == 0
+
+
+@pytest.mark.asyncio
+async def test_admission_control_priority():
+    controller = AdmissionController(
+        max_in_flight=1,
+        route_queue_size={'rag': 2, 'completion': 2, 'provider_status': 2},
+    )
+    admitted = []
+
+    async def acquire(route_class: RouteClass):
+        await controller.acquire(route_class)
+        admitted.append(route_class)
+
+    await controller.acquire(RouteClass.COMPLETION)
+    tasks = []
+    for route_class in [
+        RouteClass.PROVIDER_STATUS,
+        RouteClass.COMPLETION,
+        RouteClass.RAG,
+    ]:
+        tasks.append(asyncio.create_task(acquire(route_class)))
+        await asyncio.sleep(0)
+
+    # Each admitted request is released in turn, the queued ones are admitted by priority
+    running = RouteClass.COMPLETION
+    for count in range(1, len(tasks) + 1):
+        controller.release(running)
+        while len(admitted) < count:
+            await asyncio.sleep(0)
+        running = admitted[-1]
+
+    await asyncio.gather(*tasks)
+    assert admitted == [
+        RouteClass.RAG,
+        RouteClass.COMPLETION,
+        RouteClass.PROVIDER_STATUS,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_admission_control_queue_timeout():
+    controller = AdmissionController(
+        route_max_in_flight={'qa': 1}, route_queue_size={'qa': 1}, queue_timeout=0.01
+    )
+    await controller.acquire(RouteClass.QA)
+
+    with pytest.raises(GenAIServerOverloadedException) as exc_info:
+        await controller.acquire(RouteClass.QA)
+
+    assert exc_info.value.info.error == QUEUE_TIMEOUT
+    assert controller.queue_depth(RouteClass.QA) == 0
+    # The timed out request does not take the released slot
+    controller.release(RouteClass.QA)
+    assert controller.in_flight(RouteClass.QA) == 0
+
+
+def test_admission_control_middleware():
+    app = FastAPI()
+    app.add_middleware(
+        AdmissionControlMiddleware, controller=AdmissionController(max_in_flight=0)
+    )
+
+    @app.post('/rag')
+    async def rag():
+        return {}
+
+    @app.get('/health-check')
+    async def health_check():
+        return {}
+
+    client = TestClient(app)
+
+    response = client.post('/rag')
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '5'
+    assert response.json()['code'] == ErrorCode.GEN_AI_SERVER_OVERLOADED.value
+    assert response.json()['info']['request'] == '[POST] /rag'
+
+    assert client.get('/health-check').status_code == 200
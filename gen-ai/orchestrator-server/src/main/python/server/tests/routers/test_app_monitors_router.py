@@ -0,0 +1,66 @@
+#   Copyright (C) 2024-2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from gen_ai_orchestrator.main import app
+from gen_ai_orchestrator.utils.circuit_breaker import get_circuit_breaker
+
+client = TestClient(app)
+
+
+def test_get_metrics():
+    client.get('/health-check')
+
+    response = client.get('/metrics')
+
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/plain; version=0.0.4')
+    assert (
+        'gen_ai_orchestrator_http_request_duration_seconds_count'
+        '{route="/health-check",method="GET",status="200"}'
+    ) in response.text
+    assert '# TYPE gen_ai_orchestrator_stage_duration_seconds histogram' in response.text
+    assert 'gen_ai_orchestrator_cache_hits_total{cache="rag_chain"}' in response.text
+    assert 'gen_ai_orchestrator_http_requests_in_flight{route="/metrics"} 1' in response.text
+
+
+@patch('gen_ai_orchestrator.routers.app_monitors_router.is_ready')
+def test_get_readiness(mocked_is_ready):
+    mocked_is_ready.return_value = False
+    response = client.get('/readiness-check')
+    assert response.status_code == 503
+    assert response.json() == {'status': 'Warming up'}
+
+    mocked_is_ready.return_value = True
+    response = client.get('/readiness-check')
+    assert response.status_code == 200
+    assert response.json() == {'status': 'OK'}
+
+
+def test_get_circuit_breakers():
+    circuit_breaker = get_circuit_breaker('OpenAI:http://circuit-breakers-router.com')
+    for _ in range(circuit_breaker.min_calls):
+        circuit_breaker.record(0.1, failed=True)
+
+    response = client.get('/circuit-breakers')
+
+    assert response.status_code == 200
+    states = {state['name']: state for state in response.json()}
+    state = states['OpenAI:http://circuit-breakers-router.com']
+    assert state['state'] == 'open'
+    assert state['error_rate'] == 1
+    assert state['open_remaining_seconds'] > 0
@@ -0,0 +1,191 @@
+#   Copyright (C) 2023-2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import json
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from gen_ai_orchestrator.errors.exceptions.exceptions import (
+    GenAIGuardCheckException,
+)
+from gen_ai_orchestrator.main import app
+from gen_ai_orchestrator.models.errors.errors_models import ErrorCode, ErrorInfo
+from gen_ai_orchestrator.models.rag.rag_models import LLMAnswer, RAGStreamEventType
+from gen_ai_orchestrator.routers.responses.responses import (
+    ErrorResponse,
+    RAGBatchItemResponse,
+    RAGResponse,
+)
+from gen_ai_orchestrator.services.langchain.callbacks.stage_metrics_callback_handler import (
+    PipelineStage,
+    observe_stage,
+)
+
+client = TestClient(app)
+
+rag_request = {
+    'dialog': None,
+    'question_answering_llm_setting': {
+        'provider': 'FakeLLM',
+        'api_key': {'type': 'Raw', 'secret': 'ab7***************************A1IV4B'},
+        'temperature': 0,
+        'responses': ['{"status": "found_in_context", "answer": "an answer"}'],
+    },
+    'question_answering_prompt': {
+        'formatter': 'f-string',
+        'template': 'Answer {question} with {context}',
+        'inputs': {'question': 'a question ?'},
+    },
+    'embedding_question_em_setting': {
+        'provider': 'OpenAI',
+        'api_key': {'type': 'Raw', 'secret': 'ab7***************************A1IV4B'},
+        'model': 'text-embedding-ada-002',
+    },
+    'document_index_name': 'my-index-name',
+    'document_search_params': {'provider': 'OpenSearch', 'k': 4},
+}
+
+
+def read_events(response) -> list[tuple[str, object]]:
+    events = []
+    for block in response.text.strip().split('\n\n'):
+        lines = dict(line.split(': ', 1) for line in block.split('\n'))
+        events.append((lines['event'], json.loads(lines['data'])))
+    return events
+
+
+@patch('gen_ai_orchestrator.routers.rag_router.rag')
+def test_ask_rag_server_timing(mocked_rag):
+    async def rag(*args):
+        observe_stage(PipelineStage.VECTOR_SEARCH, 0.05)
+        observe_stage(PipelineStage.ANSWER, 1.2)
+        observe_stage(PipelineStage.VECTOR_SEARCH, 0.02)
+        return RAGResponse(answer=LLMAnswer(answer='an answer'), footnotes=set())
+
+    mocked_rag.side_effect = rag
+
+    response = client.post('/rag', json=rag_request)
+
+    assert response.status_code == 200
+    metrics = response.headers['server-timing'].split(', ')
+    assert metrics[:2] == ['vector_search;dur=70.0', 'answer;dur=1200.0']
+    assert metrics[2].startswith('total;dur=')
+
+
+@patch('gen_ai_orchestrator.routers.rag_router.rag_stream')
+def test_ask_rag_stream(mocked_rag_stream):
+    async def events(*args):
+        yield RAGStreamEventType.ANSWER, 'an '
+        yield RAGStreamEventType.ANSWER, 'answer'
+        yield RAGStreamEventType.CONTEXT_USAGE, []
+        yield RAGStreamEventType.FOOTNOTES, set()
+        yield RAGStreamEventType.OBSERVABILITY_INFO, None
+        yield RAGStreamEventType.DONE, LLMAnswer(answer='an answer')
+
+    mocked_rag_stream.side_effect = events
+
+    response = client.post('/rag/stream', json=rag_request)
+
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/event-stream')
+    assert read_events(response)[:5] == [
+        ('answer', 'an '),
+        ('answer', 'answer'),
+        ('context_usage', []),
+        ('footnotes', []),
+        ('observability_info', None),
+    ]
+    assert read_events(response)[5][0] == 'done'
+    assert read_events(response)[5][1]['answer'] == 'an answer'
+
+
+@patch('gen_ai_orchestrator.routers.rag_router.rag_stream')
+def test_ask_rag_stream_error(mocked_rag_stream):
+    async def events(*args):
+        yield RAGStreamEventType.ANSWER, 'a toxic'
+        raise GenAIGuardCheckException(ErrorInfo(cause='Toxicity detected'))
+
+    mocked_rag_stream.side_effect = events
+
+    response = client.post('/rag/stream', json=rag_request)
+
+    assert response.status_code == 200
+    events = read_events(response)
+    assert events[0] == ('answer', 'a toxic')
+    assert events[1][0] == 'error'
+    assert events[1][1]['code'] == ErrorCode.GEN_AI_GUARD_CHECK_ERROR.value
+    assert events[1][1]['info']['cause'] == 'Toxicity detected'
+
+
+def test_ask_rag_stream_bad_request():
+    response = client.post(
+        '/rag/stream',
+        json={**rag_request, 'document_search_params': {'provider': 'PGVector', 'k': 4}},
+    )
+
+    assert response.status_code == 200
+    assert read_events(response)[0][0] == 'error'
+
+
+@patch('gen_ai_orchestrator.routers.rag_router.rag_batch')
+def test_ask_rag_batch(mocked_rag_batch):
+    async def responses(*args):
+        yield RAGBatchItemResponse(
+            id='2',
+            response=RAGResponse(answer=LLMAnswer(answer='an answer'), footnotes=set()),
+        )
+        yield RAGBatchItemResponse(
+            id='1',
+            error=ErrorResponse(
+                code=ErrorCode.GEN_AI_GUARD_CHECK_ERROR,
+                message='Guard check error',
+                info=ErrorInfo(cause='Toxicity detected'),
+            ),
+        )
+
+    mocked_rag_batch.side_effect = responses
+
+    response = client.post(
+        '/rag/batch',
+        json={
+            'configuration': rag_request,
+            'items': [
+                {'id': '1', 'inputs': {'question': 'a question ?'}},
+                {'id': '2', 'inputs': {'question': 'another question ?'}},
+            ],
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('application/x-ndjson')
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line['id'] for line in lines] == ['2', '1']
+    assert lines[0]['response']['answer']['answer'] == 'an answer'
+    assert lines[1]['error']['code'] == ErrorCode.GEN_AI_GUARD_CHECK_ERROR.value
+
+
+def test_ask_rag_batch_bad_request():
+    response = client.post(
+        '/rag/batch',
+        json={
+            'configuration': {
+                **rag_request,
+                'document_search_params': {'provider': 'PGVector', 'k': 4},
+            },
+            'items': [{'id': '1', 'inputs': {'question': 'a question ?'}}],
+        },
+    )
+
+    assert response.status_code == 400
@@ -0,0 +1,73 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from langchain_core.embeddings import FakeEmbeddings
+
+from gen_ai_orchestrator.services.langchain.impls.vector_stores.async_opensearch_vector_search import (
+    AsyncOpenSearchVectorSearch,
+)
+
+
+def _vector_store() -> AsyncOpenSearchVectorSearch:
+    async_client = MagicMock()
+    async_client.search = AsyncMock(
+        return_value={
+            'hits': {
+                'hits': [
+                    {
+                        '_id': 'doc-1',
+                        '_score': 0.9,
+                        '_source': {'text': 'content', 'metadata': {'id': 1}},
+                    }
+                ]
+            }
+        }
+    )
+    return AsyncOpenSearchVectorSearch(
+        opensearch_url='http://localhost:9200',
+        index_name='my-index',
+        embedding_function=FakeEmbeddings(size=3),
+        async_client=async_client,
+    )
+
+
+@pytest.mark.asyncio
+async def test_retriever_uses_async_client():
+    vector_store = _vector_store()
+    retriever = vector_store.as_retriever(
+        search_kwargs={'k': 2, 'filter': [{'term': {'key': 'value'}}]}
+    )
+
+    documents = await retriever.ainvoke('question')
+
+    assert [doc.id for doc in documents] == ['doc-1']
+    assert documents[0].metadata == {'id': 1}
+    call = vector_store.async_client.search.call_args
+    assert call.kwargs['index'] == 'my-index'
+    query = call.kwargs['body']
+    assert query['size'] == 2
+    assert query['query']['bool']['filter'] == [{'term': {'key': 'value'}}]
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_falls_back_to_sync_client():
+    vector_store = _vector_store()
+    vector_store.similarity_search_with_score = MagicMock(return_value=[])
+
+    assert await vector_store.asimilarity_search_with_score('q', search_type='hybrid_search') == []
+    vector_store.async_client.search.assert_not_called()
@@ -0,0 +1,109 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from gen_ai_orchestrator.services.langchain.impls.em.bloomz_embedding import (
+    BloomzEmbeddings,
+)
+
+
+def _embed(request: httpx.Request) -> httpx.Response:
+    texts = json.loads(request.content)['text']
+    return httpx.Response(200, json={'embedding': [[float(len(text))] for text in texts]})
+
+
+@pytest.mark.asyncio
+async def test_aembed_documents_in_batches():
+    requested_batches = []
+
+    def embed(request: httpx.Request) -> httpx.Response:
+        requested_batches.append(json.loads(request.content)['text'])
+        return _embed(request)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(embed))
+    embeddings = BloomzEmbeddings(pooling='last', api_base='http://bloomz', batch_size=2, max_concurrency=2)
+
+    with patch(
+        'gen_ai_orchestrator.services.langchain.impls.em.bloomz_embedding.get_async_http_client',
+        return_value=client,
+    ):
+        result = await embeddings.aembed_documents(['a', 'bb', 'ccc', 'dddd', 'eeeee'])
+        query_result = await embeddings.aembed_query('query')
+
+    assert result == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert query_result == [5.0]
+    assert sorted(requested_batches) == [['a', 'bb'], ['ccc', 'dddd'], ['eeeee'], ['query']]
+
+
+@patch('gen_ai_orchestrator.services.langchain.impls.em.bloomz_embedding.asyncio.sleep', new_callable=AsyncMock)
+@pytest.mark.asyncio
+async def test_aembed_retries_with_backoff(mocked_sleep):
+    responses = iter([httpx.Response(503), httpx.ConnectError('refused')])
+
+    def embed(request: httpx.Request) -> httpx.Response:
+        response = next(responses, None)
+        if isinstance(response, Exception):
+            raise response
+        return response or _embed(request)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(embed))
+    embeddings = BloomzEmbeddings(pooling='last', api_base='http://bloomz', retry_backoff=0.5)
+
+    with patch(
+        'gen_ai_orchestrator.services.langchain.impls.em.bloomz_embedding.get_async_http_client',
+        return_value=client,
+    ):
+        assert await embeddings.aembed_query('abc') == [3.0]
+
+    assert [call.args[0] for call in mocked_sleep.call_args_list] == [0.5, 1.0]
+
+
+@patch('gen_ai_orchestrator.services.langchain.impls.em.bloomz_embedding.asyncio.sleep', new_callable=AsyncMock)
+@pytest.mark.asyncio
+async def test_aembed_raises_on_client_error(mocked_sleep):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(400)))
+    embeddings = BloomzEmbeddings(pooling='last', api_base='http://bloomz')
+
+    with patch(
+        'gen_ai_orchestrator.services.langchain.impls.em.bloomz_embedding.get_async_http_client',
+        return_value=client,
+    ):
+        with pytest.raises(httpx.HTTPStatusError):
+            await embeddings.aembed_query('abc')
+
+    mocked_sleep.assert_not_called()
+
+
+@patch('gen_ai_orchestrator.services.langchain.impls.em.bloomz_embedding.time.sleep')
+def test_embed_uses_the_shared_client_and_retries(mocked_sleep):
+    responses = iter([httpx.Response(503)])
+    client = httpx.Client(
+        transport=httpx.MockTransport(lambda request: next(responses, None) or _embed(request))
+    )
+    embeddings = BloomzEmbeddings(pooling='last', api_base='http://bloomz', batch_size=2)
+
+    with patch(
+        'gen_ai_orchestrator.services.langchain.impls.em.bloomz_embedding.get_http_client',
+        return_value=client,
+    ) as mocked_get_http_client:
+        assert embeddings.embed_documents(['a', 'bb', 'ccc']) == [[1.0], [2.0], [3.0]]
+
+    mocked_get_http_client.assert_called_with(verify=False)
+    assert [call.args[0] for call in mocked_sleep.call_args_list] == [0.5]
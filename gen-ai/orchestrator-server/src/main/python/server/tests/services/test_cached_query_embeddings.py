@@ -0,0 +1,127 @@
+#   Copyright (C) 2024-2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+from typing import List
+
+import pytest
+from langchain.embeddings.base import Embeddings
+
+from gen_ai_orchestrator.models.em.bloomz.bloomz_em_setting import BloomzEMSetting
+from gen_ai_orchestrator.services.langchain.factories.em.bloomz_em_factory import (
+    BloomzEMFactory,
+)
+from gen_ai_orchestrator.services.langchain.impls.em.bloomz_embedding import (
+    BloomzEmbeddings,
+)
+from gen_ai_orchestrator.services.langchain.impls.em.cached_query_embeddings import (
+    CachedQueryEmbeddings,
+    QueryEmbeddingCache,
+)
+from gen_ai_orchestrator.services.langchain.impls.em.timed_query_embeddings import (
+    TimedQueryEmbeddings,
+)
+from gen_ai_orchestrator.utils.cache.sqlite_embedding_cache import (
+    SQLiteEmbeddingCache,
+)
+
+
+class CountingEmbeddings(Embeddings):
+    def __init__(self):
+        self.calls = []
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.calls.extend(texts)
+        return [[float(len(text)), 1.0] for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+
+def _cached_embeddings(cache: QueryEmbeddingCache, model_key: str = 'model'):
+    return CachedQueryEmbeddings(
+        embeddings=CountingEmbeddings(), model_key=model_key, cache=cache
+    )
+
+
+@pytest.mark.asyncio
+async def test_query_embeddings_are_cached():
+    cache = QueryEmbeddingCache(max_size=10)
+    embeddings = _cached_embeddings(cache)
+
+    assert embeddings.embed_query('a question') == [10.0, 1.0]
+    assert embeddings.embed_query('  a   question ') == [10.0, 1.0]
+    assert await embeddings.aembed_query('a question') == [10.0, 1.0]
+    assert embeddings.embeddings.calls == ['a question']
+
+    # The cache key depends on the model
+    other_embeddings = _cached_embeddings(cache, model_key='other-model')
+    other_embeddings.embed_query('a question')
+    assert other_embeddings.embeddings.calls == ['a question']
+
+    # The documents embeddings are not cached
+    embeddings.embed_documents(['a question'])
+    assert embeddings.embeddings.calls == ['a question', 'a question']
+
+
+@pytest.mark.asyncio
+async def test_query_embeddings_disk_cache(tmp_path):
+    path = str(tmp_path / 'embeddings.db')
+    embeddings = _cached_embeddings(
+        QueryEmbeddingCache(max_size=10, disk_cache=SQLiteEmbeddingCache(path, max_size=10))
+    )
+    await embeddings.aembed_query('a question')
+
+    # Another process (new memory cache) reuses the disk cache
+    embeddings = _cached_embeddings(
+        QueryEmbeddingCache(max_size=10, disk_cache=SQLiteEmbeddingCache(path, max_size=10))
+    )
+    assert await embeddings.aembed_query('a question') == [10.0, 1.0]
+    assert embeddings.embed_query('a question') == [10.0, 1.0]
+    assert embeddings.embeddings.calls == []
+
+
+def test_query_embeddings_are_kept_as_float32_in_memory():
+    cache = QueryEmbeddingCache(max_size=10)
+    cache.put('a', [0.1, 0.2])
+
+    compact_embedding = cache.memory_cache.get('a')
+    assert compact_embedding.typecode == 'f'
+    assert compact_embedding.itemsize == 4
+    assert cache.get('a') == pytest.approx([0.1, 0.2])
+    assert isinstance(cache.get('a'), list)
+
+
+def test_sqlite_embedding_cache_eviction(tmp_path):
+    disk_cache = SQLiteEmbeddingCache(str(tmp_path / 'embeddings.db'), max_size=2, ttl=60)
+    disk_cache.EVICTION_INTERVAL = 1
+    for key in ['a', 'b', 'c']:
+        disk_cache.put(key, [0.1, 0.2])
+
+    assert disk_cache.get('a') is None
+    assert disk_cache.get('c') == [0.1, 0.2]
+
+    disk_cache.ttl = 0
+    assert disk_cache.get('c') is None
+
+
+def test_em_factory_wraps_embedding_model():
+    setting = BloomzEMSetting(provider='Bloomz', api_base='http://bloomz.test', pooling='last')
+    embedding_model = BloomzEMFactory(setting=setting).get_embedding_model()
+
+    assert isinstance(embedding_model, TimedQueryEmbeddings)
+    cached_model = embedding_model.embeddings
+    assert isinstance(cached_model, CachedQueryEmbeddings)
+    # The query embeddings coalescing is disabled by default
+    assert isinstance(cached_model.embeddings, BloomzEmbeddings)
+    assert BloomzEMFactory(setting=setting).get_embedding_model() is embedding_model
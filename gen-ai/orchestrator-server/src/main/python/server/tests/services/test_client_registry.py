@@ -0,0 +1,182 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from gen_ai_orchestrator.models.em.bloomz.bloomz_em_setting import (
+    BloomzEMSetting,
+)
+from gen_ai_orchestrator.models.llm.openai.openai_llm_setting import (
+    OpenAILLMSetting,
+)
+from gen_ai_orchestrator.services.langchain.factories.client_registry import (
+    clear_client_registry,
+    client_registry,
+    get_or_create_client,
+    invalidate_client,
+)
+from gen_ai_orchestrator.services.langchain.factories.em.bloomz_em_factory import (
+    BloomzEMFactory,
+)
+from gen_ai_orchestrator.services.langchain.factories.llm.openai_llm_factory import (
+    OpenAILLMFactory,
+)
+from gen_ai_orchestrator.utils.cache.ttl_lru_cache import TTLLRUCache
+
+
+@pytest.fixture(autouse=True)
+def empty_registry():
+    clear_client_registry()
+    yield
+    clear_client_registry()
+
+
+def _openai_setting(model: str = 'model') -> OpenAILLMSetting:
+    return OpenAILLMSetting(
+        **{
+            'provider': 'OpenAI',
+            'api_key': {'type': 'Raw', 'secret': 'ab7***************************A1IV4B'},
+            'model': model,
+            'temperature': '0',
+        }
+    )
+
+
+def test_ttl_lru_cache_evicts_least_recently_used():
+    cache = TTLLRUCache(max_size=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.hits == 3
+    assert cache.misses == 1
+
+
+@patch('gen_ai_orchestrator.utils.cache.ttl_lru_cache.time.monotonic')
+def test_ttl_lru_cache_expires_entries(mocked_monotonic):
+    cache = TTLLRUCache(max_size=2, ttl=10)
+    mocked_monotonic.return_value = 100
+    cache.put('a', 1)
+
+    mocked_monotonic.return_value = 105
+    assert cache.get('a') == 1
+    mocked_monotonic.return_value = 111
+    assert cache.get('a') is None
+    assert len(cache) == 0
+
+
+@patch('gen_ai_orchestrator.utils.cache.ttl_lru_cache.time.monotonic')
+def test_ttl_lru_cache_calls_on_evict_with_removed_values(mocked_monotonic):
+    evicted = []
+    cache = TTLLRUCache(max_size=2, ttl=10, on_evict=evicted.append)
+    mocked_monotonic.return_value = 100
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.put('c', 3)
+    assert evicted == [1]
+    # Replaced
+    cache.put('c', 4)
+    assert evicted == [1, 3]
+    assert cache.invalidate('b')
+    assert evicted == [1, 3, 2]
+
+    # Expired
+    mocked_monotonic.return_value = 111
+    assert cache.get_or_create('c', lambda: 5) == 5
+    assert evicted == [1, 3, 2, 4]
+    cache.clear()
+    assert evicted == [1, 3, 2, 4, 5]
+
+
+class _Client:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class _AsyncClient(_Client):
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_removed_clients_are_closed():
+    client = get_or_create_client(_Client, 'Factory', _openai_setting())
+    async_client = get_or_create_client(_AsyncClient, 'AsyncFactory', _openai_setting())
+
+    assert invalidate_client('Factory', _openai_setting())
+    assert client.closed
+    clear_client_registry()
+    await asyncio.sleep(0)
+    assert async_client.closed
+
+
+def test_get_or_create_client_builds_once():
+    calls = []
+
+    def builder():
+        calls.append(1)
+        return object()
+
+    first = get_or_create_client(builder, 'Factory', _openai_setting())
+    second = get_or_create_client(builder, 'Factory', _openai_setting())
+
+    assert first is second
+    assert len(calls) == 1
+
+    assert invalidate_client('Factory', _openai_setting())
+    assert get_or_create_client(builder, 'Factory', _openai_setting()) is not first
+    assert len(calls) == 2
+
+
+def test_llm_factory_reuses_client_for_same_setting():
+    first = OpenAILLMFactory(setting=_openai_setting()).get_language_model()
+    second = OpenAILLMFactory(setting=_openai_setting()).get_language_model()
+    other = OpenAILLMFactory(setting=_openai_setting('other')).get_language_model()
+
+    assert first is second
+    assert other is not first
+    assert len(client_registry) == 2
+
+
+def test_em_factory_reuses_client_for_same_setting():
+    setting = BloomzEMSetting(
+        provider='Bloomz', api_base='https://doc.tock.ai/tock', pooling='last'
+    )
+    assert (
+        BloomzEMFactory(setting=setting).get_embedding_model()
+        is BloomzEMFactory(setting=setting).get_embedding_model()
+    )
+
+
+@patch(
+    'gen_ai_orchestrator.services.langchain.factories.client_registry.application_settings.client_registry_enabled',
+    False,
+)
+def test_registry_disabled_builds_new_clients():
+    first = OpenAILLMFactory(setting=_openai_setting()).get_language_model()
+    second = OpenAILLMFactory(setting=_openai_setting()).get_language_model()
+
+    assert first is not second
+    assert len(client_registry) == 0
@@ -0,0 +1,98 @@
+#   Copyright (C) 2024-2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import asyncio
+from typing import List
+
+import pytest
+from langchain.embeddings.base import Embeddings
+
+from gen_ai_orchestrator.services.langchain.impls.em.coalescing_embeddings import (
+    CoalescingEmbeddings,
+    batch_size_histogram,
+)
+
+
+class BatchEmbeddings(Embeddings):
+    def __init__(self, error: Exception = None):
+        self.batches = []
+        self.error = error
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        raise NotImplementedError
+
+    def embed_query(self, text: str) -> List[float]:
+        raise NotImplementedError
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.batches.append(texts)
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        return [[float(len(text))] for text in texts]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_queries_are_coalesced():
+    embeddings = CoalescingEmbeddings(
+        embeddings=BatchEmbeddings(), provider='test-coalesced', max_batch_size=3, max_wait=0.01
+    )
+
+    results = await asyncio.gather(
+        *(embeddings.aembed_query(text) for text in ['a', 'bb', 'a', 'ccc', 'dddd'])
+    )
+
+    assert results == [[1.0], [2.0], [1.0], [3.0], [4.0]]
+    # The first batch is full, the second one is sent when its time is up
+    assert embeddings.embeddings.batches == [['a', 'bb'], ['ccc', 'dddd']]
+    assert batch_size_histogram.collect()[('test-coalesced',)][1] == 4
+
+
+@pytest.mark.asyncio
+async def test_coalesced_queries_get_the_batch_error():
+    embeddings = CoalescingEmbeddings(
+        embeddings=BatchEmbeddings(error=ValueError('provider error')),
+        provider='test',
+        max_wait=0.001,
+    )
+
+    results = await asyncio.gather(
+        embeddings.aembed_query('a'), embeddings.aembed_query('b'), return_exceptions=True
+    )
+
+    assert [str(result) for result in results] == ['provider error'] * 2
+    assert embeddings.embeddings.batches == [['a', 'b']]
+
+
+@pytest.mark.asyncio
+async def test_coalesced_queries_are_cancelled_with_their_batch():
+    embeddings = CoalescingEmbeddings(
+        embeddings=BatchEmbeddings(), provider='test', max_batch_size=2
+    )
+    started = asyncio.Event()
+
+    async def aembed_documents(texts):
+        started.set()
+        await asyncio.sleep(10)
+
+    embeddings.embeddings.aembed_documents = aembed_documents
+
+    queries = [asyncio.create_task(embeddings.aembed_query(text)) for text in ['a', 'b']]
+    await started.wait()
+    for task in embeddings._tasks:
+        task.cancel()
+
+    results = await asyncio.wait_for(asyncio.gather(*queries, return_exceptions=True), 1)
+
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
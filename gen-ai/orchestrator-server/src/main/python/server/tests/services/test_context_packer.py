@@ -0,0 +1,160 @@
+#   Copyright (C) 2024-2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import json
+from unittest.mock import MagicMock, patch
+
+from langchain_core.documents import Document
+from langchain_core.messages import AIMessage, HumanMessage
+
+from gen_ai_orchestrator.models.llm.fake_llm.fake_llm_setting import (
+    FakeLLMSetting,
+)
+from gen_ai_orchestrator.models.llm.openai.openai_llm_setting import (
+    OpenAILLMSetting,
+)
+from gen_ai_orchestrator.services.utils.context_packer import (
+    get_token_counter,
+    pack_context,
+    to_compact_json,
+    truncate_to_sentences,
+)
+from gen_ai_orchestrator.utils.token_counter import TiktokenCounter, estimate_tokens
+
+
+def count_words(text: str) -> int:
+    # A deterministic token counter: one token by word (or JSON punctuation)
+    return len(text.replace('"', ' " ').replace(',', ' , ').split())
+
+
+def _doc(chunk_id: str, content: str) -> Document:
+    return Document(page_content=content, metadata={'id': chunk_id, 'title': 'title'})
+
+
+def test_truncate_to_sentences():
+    text = 'First sentence. Second one! Third one? Fourth'
+
+    assert truncate_to_sentences(text, lambda t: len(t) <= 30) == 'First sentence. Second one!'
+    assert truncate_to_sentences(text, lambda t: True) == 'First sentence. Second one! Third one?'
+    assert truncate_to_sentences(text, lambda t: len(t) < 10) is None
+
+
+def test_pack_context_within_budget():
+    documents = [
+        _doc('1', 'one two three. four five six.'),
+        _doc('2', 'seven eight nine. ten eleven twelve. thirteen fourteen.'),
+        _doc('3', 'dropped document.'),
+    ]
+    # Room for the first document and the first sentence of the second one
+    max_tokens = count_words(
+        to_compact_json(
+            [
+                {'chunk_id': '1', 'chunk_text': 'one two three. four five six.'},
+                {'chunk_id': '2', 'chunk_text': 'seven eight nine.'},
+            ]
+        )
+    )
+
+    packed = pack_context(documents, [], count_words, max_tokens=max_tokens, history_max_tokens=None)
+
+    assert json.loads(packed.documents) == [
+        {'chunk_id': '1', 'chunk_text': 'one two three. four five six.'},
+        {'chunk_id': '2', 'chunk_text': 'seven eight nine.'},
+    ]
+    # Compact JSON: no indentation
+    assert '\n' not in packed.documents and ', ' not in packed.documents
+    assert (packed.packed_documents, packed.truncated_documents, packed.dropped_documents) == (2, 1, 1)
+    assert packed.tokens <= max_tokens
+
+
+def test_pack_context_keeps_the_ranking_order():
+    documents = [
+        _doc('1', 'one two three.'),
+        # No sentence of this document fits
+        _doc('2', 'a long sentence that does not fit in the remaining budget.'),
+        # This one would fit, but it is ranked after a dropped document
+        _doc('3', 'small.'),
+    ]
+    max_tokens = count_words(
+        to_compact_json(
+            [
+                {'chunk_id': '1', 'chunk_text': 'one two three.'},
+                {'chunk_id': '3', 'chunk_text': 'small.'},
+            ]
+        )
+    )
+
+    packed = pack_context(documents, [], count_words, max_tokens=max_tokens, history_max_tokens=None)
+
+    assert json.loads(packed.documents) == [{'chunk_id': '1', 'chunk_text': 'one two three.'}]
+    assert (packed.packed_documents, packed.truncated_documents, packed.dropped_documents) == (1, 0, 2)
+
+
+def test_pack_context_without_budget():
+    documents = [_doc(str(i), 'a sentence.' * 100) for i in range(3)]
+
+    packed = pack_context(documents, [], count_words, max_tokens=None, history_max_tokens=None)
+
+    assert (packed.packed_documents, packed.truncated_documents, packed.dropped_documents) == (3, 0, 0)
+
+
+def test_pack_context_keeps_the_most_recent_history():
+    chat_history = [
+        HumanMessage(content='an old question with many words'),
+        AIMessage(content='an old answer'),
+        HumanMessage(content='last question'),
+    ]
+
+    history_max_tokens = count_words(to_compact_json([{'assistant': 'an old answer'}, {'user': 'last question'}]))
+
+    packed = pack_context([], chat_history, count_words, max_tokens=None, history_max_tokens=history_max_tokens)
+
+    assert json.loads(packed.chat_history) == [{'assistant': 'an old answer'}, {'user': 'last question'}]
+    assert packed.dropped_history_messages == 1
+
+
+def test_get_token_counter():
+    assert get_token_counter(FakeLLMSetting(provider='FakeLLM', temperature=0, responses=[])) is estimate_tokens
+    counter = get_token_counter(
+        OpenAILLMSetting(
+            provider='OpenAI',
+            api_key={'type': 'Raw', 'secret': 'key'},
+            model='gpt-4o',
+            temperature=0,
+        )
+    )
+    assert isinstance(counter, TiktokenCounter)
+    assert counter.model == 'gpt-4o'
+
+
+@patch.dict('sys.modules', {'tiktoken': MagicMock()})
+def test_tiktoken_counter():
+    import sys
+
+    tiktoken = sys.modules['tiktoken']
+    tiktoken.encoding_for_model.side_effect = KeyError('unknown model')
+    tiktoken.get_encoding.return_value.encode_ordinary.side_effect = lambda text: text.split()
+
+    counter = TiktokenCounter('my-model')
+
+    assert counter('three small words') == 3
+    assert counter('two words') == 2
+    # The encoding is loaded once (the default one for an unknown model)
+    tiktoken.get_encoding.assert_called_once_with('cl100k_base')
+
+
+@patch.dict('sys.modules', {'tiktoken': None})
+def test_tiktoken_counter_fallback_to_estimation():
+    # The encoding cannot be loaded: the tokens are estimated
+    assert TiktokenCounter('gpt-4o')('12345678') == 2
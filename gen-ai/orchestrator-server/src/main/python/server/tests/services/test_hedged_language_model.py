@@ -0,0 +1,187 @@
+#   Copyright (C) 2024-2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from gen_ai_orchestrator.configurations.environment.settings import (
+    application_settings,
+)
+from gen_ai_orchestrator.models.llm.fake_llm.fake_llm_setting import (
+    FakeLLMSetting,
+)
+from gen_ai_orchestrator.services.langchain.factories.langchain_factory import (
+    get_llm_factory,
+)
+from gen_ai_orchestrator.services.langchain.impls.llm.hedged_language_model import (
+    FALLBACK,
+    HEDGED_ALTERNATE,
+    HEDGED_PRIMARY,
+    PRIMARY,
+    HedgedLanguageModel,
+    LatencyTracker,
+    hedged_requests_counter,
+)
+
+
+def _count(outcome: str) -> float:
+    return hedged_requests_counter.collect().get(('FakeLLM', 'test', outcome), 0)
+
+
+def _hedged_model(primary, alternate, **kwargs) -> HedgedLanguageModel:
+    return HedgedLanguageModel(
+        primary=primary, alternate=alternate, provider='FakeLLM', model='test', **kwargs
+    )
+
+
+def test_latency_tracker_percentile():
+    tracker = LatencyTracker(window_size=100)
+    assert tracker.percentile(95) is None
+
+    for latency in range(1, 201):
+        tracker.observe(latency / 100)
+
+    # Only the last 100 latencies are kept
+    assert len(tracker) == 100
+    assert tracker.percentile(50) == 1.5
+    assert tracker.percentile(95) == 1.95
+    assert tracker.percentile(100) == 2.0
+
+
+@pytest.mark.asyncio
+async def test_primary_answers_within_the_hedge_delay():
+    outcomes = _count(PRIMARY)
+    model = _hedged_model(
+        FakeListChatModel(responses=['primary']),
+        FakeListChatModel(responses=['alternate']),
+        default_delay=1,
+    )
+
+    response = await model.ainvoke('a question')
+
+    assert response.content == 'primary'
+    assert _count(PRIMARY) == outcomes + 1
+
+
+@pytest.mark.asyncio
+async def test_late_primary_is_hedged():
+    outcomes = _count(HEDGED_ALTERNATE)
+    model = _hedged_model(
+        FakeListChatModel(responses=['primary'], sleep=0.5),
+        FakeListChatModel(responses=['alternate']),
+        default_delay=0.05,
+    )
+
+    chunks = [chunk.content async for chunk in model.astream('a question')]
+
+    assert ''.join(chunks) == 'alternate'
+    assert _count(HEDGED_ALTERNATE) == outcomes + 1
+    assert model.hedge_delay == 0.05
+
+
+@pytest.mark.asyncio
+async def test_late_primary_can_still_win():
+    outcomes = _count(HEDGED_PRIMARY)
+    model = _hedged_model(
+        FakeListChatModel(responses=['primary'], sleep=0.1),
+        FakeListChatModel(responses=['alternate'], sleep=1),
+        default_delay=0.05,
+    )
+
+    response = await model.ainvoke('a question')
+
+    assert response.content == 'primary'
+    assert _count(HEDGED_PRIMARY) == outcomes + 1
+
+
+@pytest.mark.asyncio
+async def test_hedge_delay_is_a_percentile_of_the_times_to_first_token():
+    model = _hedged_model(
+        FakeListChatModel(responses=['primary']),
+        FakeListChatModel(responses=['alternate']),
+        default_delay=5,
+        min_delay=0.01,
+        min_samples=3,
+    )
+    assert model.hedge_delay == 5
+
+    for _ in range(3):
+        await model.ainvoke('a question')
+
+    assert 0.01 <= model.hedge_delay < 1
+
+
+@pytest.mark.asyncio
+async def test_failing_primary_falls_back():
+    outcomes = _count(FALLBACK)
+    model = _hedged_model(
+        FakeListChatModel(responses=['primary'], error_on_chunk_number=0),
+        FakeListChatModel(responses=['alternate']),
+        hedging=False,
+    )
+
+    response = await model.ainvoke('a question')
+
+    assert response.content == 'alternate'
+    assert _count(FALLBACK) == outcomes + 1
+
+
+@pytest.mark.asyncio
+async def test_closing_a_lost_attempt_can_be_cancelled():
+    async def first_chunk():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            # A slow cancellation
+            await asyncio.sleep(0.1)
+            raise
+
+    async def stream():
+        yield
+
+    attempt = (stream(), asyncio.create_task(first_chunk()))
+    await asyncio.sleep(0)
+    close = asyncio.create_task(HedgedLanguageModel._close(attempt))
+    await asyncio.sleep(0.01)
+    close.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await close
+
+
+def test_get_hedged_language_model():
+    setting = FakeLLMSetting(provider='FakeLLM', temperature=0, responses=['primary'])
+    alternate_setting = FakeLLMSetting(
+        provider='FakeLLM', temperature=0, responses=['alternate']
+    )
+    factory = get_llm_factory(setting, alternate_setting=alternate_setting)
+
+    # Disabled by default
+    assert not isinstance(factory.get_hedged_language_model(), HedgedLanguageModel)
+
+    with patch.object(application_settings, 'llm_hedging_enabled', True):
+        model = factory.get_hedged_language_model()
+        assert isinstance(model, HedgedLanguageModel)
+        assert model.hedging
+        assert model.alternate.responses == ['alternate']
+        # Registered by settings
+        assert factory.get_hedged_language_model() is model
+        # Without alternate setting
+        assert not isinstance(
+            get_llm_factory(setting).get_hedged_language_model(), HedgedLanguageModel
+        )
+
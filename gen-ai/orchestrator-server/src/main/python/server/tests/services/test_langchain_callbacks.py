@@ -12,13 +12,27 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 #
+import asyncio
+from typing import List
+
+import pytest
+from langchain_core.callbacks import AsyncCallbackManagerForRetrieverRun
 from langchain_core.documents import Document
+from langchain_core.language_models import FakeListChatModel
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langchain_core.prompt_values import ChatPromptValue, StringPromptValue
+from langchain_core.retrievers import BaseRetriever
+from langchain_core.runnables import RunnableLambda
 
 from gen_ai_orchestrator.services.langchain.callbacks.rag_callback_handler import (
     RAGCallbackHandler,
 )
+from gen_ai_orchestrator.services.langchain.callbacks.stage_metrics_callback_handler import (
+    PipelineStage,
+    StageMetricsCallbackHandler,
+    stage_duration_histogram,
+    stage_metadata,
+)
 
 
 def test_rag_callback_handler_qa_documents():
@@ -68,3 +82,98 @@ def test_rag_callback_handler_qa_prompt():
     prompt = 'A custom prompt !'
     handler.on_chain_end(serialized={}, outputs=StringPromptValue(text=prompt))
     assert handler.records['rag_prompt'] == prompt
+
+
+def stage_observations(stage: PipelineStage, index: str) -> dict:
+    """The (count, sum) of the stage durations, by label values"""
+    return {
+        labels: (counts[-1], total)
+        for labels, (counts, total) in stage_duration_histogram.collect().items()
+        if labels[0] == stage.value and labels[3] == index
+    }
+
+
+class SleepingRetriever(BaseRetriever):
+    delay: float
+    base_retriever: BaseRetriever = None
+
+    async def _aget_relevant_documents(
+        self, query: str, *, run_manager: AsyncCallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        await asyncio.sleep(self.delay)
+        if self.base_retriever is None:
+            return [Document(page_content=query)]
+        return await self.base_retriever.ainvoke(
+            query, config={'callbacks': run_manager.get_child()}
+        )
+
+    def _get_relevant_documents(self, query: str, *, run_manager) -> List[Document]:
+        raise NotImplementedError()
+
+
+@pytest.mark.asyncio
+async def test_stage_metrics_callback_handler_times_the_stage_runs():
+    llm = FakeListChatModel(responses=['a condensed question'])
+    chain = (
+        RunnableLambda(lambda question: question)
+        | llm.with_config(metadata=stage_metadata(PipelineStage.CONDENSATION))
+    ).with_config(metadata={'langfuse_user_id': 'a user'})
+
+    await chain.ainvoke(
+        'a question',
+        config={'callbacks': [StageMetricsCallbackHandler(index='timed-index')]},
+    )
+
+    observations = stage_observations(PipelineStage.CONDENSATION, 'timed-index')
+    # The LLM run is timed once (not its parent chain, nor its inherited metadata)
+    assert [(labels[1], labels[4], count) for labels, (count, _) in observations.items()] == [
+        ('fakelistchatmodel', 'success', 1)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stage_metrics_callback_handler_excludes_nested_stages():
+    vector_search = SleepingRetriever(
+        delay=0.1, metadata=stage_metadata(PipelineStage.VECTOR_SEARCH)
+    )
+    rerank = SleepingRetriever(
+        delay=0.01,
+        base_retriever=vector_search,
+        metadata=stage_metadata(PipelineStage.RERANK, 'a-reranker'),
+    )
+
+    await rerank.ainvoke(
+        'a question',
+        config={'callbacks': [StageMetricsCallbackHandler(index='nested-index')]},
+    )
+
+    [(rerank_labels, (rerank_count, rerank_duration))] = stage_observations(
+        PipelineStage.RERANK, 'nested-index'
+    ).items()
+    [(_, (search_count, search_duration))] = stage_observations(
+        PipelineStage.VECTOR_SEARCH, 'nested-index'
+    ).items()
+    assert rerank_labels[1] == 'a-reranker'
+    assert (rerank_count, search_count) == (1, 1)
+    assert search_duration >= 0.1
+    assert rerank_duration < 0.1
+
+
+@pytest.mark.asyncio
+async def test_stage_metrics_callback_handler_reports_errors():
+    def fail(_):
+        raise ValueError('an error')
+
+    chain = RunnableLambda(fail).with_config(
+        metadata=stage_metadata(PipelineStage.ANSWER)
+    )
+
+    with pytest.raises(ValueError):
+        await chain.ainvoke(
+            'a question',
+            config={'callbacks': [StageMetricsCallbackHandler(index='error-index')]},
+        )
+
+    assert [labels[4] for labels in stage_observations(PipelineStage.ANSWER, 'error-index')] == [
+        'error'
+    ]
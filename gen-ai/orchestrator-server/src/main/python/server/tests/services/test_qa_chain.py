@@ -12,7 +12,7 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 #
-from unittest.mock import AsyncMock, patch
+from unittest.mock import ANY, AsyncMock, patch
 
 import pytest
 from langchain_core.documents import Document
@@ -21,6 +21,10 @@ from gen_ai_orchestrator.models.vector_stores.vectore_store_provider import (
     VectorStoreProvider,
 )
 from gen_ai_orchestrator.routers.requests.requests import QARequest
+from gen_ai_orchestrator.services.langchain.callbacks.stage_metrics_callback_handler import (
+    PipelineStage,
+    stage_metadata,
+)
 from gen_ai_orchestrator.services.langchain.qa_chain import execute_qa_chain
 
 
@@ -101,12 +105,15 @@ async def test_qa_chain(
     # Assert LangChain qa chain is created using the expected settings from request
     mocked_build_chain.assert_called_once_with(
         vector_store_factory_instance.get_vector_store().as_retriever(
-            search_kwargs=request.document_search_params.to_dict()
+            search_kwargs=request.document_search_params.to_dict(),
+            metadata=stage_metadata(PipelineStage.VECTOR_SEARCH),
         )
     )
 
-    # Assert qa chain is ainvoke()d with the expected settings from request
-    mocked_chain.ainvoke.assert_called_once_with(request.user_query)
+    # Assert qa chain is ainvoke()d with the expected settings from request (and the stage metrics)
+    mocked_chain.ainvoke.assert_called_once_with(
+        request.user_query, config={'callbacks': [ANY]}
+    )
 
     # Assert the response is build using the expected settings
     mocked_qa_response.assert_called_once_with(
@@ -12,15 +12,21 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 #
+import asyncio
+import json
 import os
 from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 from langchain_core.documents import Document
 from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.runnables import RunnableLambda
+from langchain_core.runnables.utils import AddableDict
 from requests.exceptions import HTTPError
 
 from gen_ai_orchestrator.errors.exceptions.document_compressor.document_compressor_exceptions import (
+    GenAIDocumentCompressorErrorException,
     GenAIDocumentCompressorUnknownLabelException,
 )
 from gen_ai_orchestrator.errors.exceptions.exceptions import (
@@ -29,7 +35,7 @@ from gen_ai_orchestrator.errors.exceptions.exceptions import (
 from gen_ai_orchestrator.models.guardrail.bloomz.bloomz_guardrail_setting import (
     BloomzGuardrailSetting,
 )
-from gen_ai_orchestrator.models.rag.rag_models import LLMAnswer
+from gen_ai_orchestrator.models.rag.rag_models import LLMAnswer, RAGStreamEventType
 from gen_ai_orchestrator.routers.requests.requests import RAGRequest
 from gen_ai_orchestrator.services.langchain import rag_chain
 from gen_ai_orchestrator.services.langchain.factories.langchain_factory import (
@@ -38,14 +44,20 @@ from gen_ai_orchestrator.services.langchain.factories.langchain_factory import (
 from gen_ai_orchestrator.services.langchain.impls.document_compressor.bloomz_rerank import (
     BloomzRerank,
 )
+from gen_ai_orchestrator.services.langchain.callbacks.rag_callback_handler import (
+    RAGCallbackHandler,
+)
 from gen_ai_orchestrator.services.langchain.rag_chain import (
+    astream_rag_chain,
     check_guardrail_output,
+    create_rag_chain,
     execute_rag_chain,
+    rag_chain_cache,
 )
 
 
 @patch(
-    'gen_ai_orchestrator.services.langchain.impls.document_compressor.bloomz_rerank.requests.post'
+    'gen_ai_orchestrator.services.langchain.impls.guardrail.bloomz_guardrail.get_async_http_client'
 )
 @patch(
     'gen_ai_orchestrator.services.langchain.factories.langchain_factory.get_compressor_factory'
@@ -67,7 +79,7 @@ async def test_rag_chain(
     mocked_create_rag_chain,
     mocked_get_callback_handler_factory,
     mocked_get_document_compressor_factory,
-    mocked_guardrail_parse,
+    mocked_guardrail_http_client,
 ):
     """Test the full execute_qa_chain method by mocking all external calls."""
     # Build a test RAGRequest
@@ -190,14 +202,25 @@ Answer in {locale}:""",
     mocked_callback = mocked_callback_init.return_value
     mocked_langfuse_callback = observability_factory_instance.get_callback_handler()
     mocked_chain = mocked_create_rag_chain.return_value
-    mocked_chain.ainvoke = AsyncMock(return_value=response)
-    mocked_rag_answer = mocked_chain.ainvoke.return_value
 
-    mocked_response = MagicMock()
-    mocked_response.status_code = 200
-    mocked_response.content = {'response': []}
+    async def stream_response(**kwargs):
+        # The documents, then the answer as it is generated
+        yield AddableDict(documents=docs)
+        yield AddableDict(answer={'status': '', 'answer': 'an answer'})
+        yield AddableDict(answer=response['answer'])
 
-    mocked_guardrail_parse.return_value = mocked_response
+    mocked_chain.astream = MagicMock(side_effect=stream_response)
+    mocked_rag_answer = response
+
+    guardrail_requests = []
+
+    def guardrail(request: httpx.Request) -> httpx.Response:
+        guardrail_requests.append(request)
+        return httpx.Response(200, json={'response': [[{'label': 'insult', 'score': 0.1}]]})
+
+    mocked_guardrail_http_client.return_value = httpx.AsyncClient(
+        transport=httpx.MockTransport(guardrail)
+    )
 
     # Call function
     await execute_rag_chain(request, debug=True)
@@ -206,11 +229,11 @@ Answer in {locale}:""",
     mocked_get_callback_handler_factory.assert_called_once_with(
         setting=request.observability_setting
     )
-    # Assert qa chain is ainvoke()d with the expected settings from request
-    mocked_chain.ainvoke.assert_called_once_with(
+    # Assert qa chain is streamed with the expected settings from request (the guardrail is enabled)
+    mocked_chain.astream.assert_called_once_with(
         input=inputs,
         config={
-            'callbacks': [mocked_callback, mocked_langfuse_callback],
+            'callbacks': [mocked_callback, mocked_langfuse_callback, ANY],
             'metadata': ANY,
         },
     )
@@ -223,10 +246,12 @@ Answer in {locale}:""",
     )
     mocked_get_document_compressor_factory(setting=request.compressor_setting)
     # Assert the rag guardrail is called
-    mocked_guardrail_parse.assert_called_once_with(
-        os.path.join(request.guardrail_setting.api_base, 'guardrail'),
-        json={'text': [mocked_rag_answer['answer']['answer']]},
-    )
+    assert [str(r.url) for r in guardrail_requests] == [
+        os.path.join(request.guardrail_setting.api_base, 'guardrail')
+    ]
+    assert json.loads(guardrail_requests[0].content) == {
+        'text': [mocked_rag_answer['answer']['answer']]
+    }
 
 
 @patch(
@@ -430,6 +455,180 @@ def test_compress_documents_with_unknown_label(mocked_rerank):
     assert exc.value.detail == 'Check the Document Compressor label you sent.'
 
 
+@pytest.mark.asyncio
+async def test_acompress_documents_scores_shards_concurrently():
+    requests_contexts = []
+
+    def score(request: httpx.Request) -> httpx.Response:
+        contexts = json.loads(request.content)['contexts']
+        requests_contexts.append([c['context'] for c in contexts])
+        return httpx.Response(
+            200,
+            json={
+                'response': [
+                    [{'label': 'entailment', 'score': float(c['context'])}]
+                    for c in contexts
+                ]
+            },
+        )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(score))
+    bloomz_reranker = BloomzRerank(endpoint='http://example.com', shard_size=2, min_score=0.3)
+    documents = [
+        Document(page_content=score, metadata={'id': score})
+        for score in ['0.1', '0.9', '0.5', '0.2', '0.7']
+    ]
+
+    with patch(
+        'gen_ai_orchestrator.services.langchain.impls.document_compressor.bloomz_rerank.get_async_http_client',
+        return_value=client,
+    ):
+        result = await bloomz_reranker.acompress_documents(documents=documents, query='Some query')
+
+    assert sorted(requests_contexts) == [['0.1', '0.9'], ['0.5', '0.2'], ['0.7']]
+    assert [doc.metadata['id'] for doc in result] == ['0.9', '0.7', '0.5']
+    assert result[0].metadata['retriever_score'] == 0.9
+
+
+@pytest.mark.asyncio
+async def test_acompress_documents_cancels_the_other_shards_on_failure():
+    cancelled = []
+
+    async def score(request: httpx.Request) -> httpx.Response:
+        contexts = json.loads(request.content)['contexts']
+        if contexts[0]['context'] == 'failing':
+            raise httpx.ConnectError('connection error')
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(contexts[0]['context'])
+            raise
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(score))
+    documents = [
+        Document(page_content=content, metadata={'id': content})
+        for content in ['failing', 'slow']
+    ]
+
+    with patch(
+        'gen_ai_orchestrator.services.langchain.impls.document_compressor.bloomz_rerank.get_async_http_client',
+        return_value=client,
+    ):
+        result = await BloomzRerank(endpoint='http://example.com', shard_size=1).acompress_documents(
+            documents=documents, query='Some query'
+        )
+        await asyncio.sleep(0)
+
+    assert result == documents
+    assert cancelled == ['slow']
+
+
+@pytest.mark.asyncio
+async def test_acompress_documents_fallback_on_bad_response():
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(500, text='error'))
+    )
+    documents = [Document(page_content='content', metadata={'id': '1'})]
+
+    with patch(
+        'gen_ai_orchestrator.services.langchain.impls.document_compressor.bloomz_rerank.get_async_http_client',
+        return_value=client,
+    ):
+        result = await BloomzRerank(endpoint='http://example.com').acompress_documents(
+            documents=documents, query='Some query'
+        )
+        assert result == documents
+
+        with pytest.raises(GenAIDocumentCompressorErrorException):
+            await BloomzRerank(
+                endpoint='http://example.com', is_fault_tolerant=False
+            ).acompress_documents(documents=documents, query='Some query')
+
+
+@pytest.mark.asyncio
+async def test_guardrail_checks_answer_segments_while_streaming():
+    checked_texts = []
+
+    def guardrail_endpoint(request: httpx.Request) -> httpx.Response:
+        text = json.loads(request.content)['text'][0]
+        checked_texts.append(text)
+        score = 0.9 if 'toxic' in text else 0.1
+        return httpx.Response(200, json={'response': [[{'label': 'insult', 'score': score}]]})
+
+    guardrail = get_guardrail_factory(
+        BloomzGuardrailSetting(
+            provider='BloomzGuardrail', max_score=0.5, api_base='http://test-guard.com'
+        )
+    ).get_parser()
+    guardrail.segment_min_length = 10
+
+    async def tokens(text):
+        for token in text.split(' '):
+            yield token + ' '
+
+    with patch(
+        'gen_ai_orchestrator.services.langchain.impls.guardrail.bloomz_guardrail.get_async_http_client',
+        return_value=httpx.AsyncClient(transport=httpx.MockTransport(guardrail_endpoint)),
+    ):
+        outputs = [
+            output
+            async for output in guardrail.atransform(
+                tokens('A first clean sentence. A second clean one. The end')
+            )
+        ]
+        assert outputs[-1]['output_toxicity'] is False
+        assert ''.join(output['content'] for output in outputs) == (
+            'A first clean sentence. A second clean one. The end '
+        )
+        assert checked_texts == [
+            'A first clean sentence. ',
+            'A second clean one. ',
+            'The end ',
+        ]
+
+        # The toxicity of a segment is reported while the text is still streamed
+        rag_chain_chunks = []
+
+        async def stream_rag_chain(**kwargs):
+            answer = ''
+            for token in ['A toxic sentence. ', 'Then', ' more', ' text', ' to', ' come.']:
+                answer += token
+                rag_chain_chunks.append(token)
+                await asyncio.sleep(0.01)
+                yield AddableDict(answer={'answer': answer})
+
+        chain = MagicMock()
+        chain.astream = MagicMock(side_effect=stream_rag_chain)
+        with pytest.raises(GenAIGuardCheckException):
+            await rag_chain.ainvoke_with_guardrail(chain, {}, {}, guardrail)
+        assert len(rag_chain_chunks) < 6
+
+
+@pytest.mark.asyncio
+async def test_stream_rag_chain_output():
+    docs = [Document(page_content='some content', metadata={'id': '123-abc', 'title': 'my-title'})]
+
+    async def stream_rag_chain(**kwargs):
+        yield AddableDict(documents=docs)
+        for answer in [
+            {'status': 'found_in_context', 'answer': 'An'},
+            {'status': 'found_in_context', 'answer': 'An answer', 'footnotes': ['123-abc']},
+            {'status': 'found_in_context', 'answer': 'An answer', 'footnotes': ['123-abc']},
+        ]:
+            yield AddableDict(answer=answer)
+
+    chain = MagicMock()
+    chain.astream = MagicMock(side_effect=stream_rag_chain)
+    outputs = [output async for output in rag_chain.astream_rag_chain_output(chain, {}, {})]
+
+    assert [answer_text for _, answer_text in outputs] == ['', 'An', ' answer', '']
+    # The parsed answer is not added to the previous ones
+    assert outputs[-1][0] == {
+        'documents': docs,
+        'answer': {'status': 'found_in_context', 'answer': 'An answer', 'footnotes': ['123-abc']},
+    }
+
+
 def test_check_guardrail_output_find_toxicities():
     guardrail_output = {
         'content': 'This is a sample text.',
@@ -452,3 +651,205 @@ def test_check_guardrail_output_is_ok():
     }
 
     assert check_guardrail_output(guardrail_output) is True
+
+
+def _rag_request(question: str, template: str = 'Answer {question} in {locale} with {context}') -> RAGRequest:
+    return RAGRequest(
+        **{
+            'dialog': None,
+            'question_answering_llm_setting': {
+                'provider': 'FakeLLM',
+                'api_key': {'type': 'Raw', 'secret': 'ab7***************************A1IV4B'},
+                'temperature': 0,
+                'responses': ['{"status": "found_in_context", "answer": "an answer"}'],
+            },
+            'question_answering_prompt': {
+                'formatter': 'f-string',
+                'template': template,
+                'inputs': {'question': question, 'locale': 'French'},
+            },
+            'embedding_question_em_setting': {
+                'provider': 'OpenAI',
+                'api_key': {'type': 'Raw', 'secret': 'ab7***************************A1IV4B'},
+                'model': 'text-embedding-ada-002',
+            },
+            'document_index_name': 'my-index-name',
+            'document_search_params': {'provider': 'OpenSearch', 'k': 4},
+            'vector_store_setting': {
+                'provider': 'OpenSearch',
+                'host': 'localhost',
+                'port': 9200,
+                'username': 'admin',
+                'password': {'type': 'Raw', 'secret': 'admin'},
+            },
+        }
+    )
+
+
+@patch('gen_ai_orchestrator.services.langchain.rag_chain.get_vector_store_factory')
+@pytest.mark.asyncio
+async def test_rag_chain_is_cached_by_configuration(mocked_get_vector_store_factory):
+    docs = [Document(page_content='some content', metadata={'id': '123-abc', 'title': 'my-title'})]
+    mocked_get_vector_store_factory.return_value.get_vector_store_retriever.return_value = (
+        RunnableLambda(lambda _: docs)
+    )
+    rag_chain_cache.clear()
+
+    chain = create_rag_chain(_rag_request('first question ?'))
+    assert create_rag_chain(_rag_request('second question ?')) is chain
+    assert create_rag_chain(_rag_request('first question ?', template='{question} {locale} {context}')) is not chain
+    assert (rag_chain_cache.hits, rag_chain_cache.misses) == (1, 2)
+    mocked_get_vector_store_factory.assert_called()
+    # A chain is not kept longer than the secrets resolved by its clients
+    assert rag_chain_cache.ttl <= rag_chain.application_settings.secret_cache_ttl
+
+    # The per-request inputs flow through the cached chain
+    for question in ['first question ?', 'second question ?']:
+        handler = RAGCallbackHandler()
+        request = _rag_request(question)
+        response = await create_rag_chain(request).ainvoke(
+            input={**request.question_answering_prompt.inputs, 'chat_history': []},
+            config={'callbacks': [handler]},
+        )
+        assert response['answer']['answer'] == 'an answer'
+        assert response['documents'] == docs
+        assert handler.records['rag_prompt'].startswith(f'Answer {question} in French with')
+
+
+@patch('gen_ai_orchestrator.services.langchain.rag_chain.get_vector_store_factory')
+@pytest.mark.asyncio
+async def test_astream_rag_chain(mocked_get_vector_store_factory):
+    docs = [
+        Document(
+            page_content='my-title\n\nsome content',
+            metadata={'id': '123-abc', 'title': 'my-title', 'source': None},
+        )
+    ]
+    mocked_get_vector_store_factory.return_value.get_vector_store_retriever.return_value = (
+        RunnableLambda(lambda _: docs)
+    )
+    rag_chain_cache.clear()
+    request = _rag_request('a streamed question ?')
+    llm_answer = {
+        'status': 'found_in_context',
+        'answer': 'A "streamed" answer.',
+        'topic': 'unknown',
+        'context_usage': [{'chunk': '123-abc', 'used_in_response': True}],
+    }
+    request.question_answering_llm_setting.responses = [json.dumps(llm_answer)]
+
+    events = [event async for event in astream_rag_chain(request, debug=False)]
+
+    answer_events = [data for event, data in events if event == RAGStreamEventType.ANSWER]
+    # The answer text is streamed in several parts, before the final events
+    assert len(answer_events) > 1
+    assert ''.join(answer_events) == 'A "streamed" answer.'
+    assert [event for event, _ in events[len(answer_events) :]] == [
+        RAGStreamEventType.CONTEXT_USAGE,
+        RAGStreamEventType.FOOTNOTES,
+        RAGStreamEventType.OBSERVABILITY_INFO,
+        RAGStreamEventType.DONE,
+    ]
+    final_events = dict(events[len(answer_events) :])
+    assert final_events[RAGStreamEventType.CONTEXT_USAGE][0].chunk == '123-abc'
+    assert [footnote.content for footnote in final_events[RAGStreamEventType.FOOTNOTES]] == [
+        'some content'
+    ]
+    assert final_events[RAGStreamEventType.OBSERVABILITY_INFO] is None
+    assert final_events[RAGStreamEventType.DONE] == LLMAnswer(**llm_answer)
+
+
+@pytest.mark.asyncio
+async def test_retrieve_documents_with_variants_concurrently():
+    retrieved = {
+        'condensed question': [
+            Document(page_content='1', metadata={'id': '1'}),
+            Document(page_content='2', metadata={'id': '2'}),
+        ],
+        'raw question': [
+            Document(page_content='2', metadata={'id': '2'}),
+            Document(page_content='3', metadata={'id': '3'}),
+        ],
+    }
+    running = []
+
+    async def retrieve(query):
+        running.append(query)
+        await asyncio.sleep(0.05)
+        # All the variants are retrieved at the same time
+        assert set(running) == set(retrieved)
+        return retrieved[query]
+
+    retriever = RunnableLambda(lambda query: retrieved[query], afunc=retrieve)
+
+    docs = await rag_chain.retrieve_documents_with_variants(
+        retriever, ['condensed question', 'raw question', 'raw question', '']
+    )
+
+    assert [doc.page_content for doc in docs] == ['2', '1', '3']
+    assert docs[0].metadata['retriever_score'] == pytest.approx(1 / 62 + 1 / 61)
+
+    # A single variant keeps the retriever ranking and scores
+    docs = await rag_chain.retrieve_documents_with_variants(
+        retriever, ['condensed question', 'condensed question']
+    )
+    assert docs == retrieved['condensed question']
+
+
+@patch.object(rag_chain.application_settings, 'rag_semantic_cache_enabled', True)
+@patch('gen_ai_orchestrator.services.langchain.rag_chain.get_em_factory')
+@patch('gen_ai_orchestrator.services.langchain.rag_chain.get_vector_store_factory')
+@pytest.mark.asyncio
+async def test_rag_chain_semantic_answer_cache(
+    mocked_get_vector_store_factory, mocked_get_em_factory
+):
+    docs = [
+        Document(
+            page_content='content',
+            metadata={'id': '1', 'chunk': '1/1', 'index_session_id': '1', 'title': 'title', 'source': None},
+        )
+    ]
+    mocked_get_vector_store_factory.return_value.get_vector_store_retriever.return_value = (
+        RunnableLambda(lambda _: docs)
+    )
+    mocked_get_em_factory.return_value.get_embedding_model.return_value.aembed_query = AsyncMock(
+        side_effect=lambda question: [1.0, 0.1] if 'guitar' in question else [0.0, 1.0]
+    )
+    rag_chain_cache.clear()
+    rag_chain.rag_answer_cache.clear()
+
+    def request(question, index_name='ns-a-bot-b-session-1'):
+        rag_request = _rag_request(question)
+        rag_request.document_index_name = index_name
+        # The LLM answers are given in turn
+        rag_request.question_answering_llm_setting.responses = [
+            json.dumps({'answer': answer, 'context_usage': [{'chunk': '1', 'used_in_response': True}]})
+            for answer in ['first answer', 'second answer', 'third answer']
+        ]
+        return rag_request
+
+    response = await execute_rag_chain(request('how to play guitar ?'), debug=True)
+    assert response.answer.answer == 'first answer'
+    assert response.debug.semantic_cache.hit is False
+    assert 'answer' in response.debug.stage_timings
+    assert response.debug.context_packing.packed_documents == 1
+    assert response.debug.context_packing.dropped_documents == 0
+
+    # A similar question reuses the answer
+    response = await execute_rag_chain(request('how to play the guitar ?'), debug=True)
+    assert response.answer.answer == 'first answer'
+    assert [footnote.identifier for footnote in response.footnotes] == ['1']
+    assert response.debug.semantic_cache.hit is True
+    assert response.debug.semantic_cache.similarity == pytest.approx(1.0)
+    assert (response.debug.semantic_cache.hits, response.debug.semantic_cache.misses) == (1, 1)
+
+    # Another question, then a new index session
+    response = await execute_rag_chain(request('how to cook ?'), debug=False)
+    assert response.answer.answer == 'second answer'
+    assert response.debug is None
+    response = await execute_rag_chain(
+        request('how to play guitar ?', index_name='ns-a-bot-b-session-2'), debug=True
+    )
+    assert response.debug.semantic_cache.hit is False
+    # The answers of the previous session are no longer matched (they age out)
+    assert len(rag_chain.rag_answer_cache) == 3
@@ -0,0 +1,275 @@
+#   Copyright (C) 2024-2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import asyncio
+from typing import Optional
+from unittest.mock import patch
+
+import pytest
+
+from gen_ai_orchestrator.errors.exceptions.exceptions import (
+    GenAIGuardCheckException,
+)
+from gen_ai_orchestrator.middlewares.admission_control_middleware import (
+    AdmissionController,
+)
+from gen_ai_orchestrator.models.errors.errors_models import ErrorCode, ErrorInfo
+from gen_ai_orchestrator.routers.requests.requests import RAGBatchRequest, RAGRequest
+from gen_ai_orchestrator.services.langchain.callbacks.stage_metrics_callback_handler import (
+    PipelineStage,
+    StageTimings,
+    observe_stage,
+    request_stage_timings,
+)
+from gen_ai_orchestrator.services.rag import rag_service
+
+
+def _rag_request(
+    dialog_id: str,
+    question: str = 'a question ?',
+    user_id: Optional[str] = None,
+    observability_setting: Optional[dict] = None,
+) -> RAGRequest:
+    return RAGRequest(
+        **{
+            'dialog': {
+                'dialog_id': dialog_id,
+                'user_id': user_id or dialog_id,
+                'history': [{'text': 'Hello', 'type': 'HUMAN'}],
+                'tags': [],
+            },
+            'question_answering_llm_setting': {
+                'provider': 'FakeLLM',
+                'api_key': {'type': 'Raw', 'secret': 'ab7***************************A1IV4B'},
+                'temperature': 0,
+                'responses': [],
+            },
+            'question_answering_prompt': {
+                'formatter': 'f-string',
+                'template': '{question} {context}',
+                'inputs': {'question': question},
+            },
+            'embedding_question_em_setting': {
+                'provider': 'OpenAI',
+                'api_key': {'type': 'Raw', 'secret': 'ab7***************************A1IV4B'},
+                'model': 'text-embedding-ada-002',
+            },
+            'document_index_name': 'my-index-name',
+            'document_search_params': {'provider': 'OpenSearch', 'k': 4},
+            'observability_setting': observability_setting,
+        }
+    )
+
+
+@patch('gen_ai_orchestrator.services.rag.rag_service.execute_rag_chain')
+@pytest.mark.asyncio
+async def test_identical_concurrent_rag_requests_share_an_execution(mocked_execute_rag_chain):
+    async def execute_rag_chain(request, debug):
+        await asyncio.sleep(0.01)
+        return request.question_answering_prompt.inputs['question']
+
+    mocked_execute_rag_chain.side_effect = execute_rag_chain
+
+    responses = await asyncio.gather(
+        rag_service.rag(_rag_request('dialog-1'), debug=False),
+        # Another bot replica
+        rag_service.rag(_rag_request('dialog-2'), debug=False),
+        rag_service.rag(_rag_request('dialog-1', 'another question ?'), debug=False),
+        rag_service.rag(_rag_request('dialog-1'), debug=True),
+    )
+
+    assert responses == ['a question ?', 'a question ?', 'another question ?', 'a question ?']
+    assert mocked_execute_rag_chain.call_count == 3
+
+    with patch.object(rag_service.application_settings, 'rag_single_flight_enabled', False):
+        await asyncio.gather(
+            rag_service.rag(_rag_request('dialog-1'), debug=False),
+            rag_service.rag(_rag_request('dialog-1'), debug=False),
+        )
+    assert mocked_execute_rag_chain.call_count == 5
+
+
+@patch('gen_ai_orchestrator.services.rag.rag_service.execute_rag_chain')
+@pytest.mark.asyncio
+async def test_rag_requests_of_different_users_share_an_untraced_execution(
+    mocked_execute_rag_chain,
+):
+    async def execute_rag_chain(request, debug):
+        await asyncio.sleep(0.01)
+        observe_stage(PipelineStage.ANSWER, 0.5)
+        return request.dialog.user_id
+
+    mocked_execute_rag_chain.side_effect = execute_rag_chain
+
+    async def rag(request):
+        # The stage timings of the caller HTTP request (see the Server-Timing middleware)
+        stage_timings = StageTimings()
+        request_stage_timings.set(stage_timings)
+        return await rag_service.rag(request, debug=False), stage_timings
+
+    (response_1, timings_1), (response_2, timings_2) = await asyncio.gather(
+        rag(_rag_request('dialog-1', user_id='user-1')),
+        rag(_rag_request('dialog-2', user_id='user-2')),
+    )
+
+    # Without observability, the execution is shared
+    assert mocked_execute_rag_chain.call_count == 1
+    assert response_1 == response_2
+    # and so are its stage timings
+    assert timings_1.durations() == timings_2.durations() == {'answer': 0.5}
+
+
+@patch('gen_ai_orchestrator.services.rag.rag_service.execute_rag_chain')
+@pytest.mark.asyncio
+async def test_traced_rag_requests_of_different_users_do_not_share_an_execution(
+    mocked_execute_rag_chain,
+):
+    async def execute_rag_chain(request, debug):
+        await asyncio.sleep(0.01)
+        return request.dialog.user_id
+
+    mocked_execute_rag_chain.side_effect = execute_rag_chain
+    observability_setting = {
+        'provider': 'Langfuse',
+        'url': 'http://localhost:3000',
+        'secret_key': {'type': 'Raw', 'secret': 'sk-********************be8f'},
+        'public_key': 'pk-lf-5e374dc6-e194-4b37-9c07-b77e68ef7d2c',
+    }
+
+    responses = await asyncio.gather(
+        rag_service.rag(
+            _rag_request('dialog-1', user_id='user-1', observability_setting=observability_setting),
+            debug=False,
+        ),
+        rag_service.rag(
+            _rag_request('dialog-1', user_id='user-2', observability_setting=observability_setting),
+            debug=False,
+        ),
+        # The same dialog and user
+        rag_service.rag(
+            _rag_request('dialog-1', user_id='user-1', observability_setting=observability_setting),
+            debug=False,
+        ),
+    )
+
+    # Each user gets its own (traced) execution
+    assert responses == ['user-1', 'user-2', 'user-1']
+    assert mocked_execute_rag_chain.call_count == 2
+
+
+@patch('gen_ai_orchestrator.services.rag.rag_service.create_rag_chain')
+@patch('gen_ai_orchestrator.services.rag.rag_service.execute_rag_chain')
+@pytest.mark.asyncio
+async def test_rag_batch(mocked_execute_rag_chain, mocked_create_rag_chain):
+    running = 0
+    max_running = 0
+
+    async def execute_rag_chain(request, debug, rag_chain):
+        nonlocal running, max_running
+        assert rag_chain is mocked_create_rag_chain.return_value
+        running += 1
+        max_running = max(max_running, running)
+        question = request.question_answering_prompt.inputs['question']
+        # The first item is the slowest one
+        await asyncio.sleep(0.2 if question == 'question 0' else 0.01)
+        running -= 1
+        if question == 'question 3':
+            raise GenAIGuardCheckException(ErrorInfo(cause='Toxicity detected'))
+        if question == 'question 4':
+            raise ValueError('unexpected')
+        return None
+
+    mocked_execute_rag_chain.side_effect = execute_rag_chain
+    request = RAGBatchRequest(
+        configuration=_rag_request('dialog-1'),
+        items=[
+            {'id': str(i), 'inputs': {'question': f'question {i}'}} for i in range(6)
+        ],
+        max_concurrency=2,
+    )
+
+    responses = [
+        response async for response in rag_service.rag_batch(request, debug=False)
+    ]
+
+    # The chain is built once, and the items responses are yielded as soon as they complete
+    mocked_create_rag_chain.assert_called_once_with(request=request.configuration)
+    assert max_running == 2
+    assert sorted(response.id for response in responses) == ['0', '1', '2', '3', '4', '5']
+    assert responses[-1].id == '0'
+    errors = {response.id: response.error for response in responses if response.error}
+    assert errors.keys() == {'3', '4'}
+    assert errors['3'].code == ErrorCode.GEN_AI_GUARD_CHECK_ERROR
+    assert errors['4'].code == ErrorCode.GEN_AI_UNKNOWN_ERROR
+    assert errors['4'].info.error == 'ValueError'
+
+
+@patch(
+    'gen_ai_orchestrator.middlewares.admission_control_middleware.admission_controller',
+    AdmissionController(route_max_in_flight={'rag': 1}),
+)
+@patch('gen_ai_orchestrator.services.rag.rag_service.create_rag_chain')
+@patch('gen_ai_orchestrator.services.rag.rag_service.execute_rag_chain')
+@pytest.mark.asyncio
+async def test_rag_batch_items_are_admitted_one_by_one(
+    mocked_execute_rag_chain, mocked_create_rag_chain
+):
+    async def execute_rag_chain(request, debug, rag_chain):
+        await asyncio.sleep(0.01)
+        return None
+
+    mocked_execute_rag_chain.side_effect = execute_rag_chain
+    request = RAGBatchRequest(
+        configuration=_rag_request('dialog-1'),
+        items=[{'id': str(i), 'inputs': {'question': f'question {i}'}} for i in range(2)],
+        max_concurrency=2,
+    )
+
+    responses = [
+        response async for response in rag_service.rag_batch(request, debug=False)
+    ]
+
+    # Each item takes a RAG admission slot: the second one has no queue to wait in
+    errors = [response.error for response in responses if response.error]
+    assert len(errors) == 1
+    assert errors[0].code == ErrorCode.GEN_AI_SERVER_OVERLOADED
+    assert mocked_execute_rag_chain.call_count == 1
+
+
+def test_get_rag_batch_item_request():
+    configuration = _rag_request('dialog-1')
+    configuration.question_answering_prompt.inputs['locale'] = 'French'
+    request = RAGBatchRequest(
+        configuration=configuration,
+        items=[
+            {'id': '1', 'inputs': {'question': 'another question ?'}},
+            {
+                'id': '2',
+                'inputs': {'question': 'a third question ?'},
+                'dialog': {'history': [], 'tags': ['batch']},
+            },
+        ],
+    )
+
+    first = rag_service.get_rag_batch_item_request(configuration, request.items[0])
+    second = rag_service.get_rag_batch_item_request(configuration, request.items[1])
+
+    assert first.question_answering_prompt.inputs == {
+        'question': 'another question ?',
+        'locale': 'French',
+    }
+    assert first.dialog == configuration.dialog
+    assert second.dialog.tags == ['batch']
+    # The configuration is left untouched
+    assert configuration.question_answering_prompt.inputs['question'] == 'a question ?'
@@ -0,0 +1,48 @@
+#   Copyright (C) 2024-2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import pytest
+from langchain_core.documents import Document
+
+from gen_ai_orchestrator.services.utils.rank_fusion import reciprocal_rank_fusion
+
+
+def _doc(doc_id: str) -> Document:
+    return Document(page_content=f'content {doc_id}', metadata={'id': doc_id})
+
+
+def test_reciprocal_rank_fusion():
+    first_results = [_doc('a'), _doc('b'), _doc('c')]
+    second_results = [_doc('c'), _doc('b'), _doc('d')]
+
+    fused = reciprocal_rank_fusion([first_results, second_results], k=60)
+
+    assert [doc.metadata['id'] for doc in fused] == ['c', 'b', 'a', 'd']
+    assert fused[0].metadata['retriever_score'] == pytest.approx(1 / 63 + 1 / 61)
+    assert fused[1].metadata['retriever_score'] == pytest.approx(1 / 62 + 1 / 62)
+    assert fused[2].metadata['retriever_score'] == pytest.approx(1 / 61)
+    assert fused[3].metadata['retriever_score'] == pytest.approx(1 / 63)
+    # The retrieved documents are not altered
+    assert 'retriever_score' not in first_results[0].metadata
+
+
+def test_reciprocal_rank_fusion_distinguishes_chunks():
+    chunks = [
+        Document(page_content='1', metadata={'id': 'a', 'chunk': 1}),
+        Document(page_content='2', metadata={'id': 'a', 'chunk': 2}),
+    ]
+
+    fused = reciprocal_rank_fusion([chunks, chunks[:1]])
+
+    assert [doc.page_content for doc in fused] == ['1', '2']
@@ -37,9 +37,15 @@ from gen_ai_orchestrator.services.security.security_service import (
 from gen_ai_orchestrator.utils.gcp.gcp_secret_manager_client import (
     GCPSecretManagerClient,
 )
+from gen_ai_orchestrator.utils.secret_manager.secret_manager_service import (
+    clear_secret_cache,
+)
 
 
 class TestSecurityService(unittest.TestCase):
+    def setUp(self):
+        """Clear the secret cache before each test to avoid cached secrets."""
+        clear_secret_cache()
 
     def test_fetch_unknown_secret_key_value(self):
         # Test data
@@ -139,6 +145,23 @@ class TestSecurityService(unittest.TestCase):
             name=f'projects/{application_settings.gcp_project_id}/secrets/{gcp_secret_name}/versions/latest')
         self.assertIsNone(value)
 
+    @patch('boto3.client')
+    @patch('gen_ai_orchestrator.utils.aws.aws_secrets_manager_client.AWSSecretsManagerClient.get_ai_provider_secret')
+    def test_fetch_aws_secret_key_value_is_cached(self, mock_get_ai_provider_secret, mock_boto3_client):
+        mock_get_ai_provider_secret.return_value = AIProviderSecret(secret='my_secret_key_value')
+
+        # The secret and the boto3 client are fetched once
+        for _ in range(3):
+            value = fetch_secret_key_value(AwsSecretKey(secret_name='my_secret_key'))
+            self.assertEqual(value, 'my_secret_key_value')
+        mock_boto3_client.assert_called_once_with(service_name='secretsmanager')
+        mock_get_ai_provider_secret.assert_called_once_with('my_secret_key')
+
+        # Another secret reuses the boto3 client
+        fetch_secret_key_value(AwsSecretKey(secret_name='other_secret_key'))
+        mock_boto3_client.assert_called_once()
+        self.assertEqual(mock_get_ai_provider_secret.call_count, 2)
+
     @patch('google.cloud.secretmanager.SecretManagerServiceClient')
     def test_fetch_gcp_credentials_value(self, mock_gcp_secret_manager_client):
         # Test data
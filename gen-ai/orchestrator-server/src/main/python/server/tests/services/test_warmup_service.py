@@ -0,0 +1,94 @@
+#   Copyright (C) 2024-2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from gen_ai_orchestrator.models.llm.llm_provider import LLMProvider
+from gen_ai_orchestrator.models.vector_stores.vectore_store_provider import (
+    VectorStoreProvider,
+)
+from gen_ai_orchestrator.services.warmup import warmup_service
+from gen_ai_orchestrator.services.warmup.warmup_service import (
+    is_ready,
+    load_provider_modules,
+    warm_up,
+)
+
+
+@patch.object(warmup_service.application_settings, 'warmup_indexes', ['index-1', 'index-2'])
+@patch.object(warmup_service.application_settings, 'warmup_tiktoken_encodings', [])
+@patch('gen_ai_orchestrator.services.warmup.warmup_service.load_provider_modules')
+@patch('gen_ai_orchestrator.services.warmup.warmup_service.fetch_default_vector_store_credentials')
+@patch('gen_ai_orchestrator.services.warmup.warmup_service.get_vector_store_factory')
+@pytest.mark.asyncio
+async def test_warm_up(
+    mocked_get_vector_store_factory,
+    mocked_fetch_credentials,
+    mocked_load_provider_modules,
+):
+    mocked_warm_up = AsyncMock(side_effect=[None, Exception('index not found')])
+    mocked_get_vector_store_factory.return_value.warm_up = mocked_warm_up
+
+    await warm_up()
+
+    # A failing step does not prevent the application from being ready
+    assert is_ready()
+    mocked_fetch_credentials.assert_called_once()
+    mocked_load_provider_modules.assert_called_once()
+    assert [call.kwargs['index_name'] for call in mocked_get_vector_store_factory.call_args_list] == [
+        'index-1',
+        'index-2',
+    ]
+    assert mocked_warm_up.await_count == 2
+
+
+@patch.object(warmup_service.application_settings, 'warmup_timeout', 0.05)
+@patch('gen_ai_orchestrator.services.warmup.warmup_service._run_steps')
+@pytest.mark.asyncio
+async def test_warm_up_timeout(mocked_run_steps):
+    async def slow_steps():
+        assert not is_ready()
+        await asyncio.sleep(10)
+
+    mocked_run_steps.side_effect = slow_steps
+
+    await warm_up()
+
+    assert is_ready()
+
+
+@patch.object(warmup_service.application_settings, 'warmup_enabled', False)
+@patch('gen_ai_orchestrator.services.warmup.warmup_service._run_steps')
+@pytest.mark.asyncio
+async def test_warm_up_disabled(mocked_run_steps):
+    await warm_up()
+
+    assert is_ready()
+    mocked_run_steps.assert_not_called()
+
+
+@patch.object(warmup_service.application_settings, 'vector_store_provider', VectorStoreProvider.OPEN_SEARCH)
+@patch.object(warmup_service.application_settings, 'warmup_llm_providers', [LLMProvider.FAKE_LLM])
+@patch.object(warmup_service.application_settings, 'warmup_em_providers', [])
+def test_load_provider_modules():
+    with patch.object(warmup_service, 'llm_factories', MagicMock()) as llm_factories, patch.object(
+        warmup_service, 'vector_store_factories', MagicMock()
+    ) as vector_store_factories:
+        load_provider_modules()
+
+    llm_factories.__getitem__.assert_called_once_with(LLMProvider.FAKE_LLM)
+    vector_store_factories.__getitem__.assert_called_once_with(VectorStoreProvider.OPEN_SEARCH)
@@ -0,0 +1,71 @@
+#   Copyright (C) 2024-2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""Startup benchmark: the import time of the application, measured with python -X importtime"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# The import time budget (in seconds) of the application module, for a worker cold start.
+# A wall-clock measure depends on the runner: it is only checked if set (e.g. on a dedicated benchmark runner).
+IMPORT_TIME_BUDGET = os.environ.get('GEN_AI_ORCHESTRATOR_IMPORT_TIME_BUDGET')
+
+# The provider SDKs, only loaded on first use of their provider
+LAZY_PROVIDER_MODULES = [
+    'langchain_openai',
+    'langchain_postgres',
+    'langfuse',
+    'openai',
+    'opensearchpy',
+    'sqlalchemy',
+    'boto3',
+    'google.cloud.secretmanager',
+]
+
+
+def _import_times(module: str) -> dict:
+    """Import a module in a new interpreter, and parse the cumulative import times (in seconds)."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        text=True,
+        env={**os.environ, 'PYTHONPATH': os.pathsep.join(sys.path)},
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        times[name.strip()] = int(cumulative) / 1_000_000
+    return times
+
+
+def test_provider_sdks_are_not_imported_at_startup():
+    times = _import_times('gen_ai_orchestrator.main')
+
+    assert [module for module in LAZY_PROVIDER_MODULES if module in times] == []
+
+
+@pytest.mark.skipif(
+    IMPORT_TIME_BUDGET is None,
+    reason='GEN_AI_ORCHESTRATOR_IMPORT_TIME_BUDGET is not set',
+)
+def test_import_time_budget():
+    times = _import_times('gen_ai_orchestrator.main')
+
+    assert times['gen_ai_orchestrator.main'] < float(IMPORT_TIME_BUDGET)
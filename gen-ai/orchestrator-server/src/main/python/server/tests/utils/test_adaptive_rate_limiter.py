@@ -0,0 +1,225 @@
+#   Copyright (C) 2024-2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import asyncio
+import sqlite3
+import time
+
+import httpx
+import pytest
+
+from gen_ai_orchestrator.utils.rate_limit.adaptive_rate_limiter import (
+    AdaptiveRateLimiter,
+    RateLimitedHttpHooks,
+    estimate_request_tokens,
+    parse_duration,
+    parse_retry_after,
+)
+from gen_ai_orchestrator.utils.rate_limit.rate_limit_backend import (
+    InMemoryRateLimitBackend,
+    SQLiteRateLimitBackend,
+)
+
+
+def test_requests_are_limited_by_key():
+    backend = InMemoryRateLimitBackend()
+    limiter = AdaptiveRateLimiter('a', requests_per_minute=2, backend=backend)
+    other_limiter = AdaptiveRateLimiter('b', requests_per_minute=2, backend=backend)
+
+    assert limiter.acquire(blocking=False)
+    assert limiter.acquire(blocking=False)
+    assert not limiter.acquire(blocking=False)
+    # Another credential has its own budget
+    assert other_limiter.acquire(blocking=False)
+    # The limiters of the same key share their budget
+    assert not AdaptiveRateLimiter(
+        'a', requests_per_minute=2, backend=backend
+    ).acquire(blocking=False)
+
+
+def test_idle_keys_are_removed_from_the_memory_backend(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(time, 'time', lambda: now)
+    backend = InMemoryRateLimitBackend(prune_interval=10)
+    limiter = AdaptiveRateLimiter('a', requests_per_minute=60, backend=backend)
+    assert limiter.acquire(blocking=False)
+    AdaptiveRateLimiter('b', requests_per_minute=60, backend=backend).acquire(blocking=False)
+    assert list(backend._states) == ['a', 'b']
+
+    # The bucket of 'a' is not full yet
+    now += 0.5
+    limiter.acquire(blocking=False)
+    now += 10
+    limiter.acquire(blocking=False)
+    assert list(backend._states) == ['a']
+
+    now += 10
+    AdaptiveRateLimiter('c', requests_per_minute=60, backend=backend).acquire(blocking=False)
+    assert list(backend._states) == ['c']
+
+
+def test_tokens_are_limited():
+    limiter = AdaptiveRateLimiter('a', requests_per_minute=100, tokens_per_minute=1000)
+
+    assert limiter.acquire_tokens(600, blocking=False)
+    assert not limiter.acquire_tokens(600, blocking=False)
+    assert limiter.acquire_tokens(400, blocking=False)
+    # Requests are not limited by the tokens
+    assert limiter.acquire(blocking=False)
+
+
+def test_tokens_are_not_limited_without_tokens_per_minute():
+    limiter = AdaptiveRateLimiter('a', requests_per_minute=1)
+
+    assert limiter.acquire_tokens(10**9, blocking=False)
+
+
+@pytest.mark.asyncio
+async def test_aacquire_waits_for_the_refill():
+    limiter = AdaptiveRateLimiter('a', requests_per_minute=600)
+    for _ in range(600):
+        assert await limiter.aacquire(blocking=False)
+
+    start = time.monotonic()
+    assert await limiter.aacquire()
+    # 600 requests per minute: a request is available every 100 ms
+    assert 0.05 < time.monotonic() - start < 0.5
+
+
+def test_too_many_requests_blocks_until_retry_after():
+    limiter = AdaptiveRateLimiter('a', requests_per_minute=100)
+
+    limiter.update_from_response(429, {'retry-after': '30'})
+
+    assert not limiter.acquire(blocking=False)
+
+
+def test_exhausted_remaining_blocks_until_reset():
+    limiter = AdaptiveRateLimiter('a', requests_per_minute=100, tokens_per_minute=1000)
+
+    limiter.update_from_response(
+        200,
+        {
+            'x-ratelimit-remaining-requests': '50',
+            'x-ratelimit-remaining-tokens': '0',
+            'x-ratelimit-reset-tokens': '6m0s',
+        },
+    )
+
+    assert limiter.acquire(blocking=False)
+    assert not limiter.acquire_tokens(1, blocking=False)
+
+
+def test_remaining_lowers_the_bucket():
+    limiter = AdaptiveRateLimiter('a', requests_per_minute=100)
+
+    limiter.update_from_response(200, {'x-ratelimit-remaining-requests': '1'})
+
+    assert limiter.acquire(blocking=False)
+    assert not limiter.acquire(blocking=False)
+
+
+def test_sqlite_backend_is_shared(tmp_path):
+    path = str(tmp_path / 'rate_limits.db')
+    limiter = AdaptiveRateLimiter(
+        'a', requests_per_minute=2, backend=SQLiteRateLimitBackend(path)
+    )
+    # Another worker, with its own connection
+    other_limiter = AdaptiveRateLimiter(
+        'a', requests_per_minute=2, backend=SQLiteRateLimitBackend(path)
+    )
+
+    assert limiter.acquire(blocking=False)
+    assert other_limiter.acquire(blocking=False)
+    assert not limiter.acquire(blocking=False)
+
+    other_limiter.update_from_response(429, {'retry-after-ms': '60000'})
+    assert not AdaptiveRateLimiter(
+        'a', requests_per_minute=1000, backend=SQLiteRateLimitBackend(path)
+    ).acquire(blocking=False)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_does_not_block_the_event_loop(tmp_path):
+    path = str(tmp_path / 'rate_limits.db')
+    limiter = AdaptiveRateLimiter(
+        'a', requests_per_minute=2, backend=SQLiteRateLimitBackend(path)
+    )
+    # Another worker holds the write lock
+    other_connection = sqlite3.connect(path, isolation_level=None)
+    other_connection.execute('BEGIN IMMEDIATE')
+
+    acquire = asyncio.create_task(limiter.aacquire(blocking=False))
+    # The event loop keeps running meanwhile
+    await asyncio.sleep(0.05)
+    assert not acquire.done()
+
+    other_connection.execute('COMMIT')
+    other_connection.close()
+    assert await acquire
+
+    await limiter.aupdate_from_response(200, {'x-ratelimit-remaining-requests': '0'})
+    assert not await limiter.aacquire(blocking=False)
+
+
+@pytest.mark.asyncio
+async def test_http_hooks_acquire_tokens_and_adapt_the_limiter():
+    limiter = AdaptiveRateLimiter('a', requests_per_minute=100, tokens_per_minute=1000)
+    hooks = RateLimitedHttpHooks(limiter).async_event_hooks()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(429, headers={'retry-after': '10'})
+
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), event_hooks=hooks
+    ) as client:
+        response = await client.post(
+            'https://llm/chat/completions', json={'max_tokens': 500}
+        )
+
+    assert response.status_code == 429
+    assert not limiter.acquire_tokens(1, blocking=False)
+
+
+def test_estimate_request_tokens():
+    assert estimate_request_tokens(b'') == 0
+    assert estimate_request_tokens(b'x' * 400) == 100
+    assert estimate_request_tokens(b'{"max_tokens": 100}') == 104
+    assert estimate_request_tokens(b'{"max_completion_tokens": 10}') == 17
+
+
+@pytest.mark.parametrize(
+    'value,expected',
+    [
+        ('1s', 1),
+        ('6m0s', 360),
+        ('20ms', 0.02),
+        ('1h2m3.5s', 3723.5),
+        ('2.5', 2.5),
+        ('soon', None),
+        (None, None),
+    ],
+)
+def test_parse_duration(value, expected):
+    if expected is None:
+        assert parse_duration(value) is None
+    else:
+        assert parse_duration(value) == pytest.approx(expected)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after({'retry-after': '2'}) == 2
+    assert parse_retry_after({'retry-after-ms': '1500', 'retry-after': '2'}) == 1.5
+    assert parse_retry_after({}) is None
+    assert parse_retry_after({'retry-after': 'Wed, 21 Oct 2015 07:28:00 GMT'}) == 0
@@ -0,0 +1,184 @@
+#   Copyright (C) 2024-2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+from unittest.mock import patch
+
+import pytest
+from langchain_core.documents import Document
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from gen_ai_orchestrator.errors.exceptions.ai_provider.ai_provider_exceptions import (
+    AIProviderCircuitOpenException,
+)
+from gen_ai_orchestrator.errors.exceptions.document_compressor.document_compressor_exceptions import (
+    GenAIDocumentCompressorErrorException,
+)
+from gen_ai_orchestrator.services.langchain.callbacks.circuit_breaker_callback_handler import (
+    CircuitBreakerCallbackHandler,
+)
+from gen_ai_orchestrator.services.langchain.impls.document_compressor.bloomz_rerank import (
+    BloomzRerank,
+)
+from gen_ai_orchestrator.services.langchain.impls.llm.hedged_language_model import (
+    HedgedLanguageModel,
+)
+from gen_ai_orchestrator.utils.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+    get_circuit_breaker,
+    is_failure,
+)
+
+
+class _HTTPError(Exception):
+    def __init__(self, status_code: int):
+        super().__init__(f'HTTP {status_code}')
+        self.status_code = status_code
+
+
+def _fail(circuit_breaker: CircuitBreaker, error: Exception = ConnectionError()):
+    with pytest.raises(type(error)):
+        with circuit_breaker.call():
+            raise error
+
+
+def test_circuit_opens_on_error_rate():
+    circuit_breaker = CircuitBreaker('test', window_size=4, min_calls=4, error_rate_threshold=0.5)
+
+    _fail(circuit_breaker)
+    with circuit_breaker.call():
+        pass
+    _fail(circuit_breaker)
+    assert circuit_breaker.state == CircuitState.CLOSED
+
+    # 2 failures out of the 4 last calls
+    with circuit_breaker.call():
+        pass
+    assert circuit_breaker.state == CircuitState.OPEN
+
+    with pytest.raises(AIProviderCircuitOpenException):
+        with circuit_breaker.call():
+            pass
+    assert circuit_breaker.snapshot()['rejected_calls'] == 1
+
+
+def test_client_errors_are_not_failures():
+    assert not is_failure(_HTTPError(404))
+    assert is_failure(_HTTPError(429))
+    assert is_failure(_HTTPError(503))
+    assert is_failure(TimeoutError())
+
+    circuit_breaker = CircuitBreaker('test', window_size=2, min_calls=2)
+    for _ in range(3):
+        _fail(circuit_breaker, _HTTPError(400))
+
+    assert circuit_breaker.state == CircuitState.CLOSED
+
+
+def test_circuit_opens_on_slow_calls():
+    circuit_breaker = CircuitBreaker(
+        'test', window_size=2, min_calls=2, slow_call_duration=1, slow_call_rate_threshold=1
+    )
+
+    circuit_breaker.record(0.5, failed=False)
+    circuit_breaker.record(1.5, failed=False)
+    assert circuit_breaker.state == CircuitState.CLOSED
+
+    circuit_breaker.record(2, failed=False)
+    assert circuit_breaker.state == CircuitState.OPEN
+
+
+@patch('gen_ai_orchestrator.utils.circuit_breaker.time.monotonic')
+def test_half_open_circuit(mocked_monotonic):
+    mocked_monotonic.return_value = 100
+    circuit_breaker = CircuitBreaker('test', window_size=1, min_calls=1, open_duration=30)
+    _fail(circuit_breaker)
+    assert circuit_breaker.state == CircuitState.OPEN
+
+    mocked_monotonic.return_value = 130
+    assert circuit_breaker.state == CircuitState.HALF_OPEN
+    # A single trial call
+    assert circuit_breaker.allow_request()
+    assert not circuit_breaker.allow_request()
+    # It fails: the circuit is open again
+    circuit_breaker.record(0.1, failed=True)
+    assert circuit_breaker.state == CircuitState.OPEN
+
+    mocked_monotonic.return_value = 160
+    with circuit_breaker.call():
+        pass
+    assert circuit_breaker.state == CircuitState.CLOSED
+
+
+def test_half_open_trial_call_is_released_on_cancellation():
+    circuit_breaker = CircuitBreaker('test', window_size=1, min_calls=1, open_duration=0)
+    _fail(circuit_breaker)
+    assert circuit_breaker.state == CircuitState.HALF_OPEN
+
+    _fail(circuit_breaker, KeyboardInterrupt())
+
+    assert circuit_breaker.allow_request()
+
+
+def test_get_circuit_breaker():
+    assert get_circuit_breaker('test:shared') is get_circuit_breaker('test:shared')
+    assert get_circuit_breaker('test:slow', timeout=10).slow_call_duration == 8
+
+    with patch(
+        'gen_ai_orchestrator.utils.circuit_breaker.application_settings.circuit_breaker_enabled',
+        False,
+    ):
+        assert get_circuit_breaker('test:disabled') is None
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_falls_back_to_the_original_documents():
+    reranker = BloomzRerank(endpoint='http://rerank-circuit-open.com')
+    circuit_breaker = get_circuit_breaker(f'BloomzRerank:{reranker.endpoint}')
+    for _ in range(circuit_breaker.min_calls):
+        circuit_breaker.record(0.1, failed=True)
+    documents = [Document(page_content='a document')]
+
+    with patch('gen_ai_orchestrator.services.langchain.impls.document_compressor.bloomz_rerank.requests') as mocked_requests:
+        # The rerank endpoint is not called
+        assert reranker.compress_documents(documents, 'a query') == documents
+        assert await reranker.acompress_documents(documents, 'a query') == documents
+        mocked_requests.post.assert_not_called()
+
+    reranker.is_fault_tolerant = False
+    with pytest.raises(GenAIDocumentCompressorErrorException):
+        await reranker.acompress_documents(documents, 'a query')
+
+
+@pytest.mark.asyncio
+async def test_open_llm_circuit_falls_back_to_the_alternate_llm():
+    circuit_breaker = CircuitBreaker('test:llm', window_size=1, min_calls=1)
+    primary = FakeListChatModel(
+        responses=['primary'], callbacks=[CircuitBreakerCallbackHandler(circuit_breaker)]
+    )
+
+    assert (await primary.ainvoke('a question')).content == 'primary'
+    assert circuit_breaker.snapshot()['calls'] == 1
+
+    circuit_breaker.record(0.1, failed=True)
+    with pytest.raises(AIProviderCircuitOpenException):
+        await primary.ainvoke('a question')
+
+    hedged_model = HedgedLanguageModel(
+        primary=primary,
+        alternate=FakeListChatModel(responses=['alternate']),
+        provider='FakeLLM',
+        hedging=False,
+    )
+    assert (await hedged_model.ainvoke('a question')).content == 'alternate'
@@ -0,0 +1,40 @@
+#   Copyright (C) 2024-2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import sys
+
+import pytest
+
+from gen_ai_orchestrator.models.llm.llm_provider import LLMProvider
+from gen_ai_orchestrator.utils.lazy_registry import LazyRegistry
+
+
+def test_lazy_registry_imports_on_first_use():
+    registry = LazyRegistry(
+        'Test',
+        {
+            LLMProvider.OPEN_AI: 'json:JSONDecoder',
+            LLMProvider.OLLAMA: 'not_an_installed_module:Factory',
+        },
+    )
+
+    assert LLMProvider.OPEN_AI in registry
+    assert LLMProvider.FAKE_LLM not in registry
+    assert registry.loaded() == []
+    assert registry[LLMProvider.OPEN_AI] is sys.modules['json'].JSONDecoder
+    assert registry.loaded() == [LLMProvider.OPEN_AI]
+    # The unused providers are never imported
+    assert 'not_an_installed_module' not in sys.modules
+    with pytest.raises(KeyError):
+        registry[LLMProvider.FAKE_LLM]
@@ -0,0 +1,98 @@
+#   Copyright (C) 2024-2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+from gen_ai_orchestrator.utils.cache.ttl_lru_cache import TTLLRUCache
+from gen_ai_orchestrator.utils.metrics.cache_metrics import (
+    cache_hits_counter,
+    cache_misses_counter,
+    register_cache_metrics,
+)
+from gen_ai_orchestrator.utils.metrics.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+)
+from gen_ai_orchestrator.utils.metrics.prometheus import generate_latest
+
+
+def test_histogram():
+    metric = Histogram('duration', 'A duration', buckets=(1, 0.1), label_names=('stage',))
+    for value in [0.05, 0.1, 0.5, 2]:
+        metric.observe(value, stage='retrieval')
+    metric.observe(0.2, stage='generation')
+
+    assert metric.collect() == {
+        ('retrieval',): ([2, 3, 4], 2.65),
+        ('generation',): ([0, 1, 1], 0.2),
+    }
+
+
+def test_metrics_registry_returns_registered_metric():
+    registry = MetricsRegistry()
+    metric = registry.register(Histogram('duration', 'A duration', buckets=(1,)))
+
+    assert registry.register(Histogram('duration', 'A duration', buckets=(1,))) is metric
+    assert registry.metrics() == [metric]
+
+
+def test_counter_and_gauge():
+    tokens = Counter('tokens', 'Tokens', label_names=('type',))
+    tokens.inc(10, type='input')
+    tokens.inc(5, type='input')
+    tokens.set_function(lambda: 42, type='output')
+    in_flight = Gauge('in_flight', 'In-flight requests')
+    in_flight.inc()
+    in_flight.inc()
+    in_flight.dec()
+
+    assert tokens.collect() == {('input',): 15, ('output',): 42}
+    assert in_flight.collect() == {(): 1}
+
+
+def test_cache_metrics_are_not_reset_when_the_cache_is_cleared():
+    cache = TTLLRUCache(max_size=2)
+    register_cache_metrics('test', cache)
+    cache.put('a', 1)
+    cache.get('a')
+    cache.get('b')
+    cache.clear()
+    cache.get('a')
+
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert cache_hits_counter.collect()[('test',)] == 1
+    assert cache_misses_counter.collect()[('test',)] == 2
+
+
+def test_generate_latest():
+    registry = MetricsRegistry()
+    registry.register(Counter('requests_total', 'Number of\nrequests', label_names=('route',))).inc(
+        route='/rag "stream"'
+    )
+    registry.register(
+        Histogram('duration_seconds', 'Duration', buckets=(0.5, 1), label_names=('stage',))
+    ).observe(0.75, stage='answer')
+
+    assert generate_latest(registry) == (
+        '# HELP requests_total Number of\\nrequests\n'
+        '# TYPE requests_total counter\n'
+        'requests_total{route="/rag \\"stream\\""} 1\n'
+        '# HELP duration_seconds Duration\n'
+        '# TYPE duration_seconds histogram\n'
+        'duration_seconds_bucket{stage="answer",le="0.5"} 0\n'
+        'duration_seconds_bucket{stage="answer",le="1"} 1\n'
+        'duration_seconds_bucket{stage="answer",le="+Inf"} 1\n'
+        'duration_seconds_sum{stage="answer"} 0.75\n'
+        'duration_seconds_count{stage="answer"} 1\n'
+    )
@@ -0,0 +1,100 @@
+#   Copyright (C) 2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gen_ai_orchestrator.utils.secret_manager.secret_cache import SecretCache
+
+
+@patch('gen_ai_orchestrator.utils.secret_manager.secret_cache.time.monotonic')
+def test_secret_expires_after_ttl(mocked_monotonic):
+    cache = SecretCache(ttl=10)
+    loader = MagicMock(side_effect=['v1', 'v2'])
+
+    mocked_monotonic.return_value = 100
+    assert cache.get('key', loader) == 'v1'
+    mocked_monotonic.return_value = 109
+    assert cache.get('key', loader) == 'v1'
+    mocked_monotonic.return_value = 111
+    assert cache.get('key', loader) == 'v2'
+    assert loader.call_count == 2
+
+
+def test_none_is_not_cached():
+    cache = SecretCache(ttl=10)
+    loader = MagicMock(side_effect=[None, 'value'])
+
+    assert cache.get('key', loader) is None
+    assert cache.get('key', loader) == 'value'
+
+
+def test_concurrent_fetches_are_coalesced():
+    cache = SecretCache(ttl=10)
+    release = threading.Event()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        release.wait(timeout=5)
+        return 'value'
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get('key', loader)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == ['value'] * 5
+    assert len(calls) == 1
+
+
+def test_fetch_error_is_raised_and_not_cached():
+    cache = SecretCache(ttl=10)
+    loader = MagicMock(side_effect=[RuntimeError('unavailable'), 'value'])
+
+    with pytest.raises(RuntimeError):
+        cache.get('key', loader)
+    assert cache.get('key', loader) == 'value'
+
+
+def test_secret_is_refreshed_ahead_in_background():
+    cache = SecretCache(ttl=10, refresh_ahead=10)
+    refreshed = threading.Event()
+    values = iter(['v1', 'v2'])
+
+    def loader():
+        value = next(values)
+        if value == 'v2':
+            refreshed.set()
+        return value
+
+    assert cache.get('key', loader) == 'v1'
+    # Within the refresh window: the current value is served, and refreshed in background
+    assert cache.get('key', loader) == 'v1'
+    assert refreshed.wait(timeout=5)
+    deadline = time.monotonic() + 5
+    while 'key' in cache._refreshing and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert cache.get('key', MagicMock(side_effect=RuntimeError('unavailable'))) == 'v2'
@@ -0,0 +1,74 @@
+#   Copyright (C) 2024-2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import time
+
+from gen_ai_orchestrator.utils.cache.semantic_cache import SemanticCache
+
+
+def test_get_most_similar_entry():
+    cache = SemanticCache(max_size=10, threshold=0.9)
+    cache.put('index', 'session-1', 'scope', [1.0, 0.0], 'first')
+    cache.put('index', 'session-1', 'scope', [0.0, 1.0], 'second')
+
+    value, similarity = cache.get('index', 'session-1', 'scope', [0.95, 0.05])
+    assert value == 'first'
+    assert similarity > 0.99
+    # Below the threshold
+    assert cache.get('index', 'session-1', 'scope', [1.0, 1.0]) is None
+    # Another scope
+    assert cache.get('index', 'session-1', 'other-scope', [1.0, 0.0]) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_sessions_of_a_namespace_are_served_at_the_same_time():
+    cache = SemanticCache(max_size=10, threshold=0.9)
+    cache.put('index', 'session-1', 'scope', [1.0, 0.0], 'old answer')
+    # A reindex rollout: the new session is served besides the old one
+    cache.put('index', 'session-2', 'scope', [1.0, 0.0], 'new answer')
+    # A late put of the old session does not drop the new session entries
+    cache.put('index', 'session-1', 'scope', [0.0, 1.0], 'other old answer')
+
+    assert cache.get('index', 'session-2', 'scope', [1.0, 0.0])[0] == 'new answer'
+    assert cache.get('index', 'session-1', 'scope', [1.0, 0.0])[0] == 'old answer'
+    assert cache.get('index', 'session-2', 'scope', [0.0, 1.0]) is None
+    assert len(cache) == 3
+
+
+def test_invalidate_namespace():
+    cache = SemanticCache(max_size=10, threshold=0.9)
+    cache.put('index', 'session-1', 'scope', [1.0, 0.0], 'answer')
+    cache.put('index', 'session-2', 'scope', [1.0, 0.0], 'new answer')
+    cache.put('other-index', 'session-1', 'scope', [1.0, 0.0], 'other answer')
+
+    assert cache.invalidate('index') == 2
+
+    assert cache.get('index', 'session-2', 'scope', [1.0, 0.0]) is None
+    assert cache.get('other-index', 'session-1', 'scope', [1.0, 0.0])[0] == 'other answer'
+    assert len(cache) == 1
+
+
+def test_evict_least_recently_used_and_expired_entries():
+    cache = SemanticCache(max_size=2, threshold=0.9, ttl=0.05)
+    cache.put('index', None, 'scope', [1.0, 0.0, 0.0], 'first')
+    cache.put('index', None, 'scope', [0.0, 1.0, 0.0], 'second')
+    assert cache.get('index', None, 'scope', [1.0, 0.0, 0.0])[0] == 'first'
+    cache.put('index', None, 'scope', [0.0, 0.0, 1.0], 'third')
+
+    assert cache.get('index', None, 'scope', [0.0, 1.0, 0.0]) is None
+    assert cache.get('index', None, 'scope', [1.0, 0.0, 0.0])[0] == 'first'
+
+    time.sleep(0.1)
+    assert cache.get('index', None, 'scope', [1.0, 0.0, 0.0]) is None
+    assert len(cache) == 0
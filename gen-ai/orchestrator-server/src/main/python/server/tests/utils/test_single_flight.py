@@ -0,0 +1,63 @@
+#   Copyright (C) 2024-2026 Credit Mutuel Arkea
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import asyncio
+
+import pytest
+
+from gen_ai_orchestrator.utils.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_an_execution():
+    single_flight = SingleFlight('test')
+    executions = []
+
+    async def call(value):
+        executions.append(value)
+        await asyncio.sleep(0.01)
+        return value
+
+    results = await asyncio.gather(
+        single_flight.run('a', lambda: call('a1')),
+        single_flight.run('a', lambda: call('a2')),
+        single_flight.run('b', lambda: call('b')),
+    )
+
+    assert results == ['a1', 'a1', 'b']
+    assert executions == ['a1', 'b']
+    assert (single_flight.executions, single_flight.shared) == (2, 1)
+    assert single_flight.in_flight() == 0
+
+    # The next call is executed again
+    assert await single_flight.run('a', lambda: call('a3')) == 'a3'
+
+
+@pytest.mark.asyncio
+async def test_shared_execution_error_and_cancellation():
+    single_flight = SingleFlight('test')
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError('error')
+
+    first = asyncio.create_task(single_flight.run('a', fail))
+    second = asyncio.create_task(single_flight.run('a', fail))
+    await asyncio.sleep(0)
+    # A cancelled caller does not cancel the shared execution
+    first.cancel()
+
+    with pytest.raises(ValueError):
+        await second
+    assert first.cancelled()